@@ -10,9 +10,10 @@ from typing import Optional
 import streamlit as st
 
 from core.state import init_session_state
-from core import persist
+from core import persist, theme
+from core.model_loader import ensure_compiled_model
 from core.i18n import (
-    LANGUAGE_OPTIONS,
+    available_languages,
     get_language,
     init_language_state,
     language_option_label,
@@ -22,9 +23,6 @@ from core.i18n import (
     t,
 )
 
-TU_GREEN = "#639A00"
-TU_ORANGE = "#CA7406"
-
 st.set_page_config(
     page_title="Reifegradmodell Technische Dokumentation",
     layout="wide",
@@ -64,7 +62,7 @@ def _sync_language_selectors_before_render() -> None:
 
     for widget_key in _LANGUAGE_WIDGET_KEYS:
         widget_language = st.session_state.get(widget_key)
-        if widget_language in LANGUAGE_OPTIONS and widget_language != current:
+        if widget_language in available_languages() and widget_language != current:
             _set_language_and_widgets(str(widget_language))
             return
 
@@ -88,7 +86,7 @@ def _render_language_selector(container, key: str, *, label_visibility: str = "v
 
     selected = container.radio(
         t("language.label"),
-        list(LANGUAGE_OPTIONS),
+        list(available_languages()),
         key=key,
         horizontal=True,
         format_func=language_option_label,
@@ -249,321 +247,9 @@ def _init_theme_state_from_snapshot() -> None:
 
 
 def apply_global_theme_css(dark: bool) -> None:
-    bg = "#0e1117" if dark else "#ffffff"
-    text = "rgba(250,250,250,0.92)" if dark else "#111111"
-    sidebar_bg = "#0b0f16" if dark else "#f6f7f9"
-    card_bg = "#111827" if dark else "#ffffff"
-    border = "rgba(255,255,255,0.10)" if dark else "rgba(0,0,0,0.10)"
-
-    btn2_bg = "rgba(255,255,255,0.06)" if dark else "#ffffff"
-    btn2_text = "rgba(250,250,250,0.92)" if dark else "#111111"
-
-    pop_hover = "rgba(202,116,6,0.22)" if dark else "rgba(202,116,6,0.14)"
-    pop_sel = "rgba(255,255,255,0.08)" if dark else "rgba(0,0,0,0.04)"
-
-    pipe_inactive = "rgba(255,255,255,0.14)" if dark else "rgba(0,0,0,0.10)"
-
-    st.markdown(
-        f"""
-<style>
-  :root {{
-    --rgm-bg: {bg};
-    --rgm-text: {text};
-    --rgm-sidebar-bg: {sidebar_bg};
-    --rgm-card-bg: {card_bg};
-    --rgm-border: {border};
-
-    --rgm-footer-bg: {("#0e1117" if dark else "#ffffff")};
-
-    --rgm-logo-bg: {("rgba(255,255,255,0.95)" if dark else "#ffffff")};
-    --rgm-logo-border: {("rgba(255,255,255,0.14)" if dark else "rgba(0,0,0,0.10)")};
-    --rgm-logo-shadow: {("0 6px 18px rgba(0,0,0,0.35)" if dark else "0 6px 18px rgba(0,0,0,0.20)")};
-
-    --tu-green: {TU_GREEN};
-    --tu-orange: {TU_ORANGE};
-
-    --rgm-pipe-inactive: {pipe_inactive};
-  }}
-
-  div[data-testid="stAppViewContainer"] {{
-    background: var(--rgm-bg) !important;
-    color: var(--rgm-text) !important;
-  }}
-  header[data-testid="stHeader"] {{
-    background: transparent !important;
-  }}
-  section[data-testid="stMain"] {{
-    background: var(--rgm-bg) !important;
-  }}
-
-  section[data-testid="stSidebar"] {{
-    background: var(--rgm-sidebar-bg) !important;
-    border-right: 1px solid var(--rgm-border) !important;
-  }}
-  section[data-testid="stSidebar"] > div {{
-    background: var(--rgm-sidebar-bg) !important;
-  }}
-
-  html, body,
-  .stMarkdown, .stText, p, li, span, label,
-  div[data-testid="stCaptionContainer"],
-  div[data-testid="stMarkdownContainer"] {{
-    color: var(--rgm-text) !important;
-  }}
-
-  hr {{
-    border-color: var(--rgm-border) !important;
-  }}
-
-  a {{
-    color: var(--tu-green) !important;
-  }}
-
-  div[data-baseweb="input"] input,
-  div[data-baseweb="textarea"] textarea,
-  div[data-baseweb="select"] > div {{
-    background-color: var(--rgm-card-bg) !important;
-    color: var(--rgm-text) !important;
-    border-color: var(--rgm-border) !important;
-  }}
-
-  div[data-baseweb="select"] svg {{
-    color: var(--rgm-text) !important;
-  }}
-
-  div[role="radiogroup"] label,
-  div[data-testid="stSidebar"] label {{
-    color: var(--rgm-text) !important;
-  }}
-
-  div[data-baseweb="popover"] div[data-baseweb="menu"],
-  div[data-baseweb="popover"] ul {{
-    background: var(--rgm-card-bg) !important;
-    border: 1px solid var(--rgm-border) !important;
-    box-shadow: 0 12px 28px rgba(0,0,0,0.35) !important;
-  }}
-
-  div[data-baseweb="popover"] div[role="option"],
-  div[data-baseweb="popover"] div[role="option"] *,
-  div[data-baseweb="popover"] li,
-  div[data-baseweb="popover"] li * {{
-    color: var(--rgm-text) !important;
-  }}
-
-  div[data-baseweb="popover"] div[role="option"]:hover,
-  div[data-baseweb="popover"] li:hover {{
-    background: rgba(202,116,6,0.18) !important;
-  }}
-
-  div[data-baseweb="popover"] div[role="option"][aria-selected="true"],
-  div[data-baseweb="popover"] li[aria-selected="true"] {{
-    background: rgba(99,154,0,0.18) !important;
-  }}
-
-  div[data-baseweb="popover"] > div {{
-    background: var(--rgm-card-bg) !important;
-    color: var(--rgm-text) !important;
-    border: 1px solid var(--rgm-border) !important;
-    border-radius: 12px !important;
-    overflow: hidden !important;
-  }}
-
-  div[data-baseweb="popover"] ul[role="listbox"],
-  div[data-baseweb="popover"] div[role="listbox"],
-  div[data-baseweb="menu"] {{
-    background: var(--rgm-card-bg) !important;
-    color: var(--rgm-text) !important;
-  }}
-
-  div[data-baseweb="popover"] li[role="option"],
-  div[data-baseweb="menu"] li {{
-    background: transparent !important;
-    color: var(--rgm-text) !important;
-  }}
-
-  div[data-baseweb="popover"] li[role="option"]:hover,
-  div[data-baseweb="menu"] li:hover {{
-    background: {pop_hover} !important;
-  }}
-
-  div[data-baseweb="popover"] li[aria-selected="true"],
-  div[data-baseweb="menu"] li[aria-selected="true"] {{
-    background: {pop_sel} !important;
-  }}
-
-  .rgm-sidebar-logo {{
-    width: 100%;
-    display: flex;
-    align-items: center;
-    justify-content: center;
-
-    background: var(--rgm-logo-bg);
-    border: 1px solid var(--rgm-logo-border);
-    border-radius: 14px;
-    padding: 10px 14px;
-    box-shadow: var(--rgm-logo-shadow);
-
-    text-decoration: none;
-    color: inherit;
-    margin: 4px 0 14px 0;
-  }}
-  .rgm-sidebar-logo:hover {{
-    opacity: 0.94;
-  }}
-  .rgm-sidebar-logo img {{
-    height: 64px;
-    width: auto;
-    max-width: 100%;
-    object-fit: contain;
-    display: block;
-  }}
-
-  .stApp button[kind="primary"],
-  .stApp button[data-testid="baseButton-primary"] {{
-    background: var(--tu-green) !important;
-    border: 1px solid var(--tu-green) !important;
-    color: #ffffff !important;
-    border-radius: 10px !important;
-    font-weight: 650 !important;
-    opacity: 1 !important;
-  }}
-
-  .stApp button[kind="secondary"],
-  .stApp button[data-testid="baseButton-secondary"] {{
-    background: {btn2_bg} !important;
-    border: 1px solid var(--rgm-border) !important;
-    color: {btn2_text} !important;
-    border-radius: 10px !important;
-    font-weight: 650 !important;
-    opacity: 1 !important;
-  }}
-
-  .stApp div.stButton > button *,
-  .stApp button[data-testid^="baseButton-"] * {{
-    color: inherit !important;
-  }}
-
-  .stApp div.stButton > button:not(:disabled):hover,
-  .stApp button[data-testid^="baseButton-"]:not(:disabled):hover,
-  .stApp div[data-testid="stFormSubmitButton"] button:not(:disabled):hover,
-  .stApp div[data-testid="stDownloadButton"] button:not(:disabled):hover,
-  .stApp div[data-testid="stFileUploader"] [data-baseweb="button"] button:not(:disabled):hover {{
-    background: var(--tu-orange) !important;
-    background-color: var(--tu-orange) !important;
-    background-image: none !important;
-    border-color: var(--tu-orange) !important;
-    color: #ffffff !important;
-    opacity: 1 !important;
-  }}
-
-  .stApp div.stButton > button:not(:disabled):hover *,
-  .stApp button[data-testid^="baseButton-"]:not(:disabled):hover *,
-  .stApp div[data-testid="stFormSubmitButton"] button:not(:disabled):hover *,
-  .stApp div[data-testid="stDownloadButton"] button:not(:disabled):hover *,
-  .stApp div[data-testid="stFileUploader"] [data-baseweb="button"] button:not(:disabled):hover * {{
-    color: #ffffff !important;
-    fill: currentColor !important;
-    stroke: currentColor !important;
-  }}
-
-  .stApp div.stButton > button:disabled,
-  .stApp button[data-testid^="baseButton-"]:disabled {{
-    opacity: 0.55 !important;
-    cursor: not-allowed !important;
-  }}
-
-  .stApp div.stButton > button:focus,
-  .stApp button[data-testid^="baseButton-"]:focus {{
-    outline: none !important;
-    box-shadow: 0 0 0 3px rgba(99,154,0,0.25) !important;
-  }}
-
-  .stApp div.stButton > button,
-  .stApp button[data-testid^="baseButton-"] {{
-    transition: background 120ms ease, border-color 120ms ease, color 120ms ease;
-  }}
-
-  section[data-testid="stSidebar"] div[role="radiogroup"] label {{
-    padding: 6px 10px;
-    border-radius: 10px;
-    transition: background 120ms ease, color 120ms ease;
-  }}
-  section[data-testid="stSidebar"] div[role="radiogroup"] label:hover {{
-    background: rgba(202,116,6,0.14);
-  }}
-  section[data-testid="stSidebar"] div[role="radiogroup"] label:hover span {{
-    color: var(--tu-orange) !important;
-  }}
-  section[data-testid="stSidebar"] div[role="radiogroup"] label:hover svg {{
-    color: var(--tu-orange) !important;
-  }}
-
-  div[data-testid="stAppViewContainer"] .rgm-seg {{
-    background: var(--rgm-pipe-inactive) !important;
-  }}
-  div[data-testid="stAppViewContainer"] .rgm-seg.active,
-  div[data-testid="stAppViewContainer"] .rgm-seg.filled,
-  div[data-testid="stAppViewContainer"] .rgm-seg--active,
-  div[data-testid="stAppViewContainer"] .rgm-seg--filled {{
-    background: var(--tu-green) !important;
-  }}
-
-  div[data-testid="stExpander"],
-  details[data-testid="stExpander"],
-  .stExpander {{
-    border: 1px solid var(--rgm-border) !important;
-    border-radius: 14px !important;
-    background: transparent !important;
-    overflow: hidden !important;
-  }}
-
-  div[data-testid="stExpander"] summary,
-  details[data-testid="stExpander"] summary,
-  .stExpander summary {{
-    background: var(--rgm-card-bg) !important;
-    color: var(--rgm-text) !important;
-    padding: 10px 14px !important;
-    border-radius: 14px !important;
-  }}
-
-  div[data-testid="stExpander"] summary *,
-  details[data-testid="stExpander"] summary *,
-  .stExpander summary * {{
-    color: var(--rgm-text) !important;
-  }}
-
-  div[data-testid="stExpander"] summary svg,
-  details[data-testid="stExpander"] summary svg,
-  .stExpander summary svg {{
-    color: var(--rgm-text) !important;
-    fill: currentColor !important;
-  }}
-
-  div[data-testid="stExpander"] summary:hover,
-  details[data-testid="stExpander"] summary:hover,
-  .stExpander summary:hover {{
-    box-shadow: 0 0 0 2px rgba(202,116,6,0.28) !important;
-  }}
-
-  div[data-testid="stExpander"] .streamlit-expanderContent,
-  details[data-testid="stExpander"] .streamlit-expanderContent,
-  .stExpander .streamlit-expanderContent,
-  div[data-testid="stExpander"] > div,
-  details[data-testid="stExpander"] > div {{
-    background: var(--rgm-card-bg) !important;
-    color: var(--rgm-text) !important;
-    padding: 12px 14px 14px 14px !important;
-  }}
-
-  div[data-testid="stExpander"] div[role="region"],
-  details[data-testid="stExpander"] div[role="region"],
-  .stExpander div[role="region"] {{
-    background: transparent !important;
-  }}
-</style>
-        """,
-        unsafe_allow_html=True,
-    )
+    # Loader (Höhe 0) in der Sidebar, damit der Hauptbereich beim Theme-Wechsel nicht springt
+    with st.sidebar:
+        theme.inject_global_css(dark)
 
 
 def load_page_module(filename: str, module_name: str):
@@ -691,6 +377,9 @@ def _apply_query_navigation(aid: str) -> None:
 
 
 def main() -> None:
+    # Kompiliertes Modell nachbauen, falls das Deployment keins mitbringt (einmal je Prozess)
+    ensure_compiled_model()
+
     init_session_state()
     init_language_state()
 
@@ -785,6 +474,7 @@ def main() -> None:
 
     # Snapshot am Ende
     persist.save(aid)
+    theme.mark_global_css_delivered()
 
 
 if __name__ == "__main__":
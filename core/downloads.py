@@ -0,0 +1,104 @@
+# core/downloads.py
+from __future__ import annotations
+
+import base64
+import hashlib
+import pickle
+from typing import Any, Callable
+
+import pandas as pd
+import streamlit as st
+
+from core.exporter import make_csv_bytes
+from core.i18n import t
+
+
+# Session-Key-Präfix für vorbereitete Download-Payloads: (fingerprint, bytes)
+_PAYLOAD_PREFIX = "_rgm_dl_"
+
+
+def state_fingerprint(*parts: Any) -> str:
+    """
+    Kurzer Fingerabdruck beliebiger (picklebarer) Zustandsteile.
+    Deutlich billiger als das Serialisieren des eigentlichen Payloads.
+    """
+    try:
+        raw = pickle.dumps(parts, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        raw = repr(parts).encode("utf-8", "replace")
+    return hashlib.sha1(raw).hexdigest()[:16]
+
+
+def deferred_download_button(
+    label: str,
+    build: Callable[[], bytes],
+    *,
+    fingerprint: str,
+    file_name: str,
+    mime: str,
+    key: str,
+    prepare_label: str | None = None,
+    use_container_width: bool = True,
+    disabled: bool = False,
+) -> None:
+    """
+    Download-Button, dessen Payload erst auf Klick erzeugt wird.
+
+    - Solange kein passender Payload vorbereitet ist, wird ein "Vorbereiten"-Button gezeigt;
+      beim Klick wird build() einmal ausgeführt und im selben Lauf durch den
+      eigentlichen Download-Button ersetzt.
+    - Der Payload wird pro Session unter dem Fingerabdruck gemerkt; ändert sich der
+      Zustand, ist wieder ein Klick zum Vorbereiten nötig.
+    """
+    cache_key = f"{_PAYLOAD_PREFIX}{key}"
+    slot = st.empty()
+
+    if disabled:
+        slot.button(label, disabled=True, use_container_width=use_container_width, key=f"{key}__disabled")
+        return
+
+    cached = st.session_state.get(cache_key)
+    if not (isinstance(cached, tuple) and cached[0] == fingerprint):
+        clicked = slot.button(
+            prepare_label or t("common.prepare_download").format(label=label),
+            use_container_width=use_container_width,
+            key=f"{key}__prepare",
+        )
+        if not clicked:
+            return
+        cached = (fingerprint, build())
+        st.session_state[cache_key] = cached
+
+    slot.download_button(
+        label,
+        data=cached[1],
+        file_name=file_name,
+        mime=mime,
+        key=key,
+        on_click="ignore",
+        use_container_width=use_container_width,
+    )
+
+
+def csv_data_href(df: pd.DataFrame, key: str) -> str:
+    """
+    data:-URL für CSV-Downloads in HTML-Toolbars (Dashboard, Gesamtübersicht).
+
+    Der Link muss im HTML stehen, kann also nicht erst auf Klick entstehen; er wird
+    aber pro Session unter einem Fingerabdruck des Tabelleninhalts gemerkt, sodass
+    Reruns ohne Änderung weder CSV noch Base64 neu erzeugen. (st.cache_data wäre hier
+    teurer als die Serialisierung selbst, weil es den DataFrame vollständig hasht.)
+    """
+    if df is None:
+        df = pd.DataFrame()
+
+    cache_key = f"{_PAYLOAD_PREFIX}{key}"
+    fingerprint = state_fingerprint([str(c) for c in df.columns], df.to_numpy().tolist())
+    cached = st.session_state.get(cache_key)
+    if isinstance(cached, tuple) and cached[0] == fingerprint:
+        return cached[1]
+
+    csv_b64 = base64.b64encode(make_csv_bytes(df)).decode("utf-8")
+    href = f"data:text/csv;charset=utf-8;base64,{csv_b64}"
+    st.session_state[cache_key] = (fingerprint, href)
+    return href
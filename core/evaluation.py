@@ -13,28 +13,13 @@ from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image as RLImage, PageBreak
 
+from core.overview import code_sort_key
+from core.scoring import LEGACY_PROFILE, ScoringProfile, compile_model, score_model
 
-# --------- Scoring (an dein ANSWER_OPTIONS angelehnt) ----------
-ANSWER_TO_SCORE = {
-    "Nicht anwendbar": None,
-    "Gar nicht": 0.0,
-    "In ein paar Fällen": 0.25,
-    "In den meisten Fällen": 0.75,
-    "Vollständig": 1.0,
-}
-
-
-def _code_sort_key(code: str):
-    import re
-    c = (code or "").strip()
-    m = re.match(r"^([A-Za-z]+)(\d+)(?:\.(\d+))?$", c)
-    if not m:
-        return (99, c, 999, 999)
-    prefix = m.group(1).upper()
-    major = int(m.group(2))
-    minor = int(m.group(3) or 0)
-    prefix_order = {"TD": 0, "OG": 1}.get(prefix, 50)
-    return (prefix_order, prefix, major, minor)
+
+# --------- Scoring: gemeinsamer Kernel aus core.scoring ----------
+# Alte Skala ("In ein paar Fällen" = 0.25), bleibt für Vergleiche abrufbar
+ANSWER_TO_SCORE = dict(LEGACY_PROFILE.answer_scores)
 
 
 def compute_results_df(
@@ -44,26 +29,32 @@ def compute_results_df(
     global_target_level: float,
     dimension_targets: Dict[str, float],
     priorities: Dict[str, Any] | None = None,
+    profile: ScoringProfile | str | None = None,
 ) -> pd.DataFrame:
     """
     Erzeugt Ergebnis-Tabelle:
     code, name, category, ist_level, target_level, gap, priority, action, timeframe
 
-    IST-Logik (robust + simpel):
+    IST-Logik: derselbe Kernel wie in der UI (core.scoring, Gating + Abrunden auf 0.25).
+    Mit profile="legacy" entstehen die Zahlen der alten Auswertung:
     - pro Stufe: Mittelwert der beantworteten Fragen (0..1), NA wird ignoriert
     - Dimension-Ist = Summe der Stufenscores (max 5.0)
+
+    model: JSON-Dict, typisiertes (core.model_loader.load_model) oder kompiliertes Modell.
+    Typisierte Modelle werden nur einmal kompiliert, JSON-Dicts bei jedem Aufruf.
     """
     priorities = priorities or {}
 
+    compiled = compile_model(model)
+    ist_levels = score_model(compiled, answers, profile)
+
     rows = []
-    dims = sorted(model.get("dimensions", []) or [], key=lambda d: _code_sort_key(str(d.get("code", ""))))
+    dims = sorted(compiled.dimensions, key=lambda d: code_sort_key(d.code))
 
     target_label = (meta or {}).get("target_label", "")
 
     for dim in dims:
-        code = str(dim.get("code", "")).strip()
-        name = str(dim.get("name", "")).strip()
-        cat = str(dim.get("category", "")).strip()
+        code = dim.code
 
         # Target
         if target_label == "Eigenes Ziel":
@@ -72,26 +63,7 @@ def compute_results_df(
             target = float(global_target_level)
 
         # IST
-        ist_total = 0.0
-        for lvl in dim.get("levels", []) or []:
-            qs = lvl.get("questions", []) or []
-            scores = []
-            for q in qs:
-                qid = q.get("id")
-                if not qid:
-                    continue
-                a = answers.get(qid)
-                if a not in ANSWER_TO_SCORE:
-                    continue
-                s = ANSWER_TO_SCORE[a]
-                if s is None:
-                    continue
-                scores.append(float(s))
-
-            lvl_score = float(sum(scores) / len(scores)) if scores else 0.0
-            ist_total += lvl_score
-
-        ist_total = round(ist_total, 2)
+        ist_total = ist_levels[code]
         gap = round(target - ist_total, 2)
 
         # Priorisierung / Maßnahmen (robust)
@@ -108,8 +80,8 @@ def compute_results_df(
         rows.append(
             {
                 "code": code,
-                "name": name,
-                "category": cat,
+                "name": dim.name,
+                "category": dim.category,
                 "ist_level": ist_total,
                 "target_level": round(target, 2),
                 "gap": gap,
@@ -124,7 +96,7 @@ def compute_results_df(
 
 def _radar_data(df: pd.DataFrame, category: str) -> Tuple[List[str], List[float], List[float]]:
     sub = df[df["category"] == category].copy()
-    sub = sub.sort_values("code", key=lambda s: s.map(_code_sort_key))
+    sub = sub.sort_values("code", key=lambda s: s.map(code_sort_key))
     labels = sub["code"].tolist()
     ist = sub["ist_level"].astype(float).tolist()
     tgt = sub["target_level"].astype(float).tolist()
@@ -245,7 +217,7 @@ def build_results_pdf(
 
     # Tabelle: lange Texte als Paragraph
     df2 = df.copy()
-    df2 = df2.sort_values("code", key=lambda s: s.map(_code_sort_key))
+    df2 = df2.sort_values("code", key=lambda s: s.map(code_sort_key))
 
     headers = ["code", "name", "category", "ist_level", "target_level", "gap", "priority", "action", "timeframe"]
     data = [headers]
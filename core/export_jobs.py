@@ -0,0 +1,330 @@
+# core/export_jobs.py
+from __future__ import annotations
+
+import io
+import threading
+import time
+import uuid
+import zipfile
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from core.export_pool import current_session_id, submit_pdf_export, submit_radar_png
+
+
+# Fertige Ergebnisse bleiben so lange abrufbar (Sekunden)
+RESULT_TTL_S = 15 * 60
+# Höchstens so viele Jobs je Session behalten (älteste fliegen zuerst)
+MAX_JOBS_PER_SESSION = 6
+# So lange wartet ein Job höchstens auf den Worker-Prozess (je Stufe); danach Fehler statt Hänger
+EXPORT_TIMEOUT_S = 120.0
+
+JOB_KINDS = ("pdf", "csv", "zip")
+
+# Stufen je Job-Art, mit Fortschritt beim Betreten der Stufe
+_STAGES: Dict[str, List[tuple[str, float]]] = {
+    "pdf": [("charts", 0.05), ("layout", 0.45)],
+    "csv": [("tables", 0.10)],
+    "zip": [("charts", 0.05), ("tables", 0.35), ("layout", 0.45), ("bundle", 0.90)],
+}
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "queued", "running", "done", "failed", "cancelled"
+
+
+@dataclass
+class ExportInputs:
+    """
+    Eingaben eines Exports (nur picklebare Daten; Figures werden im Pool als JSON übergeben).
+    """
+    meta: dict
+    df_raw: pd.DataFrame
+    df_report: Optional[pd.DataFrame] = None
+    df_measures: Optional[pd.DataFrame] = None
+    fig_td: Any = None
+    fig_og: Any = None
+    dark: bool = False
+    language: str = "de"
+    file_stem: str = "export"
+    # Zusätzliche Dateien für ZIP-Bundles: Dateiname -> Bytes
+    extra_files: Dict[str, bytes] = field(default_factory=dict)
+
+
+@dataclass
+class ExportJob:
+    job_id: str
+    kind: str
+    session_id: Optional[str]
+    fingerprint: str
+    status: str = QUEUED
+    stage: str = ""
+    progress: float = 0.0
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    file_name: str = ""
+    mime: str = ""
+    error: str = ""
+    result: Optional[bytes] = field(default=None, repr=False)
+
+    @property
+    def pending(self) -> bool:
+        return self.status in (QUEUED, RUNNING)
+
+    @property
+    def expires_at(self) -> Optional[float]:
+        return None if self.finished_at is None else self.finished_at + RESULT_TTL_S
+
+
+class ExportJobQueue:
+    """
+    Lokale Job-Queue für Exporte (PDF, CSV, ZIP) mit Job-IDs, Status-Polling,
+    Fortschrittsstufen und befristeter Aufbewahrung der Ergebnisse.
+
+    Koordiniert wird in Threads (die fast nur auf den Prozess-Pool warten);
+    die CPU-lastigen Schritte laufen über core.export_pool im Worker-Prozess.
+    """
+
+    def __init__(self, max_threads: int = 2) -> None:
+        self._threads = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix="rgm-export-job")
+        self._jobs: Dict[str, ExportJob] = {}
+        self._lock = threading.Lock()
+
+    # --- Verwaltung ---
+    def submit(
+        self,
+        kind: str,
+        inputs: ExportInputs,
+        *,
+        fingerprint: str = "",
+        session_id: Optional[str] = None,
+    ) -> str:
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unbekannte Export-Art: {kind!r}")
+
+        self.purge_expired()
+        job = ExportJob(job_id=uuid.uuid4().hex, kind=kind, session_id=session_id, fingerprint=fingerprint)
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._trim_session(session_id)
+        self._threads.submit(self._run, job.job_id, inputs)
+        return job.job_id
+
+    def status(self, job_id: str) -> Optional[ExportJob]:
+        """
+        Momentaufnahme eines Jobs (ohne Ergebnis-Bytes); None wenn unbekannt oder abgelaufen.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return None if job is None else replace(job, result=None)
+
+    def result(self, job_id: str) -> Optional[bytes]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.result if job is not None and job.status == DONE else None
+
+    def find(self, session_id: Optional[str], kind: str, fingerprint: str) -> Optional[ExportJob]:
+        """
+        Letzter passender, noch gültiger Job einer Session (laufend oder fertig).
+        """
+        with self._lock:
+            for job in sorted(self._jobs.values(), key=lambda j: j.created_at, reverse=True):
+                if (
+                    job.session_id == session_id
+                    and job.kind == kind
+                    and job.fingerprint == fingerprint
+                    and job.status in (QUEUED, RUNNING, DONE)
+                ):
+                    return replace(job, result=None)
+        return None
+
+    def cancel(self, job_id: str) -> None:
+        self._update(job_id, status=CANCELLED, finished_at=time.time())
+
+    def purge_expired(self, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        with self._lock:
+            expired = [
+                job_id
+                for job_id, job in self._jobs.items()
+                if job.expires_at is not None and job.expires_at <= now
+            ]
+            for job_id in expired:
+                self._jobs.pop(job_id, None)
+        return len(expired)
+
+    def _trim_session(self, session_id: Optional[str]) -> None:
+        own = sorted(
+            (j for j in self._jobs.values() if j.session_id == session_id and not j.pending),
+            key=lambda j: j.created_at,
+        )
+        for job in own[: max(0, len(own) - MAX_JOBS_PER_SESSION)]:
+            self._jobs.pop(job.job_id, None)
+
+    def _update(self, job_id: str, **changes: Any) -> bool:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status == CANCELLED:
+                return False
+            for key, value in changes.items():
+                setattr(job, key, value)
+            return True
+
+    def _stage(self, job_id: str, kind: str, stage: str) -> None:
+        progress = dict(_STAGES[kind]).get(stage, 0.0)
+        if not self._update(job_id, status=RUNNING, stage=stage, progress=progress):
+            raise CancelledError()
+
+    # --- Ausführung ---
+    def _run(self, job_id: str, inputs: ExportInputs) -> None:
+        job = self.status(job_id)
+        if job is None:
+            return
+        kind = job.kind
+        try:
+            builder = _BUILDERS[kind]
+            data, file_name, mime = builder(
+                inputs, lambda stage: self._stage(job_id, kind, stage), job.session_id
+            )
+            self._update(
+                job_id,
+                status=DONE,
+                stage="done",
+                progress=1.0,
+                result=data,
+                file_name=file_name,
+                mime=mime,
+                finished_at=time.time(),
+            )
+        except CancelledError:
+            self._update(job_id, status=CANCELLED, finished_at=time.time())
+        except Exception as e:
+            self._update(
+                job_id, status=FAILED, stage="error", error=f"{type(e).__name__}: {e}", finished_at=time.time()
+            )
+
+
+# -----------------------------
+# Builder je Export-Art
+# -----------------------------
+StageFn = Callable[[str], None]
+Builder = Callable[[ExportInputs, StageFn, Optional[str]], tuple[bytes, str, str]]
+
+
+def _await(fut: Future, deadline: float) -> Any:
+    """
+    Ergebnis eines Pool-Jobs, höchstens bis deadline (time.monotonic()). Bei Zeitüberschreitung
+    wird der Job abgebrochen und TimeoutError geworfen; der Koordinations-Thread wird wieder frei.
+    """
+    try:
+        return fut.result(timeout=max(0.0, deadline - time.monotonic()))
+    except TimeoutError:
+        fut.cancel()
+        raise TimeoutError(f"Export nach {EXPORT_TIMEOUT_S:g} s abgebrochen (Worker antwortet nicht).") from None
+
+
+def _render_charts(inputs: ExportInputs, session_id: Optional[str]) -> Dict[str, bytes]:
+    # Füllt nebenbei den PNG-Cache des Exporters, den das PDF-Layout danach trifft
+    futures = {
+        name: submit_radar_png(fig, dark_export=inputs.dark, session_id=session_id)
+        for name, fig in (("radar_td.png", inputs.fig_td), ("radar_og.png", inputs.fig_og))
+        if fig is not None
+    }
+    charts: Dict[str, bytes] = {}
+    deadline = time.monotonic() + EXPORT_TIMEOUT_S
+    for name, fut in futures.items():
+        try:
+            charts[name] = _await(fut, deadline)
+        except (CancelledError, TimeoutError):
+            raise
+        except Exception:
+            # Ohne Kaleido/Chrome: PDF entsteht trotzdem (ohne Radar), wie bisher
+            pass
+    return charts
+
+
+def _render_pdf(inputs: ExportInputs, session_id: Optional[str]) -> bytes:
+    fut = submit_pdf_export(
+        meta=inputs.meta,
+        df_raw=inputs.df_raw,
+        df_report=inputs.df_report,
+        df_measures=inputs.df_measures,
+        fig_td=inputs.fig_td,
+        fig_og=inputs.fig_og,
+        dark=inputs.dark,
+        language=inputs.language,
+        session_id=session_id,
+    )
+    return _await(fut, time.monotonic() + EXPORT_TIMEOUT_S)
+
+
+def _render_csv(inputs: ExportInputs) -> bytes:
+    from core.exporter import make_csv_bytes
+
+    df = inputs.df_measures if inputs.df_measures is not None and not inputs.df_measures.empty else inputs.df_report
+    return make_csv_bytes(df if df is not None else inputs.df_raw)
+
+
+def _build_pdf(inputs: ExportInputs, stage: StageFn, session_id: Optional[str]) -> tuple[bytes, str, str]:
+    stage("charts")
+    _render_charts(inputs, session_id)
+    stage("layout")
+    return _render_pdf(inputs, session_id), f"{inputs.file_stem}.pdf", "application/pdf"
+
+
+def _build_csv(inputs: ExportInputs, stage: StageFn, session_id: Optional[str]) -> tuple[bytes, str, str]:
+    stage("tables")
+    return _render_csv(inputs), f"{inputs.file_stem}.csv", "text/csv"
+
+
+def _build_zip(inputs: ExportInputs, stage: StageFn, session_id: Optional[str]) -> tuple[bytes, str, str]:
+    stage("charts")
+    charts = _render_charts(inputs, session_id)
+    stage("tables")
+    csv_bytes = _render_csv(inputs)
+    stage("layout")
+    pdf_bytes = _render_pdf(inputs, session_id)
+    stage("bundle")
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(f"{inputs.file_stem}.pdf", pdf_bytes)
+        zf.writestr(f"{inputs.file_stem}.csv", csv_bytes)
+        for name, data in charts.items():
+            zf.writestr(name, data)
+        for name, data in (inputs.extra_files or {}).items():
+            zf.writestr(name, data)
+    return buf.getvalue(), f"{inputs.file_stem}.zip", "application/zip"
+
+
+_BUILDERS: Dict[str, Builder] = {
+    "pdf": _build_pdf,
+    "csv": _build_csv,
+    "zip": _build_zip,
+}
+
+
+_QUEUE: Optional[ExportJobQueue] = None
+_QUEUE_LOCK = threading.Lock()
+
+
+def get_export_queue() -> ExportJobQueue:
+    global _QUEUE
+    with _QUEUE_LOCK:
+        if _QUEUE is None:
+            _QUEUE = ExportJobQueue()
+        return _QUEUE
+
+
+def ensure_export_job(kind: str, inputs: ExportInputs, fingerprint: str) -> str:
+    """
+    Liefert den Job dieser Session für genau diesen Zustand (fingerprint); startet
+    nur dann einen neuen, wenn es noch keinen laufenden/fertigen gibt.
+    """
+    queue = get_export_queue()
+    session_id = current_session_id()
+    existing = queue.find(session_id, kind, fingerprint)
+    if existing is not None:
+        return existing.job_id
+    return queue.submit(kind, inputs, fingerprint=fingerprint, session_id=session_id)
@@ -0,0 +1,382 @@
+# core/export_pool.py
+from __future__ import annotations
+
+import multiprocessing
+import multiprocessing.context
+import os
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Iterator, Optional
+
+import pandas as pd
+
+
+# Anzahl Worker-Prozesse; 0 = Exporte laufen wie bisher im Session-Thread
+_WORKERS_ENV = "RGM_EXPORT_WORKERS"
+# Wie oft nach verwaisten Sessions geschaut wird (Sekunden)
+_REAP_INTERVAL_S = 5.0
+# Obergrenze, wie lange eine Session synchron auf einen Export wartet
+_DEFAULT_TIMEOUT_S = 120.0
+
+
+def _configured_workers() -> int:
+    raw = os.environ.get(_WORKERS_ENV, "").strip()
+    if raw:
+        try:
+            return max(0, int(raw))
+        except ValueError:
+            pass
+    return max(1, min(2, (os.cpu_count() or 1) - 1))
+
+
+# Prozessname der Export-Worker (Präfix); nur diese Prozesse starten ohne Hauptmodul
+_WORKER_NAME = "rgm-export-worker"
+
+
+class _ExportSpawnProcess(multiprocessing.context.SpawnProcess):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.name = f"{_WORKER_NAME}-{self.name}"
+
+
+if "forkserver" in multiprocessing.get_all_start_methods():
+
+    class _ExportForkServerProcess(multiprocessing.context.ForkServerProcess):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            super().__init__(*args, **kwargs)
+            self.name = f"{_WORKER_NAME}-{self.name}"
+
+
+_PREPARATION_LOCK = threading.Lock()
+_PREPARATION_USERS = 0
+
+
+@contextmanager
+def _worker_preparation() -> Iterator[None]:
+    """
+    spawn/forkserver geben neuen Prozessen sys.modules["__main__"] als Hauptmodul mit; unter
+    Streamlit ist das die laufende App (inkl. __file__), die jeder Worker sonst erneut ausführen
+    würde. Für Export-Worker (erkannt am Prozessnamen) entfällt das Hauptmodul.
+
+    Die Standardbibliothek bietet dafür keinen öffentlichen Haken (ein initializer läuft erst nach
+    dem Import des Hauptmoduls, der Forkserver-Preload lädt es nur mit "__main__" in der Liste).
+    Deshalb wird spawn.get_preparation_data nur umhüllt, solange dieses Modul Worker startet
+    (Aufrufe von pool.submit), und danach wiederhergestellt; Prozesse anderer Pools bleiben auch
+    in diesem Fenster unverändert, weil nur Namen mit _WORKER_NAME angepasst werden.
+    """
+    from multiprocessing import spawn
+
+    global _PREPARATION_USERS
+    with _PREPARATION_LOCK:
+        if _PREPARATION_USERS == 0:
+            original = spawn.get_preparation_data
+
+            def get_preparation_data(name: str) -> dict:
+                data = original(name)
+                if str(name).startswith(_WORKER_NAME):
+                    data.pop("init_main_from_path", None)
+                    data.pop("init_main_from_name", None)
+                return data
+
+            get_preparation_data._rgm_original = original  # type: ignore[attr-defined]
+            spawn.get_preparation_data = get_preparation_data
+        _PREPARATION_USERS += 1
+    try:
+        yield
+    finally:
+        with _PREPARATION_LOCK:
+            _PREPARATION_USERS -= 1
+            installed = spawn.get_preparation_data
+            # Nur die eigene Hülle entfernen; hat jemand darüber gepatcht, bleibt dessen Version
+            if _PREPARATION_USERS == 0 and hasattr(installed, "_rgm_original"):
+                spawn.get_preparation_data = installed._rgm_original
+
+
+def _submit(pool: ProcessPoolExecutor, fn: Callable[..., Any], *args: Any) -> Future:
+    # ProcessPoolExecutor startet fehlende Worker (spawn/forkserver) im submit()-Aufruf
+    with _worker_preparation():
+        return pool.submit(fn, *args)
+
+
+def _mp_context():
+    """
+    forkserver (POSIX): Worker entstehen aus einem schlanken Server-Prozess statt per fork()
+    aus dem mehrthreadigen Streamlit-Server. Sonst spawn. Gestartet werden _Export*Process.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.context.ForkServerContext()
+        ctx.set_forkserver_preload(["core.exporter"])
+        ctx.Process = _ExportForkServerProcess  # type: ignore[misc]
+        return ctx
+    ctx = multiprocessing.context.SpawnContext()
+    ctx.Process = _ExportSpawnProcess  # type: ignore[misc]
+    return ctx
+
+
+def _noop() -> None:
+    return None
+
+
+def _worker_init() -> None:
+    # Schwere Importe (ReportLab, Plotly, pandas) einmal pro Worker statt pro Job
+    import core.exporter  # noqa: F401
+
+
+# -----------------------------
+# Jobs (laufen im Worker-Prozess; nur picklebare Ein-/Ausgaben)
+# -----------------------------
+def _figure_from_json(fig_json: Optional[str]):
+    if not fig_json:
+        return None
+    import plotly.io as pio
+
+    return pio.from_json(fig_json)
+
+
+def _pdf_job(
+    meta: dict,
+    df_raw: pd.DataFrame,
+    df_report: Optional[pd.DataFrame],
+    df_measures: Optional[pd.DataFrame],
+    fig_td_json: Optional[str],
+    fig_og_json: Optional[str],
+    dark: bool,
+    language: str,
+) -> bytes:
+    from core.exporter import make_pdf_bytes
+    from core.i18n import language_override
+
+    with language_override(language):
+        return make_pdf_bytes(
+            meta=meta,
+            df_raw=df_raw,
+            df_report=df_report,
+            df_measures=df_measures,
+            fig_td=_figure_from_json(fig_td_json),
+            fig_og=_figure_from_json(fig_og_json),
+            dark=dark,
+        )
+
+
+def _radar_png_job(fig_json: str, dark_export: bool) -> bytes:
+    from core.exporter import _plotly_fig_to_png_bytes
+
+    png, err = _plotly_fig_to_png_bytes(_figure_from_json(fig_json), dark_export=dark_export)
+    if png is None:
+        raise RuntimeError(err or "PNG export failed")
+    return png
+
+
+# -----------------------------
+# Executor
+# -----------------------------
+class ExportExecutor:
+    """
+    Prozess-Pool für CPU-lastige Exporte (ReportLab-Layout, Plotly -> PNG).
+
+    Der aufrufende Session-Thread wartet nur auf das Future und gibt dabei den GIL frei,
+    sodass andere Sessions desselben Streamlit-Prozesses weiter bedient werden.
+    Jobs werden pro Session registriert; verschwindet die Session, werden ihre noch
+    wartenden Jobs abgebrochen (laufende Jobs werden zu Ende gerechnet und verworfen).
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        self.max_workers = _configured_workers() if max_workers is None else max(0, int(max_workers))
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._jobs: dict[str, set[Future]] = {}
+        self._reaper: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_workers > 0
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=_mp_context(),
+                    initializer=_worker_init,
+                )
+                # Worker vorab starten, damit der erste Export nicht auf ReportLab-Importe wartet
+                for _ in range(self.max_workers):
+                    _submit(pool, _noop)
+                self._pool = pool
+            if self._reaper is None:
+                self._reaper = threading.Thread(target=self._reap_loop, name="rgm-export-reaper", daemon=True)
+                self._reaper.start()
+            return self._pool
+
+    def submit(self, fn: Callable[..., Any], *args: Any, session_id: Optional[str] = None) -> Future:
+        """
+        Startet fn(*args) im Pool. Ohne Pool (0 Worker) wird sofort im Aufrufer gerechnet.
+        """
+        if not self.enabled:
+            fut: Future = Future()
+            try:
+                fut.set_result(fn(*args))
+            except Exception as e:
+                fut.set_exception(e)
+            return fut
+
+        try:
+            fut = _submit(self._ensure_pool(), fn, *args)
+        except BrokenProcessPool:
+            # Kaputten Pool erst abbauen (Queues, Manager-Thread), dann neu starten
+            with self._lock:
+                broken, self._pool = self._pool, None
+            if broken is not None:
+                broken.shutdown(wait=False, cancel_futures=True)
+            fut = _submit(self._ensure_pool(), fn, *args)
+
+        if session_id:
+            with self._lock:
+                self._jobs.setdefault(session_id, set()).add(fut)
+            fut.add_done_callback(lambda f, sid=session_id: self._forget(sid, f))
+        return fut
+
+    def _forget(self, session_id: str, fut: Future) -> None:
+        with self._lock:
+            jobs = self._jobs.get(session_id)
+            if jobs is not None:
+                jobs.discard(fut)
+                if not jobs:
+                    self._jobs.pop(session_id, None)
+
+    def cancel_session(self, session_id: str) -> int:
+        """
+        Bricht alle noch nicht gestarteten Jobs einer Session ab. Rückgabe: Anzahl abgebrochen.
+        """
+        with self._lock:
+            jobs = list(self._jobs.pop(session_id, set()))
+        return sum(1 for fut in jobs if fut.cancel())
+
+    def pending_sessions(self) -> list[str]:
+        with self._lock:
+            return list(self._jobs)
+
+    def reap_inactive_sessions(self, is_active: Optional[Callable[[str], bool]] = None) -> int:
+        """
+        Bricht Jobs von Sessions ab, die es nicht mehr gibt (Tab geschlossen, Timeout).
+        """
+        is_active = is_active or _session_is_active
+        cancelled = 0
+        for session_id in self.pending_sessions():
+            if not is_active(session_id):
+                cancelled += self.cancel_session(session_id)
+        return cancelled
+
+    def _reap_loop(self) -> None:
+        while True:
+            time.sleep(_REAP_INTERVAL_S)
+            try:
+                self.reap_inactive_sessions()
+            except Exception:
+                pass
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._jobs.clear()
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def _session_is_active(session_id: str) -> bool:
+    try:
+        from streamlit import runtime
+
+        if not runtime.exists():
+            return True
+        return bool(runtime.get_instance().is_active_session(session_id))
+    except Exception:
+        return True
+
+
+def current_session_id() -> Optional[str]:
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+        ctx = get_script_run_ctx()
+        return ctx.session_id if ctx is not None else None
+    except Exception:
+        return None
+
+
+_EXECUTOR: Optional[ExportExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_export_executor() -> ExportExecutor:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ExportExecutor()
+        return _EXECUTOR
+
+
+# -----------------------------
+# Public API (Pages)
+# -----------------------------
+def _fig_json(fig) -> Optional[str]:
+    if fig is None:
+        return None
+    return fig.to_json() if hasattr(fig, "to_json") else None
+
+
+def submit_pdf_export(
+    meta: dict,
+    df_raw: pd.DataFrame,
+    df_report: Optional[pd.DataFrame] = None,
+    df_measures: Optional[pd.DataFrame] = None,
+    fig_td=None,
+    fig_og=None,
+    dark: bool = False,
+    language: Optional[str] = None,
+    session_id: Optional[str] = None,
+) -> Future:
+    """
+    Wie core.exporter.make_pdf_bytes, aber im Worker-Prozess. Figures gehen als JSON rüber.
+    """
+    from core.i18n import get_language
+
+    return get_export_executor().submit(
+        _pdf_job,
+        dict(meta or {}),
+        df_raw,
+        df_report,
+        df_measures,
+        _fig_json(fig_td),
+        _fig_json(fig_og),
+        bool(dark),
+        language or get_language(),
+        session_id=session_id or current_session_id(),
+    )
+
+
+def submit_radar_png(fig, dark_export: bool = False, session_id: Optional[str] = None) -> Future:
+    """
+    Radar-Figure -> PNG-Bytes im Worker-Prozess (gleiches Styling/Caching wie im PDF).
+    """
+    return get_export_executor().submit(
+        _radar_png_job,
+        _fig_json(fig),
+        bool(dark_export),
+        session_id=session_id or current_session_id(),
+    )
+
+
+def make_pdf_bytes_offloaded(*args: Any, timeout: float = _DEFAULT_TIMEOUT_S, **kwargs: Any) -> bytes:
+    """
+    Synchroner Ersatz für make_pdf_bytes: rechnet im Pool, wartet GIL-frei auf das Ergebnis.
+    """
+    fut = submit_pdf_export(*args, **kwargs)
+    try:
+        return fut.result(timeout=timeout)
+    except FutureTimeout:
+        fut.cancel()
+        raise
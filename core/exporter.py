@@ -17,7 +17,7 @@ import tempfile
 
 import pandas as pd
 
-from core.i18n import get_language, priority_value_label, t as i18n_t, target_option_label
+from core.i18n import get_language, t as i18n_t, target_option_label, translator
 from core.maturity import calculate_current_maturity_averages
 
 # ReportLab (PDF)
@@ -1697,6 +1697,7 @@ def make_pdf_bytes(
 
         P_TAB = ParagraphStyle("P_TAB", parent=P, fontSize=9.2, leading=12, textColor=TEXT)
 
+        priority_value_label = translator().priority_value_label
         for _, r in d2.iterrows():
             row: list[Any] = []
             for c in cols:
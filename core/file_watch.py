@@ -0,0 +1,286 @@
+# core/file_watch.py
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+# Nur Standardbibliothek. Dateiwächter für die Datenordner: statt bei jedem Zugriff stat()
+# aufzurufen, fragen Caches einen Token ab, der sich nur ändert, wenn sich eine Datei
+# tatsächlich ändert. Linux: inotify (ctypes), sonst ein Polling-Thread.
+#
+# Backend per Umgebung: RGM_FILE_WATCH = auto (Standard) | inotify | poll | off
+# Polling-Intervall: RGM_FILE_WATCH_POLL (Sekunden, Standard 2).
+# Bei "off" (oder wenn kein Backend startet) liefert token() wie bisher mtime:size.
+
+_log = logging.getLogger(__name__)
+
+# inotify(7)
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+_WATCH_MASK = (
+    _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+    | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR
+)
+_GONE = _IN_DELETE | _IN_MOVED_FROM
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len (danach der Name)
+
+# Nach dem ersten Ereignis kurz weitersammeln: ein Deploy/Speichern ergibt eine Version
+_COALESCE_S = 0.05
+
+MISSING = "missing"
+
+
+def stat_token(path: Path) -> str:
+    try:
+        stat = path.stat()
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+    except OSError:
+        return MISSING
+
+
+def _snapshot(directory: str) -> Optional[Dict[str, Tuple[int, int]]]:
+    try:
+        with os.scandir(directory) as it:
+            result = {}
+            for entry in it:
+                try:
+                    stat = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                result[entry.name] = (stat.st_mtime_ns, stat.st_size)
+            return result
+    except OSError:
+        return None
+
+
+class FileWatcher:
+    """
+    Beobachtet Verzeichnisse (nicht rekursiv) und zählt Änderungen.
+
+    - version: steigt bei jeder Änderungsrunde (mehrere Dateien eines Speichervorgangs = eine Runde).
+    - token(pfad): Stand einer Datei bzw. eines Verzeichnisses ("v<version der letzten Änderung>",
+      "missing" für fehlende Dateien); ändert sich nur, wenn sich dort etwas ändert.
+      Pfade außerhalb der beobachteten Verzeichnisse und ein inaktiver Wächter: mtime:size.
+
+    Fehlende Verzeichnisse werden aufgenommen, sobald sie entstehen (inotify: bei der nächsten
+    Änderung im übergeordneten Ordner, Polling: im nächsten Durchlauf).
+    """
+
+    def __init__(self, directories: Iterable[Path], backend: str = "auto", poll_interval: float = 2.0) -> None:
+        self.directories: Tuple[str, ...] = tuple(dict.fromkeys(str(Path(d)) for d in directories))
+        self.poll_interval = max(0.1, float(poll_interval))
+        self.version = 0
+        self.backend = "off"
+        self._dirs: Set[str] = set(self.directories)
+        self._state: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # inotify
+        self._fd = -1
+        self._wd: Dict[int, str] = {}
+        # Polling
+        self._snapshots: Dict[str, Optional[Dict[str, Tuple[int, int]]]] = {}
+
+        wanted = (backend or "auto").strip().lower()
+        if wanted in ("auto", "inotify") and sys.platform.startswith("linux"):
+            try:
+                self._start_inotify()
+                return
+            except OSError as exc:
+                _log.info("inotify nicht verfügbar (%s), nutze Polling.", exc)
+        if wanted in ("auto", "inotify", "poll"):
+            self._start_polling()
+
+    @property
+    def active(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def token(self, path: Path) -> str:
+        key = str(path)
+        state = self._state.get(key)
+        if state is not None:
+            return state
+        if not self.active or (key not in self._dirs and os.path.dirname(key) not in self._dirs):
+            return stat_token(path)
+        with self._lock:
+            state = self._state.get(key)
+            if state is None:
+                # Erster Zugriff: Stand seit Start des Wächters
+                state = self._state[key] = "v0" if os.path.exists(key) else MISSING
+            return state
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self.backend = "off"
+
+    # --- Änderungen verbuchen ---
+    def _bump(self, changed: Dict[str, bool]) -> None:
+        # changed: Pfad -> noch vorhanden
+        if not changed:
+            return
+        with self._lock:
+            self.version += 1
+            current = f"v{self.version}"
+            for path, exists in changed.items():
+                self._state[path] = current if exists else MISSING
+                parent = os.path.dirname(path)
+                if parent in self._dirs:
+                    self._state[parent] = current
+        _log.debug("Datenstand %d: %s", self.version, ", ".join(sorted(changed)))
+
+    def _bump_all(self) -> None:
+        # Unbekannt, was sich geändert hat (z. B. inotify-Überlauf): alle bekannten Pfade neu
+        with self._lock:
+            known = list(self._state) + list(self._dirs)
+        self._bump({path: os.path.exists(path) for path in known})
+
+    # --- inotify ---
+    def _start_inotify(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._fd = fd
+        for directory in self.directories:
+            self._watch_dir(directory)
+        self.backend = "inotify"
+        self._thread = threading.Thread(target=self._inotify_loop, name="rgm-file-watch", daemon=True)
+        self._thread.start()
+
+    def _watch_dir(self, directory: str) -> bool:
+        if directory in self._wd.values():
+            return True
+        wd = self._add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            return False
+        self._wd[wd] = directory
+        return True
+
+    def _inotify_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                ready, _, _ = select.select([self._fd], [], [], 0.5)
+                if not ready:
+                    continue
+                changed: Dict[str, bool] = {}
+                overflow = False
+                while ready:
+                    overflow |= self._read_events(changed)
+                    ready, _, _ = select.select([self._fd], [], [], _COALESCE_S)
+            except (OSError, ValueError):
+                if self._stop.is_set():
+                    return
+                _log.exception("Dateiwächter (inotify) beendet.")
+                return
+            # Fehlende Verzeichnisse nachziehen (z. B. compiled/ nach dem ersten Kompilieren)
+            for directory in self.directories:
+                if directory not in self._wd.values() and os.path.isdir(directory) and self._watch_dir(directory):
+                    changed[directory] = True
+                    # Was vor dem Watch schon angelegt wurde, meldet inotify nicht mehr
+                    for name in (_snapshot(directory) or {}):
+                        changed[os.path.join(directory, name)] = True
+            if overflow:
+                self._bump_all()
+            else:
+                self._bump(changed)
+
+    def _read_events(self, changed: Dict[str, bool]) -> bool:
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return False
+        overflow = False
+        pos = 0
+        while pos + _EVENT.size <= len(data):
+            wd, mask, _cookie, length = _EVENT.unpack_from(data, pos)
+            raw_name = data[pos + _EVENT.size : pos + _EVENT.size + length].rstrip(b"\0")
+            pos += _EVENT.size + length
+            if mask & _IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            directory = self._wd.get(wd)
+            if directory is None:
+                continue
+            if mask & (_IN_IGNORED | _IN_DELETE_SELF | _IN_MOVE_SELF):
+                # Verzeichnis selbst weg: Watch verfällt, wird neu angelegt, sobald es wieder da ist
+                if mask & _IN_IGNORED:
+                    self._wd.pop(wd, None)
+                changed[directory] = os.path.isdir(directory)
+                continue
+            if raw_name:
+                changed[os.path.join(directory, os.fsdecode(raw_name))] = not (mask & _GONE)
+        return overflow
+
+    # --- Polling ---
+    def _start_polling(self) -> None:
+        self._snapshots = {d: _snapshot(d) for d in self.directories}
+        self.backend = "poll"
+        self._thread = threading.Thread(target=self._poll_loop, name="rgm-file-watch", daemon=True)
+        self._thread.start()
+
+    def _poll_loop(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            changed: Dict[str, bool] = {}
+            for directory in self.directories:
+                before = self._snapshots.get(directory)
+                after = _snapshot(directory)
+                if after == before:
+                    continue
+                self._snapshots[directory] = after
+                if before is None or after is None:
+                    changed[directory] = after is not None
+                before, after = before or {}, after or {}
+                for name in before.keys() | after.keys():
+                    if before.get(name) != after.get(name):
+                        changed[os.path.join(directory, name)] = name in after
+            self._bump(changed)
+
+
+_WATCHERS: Dict[Tuple[str, ...], FileWatcher] = {}
+_WATCHERS_LOCK = threading.Lock()
+
+
+def get_file_watcher(directories: Iterable[Path]) -> FileWatcher:
+    """
+    Prozessweiter Wächter je Verzeichnisliste (startet beim ersten Aufruf).
+    Umgebung: RGM_FILE_WATCH (auto|inotify|poll|off), RGM_FILE_WATCH_POLL (Sekunden).
+    """
+    key = tuple(str(Path(d).resolve()) for d in directories)
+    with _WATCHERS_LOCK:
+        watcher = _WATCHERS.get(key)
+        if watcher is None:
+            watcher = FileWatcher(
+                key,
+                backend=os.getenv("RGM_FILE_WATCH", "auto"),
+                poll_interval=float(os.getenv("RGM_FILE_WATCH_POLL", "2") or 2),
+            )
+            _WATCHERS[key] = watcher
+        return watcher
@@ -0,0 +1,236 @@
+# core/gating.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from core.scoring import (
+    NOT_APPLICABLE,
+    CompiledModel,
+    ScoringProfile,
+    compile_model,
+    get_scoring_profile,
+    level_is_full,
+    maturity_from_levels,
+)
+
+# Stufen-Freischaltung einer laufenden Erhebung: je Level wird gezählt, wie viele Fragen
+# welche Antwort haben. Eine Antwortänderung führt nur die Level dieser Frage nach; Sperre,
+# Fortschritt und Ist-Reifegrad lesen die Zähler (O(1) je Level). Regeln: core.scoring
+# (level_is_full, maturity_from_levels), damit Erhebung und Auswertung nicht auseinanderlaufen.
+
+
+@dataclass(frozen=True, slots=True)
+class LevelCounts:
+    total: int
+    full: int      # Antworten, die das Level allein erfüllen würden ("Vollständig")
+    na: int        # "Nicht anwendbar"
+    answered: int  # gültige Antworten (ohne unbeantwortet/unbekannt)
+
+    @property
+    def blocking(self) -> int:
+        # Alles außer erfüllt/n.a. (auch unbeantwortet) verhindert die Freischaltung
+        return self.total - self.full - self.na
+
+    @property
+    def all_na(self) -> bool:
+        return self.total > 0 and self.na == self.total
+
+
+class GatingEngine:
+    """
+    Zähler je Level über einem kompilierten Modell (Dimensionen per Code).
+
+    set_answer() bzw. sync(answers) halten die Zähler aktuell; sync vergleicht erst die ganzen
+    Antworten (dict-Vergleich in C) und bucht danach nur geänderte Fragen um. Mittelwerte
+    entstehen aus den Zählern; bei Scores, die als Binärbruch exakt sind (beide Profile),
+    stimmt das bitgenau mit core.scoring überein.
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        profile: ScoringProfile | str | None = None,
+        answers: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        self.model: CompiledModel = compile_model(model)
+        self.profile = get_scoring_profile(profile)
+        self.version = 0
+
+        # Zählerspalten: Antwortoptionen des Profils, dann unbeantwortet, unbekannt
+        options = [o for o in self.profile.answer_scores if o != NOT_APPLICABLE] + [NOT_APPLICABLE]
+        self._slot_of: Dict[str, int] = {o: i for i, o in enumerate(options)}
+        self._unanswered = len(options)
+        self._unknown = len(options) + 1
+        scores: List[Optional[float]] = [
+            None if o == NOT_APPLICABLE else self.profile.answer_scores[o] for o in options
+        ] + [self.profile.unanswered_score, self.profile.unknown_score]
+        self._scored: Tuple[Tuple[int, float], ...] = tuple((i, s) for i, s in enumerate(scores) if s is not None)
+        self._full_slots = tuple(i for i, s in self._scored if level_is_full(s, self.profile))
+        self._na_slot = self._slot_of[NOT_APPLICABLE]
+
+        # Level flach in Modellreihenfolge; _level_base[d]..[d+1] = Level der Dimension d
+        self._dim_index: Dict[str, int] = {}
+        self._level_base: List[int] = [0]
+        self._numbers: List[int] = []
+        self._totals: List[int] = []
+        self._dim_of_level: List[int] = []
+        self._levels_of: Dict[Any, List[int]] = {}
+        for d_idx, dim in enumerate(self.model.dimensions):
+            self._dim_index.setdefault(dim.code, d_idx)
+            for level in dim.levels:
+                flat = len(self._numbers)
+                self._numbers.append(level.level_number)
+                self._totals.append(len(level.question_ids))
+                self._dim_of_level.append(d_idx)
+                for q_id in level.question_ids:
+                    # IDs können mehrfach vorkommen: dann zählt jedes Vorkommen
+                    self._levels_of.setdefault(q_id, []).append(flat)
+            self._level_base.append(len(self._numbers))
+
+        width = len(options) + 2
+        self._counts: List[List[int]] = []
+        for total in self._totals:
+            row = [0] * width
+            row[self._unanswered] = total
+            self._counts.append(row)
+        self._answered_in_dim: List[int] = [0] * len(self.model.dimensions)
+        self._reached: List[Optional[int]] = [None] * len(self.model.dimensions)
+        self._slots: Dict[Any, int] = {}   # Frage -> verbuchte Zählerspalte (ohne unbeantwortet)
+        self._synced: Dict[Any, Any] = {}  # zuletzt mit sync() abgeglichene Antworten
+
+        if answers:
+            self.sync(answers)
+
+    # --- Antworten ---
+    def _slot(self, answer: Any) -> int:
+        if answer is None:
+            return self._unanswered
+        return self._slot_of.get(str(answer), self._unknown)
+
+    def set_answer(self, question_id: Any, answer: Any) -> bool:
+        """
+        Bucht eine Antwort (None = unbeantwortet) um; True, wenn sich etwas geändert hat.
+        Wer zugleich sein Antwort-Dict ändert, spart damit den Abgleich im nächsten sync().
+        """
+        if answer is None:
+            self._synced.pop(question_id, None)
+        else:
+            self._synced[question_id] = answer
+        levels = self._levels_of.get(question_id)
+        if not levels:
+            return False
+        new = self._slot(answer)
+        old = self._slots.get(question_id, self._unanswered)
+        if new == old:
+            return False
+        delta = int(new < self._unanswered) - int(old < self._unanswered)
+        for flat in levels:
+            row = self._counts[flat]
+            row[old] -= 1
+            row[new] += 1
+            d_idx = self._dim_of_level[flat]
+            self._answered_in_dim[d_idx] += delta
+            self._reached[d_idx] = None
+        if new == self._unanswered:
+            self._slots.pop(question_id, None)
+        else:
+            self._slots[question_id] = new
+        self.version += 1
+        return True
+
+    def sync(self, answers: Mapping[str, Any]) -> int:
+        """
+        Gleicht mit einem Antwort-Dict ab; Rückgabe: Anzahl umgebuchter Fragen.
+        """
+        if answers == self._synced:
+            return 0
+        changed = 0
+        for q_id in self._synced.keys() - answers.keys():
+            changed += self.set_answer(q_id, None)
+        for q_id, answer in answers.items():
+            if q_id not in self._synced or self._synced[q_id] != answer:
+                changed += self.set_answer(q_id, answer)
+        self._synced = dict(answers)
+        return changed
+
+    # --- Abfragen ---
+    def _levels(self, code: str) -> range:
+        d_idx = self._dim_index[code]
+        return range(self._level_base[d_idx], self._level_base[d_idx + 1])
+
+    def level_count(self, code: str) -> int:
+        return len(self._levels(code))
+
+    def level_counts(self, code: str, level_index: int) -> LevelCounts:
+        flat = self._levels(code)[level_index]
+        row = self._counts[flat]
+        total = self._totals[flat]
+        return LevelCounts(
+            total=total,
+            full=sum(row[i] for i in self._full_slots),
+            na=row[self._na_slot],
+            answered=total - row[self._unanswered] - row[self._unknown],
+        )
+
+    def _average(self, flat: int) -> Optional[float]:
+        row = self._counts[flat]
+        count = 0
+        total = 0.0
+        for slot, score in self._scored:
+            n = row[slot]
+            if n:
+                count += n
+                total += n * score
+        return total / count if count else None
+
+    def level_average(self, code: str, level_index: int) -> Optional[float]:
+        """
+        Mittelwert der anwendbaren Fragen (wie core.scoring); None, wenn keine anwendbar ist.
+        """
+        return self._average(self._levels(code)[level_index])
+
+    def level_full(self, code: str, level_index: int) -> bool:
+        return level_is_full(self._average(self._levels(code)[level_index]), self.profile)
+
+    def fully_reached(self, code: str) -> int:
+        """
+        Anzahl der von unten lückenlos erfüllten Level (zwischengespeichert je Dimension).
+        """
+        d_idx = self._dim_index[code]
+        reached = self._reached[d_idx]
+        if reached is None:
+            reached = 0
+            for flat in range(self._level_base[d_idx], self._level_base[d_idx + 1]):
+                if not level_is_full(self._average(flat), self.profile):
+                    break
+                reached += 1
+            self._reached[d_idx] = reached
+        return reached
+
+    def is_unlocked(self, code: str, level_index: int) -> bool:
+        """
+        Level freigeschaltet: das erste immer, jedes weitere, wenn alle darunter erfüllt sind.
+        """
+        return level_index <= self.fully_reached(code)
+
+    def has_answers(self, code: str) -> bool:
+        return self._answered_in_dim[self._dim_index[code]] > 0
+
+    def _score(self, d_idx: int) -> float:
+        levels = range(self._level_base[d_idx], self._level_base[d_idx + 1])
+        if not levels:
+            return 0.0
+        return maturity_from_levels(((self._numbers[f], self._average(f)) for f in levels), self.profile)
+
+    def score(self, code: str) -> float:
+        """
+        Ist-Reifegrad einer Dimension (gleiches Ergebnis wie core.scoring.score_dimension).
+        """
+        return self._score(self._dim_index[code])
+
+    def scores(self) -> Dict[str, float]:
+        """
+        Ist-Reifegrad je Dimensionscode (wie core.scoring.score_model).
+        """
+        return {dim.code: self._score(d_idx) for d_idx, dim in enumerate(self.model.dimensions)}
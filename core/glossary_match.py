@@ -0,0 +1,167 @@
+# core/glossary_match.py
+from __future__ import annotations
+
+import functools
+import re
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+
+_WORD_CHARS = r"A-Za-z0-9ÄÖÜäöüß_"
+_SUFFIX_CHARS = r"A-Za-zÄÖÜäöüß"
+_ADJ_ENDINGS = ("e", "en", "er", "es", "em")
+
+
+@dataclass(frozen=True, slots=True)
+class GlossaryMatcher:
+    """
+    Vorberechnete Eingaben für die Glossar-Verlinkung in Modelltexten:
+    Aliase (längste zuerst) mit kanonischem Begriff und die Quelle des Such-Regex.
+    Wird einmal je Modellstand gebaut (bzw. aus dem kompilierten Modell geladen).
+    """
+    terms: FrozenSet[str]
+    aliases: Tuple[str, ...]
+    alias_to_canonical: Mapping[str, str]    # Alias (klein) -> Begriff
+    alias_items: Tuple[Tuple[str, str], ...]  # (Alias klein, Begriff), längste zuerst
+    pattern_source: str
+
+    @property
+    def pattern(self) -> Optional[re.Pattern]:
+        return _compile(self.pattern_source) if self.pattern_source else None
+
+    def canonical(self, matched: str) -> Optional[str]:
+        """
+        Begriff zu einem Treffer; Komposita ("Redaktionsleitfadens") über das längste Alias-Präfix.
+        """
+        ml = matched.lower()
+        canonical = self.alias_to_canonical.get(ml)
+        if not canonical:
+            for al, canon in self.alias_items:
+                if ml.startswith(al):
+                    canonical = canon
+                    break
+        return canonical if canonical in self.terms else None
+
+
+@functools.lru_cache(maxsize=8)
+def _compile(source: str) -> Optional[re.Pattern]:
+    try:
+        return re.compile(source, flags=re.IGNORECASE)
+    except re.error:
+        return None
+
+
+def _alias_index(glossary: Mapping[str, str]) -> Tuple[List[str], Dict[str, str]]:
+    aliases: List[str] = []
+    alias_to_canonical: Dict[str, str] = {}
+
+    def _add(alias: str, canonical: str):
+        a = (alias or "").strip()
+        c = (canonical or "").strip()
+        if not a or not c:
+            return
+        al = a.lower()
+        if al in alias_to_canonical:
+            return
+        alias_to_canonical[al] = c
+        aliases.append(a)
+
+    def _add_adj_variants(phrase: str, canonical: str):
+        tokens = (phrase or "").split()
+        if len(tokens) < 2:
+            return
+
+        for i in range(len(tokens) - 1):
+            t = tokens[i]
+            if not t:
+                continue
+            if not re.match(r"^[a-zäöüß]", t):
+                continue
+
+            for end in _ADJ_ENDINGS:
+                if t.endswith(end) and len(t) > len(end) + 3:
+                    stem = t[: -len(end)]
+                    for e in _ADJ_ENDINGS:
+                        variant_tokens = tokens[:]
+                        variant_tokens[i] = stem + e
+                        _add(" ".join(variant_tokens), canonical)
+                    break
+
+    for canonical in glossary.keys():
+        if not isinstance(canonical, str):
+            continue
+        c = canonical.strip()
+        if not c:
+            continue
+
+        _add(c, c)
+
+        if "," in c:
+            left, right = [p.strip() for p in c.split(",", 1)]
+            if left and right:
+                swapped = f"{right} {left}"
+                _add(swapped, c)
+                _add_adj_variants(swapped, c)
+
+        if "(" in c:
+            left = c.split("(", 1)[0].strip()
+            _add(left, c)
+
+            if ")" in c:
+                inside = c.split("(", 1)[1].rsplit(")", 1)[0].strip()
+                if inside:
+                    _add(inside, c)
+
+        for sep in ["–", "-", ":"]:
+            if sep in c:
+                _add(c.split(sep, 1)[0].strip(), c)
+
+        for abbr in re.findall(r"\b[A-ZÄÖÜ]{3,}\b", c):
+            _add(abbr, c)
+
+        _add_adj_variants(c, c)
+
+    return sorted(aliases, key=len, reverse=True), alias_to_canonical
+
+
+def _alias_pattern(alias: str) -> str:
+    esc = re.escape(alias)
+
+    starts_word = re.match(rf"^[{_WORD_CHARS}]", alias) is not None
+    ends_word = re.match(rf".*[{_WORD_CHARS}]$", alias) is not None
+
+    tokens = alias.split()
+    last_token = tokens[-1] if tokens else ""
+    allow_compound_suffix = (len(tokens) >= 2) and bool(re.match(r"^[A-ZÄÖÜ]", last_token))
+
+    if starts_word:
+        esc = rf"(?<![{_WORD_CHARS}]){esc}"
+
+    if ends_word:
+        if allow_compound_suffix:
+            esc = rf"{esc}(?:[{_SUFFIX_CHARS}]+)?"
+        else:
+            esc = rf"{esc}(?![{_WORD_CHARS}])"
+    return esc
+
+
+def build_glossary_matcher(glossary: Mapping[str, str]) -> GlossaryMatcher:
+    """
+    Aliase je Glossarbegriff: Original, "Modell, semantisches" -> "semantisches Modell",
+    Teil vor Klammer/Bindestrich, Klammerinhalt, Abkürzungen, Adjektivendungen.
+    """
+    aliases, alias_to_canonical = _alias_index(glossary if isinstance(glossary, Mapping) else {})
+    alias_items = sorted(alias_to_canonical.items(), key=lambda x: len(x[0]), reverse=True)
+    source = "|".join(_alias_pattern(a) for a in aliases if a.strip())
+    if source and _compile(source) is None:
+        source = ""
+    return GlossaryMatcher(
+        terms=frozenset(k for k in glossary if isinstance(k, str)) if isinstance(glossary, Mapping) else frozenset(),
+        aliases=tuple(aliases),
+        alias_to_canonical=alias_to_canonical,
+        alias_items=tuple(alias_items),
+        pattern_source=source,
+    )
+
+
+EMPTY_MATCHER = build_glossary_matcher({})
@@ -0,0 +1,328 @@
+# core/glossary_render.py
+from __future__ import annotations
+
+import functools
+import html
+import re
+from typing import NamedTuple
+
+from core.i18n import translator
+from core.model_loader import load_model_config
+from core.model_search import fold
+from core.theme import TU_GREEN, TU_ORANGE
+
+
+# Index und vorgerendertes Dokument der Glossar-Seite. Die Seite wird bei jedem Rerun neu
+# ausgeführt (app.load_page_module); Caches dort begännen jedes Mal leer, daher liegen sie hier.
+
+_URL_RE = re.compile(r"(https?://[^\s<>\"]+|\bwww\.[^\s<>\"]+)", re.IGNORECASE)
+
+
+def _linkify_urls(text: str) -> str:
+    s = text or ""
+    if not s.strip():
+        return ""
+
+    out: list[str] = []
+    last = 0
+
+    for m in _URL_RE.finditer(s):
+        start, end = m.span(1)
+        url_raw = m.group(1)
+
+        if start > last:
+            out.append(html.escape(s[last:start]))
+
+        trimmed = url_raw.rstrip(").,;:!?\u00bb\u201d\u2019]}")
+        tail = url_raw[len(trimmed):]
+
+        href = trimmed
+        if href.lower().startswith("www."):
+            href = "https://" + href
+
+        out.append(
+            f'<a class="rgm-glossary-src" href="{html.escape(href, quote=True)}" '
+            f'target="_blank" rel="noopener noreferrer">'
+            f"{html.escape(trimmed)}"
+            f"</a>"
+        )
+
+        if tail:
+            out.append(html.escape(tail))
+
+        last = end
+
+    if last < len(s):
+        out.append(html.escape(s[last:]))
+
+    return "".join(out)
+
+
+def _build_alias_to_canonical(glossary: dict) -> dict[str, str]:
+    alias_to_canonical: dict[str, str] = {}
+
+    def _add(alias: str, canonical: str) -> None:
+        a = (alias or "").strip()
+        c = (canonical or "").strip()
+        if not a or not c:
+            return
+        alias_to_canonical.setdefault(a.lower(), c)
+
+    for canonical in glossary.keys():
+        if not isinstance(canonical, str):
+            continue
+        c = canonical.strip()
+        if not c:
+            continue
+
+        _add(c, c)
+
+        if "(" in c:
+            _add(c.split("(", 1)[0].strip(), c)
+
+        if "," in c:
+            left, right = [p.strip() for p in c.split(",", 1)]
+            if left and right:
+                _add(f"{right} {left}", c)
+
+        for abbr in re.findall(r"\b[A-ZÄÖÜ]{3,}\b", c):
+            _add(abbr, c)
+
+    return alias_to_canonical
+
+
+class GlossaryIndex(NamedTuple):
+    """
+    Einmal je Glossar-Version und Sprache: Begriffe (sortiert), Alias-Map und
+    ein sortierter Präfixindex über gefaltete Aliase und Wortanfänge.
+    """
+    terms: tuple[str, ...]
+    lower_terms: dict[str, str]
+    alias_to_canonical: dict[str, str]
+    prefix_keys: tuple[str, ...]
+    prefix_terms: tuple[str, ...]
+    search_keys: dict[str, str]
+
+
+def _load_glossary(language: str) -> dict:
+    glossary = load_model_config(language).get("glossary", {}) or {}
+    return glossary if isinstance(glossary, dict) else {}
+
+
+@functools.lru_cache(maxsize=4)
+def glossary_index(version: str, language: str) -> GlossaryIndex:
+    """
+    Index je Glossar-Version (Dateitoken des Modells, Teil des Cache-Keys) und Sprache.
+    """
+    glossary = _load_glossary(language)
+    terms = tuple(sorted((k for k in glossary if isinstance(k, str) and k.strip()), key=lambda x: x.lower()))
+    alias_to_canonical = _build_alias_to_canonical(glossary)
+
+    aliases_by_term: dict[str, set[str]] = {term: set() for term in terms}
+    for alias, canonical in alias_to_canonical.items():
+        if canonical in aliases_by_term:
+            aliases_by_term[canonical].add(fold(alias))
+
+    pairs: set[tuple[str, str]] = set()
+    order = {term: i for i, term in enumerate(terms)}
+    for term, aliases in aliases_by_term.items():
+        words = {fold(w) for w in re.findall(r"\w+", term)}
+        for key in aliases | words:
+            if key:
+                pairs.add((key, term))
+    ordered = sorted(pairs, key=lambda p: (p[0], order[p[1]]))
+
+    return GlossaryIndex(
+        terms=terms,
+        lower_terms={term.lower(): term for term in terms},
+        alias_to_canonical=alias_to_canonical,
+        prefix_keys=tuple(k for k, _ in ordered),
+        prefix_terms=tuple(term for _, term in ordered),
+        search_keys={term: " | ".join(sorted(aliases_by_term[term] | {fold(term)})) for term in terms},
+    )
+
+
+def _glossary_component_css(dark: bool) -> str:
+    text = "rgba(250,250,250,0.92)" if dark else "#111111"
+    card_bg = "#111827" if dark else "#ffffff"
+    border = "rgba(255,255,255,0.12)" if dark else "rgba(0,0,0,0.10)"
+    soft_bg = "rgba(255,255,255,0.06)" if dark else "rgba(0,0,0,0.03)"
+    hover_bg = "rgba(255,255,255,0.07)" if dark else "rgba(0,0,0,0.035)"
+    shadow = "0 12px 28px rgba(0,0,0,0.40)" if dark else "0 10px 24px rgba(0,0,0,0.06)"
+
+    return f"""
+  html, body {{
+    margin: 0;
+    padding: 0;
+    background: transparent;
+    color: {text};
+    font-family: "Source Sans Pro", "Source Sans 3", system-ui, -apple-system, "Segoe UI", sans-serif;
+  }}
+  #rgm-g-root {{ padding: 0 4px 4px 4px; }}
+
+  .rgm-g-tools {{
+    background: {card_bg};
+    border: 1px solid {border};
+    border-radius: 14px;
+    padding: 14px 16px;
+    box-shadow: {shadow};
+    margin-bottom: 14px;
+  }}
+  .rgm-card-title {{
+    font-weight: 850;
+    font-size: 15px;
+    margin: 0 0 10px 0;
+  }}
+  #rgm-g-filter {{
+    box-sizing: border-box;
+    width: 100%;
+    padding: 9px 12px;
+    font: inherit;
+    font-size: 15px;
+    color: {text};
+    background: {soft_bg};
+    border: 1px solid {border};
+    border-radius: 10px;
+    outline: none;
+  }}
+  #rgm-g-filter:focus {{ border-color: {TU_ORANGE}; }}
+
+  details.rgm-g-card {{
+    background: {card_bg};
+    border: 1px solid {border};
+    border-radius: 14px;
+    box-shadow: {shadow};
+    overflow: hidden;
+    margin: 0 0 10px 0;
+  }}
+  details.rgm-g-card > summary {{
+    padding: 10px 12px;
+    font-weight: 850;
+    font-size: 15px;
+    cursor: pointer;
+  }}
+  details.rgm-g-card > summary:hover {{ background: {hover_bg}; }}
+
+  .rgm-glossary-def {{
+    padding: 0 12px 12px 12px;
+    line-height: 1.75;
+    font-size: 14px;
+    opacity: 0.95;
+  }}
+  a.rgm-glossary-src {{
+    color: {TU_GREEN} !important;
+    text-decoration: underline !important;
+    font-weight: 750;
+  }}
+  a.rgm-glossary-src:hover {{ opacity: 0.88; }}
+
+  .rgm-g-empty {{
+    padding: 12px 14px;
+    border-radius: 10px;
+    background: rgba(47,61,184,0.10);
+    font-size: 14px;
+  }}
+"""
+
+
+_GLOSSARY_SCRIPT = """
+(function() {
+  const cfg = window.RGM_GLOSSARY_CFG || {};
+  const root = document.getElementById("rgm-g-root");
+  const input = document.getElementById("rgm-g-filter");
+  const list = document.getElementById("rgm-g-list");
+  const empty = document.getElementById("rgm-g-empty");
+  const cards = Array.from(list.querySelectorAll("details.rgm-g-card"));
+
+  function fold(s) {
+    return (s || "").toLowerCase()
+      .replace(/ä/g, "ae").replace(/ö/g, "oe").replace(/ü/g, "ue").replace(/ß/g, "ss")
+      .normalize("NFD").replace(/[\\u0300-\\u036f]/g, "").trim();
+  }
+
+  function setFrameHeight() {
+    const h = Math.ceil(root.getBoundingClientRect().height);
+    window.parent.postMessage({ isStreamlitMessage: true, type: "streamlit:setFrameHeight", height: h + 8 }, "*");
+  }
+
+  function apply() {
+    const q = fold(input.value);
+    let shown = 0;
+    for (const card of cards) {
+      const ok = !q || card.dataset.search.indexOf(q) !== -1;
+      card.hidden = !ok;
+      if (ok) shown += 1;
+    }
+    empty.hidden = shown > 0;
+    setFrameHeight();
+  }
+
+  if (typeof cfg.focus === "number" && cfg.focus >= 0 && cards[cfg.focus]) {
+    const focusCard = cards[cfg.focus];
+    focusCard.open = true;
+    list.insertBefore(focusCard, list.firstChild);
+  }
+  if (cfg.query) input.value = cfg.query;
+
+  let pending = 0;
+  input.addEventListener("input", () => {
+    cancelAnimationFrame(pending);
+    pending = requestAnimationFrame(apply);
+  });
+  cards.forEach((card) => card.addEventListener("toggle", setFrameHeight));
+  new ResizeObserver(() => requestAnimationFrame(setFrameHeight)).observe(root);
+  window.addEventListener("load", setFrameHeight);
+  apply();
+})();
+"""
+
+
+def _card_html(pos: int, term: str, definition: str, search_key: str) -> str:
+    body = _linkify_urls(definition or "").replace("\n", "<br>")
+    return (
+        f'<details class="rgm-g-card" data-pos="{pos}" data-search="{html.escape(search_key, quote=True)}">'
+        f"<summary>{html.escape(term)}</summary>"
+        f'<div class="rgm-glossary-def">{body}</div>'
+        f"</details>"
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def glossary_document(version: str, language: str, dark: bool) -> tuple[str, str]:
+    """
+    Vorgerendertes Glossar (Filterfeld + alle Karten) je Glossar-Version, Sprache und Theme.
+    Rückgabe: (Kopf, Rest); dazwischen kommt nur die kleine Konfiguration (Fokus, Suchtext).
+    """
+    tr = translator(language)
+    index = glossary_index(version, language)
+    glossary = _load_glossary(language)
+    cards = "\n".join(
+        _card_html(pos, term, str(glossary.get(term, "")), index.search_keys[term])
+        for pos, term in enumerate(index.terms)
+    )
+
+    head = f"""<!doctype html>
+<html>
+<head>
+<meta charset="utf-8">
+<style>{_glossary_component_css(dark)}</style>
+</head>
+<body>
+<div id="rgm-g-root">
+  <div class="rgm-g-tools">
+    <div class="rgm-card-title">{html.escape(tr("glossary.search"))}</div>
+    <input id="rgm-g-filter" type="search" autocomplete="off"
+           placeholder="{html.escape(tr("glossary.placeholder"), quote=True)}"
+           aria-label="{html.escape(tr("glossary.search"), quote=True)}">
+  </div>
+  <div id="rgm-g-list">
+{cards}
+  </div>
+  <div id="rgm-g-empty" class="rgm-g-empty" hidden>{html.escape(tr("common.no_entries_filter"))}</div>
+</div>
+"""
+    tail = f"""<script>{_GLOSSARY_SCRIPT}</script>
+</body>
+</html>
+"""
+    return head, tail
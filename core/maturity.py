@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Optional
 
+import numpy as np
 import pandas as pd
 
 
@@ -38,32 +38,33 @@ def _pick_first_col(df: pd.DataFrame, candidates: tuple[str, ...]) -> Optional[s
     return None
 
 
-def _prefix_mask(df: pd.DataFrame, prefix: str) -> pd.Series:
-    prefix = str(prefix or "").strip().upper()
-    if df is None or df.empty:
-        return pd.Series(dtype=bool)
+def _upper_keys(values: pd.Series, extract_prefix: bool = False) -> pd.Series:
+    """
+    Getrimmte Großschreibung (optional nur das Buchstabenpräfix) je Zeile.
+    Die String-Operationen laufen nur über die eindeutigen Werte, nicht über alle Zeilen.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    keys = pd.Series(uniques, dtype=object).astype(str).fillna("").str.strip().str.upper()
+    if extract_prefix:
+        keys = keys.str.extract(r"^([A-Z]+)", expand=False).fillna("")
+    return pd.Series(keys.to_numpy(dtype=object)[codes], index=values.index, dtype=object)
+
+
+def _prefix_keys(df: pd.DataFrame) -> tuple[pd.Series, pd.Series]:
+    """
+    Liefert je Zeile den Kategorie-Schlüssel und das aus dem Code abgeleitete Präfix
+    (beide getrimmt, in Großbuchstaben). Wird einmal pro DataFrame berechnet und für
+    alle Präfixe wiederverwendet.
+    """
+    empty = pd.Series([""] * len(df), index=df.index, dtype=object)
 
     category_col = _pick_first_col(df, ("category", "Kategorie"))
-    if category_col:
-        categories = df[category_col].astype(str).fillna("").str.strip().str.upper()
-        mask = categories.eq(prefix)
-        if bool(mask.any()):
-            return mask
+    categories = _upper_keys(df[category_col]) if category_col else empty
 
     code_col = _pick_first_col(df, ("code", "Code", "Kürzel", "Kuerzel"))
-    if not code_col:
-        return pd.Series([False] * len(df), index=df.index)
+    code_prefixes = _upper_keys(df[code_col], extract_prefix=True) if code_col else empty
 
-    extracted = (
-        df[code_col]
-        .astype(str)
-        .fillna("")
-        .str.strip()
-        .str.upper()
-        .str.extract(r"^([A-Z]+)", expand=False)
-        .fillna("")
-    )
-    return extracted.eq(prefix)
+    return categories, code_prefixes
 
 
 def _current_levels(df: pd.DataFrame) -> pd.Series:
@@ -74,9 +75,9 @@ def _current_levels(df: pd.DataFrame) -> pd.Series:
     if not level_col:
         return pd.Series(dtype=float)
 
-    levels = pd.to_numeric(df[level_col], errors="coerce")
-    finite_mask = levels.apply(lambda value: pd.notna(value) and math.isfinite(float(value)))
-    return levels.where(finite_mask)
+    values = pd.to_numeric(df[level_col], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    values[~np.isfinite(values)] = np.nan
+    return pd.Series(values, index=df.index)
 
 
 def _assessed_mask(df: pd.DataFrame, levels: pd.Series) -> pd.Series:
@@ -97,28 +98,78 @@ def _assessed_mask(df: pd.DataFrame, levels: pd.Series) -> pd.Series:
     return levels.notna() & levels.astype(float).gt(0)
 
 
-def _assessed_current_levels(df: pd.DataFrame) -> pd.Series:
-    if df is None or df.empty:
-        return pd.Series(dtype=float)
-
+def _assessed_level_values(df: pd.DataFrame) -> np.ndarray:
+    """Ist-Reifegrade als float-Array; nicht bewertete/ungültige Werte sind NaN."""
     levels = _current_levels(df)
     if levels.empty:
-        return pd.Series(dtype=float)
+        return np.full(len(df), np.nan)
 
-    mask = _assessed_mask(df, levels)
-    return levels[mask & levels.notna()].astype(float)
+    mask = _assessed_mask(df, levels).to_numpy(dtype=bool)
+    return np.where(mask, levels.to_numpy(dtype=float), np.nan)
 
 
-def _average_from_levels(levels: pd.Series) -> MaturityAverage:
-    if levels.empty:
+def _average(total: float, count: int) -> MaturityAverage:
+    if count <= 0:
         return MaturityAverage(value=None, count=0)
-    return MaturityAverage(value=float(levels.mean()), count=int(levels.count()))
+    return MaturityAverage(value=float(total / count), count=int(count))
 
 
-def _valid_current_levels_for_prefix(df: pd.DataFrame, prefix: str) -> pd.Series:
-    if df is None or df.empty:
-        return pd.Series(dtype=float)
-    return _assessed_current_levels(df[_prefix_mask(df, prefix)].copy())
+def _normalize_prefixes(prefixes: Iterable[str]) -> list[str]:
+    out: list[str] = []
+    for prefix in ("TD", "OG", *prefixes):
+        p = str(prefix or "").strip().upper()
+        if p and p not in out:
+            out.append(p)
+    return out
+
+
+def _key_sums(
+    groups: np.ndarray,
+    n_groups: int,
+    keys: pd.Series,
+    values: np.ndarray,
+    prefixes: list[str],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Summen, Anzahl gültiger Werte und Zeilenvorkommen je (Gruppe, Präfix) in einem Durchlauf.
+    Rückgabe jeweils als Array der Form (n_groups, len(prefixes)).
+    """
+    lookup = {p: i for i, p in enumerate(prefixes)}
+    key_idx = keys.map(lookup).fillna(-1).to_numpy(dtype=np.int64)
+    known = key_idx >= 0
+    valid = known & ~np.isnan(values)
+
+    size = n_groups * len(prefixes)
+    flat = groups * len(prefixes) + key_idx
+
+    present = np.bincount(flat[known], minlength=size).reshape(n_groups, len(prefixes))
+    counts = np.bincount(flat[valid], minlength=size).reshape(n_groups, len(prefixes))
+    sums = np.bincount(flat[valid], weights=values[valid], minlength=size).reshape(n_groups, len(prefixes))
+    return sums, counts, present
+
+
+def _aggregate(
+    df: pd.DataFrame,
+    groups: np.ndarray,
+    n_groups: int,
+    prefixes: list[str],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Spaltenweise Aggregation aller Präfixe auf einmal.
+
+    Je Gruppe und Präfix gilt wie bisher: Trifft die Kategorie-Spalte das Präfix in
+    mindestens einer Zeile, entscheidet die Kategorie; sonst das Code-Präfix.
+    """
+    values = _assessed_level_values(df)
+    categories, code_prefixes = _prefix_keys(df)
+
+    cat_sums, cat_counts, cat_present = _key_sums(groups, n_groups, categories, values, prefixes)
+    code_sums, code_counts, _ = _key_sums(groups, n_groups, code_prefixes, values, prefixes)
+
+    use_category = cat_present > 0
+    sums = np.where(use_category, cat_sums, code_sums)
+    counts = np.where(use_category, cat_counts, code_counts)
+    return sums, counts
 
 
 def calculate_current_maturity_average(df: pd.DataFrame, prefix: Optional[str] = None) -> MaturityAverage:
@@ -133,22 +184,69 @@ def calculate_current_maturity_average(df: pd.DataFrame, prefix: Optional[str] =
     if df is None or df.empty:
         return MaturityAverage(value=None, count=0)
 
-    d = df.copy()
     if prefix:
-        return _average_from_levels(_valid_current_levels_for_prefix(d, prefix))
+        key = str(prefix).strip().lower()
+        return calculate_current_maturity_averages(df, prefixes=(prefix,))[key]
+    return calculate_current_maturity_averages(df)["overall"]
+
+
+def calculate_current_maturity_averages(
+    df: pd.DataFrame,
+    prefixes: Iterable[str] = (),
+) -> dict[str, MaturityAverage]:
+    """
+    Gesamt-, TD- und OG-Durchschnitt (plus optionale weitere Präfixe) in einem Durchlauf.
+
+    Schlüssel: "overall", "td", "og" sowie je zusätzlichem Präfix dessen Kleinschreibung.
+    "overall" umfasst wie bisher ausschließlich TD und OG.
+    """
+    wanted = _normalize_prefixes(prefixes)
+    if df is None or df.empty:
+        empty = MaturityAverage(value=None, count=0)
+        return {"overall": empty, **{p.lower(): empty for p in wanted}}
+
+    sums, counts = _aggregate(df, np.zeros(len(df), dtype=np.int64), 1, wanted)
+
+    out = {"overall": _average(float(sums[0, :2].sum()), int(counts[0, :2].sum()))}
+    for i, p in enumerate(wanted):
+        out[p.lower()] = _average(float(sums[0, i]), int(counts[0, i]))
+    return out
+
+
+def calculate_current_maturity_averages_by_group(
+    df: pd.DataFrame,
+    group_col: str = "assessment_id",
+    prefixes: Iterable[str] = (),
+) -> pd.DataFrame:
+    """
+    Batch-Variante für Portfolio-Tabellen: dieselben Durchschnitte je Erhebung (group_col).
+
+    Rückgabe: ein DataFrame mit group_col als Index und den Spalten
+    overall_avg/overall_count, td_avg/td_count, og_avg/og_count (+ weitere Präfixe).
+    Durchschnitte ohne gültige Werte sind NaN.
+    """
+    wanted = _normalize_prefixes(prefixes)
+    columns = [f"{key}_{kind}" for key in ["overall", *(p.lower() for p in wanted)] for kind in ("avg", "count")]
+
+    if df is None or df.empty or group_col not in df.columns:
+        return pd.DataFrame(columns=columns).rename_axis(group_col)
+
+    groups, group_ids = pd.factorize(df[group_col], sort=True)
+    if (groups < 0).any():
+        keep = groups >= 0
+        df = df[keep]
+        groups = groups[keep]
 
-    td_levels = _valid_current_levels_for_prefix(d, "TD")
-    og_levels = _valid_current_levels_for_prefix(d, "OG")
-    return _average_from_levels(pd.concat([td_levels, og_levels], ignore_index=True))
+    sums, counts = _aggregate(df, groups.astype(np.int64), len(group_ids), wanted)
 
+    all_sums = np.column_stack([sums[:, :2].sum(axis=1), sums])
+    all_counts = np.column_stack([counts[:, :2].sum(axis=1), counts])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avgs = np.where(all_counts > 0, all_sums / np.maximum(all_counts, 1), np.nan)
 
-def calculate_current_maturity_averages(df: pd.DataFrame) -> dict[str, MaturityAverage]:
-    td_levels = _valid_current_levels_for_prefix(df, "TD")
-    og_levels = _valid_current_levels_for_prefix(df, "OG")
-    combined = pd.concat([td_levels, og_levels], ignore_index=True)
+    data: dict[str, np.ndarray] = {}
+    for i, key in enumerate(["overall", *(p.lower() for p in wanted)]):
+        data[f"{key}_avg"] = avgs[:, i]
+        data[f"{key}_count"] = all_counts[:, i].astype(np.int64)
 
-    return {
-        "overall": _average_from_levels(combined),
-        "td": _average_from_levels(td_levels),
-        "og": _average_from_levels(og_levels),
-    }
+    return pd.DataFrame(data, index=pd.Index(group_ids, name=group_col), columns=columns)
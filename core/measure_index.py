@@ -0,0 +1,317 @@
+# core/measure_index.py
+from __future__ import annotations
+
+import math
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+try:
+    import scipy.sparse as sp
+    from sklearn.feature_extraction.text import TfidfVectorizer
+except Exception:  # pragma: no cover - scikit-learn fehlt (Vorschläge bleiben dann unsortiert)
+    sp = None
+    TfidfVectorizer = None
+
+
+LANGUAGES = ("de", "en")
+
+# Ab dieser Ähnlichkeit (Kosinus, 0..1) gilt eine Maßnahme als Beinahe-Duplikat
+NEAR_DUPLICATE_THRESHOLD = 0.8
+# Anteil neuer/gelöschter Zeilen, ab dem das Vokabular (IDF) komplett neu gelernt wird
+REFIT_RATIO = 0.25
+_QUERY_CACHE_SIZE = 512
+
+
+def index_available() -> bool:
+    return TfidfVectorizer is not None
+
+
+def _norm(text: Any) -> str:
+    return " ".join(str(text or "").split()).strip()
+
+
+def _vectorizer() -> "TfidfVectorizer":
+    # Zeichen-n-Gramme statt Wörter: robust gegen Komposita, Bindestriche und Tippfehler
+    return TfidfVectorizer(
+        analyzer="char_wb",
+        ngram_range=(3, 4),
+        lowercase=True,
+        sublinear_tf=True,
+        min_df=1,
+        dtype=np.float32,
+    )
+
+
+@dataclass(frozen=True)
+class MeasureMatch:
+    code: str
+    text: str
+    score: float
+
+
+@dataclass
+class _LanguageIndex:
+    """
+    TF-IDF-Matrix einer Sprache. Zeilen werden nur angehängt; gelöschte Maßnahmen
+    werden ausmaskiert, bis sich ein Refit lohnt.
+    """
+    vectorizer: Any = None
+    blocks: List[Any] = field(default_factory=list)
+    codes: List[str] = field(default_factory=list)
+    texts: List[str] = field(default_factory=list)
+    alive: List[bool] = field(default_factory=list)
+    rows: Dict[Tuple[str, str], int] = field(default_factory=dict)
+    rows_by_code: Dict[str, np.ndarray] = field(default_factory=dict)
+    fitted_rows: int = 0
+    _matrix: Any = None
+    # Zeilenblock je Dimension (CSR), damit Anfragen nicht die ganze Matrix slicen
+    _code_matrices: Dict[str, Any] = field(default_factory=dict)
+    # Anfragetexte wiederholen sich pro Rerun; ihre Vektoren bis zum nächsten Refit merken
+    _query_cache: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def live_rows(self) -> int:
+        return len(self.rows)
+
+    @property
+    def matrix(self):
+        if self._matrix is None:
+            if self.blocks:
+                self._matrix = sp.vstack(self.blocks, format="csr") if len(self.blocks) > 1 else self.blocks[0]
+                self.blocks = [self._matrix]
+        return self._matrix
+
+    def fit(self, entries: List[Tuple[str, str]]) -> None:
+        self.vectorizer = _vectorizer()
+        self.codes = [c for c, _ in entries]
+        self.texts = [t for _, t in entries]
+        self.alive = [True] * len(entries)
+        self.rows = {(c, t.lower()): i for i, (c, t) in enumerate(entries)}
+        self.fitted_rows = len(entries)
+        self._query_cache = {}
+        self._matrix = self.vectorizer.fit_transform(self.texts) if entries else None
+        self.blocks = [self._matrix] if entries else []
+        self._reindex_codes()
+
+    def append(self, entries: List[Tuple[str, str]]) -> None:
+        if not entries:
+            return
+        start = len(self.texts)
+        self.blocks.append(self.vectorizer.transform([t for _, t in entries]))
+        self._matrix = None
+        for offset, (code, text) in enumerate(entries):
+            self.codes.append(code)
+            self.texts.append(text)
+            self.alive.append(True)
+            self.rows[(code, text.lower())] = start + offset
+
+    def remove(self, keys: Iterable[Tuple[str, str]]) -> None:
+        for key in keys:
+            row = self.rows.pop(key, None)
+            if row is not None:
+                self.alive[row] = False
+
+    def _reindex_codes(self) -> None:
+        by_code: Dict[str, List[int]] = {}
+        for (code, _), row in self.rows.items():
+            by_code.setdefault(code, []).append(row)
+        self.rows_by_code = {c: np.array(sorted(r), dtype=np.intp) for c, r in by_code.items()}
+        self._code_matrices = {}
+
+    def code_matrix(self, code: str):
+        sub = self._code_matrices.get(code)
+        if sub is None:
+            rows = self.rows_by_code.get(code)
+            if rows is None or not rows.size or self.matrix is None:
+                return None
+            sub = self.matrix[rows]
+            self._code_matrices[code] = sub
+        return sub
+
+    def query_vector(self, text: str):
+        if self.vectorizer is None or not text:
+            return None
+        vec = self._query_cache.get(text)
+        if vec is None:
+            if len(self._query_cache) >= _QUERY_CACHE_SIZE:
+                self._query_cache.clear()
+            vec = self.vectorizer.transform([text])
+            self._query_cache[text] = vec
+        return vec
+
+    def similarities(self, vec, code: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Kosinus-Ähnlichkeiten (Zeilen sind L2-normiert) für eine Dimension oder den ganzen Pool.
+        """
+        empty = np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+        if vec is None or self.matrix is None:
+            return empty
+        if code is None:
+            rows = np.flatnonzero(np.asarray(self.alive, dtype=bool))
+            return rows, (self.matrix @ vec.T).toarray().ravel()[rows]
+        sub = self.code_matrix(code)
+        if sub is None:
+            return empty
+        return self.rows_by_code[code], (sub @ vec.T).toarray().ravel()
+
+
+class MeasureIndex:
+    """
+    Vorberechneter TF-IDF-Index über den Maßnahmenpool (data/measures/), je Sprache.
+
+    - rank(): Vorschläge einer Dimension nach Ähnlichkeit zu einem Anfragetext
+      (Dimensionsbeschreibung + Kriterien/Fragen der Stufen im Gap)
+    - near_duplicates(): ähnliche vorhandene Maßnahmen zu einem neuen Text
+    - sync(): inkrementelles Nachziehen bei Dateiänderungen (nur neue Zeilen werden
+      transformiert; Refit erst, wenn sich der Pool deutlich verändert hat)
+    """
+
+    def __init__(self) -> None:
+        self.token: Optional[str] = None
+        self._langs: Dict[str, _LanguageIndex] = {lang: _LanguageIndex() for lang in LANGUAGES}
+        self._lock = threading.Lock()
+
+    def sync(self, pool: Mapping[str, Mapping[str, List[str]]], token: Optional[str] = None) -> bool:
+        """
+        Gleicht den Index mit dem Pool ab. Rückgabe: True, wenn sich etwas geändert hat.
+        """
+        if token is not None and token == self.token:
+            return False
+
+        changed = False
+        with self._lock:
+            for lang in LANGUAGES:
+                wanted: Dict[Tuple[str, str], Tuple[str, str]] = {}
+                for code, entry in (pool or {}).items():
+                    values = entry.get(lang, []) if isinstance(entry, Mapping) else []
+                    for value in values or []:
+                        text = _norm(value)
+                        if text:
+                            wanted.setdefault((str(code), text.lower()), (str(code), text))
+
+                idx = self._langs[lang]
+                added = [entry for key, entry in wanted.items() if key not in idx.rows]
+                removed = [key for key in idx.rows if key not in wanted]
+                if not added and not removed:
+                    continue
+                changed = True
+
+                dead = len(idx.alive) - idx.live_rows + len(removed)
+                if idx.vectorizer is None or len(added) + dead > REFIT_RATIO * max(idx.fitted_rows, 1):
+                    idx.fit(list(wanted.values()))
+                else:
+                    idx.remove(removed)
+                    idx.append(added)
+                    idx._reindex_codes()
+            self.token = token
+        return changed
+
+    def _lang(self, language: Optional[str]) -> _LanguageIndex:
+        return self._langs["en" if str(language or "").lower().startswith("en") else "de"]
+
+    def size(self, language: Optional[str] = None) -> int:
+        if language is None:
+            return sum(idx.live_rows for idx in self._langs.values())
+        return self._lang(language).live_rows
+
+    def rank(self, code: str, query: str, language: Optional[str] = None, limit: Optional[int] = None) -> List[MeasureMatch]:
+        """
+        Maßnahmen einer Dimension, absteigend nach Ähnlichkeit zum Anfragetext.
+        """
+        idx = self._lang(language)
+        code = str(code)
+        with self._lock:
+            if code not in idx.rows_by_code:
+                return []
+            rows, sims = idx.similarities(idx.query_vector(_norm(query)), code)
+            if not rows.size:
+                # Ohne Anfragetext: Pool-Reihenfolge
+                return [MeasureMatch(code, idx.texts[r], 0.0) for r in idx.rows_by_code[code][:limit]]
+            order = np.argsort(-sims, kind="stable")
+            if limit:
+                order = order[:limit]
+            return [MeasureMatch(code, idx.texts[rows[i]], float(sims[i])) for i in order]
+
+    def near_duplicates(
+        self,
+        text: str,
+        language: Optional[str] = None,
+        code: Optional[str] = None,
+        threshold: float = NEAR_DUPLICATE_THRESHOLD,
+        limit: int = 5,
+    ) -> List[MeasureMatch]:
+        """
+        Vorhandene Maßnahmen mit Ähnlichkeit >= threshold (optional nur einer Dimension).
+        """
+        idx = self._lang(language)
+        with self._lock:
+            rows, sims = idx.similarities(idx.query_vector(_norm(text)), None if code is None else str(code))
+            hits = np.flatnonzero(sims >= threshold)
+            hits = hits[np.argsort(-sims[hits], kind="stable")][:limit]
+            return [MeasureMatch(idx.codes[rows[i]], idx.texts[rows[i]], float(sims[i])) for i in hits]
+
+
+def _dimension_lookup(model: Mapping[str, Any], code: str) -> Optional[Mapping[str, Any]]:
+    for dim in model.get("dimensions", []) or []:
+        if str(dim.get("code", "")).strip() == code:
+            return dim
+    return None
+
+
+def dimension_query_text(
+    model: Mapping[str, Any],
+    code: str,
+    ist_level: Optional[float] = None,
+    target_level: Optional[float] = None,
+) -> str:
+    """
+    Anfragetext für das Ranking: Name und Beschreibung der Dimension plus
+    Akzeptanzkriterien und Fragen der Stufen, die das Gap (Ist -> Soll) überspannt.
+    """
+    dim = _dimension_lookup(model, str(code))
+    if dim is None:
+        return ""
+
+    profile = dim.get("process_profile") or {}
+    parts = [dim.get("name", ""), dim.get("description", ""), profile.get("results", ""), profile.get("basic_practices", "")]
+
+    try:
+        lo = math.floor(float(ist_level)) + 1 if ist_level is not None and not math.isnan(float(ist_level)) else 1
+    except (TypeError, ValueError):
+        lo = 1
+    try:
+        hi = math.ceil(float(target_level)) if target_level is not None else None
+    except (TypeError, ValueError):
+        hi = None
+
+    for level in dim.get("levels", []) or []:
+        number = int(level.get("level_number", 0) or 0)
+        if number < lo or (hi is not None and number > hi):
+            continue
+        parts.append(level.get("acceptance_criteria", ""))
+        parts.extend(q.get("text", "") for q in level.get("questions", []) or [])
+
+    return _norm(" ".join(str(p) for p in parts if p))
+
+
+_INDEX: Optional[MeasureIndex] = None
+_INDEX_LOCK = threading.Lock()
+
+
+def get_measure_index(pool: Mapping[str, Mapping[str, List[str]]], token: Optional[str] = None) -> Optional[MeasureIndex]:
+    """
+    Prozessweiter Index, synchronisiert auf den übergebenen Pool (token = Dateistand).
+    None, wenn scikit-learn nicht verfügbar ist.
+    """
+    global _INDEX
+    if not index_available():
+        return None
+    with _INDEX_LOCK:
+        if _INDEX is None:
+            _INDEX = MeasureIndex()
+        index = _INDEX
+    index.sync(pool, token)
+    return index
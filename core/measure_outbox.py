@@ -0,0 +1,517 @@
+# core/measure_outbox.py
+from __future__ import annotations
+
+import hashlib
+import http.client
+import json
+import os
+import random
+import socket
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+
+# Status einer Outbox-Zeile
+PENDING, SENDING, SENT, FAILED = "pending", "sending", "sent", "failed"
+
+MAX_ATTEMPTS = 6
+BACKOFF_BASE_S = 2.0
+BACKOFF_MAX_S = 300.0
+# Fallback-Pause bei Rate-Limit ohne verwertbare Header
+RATE_LIMIT_PAUSE_S = 60.0
+# So lange gehört eine Zeile im Status SENDING ihrem Sender; danach darf sie jeder erneut holen
+SEND_LEASE_S = 120.0
+# Suchfenster für die Nachschau nach einem unbestätigten POST (Uhrenabweichung zu GitHub)
+LOOKUP_MARGIN_S = 300.0
+LOOKUP_MAX_PAGES = 10
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS measure_outbox (
+    dedup_key       TEXT PRIMARY KEY,
+    code            TEXT NOT NULL,
+    language        TEXT NOT NULL,
+    payload         TEXT NOT NULL,
+    status          TEXT NOT NULL,
+    attempts        INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    issue_number    INTEGER,
+    last_error      TEXT,
+    claimed_by      TEXT,
+    lease_until     REAL,
+    posted_at       REAL,
+    created_at      REAL NOT NULL,
+    updated_at      REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS measure_outbox_due ON measure_outbox (status, next_attempt_at);
+"""
+
+# Spalten, die ältere Outbox-Dateien noch nicht haben
+_ADDED_COLUMNS = (("claimed_by", "TEXT"), ("lease_until", "REAL"), ("posted_at", "REAL"))
+
+
+def _default_db_path() -> Path:
+    # Gleiche Ablage wie die Snapshots (core.persist), überschreibbar per RGM_STATE_DIR
+    base = os.getenv("RGM_STATE_DIR")
+    p = Path(base) if base else Path(tempfile.gettempdir()) / "rgm_state"
+    p.mkdir(parents=True, exist_ok=True)
+    return p / "measure_outbox.sqlite3"
+
+
+def measure_dedup_key(code: str, language: str, text: str) -> str:
+    return f"{language}||{code}||{' '.join(str(text or '').split()).lower()}"
+
+
+def outbox_marker(dedup_key: str) -> str:
+    """
+    Unsichtbare Kennung der Outbox-Zeile im Issue-Body (HTML-Kommentar, Hash des Dedup-Schlüssels).
+    Damit lässt sich nach einem unbestätigten POST prüfen, ob das Issue schon angelegt wurde.
+    """
+    return f"<!-- rgm-outbox:{hashlib.sha256(dedup_key.encode('utf-8')).hexdigest()[:24]} -->"
+
+
+def measure_issue_payload(measure_text: str, dimension_code: str, language: str) -> dict:
+    """
+    Issue-Payload für den Maßnahmenpool.
+    Format MUSS zu scripts/process_measure_issue.py passen.
+    """
+    return {
+        "title": f"[Measure Pool] {dimension_code}: {measure_text[:80]}",
+        "body": (
+            "### measure_text\n"
+            f"{measure_text}\n\n"
+            "### dimension_code\n"
+            f"{dimension_code}\n\n"
+            "### language\n"
+            f"{language}\n"
+        ),
+        "labels": ["measure:pending"],
+    }
+
+
+@dataclass(frozen=True)
+class OutboxConfig:
+    owner: str
+    repo: str
+    token: str
+    # Für Tests: z. B. http://127.0.0.1:8765 (scripts/fake_issue_tracker.py)
+    api_base: str = "https://api.github.com"
+    concurrency: int = 2
+    timeout_s: float = 15.0
+
+
+class _RateLimited(Exception):
+    def __init__(self, wait_s: float, message: str) -> None:
+        super().__init__(message)
+        self.wait_s = wait_s
+
+
+class _Retryable(Exception):
+    def __init__(self, message: str, unconfirmed: bool = False) -> None:
+        super().__init__(message)
+        # Request wurde gesendet, aber ohne Antwort: das Issue kann trotzdem angelegt worden sein
+        self.unconfirmed = unconfirmed
+
+
+def _rate_limit_wait(headers: Dict[str, str], now: float) -> Optional[float]:
+    """
+    Wartezeit laut Rate-Limit-Headern (Retry-After / X-RateLimit-*), sonst None.
+    """
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    if headers.get("x-ratelimit-remaining") == "0":
+        try:
+            return max(0.0, float(headers.get("x-ratelimit-reset", "")) - now) + 1.0
+        except ValueError:
+            return RATE_LIMIT_PAUSE_S
+    return None
+
+
+class MeasureOutbox:
+    """
+    Persistente Outbox für Maßnahmen-Einreichungen (SQLite im State-Verzeichnis).
+
+    - enqueue() ist schnell und dedupliziert über einen Primärschlüssel; die
+      Deduplizierung überlebt damit Neustarts und gilt sessionübergreifend.
+    - Ein Hintergrund-Thread sendet fällige Einträge mit begrenzter Parallelität;
+      jeder Sende-Thread hält eine Keep-Alive-Verbindung zur API.
+    - Netzwerk-/5xx-Fehler: Retry mit exponentiellem Backoff (+ Jitter);
+      Rate-Limits (403/429 mit Retry-After bzw. X-RateLimit-*) pausieren den
+      ganzen Sender bis zum Reset. Andere 4xx gelten als endgültig fehlgeschlagen;
+      erneutes Einreihen derselben Maßnahme setzt sie wieder auf PENDING.
+    - Zeilen in Arbeit (SENDING) tragen Besitzer und Lease; andere Prozesse auf derselben
+      Datei übernehmen sie erst, wenn die Lease abgelaufen ist (Absturz des Senders).
+    - Jeder Issue-Body trägt outbox_marker(dedup_key). Bricht ein POST nach dem Senden ohne
+      Antwort ab, wird vor dem nächsten POST nach einem Issue mit dieser Kennung gesucht,
+      damit keine Duplikate entstehen.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None) -> None:
+        self.db_path = Path(db_path) if db_path is not None else _default_db_path()
+        self._config: Optional[OutboxConfig] = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._local = threading.local()
+        self._paused_until = 0.0
+        # Kennung dieses Senders (mehrere Prozesse/Worker können dieselbe Datei nutzen)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+            columns = {row[1] for row in db.execute("PRAGMA table_info(measure_outbox)")}
+            for name, kind in _ADDED_COLUMNS:
+                if name not in columns:
+                    db.execute(f"ALTER TABLE measure_outbox ADD COLUMN {name} {kind}")
+            # Nach Absturz hängengebliebene Sendungen erneut versuchen – nur mit abgelaufener Lease,
+            # sonst gehört die Zeile noch einem laufenden Sender
+            db.execute(
+                "UPDATE measure_outbox SET status = ?, claimed_by = NULL, lease_until = NULL "
+                "WHERE status = ? AND COALESCE(lease_until, 0) < ?",
+                (PENDING, SENDING, time.time()),
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Autocommit; kurzlebige Verbindungen, damit jeder Thread seine eigene hat
+        db = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+            yield db
+        finally:
+            db.close()
+
+    # --- API für die Pages ---
+    def configure(self, config: OutboxConfig) -> None:
+        with self._lock:
+            self._config = config
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="rgm-measure-outbox", daemon=True)
+                self._thread.start()
+        self._wake.set()
+
+    def enqueue(self, code: str, language: str, measure_text: str) -> bool:
+        """
+        Reiht eine Maßnahme ein. False, wenn sie (in irgendeiner Session) schon eingereiht war.
+        Endgültig fehlgeschlagene Einträge (FAILED) werden dabei erneut eingereiht.
+        """
+        now = time.time()
+        payload = json.dumps(measure_issue_payload(measure_text, code, language), ensure_ascii=False)
+        with self._connect() as db:
+            cur = db.execute(
+                "INSERT INTO measure_outbox "
+                "(dedup_key, code, language, payload, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (dedup_key) DO UPDATE SET "
+                "payload = excluded.payload, status = excluded.status, attempts = 0, next_attempt_at = 0, "
+                "last_error = NULL, updated_at = excluded.updated_at "
+                "WHERE measure_outbox.status = ?",
+                (measure_dedup_key(code, language, measure_text), code, language, payload, PENDING, now, now, FAILED),
+            )
+            added = cur.rowcount == 1
+        if added:
+            self._wake.set()
+        return added
+
+    def retry_failed(self, keys: Iterable[str]) -> int:
+        """
+        Setzt endgültig fehlgeschlagene Einträge (FAILED) wieder auf PENDING. Rückgabe: Anzahl.
+        """
+        keys = tuple(keys)
+        if not keys:
+            return 0
+        with self._connect() as db:
+            cur = db.execute(
+                "UPDATE measure_outbox SET status = ?, attempts = 0, next_attempt_at = 0, last_error = NULL, "
+                f"updated_at = ? WHERE status = ? AND dedup_key IN ({', '.join('?' * len(keys))})",
+                (PENDING, time.time(), FAILED, *keys),
+            )
+            count = cur.rowcount
+        if count:
+            self._wake.set()
+        return count
+
+    def stats(self) -> Dict[str, int]:
+        with self._connect() as db:
+            rows = db.execute("SELECT status, COUNT(*) FROM measure_outbox GROUP BY status").fetchall()
+        return {status: int(count) for status, count in rows}
+
+    def entries(
+        self,
+        status: Optional[str] = None,
+        limit: int = 100,
+        keys: Optional[Iterable[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Einträge (optional nach Status und/oder Dedup-Schlüsseln gefiltert), älteste zuerst.
+        """
+        query = "SELECT dedup_key, code, language, status, attempts, issue_number, last_error FROM measure_outbox"
+        conditions: List[str] = []
+        args: Tuple[Any, ...] = ()
+        if status:
+            conditions.append("status = ?")
+            args += (status,)
+        if keys is not None:
+            keys = tuple(keys)
+            if not keys:
+                return []
+            conditions.append(f"dedup_key IN ({', '.join('?' * len(keys))})")
+            args += keys
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY created_at LIMIT ?"
+        with self._connect() as db:
+            rows = db.execute(query, args + (int(limit),)).fetchall()
+        keys = ("dedup_key", "code", "language", "status", "attempts", "issue_number", "last_error")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def flush(self, timeout: float = 30.0) -> bool:
+        """
+        Wartet, bis nichts mehr fällig ist (für Skripte/Tests). True, wenn leer.
+        """
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            self._wake.set()
+            stats = self.stats()
+            if not stats.get(PENDING) and not stats.get(SENDING):
+                return True
+            time.sleep(0.05)
+        return False
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    # --- Sender ---
+    def _claim(self, limit: int, now: float) -> List[Tuple[str, str, int, Optional[float]]]:
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            # Fällige Einträge und verwaiste Sendungen. Die Lease wird nicht verlängert: ein
+            # Sendeversuch dauert höchstens wenige timeout_s, also deutlich weniger als SEND_LEASE_S
+            rows = db.execute(
+                "SELECT dedup_key, payload, attempts, posted_at FROM measure_outbox "
+                "WHERE (status = ? AND next_attempt_at <= ?) OR (status = ? AND COALESCE(lease_until, 0) < ?) "
+                "ORDER BY created_at LIMIT ?",
+                (PENDING, now, SENDING, now, limit),
+            ).fetchall()
+            db.executemany(
+                "UPDATE measure_outbox SET status = ?, claimed_by = ?, lease_until = ?, updated_at = ? "
+                "WHERE dedup_key = ?",
+                [(SENDING, self.owner, now + SEND_LEASE_S, now, row[0]) for row in rows],
+            )
+            db.execute("COMMIT")
+        return rows
+
+    def _next_due(self) -> Optional[float]:
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT MIN(next_attempt_at) FROM measure_outbox WHERE status = ?", (PENDING,)
+            ).fetchone()
+        return row[0] if row and row[0] is not None else None
+
+    def _finish(self, key: str, **fields: Any) -> None:
+        # Nur solange die Zeile noch diesem Sender gehört (sonst hat ein anderer sie übernommen)
+        fields.update(claimed_by=None, lease_until=None, updated_at=time.time())
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._connect() as db:
+            db.execute(
+                f"UPDATE measure_outbox SET {assignments} WHERE dedup_key = ? AND claimed_by = ?",
+                (*fields.values(), key, self.owner),
+            )
+
+    def _run(self) -> None:
+        executor: Optional[ThreadPoolExecutor] = None
+        workers = 0
+        while not self._stop.is_set():
+            config = self._config
+            now = time.time()
+            wait = 5.0
+
+            if config is not None and now >= self._paused_until:
+                if executor is None or workers != max(1, config.concurrency):
+                    if executor is not None:
+                        executor.shutdown(wait=True)
+                    workers = max(1, config.concurrency)
+                    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rgm-measure-send")
+                batch = self._claim(workers, now)
+                if batch:
+                    list(executor.map(lambda row: self._send_one(config, *row), batch))
+                    continue
+                due = self._next_due()
+                if due is not None:
+                    wait = min(wait, max(0.0, due - now))
+            elif config is not None:
+                wait = min(wait, self._paused_until - now)
+
+            self._wake.wait(timeout=max(0.01, wait))
+            self._wake.clear()
+
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _send_one(
+        self, config: OutboxConfig, key: str, payload: str, attempts: int, posted_at: Optional[float]
+    ) -> None:
+        started = time.time()
+        try:
+            # Letzter POST blieb unbestätigt: erst nachsehen, ob das Issue schon existiert
+            number = self._find_issue(config, key, posted_at) if posted_at is not None else None
+            if number is None:
+                number = self._post_issue(config, key, payload)
+            self._finish(key, status=SENT, issue_number=number, attempts=attempts + 1, last_error=None, posted_at=None)
+        except _RateLimited as e:
+            # Zählt nicht als Fehlversuch; der ganze Sender pausiert
+            self._paused_until = max(self._paused_until, time.time() + e.wait_s)
+            self._finish(key, status=PENDING, next_attempt_at=self._paused_until, last_error=str(e))
+        except _Retryable as e:
+            attempts += 1
+            fields: Dict[str, Any] = {"attempts": attempts, "last_error": str(e)}
+            if e.unconfirmed and posted_at is None:
+                # Frühester unbestätigter POST bestimmt das Suchfenster
+                fields["posted_at"] = started
+            if attempts >= MAX_ATTEMPTS:
+                self._finish(key, status=FAILED, **fields)
+            else:
+                delay = min(BACKOFF_MAX_S, BACKOFF_BASE_S * 2 ** (attempts - 1)) * random.uniform(0.8, 1.2)
+                self._finish(key, status=PENDING, next_attempt_at=time.time() + delay, **fields)
+        except Exception as e:
+            self._finish(key, status=FAILED, attempts=attempts + 1, last_error=f"{type(e).__name__}: {e}")
+
+    def _connection(self, config: OutboxConfig) -> Tuple[http.client.HTTPConnection, str]:
+        parts = urlsplit(config.api_base)
+        ident = (parts.scheme, parts.netloc, config.timeout_s)
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "ident", None) != ident:
+            if conn is not None:
+                conn.close()
+            cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+            conn = cls(parts.netloc, timeout=config.timeout_s)
+            self._local.conn, self._local.ident = conn, ident
+        return conn, parts.path.rstrip("/")
+
+    def _drop_connection(self, conn: http.client.HTTPConnection) -> None:
+        # Verbindung verwerfen; nächster Versuch baut neu auf
+        conn.close()
+        self._local.conn = None
+
+    def _request(
+        self, config: OutboxConfig, method: str, path: str, body: Optional[bytes] = None
+    ) -> Tuple[int, Dict[str, str], str]:
+        """
+        Ein API-Request über die Keep-Alive-Verbindung dieses Threads. Rate-Limits und 5xx werden
+        als _RateLimited/_Retryable geworfen; andere Status gehen an den Aufrufer.
+        """
+        conn, prefix = self._connection(config)
+        headers = {
+            "Authorization": f"Bearer {config.token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            "User-Agent": "streamlit-measure-pool",
+            "Connection": "keep-alive",
+        }
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+        try:
+            conn.request(method, prefix + path, body=body, headers=headers)
+        except (OSError, http.client.HTTPException) as e:
+            self._drop_connection(conn)
+            raise _Retryable(f"Netzwerkfehler: {e}") from e
+        try:
+            resp = conn.getresponse()
+            raw = resp.read()
+        except (OSError, http.client.HTTPException) as e:
+            self._drop_connection(conn)
+            # Gesendet, aber keine Antwort: Ausgang unbekannt
+            raise _Retryable(f"Netzwerkfehler: {e}", unconfirmed=True) from e
+
+        resp_headers = {k.lower(): v for k, v in resp.getheaders()}
+        if resp_headers.get("connection", "").lower() == "close":
+            self._drop_connection(conn)
+
+        text = raw.decode("utf-8", "replace")
+        if resp.status in (403, 429):
+            wait = _rate_limit_wait(resp_headers, time.time())
+            if wait is not None or resp.status == 429:
+                raise _RateLimited(RATE_LIMIT_PAUSE_S if wait is None else wait, f"Rate-Limit ({resp.status})")
+        if resp.status >= 500:
+            raise _Retryable(f"HTTP {resp.status}: {text[:200]}")
+
+        # Kontingent aufgebraucht: vor dem nächsten Request bis zum Reset warten
+        if resp.status < 400 and resp_headers.get("x-ratelimit-remaining") == "0":
+            wait = _rate_limit_wait(resp_headers, time.time())
+            if wait:
+                self._paused_until = max(self._paused_until, time.time() + wait)
+        return resp.status, resp_headers, text
+
+    def _post_issue(self, config: OutboxConfig, key: str, payload: str) -> int:
+        issue = json.loads(payload)
+        marker = outbox_marker(key)
+        if marker not in issue.get("body", ""):
+            # Vor dem Body, damit die Abschnitte für process_measure_issue.py unverändert bleiben
+            issue["body"] = f"{marker}\n\n{issue.get('body', '')}"
+        body = json.dumps(issue, ensure_ascii=False).encode("utf-8")
+        status, _, text = self._request(config, "POST", f"/repos/{config.owner}/{config.repo}/issues", body)
+        if status >= 400:
+            raise RuntimeError(f"GitHub-Issue konnte nicht erstellt werden ({status}): {text[:500]}")
+
+        number = json.loads(text or "{}").get("number")
+        if not isinstance(number, int):
+            raise RuntimeError("GitHub hat keine gültige Issue-Nummer zurückgegeben.")
+        return number
+
+    def _find_issue(self, config: OutboxConfig, key: str, posted_at: float) -> Optional[int]:
+        """
+        Issue-Nummer eines schon angelegten Issues mit outbox_marker(key), sonst None.
+        Listet die seit dem unbestätigten POST geänderten Issues (kein Suchindex, der erst
+        verzögert aktualisiert wird).
+        """
+        marker = outbox_marker(key)
+        since = datetime.fromtimestamp(posted_at - LOOKUP_MARGIN_S, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        per_page = 100
+        for page in range(1, LOOKUP_MAX_PAGES + 1):
+            query = urlencode(
+                {"state": "all", "since": since, "sort": "created", "direction": "desc",
+                 "per_page": per_page, "page": page}
+            )
+            status, _, text = self._request(config, "GET", f"/repos/{config.owner}/{config.repo}/issues?{query}")
+            if status >= 400:
+                raise RuntimeError(f"GitHub-Issues konnten nicht gelesen werden ({status}): {text[:500]}")
+            items = json.loads(text or "[]")
+            if not isinstance(items, list):
+                raise RuntimeError("GitHub hat keine gültige Issue-Liste zurückgegeben.")
+            for item in items:
+                if not isinstance(item, dict) or not isinstance(item.get("number"), int):
+                    continue
+                if marker in str(item.get("body") or ""):
+                    return item["number"]
+            if len(items) < per_page:
+                return None
+        raise _Retryable(f"Nachschau nach unbestätigtem Issue ergebnislos nach {LOOKUP_MAX_PAGES} Seiten")
+
+
+_OUTBOX: Optional[MeasureOutbox] = None
+_OUTBOX_LOCK = threading.Lock()
+
+
+def get_measure_outbox() -> MeasureOutbox:
+    global _OUTBOX
+    with _OUTBOX_LOCK:
+        if _OUTBOX is None:
+            _OUTBOX = MeasureOutbox()
+        return _OUTBOX
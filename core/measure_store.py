@@ -0,0 +1,264 @@
+# core/measure_store.py
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Nur Standardbibliothek: wird auch von scripts/process_measure_issue.py (GitHub Action) genutzt.
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = BASE_DIR / "data"
+
+SHARD_DIR_NAME = "measures"
+LEGACY_FILE_NAME = "measures.json"
+MANIFEST_NAME = "manifest.json"
+MANIFEST_FORMAT = "rgm_measures_sharded_v1"
+LANGUAGES = ("de", "en")
+
+Pool = Dict[str, Dict[str, List[str]]]
+
+
+def _sha1(raw: bytes) -> str:
+    return hashlib.sha1(raw).hexdigest()
+
+
+def _stat_token(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return None
+
+
+def shard_file_name(code: str, language: str) -> str:
+    safe = "".join(ch if ch.isalnum() or ch in ".-_" else "_" for ch in str(code)) or "_"
+    return f"{safe}.{language}.json"
+
+
+def _shard_bytes(values: List[str]) -> bytes:
+    return (json.dumps(list(values), ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
+
+def _atomic_write(path: Path, raw: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(raw)
+    os.replace(tmp, path)
+
+
+class MeasureStore:
+    """
+    Maßnahmenpool als Shards: eine Datei je Dimensionscode und Sprache
+    (data/measures/<code>.<lang>.json) plus manifest.json mit SHA-1 und Anzahl je Shard.
+
+    - refresh() liest nur geänderte Shards neu: erst mtime/size des Manifests,
+      dann Hash-Vergleich je Shard. Kein TTL nötig.
+    - refresh_if_changed() ruft refresh() nur auf, wenn ein äußerer Wächter-Token
+      (z. B. core.data_watch) wechselt; der letzte Token liegt am Store und überdauert Reruns.
+    - save() schreibt nur Shards, deren Inhalt sich geändert hat, danach das Manifest.
+    - Ohne Manifest wird das bisherige Einzeldatei-Format (data/measures.json) gelesen;
+      das erste save() legt dann die Shards an (das Manifest hat danach Vorrang).
+    """
+
+    def __init__(self, data_dir: Path = DATA_DIR) -> None:
+        self.data_dir = Path(data_dir)
+        self.shard_dir = self.data_dir / SHARD_DIR_NAME
+        self.manifest_path = self.shard_dir / MANIFEST_NAME
+        self.legacy_path = self.data_dir / LEGACY_FILE_NAME
+        self._lock = threading.Lock()
+        self._source_stat: Optional[Tuple[str, Tuple[int, int]]] = None
+        self._shards: Dict[Tuple[str, str], Tuple[str, List[str]]] = {}  # (code, lang) -> (sha1, Werte)
+        self._codes: List[str] = []
+        self.token: str = "missing"
+        self._pool_cache: Optional[Pool] = None
+        self._watch_token: Optional[str] = None
+        self.last_reads = 0
+        self.refreshes = 0
+
+    @property
+    def sharded(self) -> bool:
+        return self.manifest_path.exists()
+
+    # --- Lesen ---
+    def refresh(self) -> str:
+        """
+        Zieht Änderungen nach und liefert den Token (Hash des Manifests bzw. der Altdatei).
+        Unveränderte Shards bleiben im Speicher; ohne Änderung kostet das nur ein stat().
+        """
+        with self._lock:
+            self.last_reads = 0
+            self.refreshes += 1
+            if self.manifest_path.exists():
+                stat = _stat_token(self.manifest_path)
+                if self._source_stat != ("manifest", stat):
+                    self._load_manifest()
+                    self._source_stat = ("manifest", stat)
+            elif self.legacy_path.exists():
+                stat = _stat_token(self.legacy_path)
+                if self._source_stat != ("legacy", stat):
+                    self._load_legacy()
+                    self._source_stat = ("legacy", stat)
+            elif self._source_stat is not None or self.token != "missing":
+                self._shards, self._codes, self.token = {}, [], "missing"
+                self._source_stat = None
+                self._pool_cache = None
+            return self.token
+
+    def refresh_if_changed(self, watch_token: str) -> str:
+        """
+        Wie refresh(), aber nur, wenn sich watch_token seit dem letzten Aufruf geändert hat;
+        sonst sofort der bekannte Token. Schlägt refresh() fehl, wird beim nächsten Aufruf erneut gelesen.
+        """
+        with self._lock:
+            if watch_token == self._watch_token:
+                return self.token
+        token = self.refresh()
+        with self._lock:
+            self._watch_token = watch_token
+        return token
+
+    def pool(self) -> Pool:
+        """
+        Geladener Pool (geteilt, nicht verändern); refresh() vorher aufrufen.
+        """
+        with self._lock:
+            if self._pool_cache is None:
+                self._pool_cache = {
+                    code: {lang: self._shards.get((code, lang), ("", []))[1] for lang in LANGUAGES}
+                    for code in self._codes
+                }
+            return self._pool_cache
+
+    def load(self) -> Pool:
+        """
+        Aktueller Pool als eigene Kopie (darf verändert und an save() gegeben werden).
+        """
+        self.refresh()
+        return {code: {lang: list(values) for lang, values in by_lang.items()} for code, by_lang in self.pool().items()}
+
+    def _load_manifest(self) -> None:
+        raw = self.manifest_path.read_bytes()
+        manifest = json.loads(raw.decode("utf-8"))
+        if not isinstance(manifest, dict) or manifest.get("format") != MANIFEST_FORMAT:
+            raise ValueError(f"{self.manifest_path} hat ein unbekanntes Format.")
+
+        shards: Dict[Tuple[str, str], Tuple[str, List[str]]] = {}
+        for entry in manifest.get("shards", []):
+            key = (str(entry["code"]), str(entry["language"]))
+            digest = str(entry.get("sha1", ""))
+            cached = self._shards.get(key)
+            if cached is not None and cached[0] == digest:
+                shards[key] = cached
+                continue
+            shard_raw = (self.shard_dir / entry["file"]).read_bytes()
+            values = json.loads(shard_raw.decode("utf-8"))
+            shards[key] = (_sha1(shard_raw), values if isinstance(values, list) else [])
+            self.last_reads += 1
+
+        self._shards = shards
+        self._codes = [str(c) for c in manifest.get("codes", [])]
+        self._pool_cache = None
+        self.token = _sha1(raw)[:16]
+
+    def _load_legacy(self) -> None:
+        raw = self.legacy_path.read_bytes()
+        data = json.loads(raw.decode("utf-8"))
+        if not isinstance(data, dict):
+            raise ValueError(f"{self.legacy_path} muss ein JSON-Objekt sein.")
+
+        shards: Dict[Tuple[str, str], Tuple[str, List[str]]] = {}
+        for code, value in data.items():
+            if isinstance(value, dict):
+                by_lang = {lang: value.get(lang) for lang in LANGUAGES}
+            else:
+                # Ganz altes Format: Liste = deutsche Maßnahmen
+                by_lang = {"de": value, "en": []}
+            for lang, values in by_lang.items():
+                values = values if isinstance(values, list) else []
+                if values:
+                    shards[(str(code), lang)] = (_sha1(_shard_bytes(values)), values)
+
+        self._shards = shards
+        self._codes = [str(c) for c in data]
+        self._pool_cache = None
+        self.token = _sha1(raw)[:16]
+        self.last_reads = 1
+
+    # --- Schreiben ---
+    def save(self, data: Pool) -> List[str]:
+        """
+        Schreibt geänderte Shards und das Manifest. Rückgabe: geschriebene Shard-Dateien.
+        """
+        with self._lock:
+            if self.manifest_path.exists() and self._source_stat is None:
+                self._load_manifest()
+            self.shard_dir.mkdir(parents=True, exist_ok=True)
+
+            written: List[str] = []
+            entries: List[Dict[str, Any]] = []
+            shards: Dict[Tuple[str, str], Tuple[str, List[str]]] = {}
+            sharded_before = self.manifest_path.exists()
+
+            for code, by_lang in data.items():
+                for lang in LANGUAGES:
+                    values = list((by_lang or {}).get(lang) or []) if isinstance(by_lang, dict) else []
+                    if not values:
+                        continue
+                    name = shard_file_name(code, lang)
+                    cached = self._shards.get((str(code), lang))
+                    if sharded_before and cached is not None and cached[1] == values:
+                        # Unverändert: weder serialisieren noch schreiben
+                        digest = cached[0]
+                    else:
+                        raw = _shard_bytes(values)
+                        digest = _sha1(raw)
+                        if not sharded_before or cached is None or cached[0] != digest or not (self.shard_dir / name).exists():
+                            _atomic_write(self.shard_dir / name, raw)
+                            written.append(name)
+                    shards[(str(code), lang)] = (digest, values)
+                    entries.append(
+                        {"code": str(code), "language": lang, "file": name, "sha1": digest, "count": len(values)}
+                    )
+
+            # Nicht mehr referenzierte Shards entfernen
+            keep = {e["file"] for e in entries}
+            for old_code, old_lang in set(self._shards) - set(shards):
+                name = shard_file_name(old_code, old_lang)
+                if name not in keep:
+                    try:
+                        (self.shard_dir / name).unlink()
+                    except OSError:
+                        pass
+
+            manifest = {"format": MANIFEST_FORMAT, "codes": [str(c) for c in data], "shards": entries}
+            raw_manifest = (json.dumps(manifest, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+            current = self.manifest_path.read_bytes() if self.manifest_path.exists() else b""
+            if raw_manifest != current:
+                _atomic_write(self.manifest_path, raw_manifest)
+
+            self._shards = shards
+            self._codes = [str(c) for c in data]
+            self._pool_cache = None
+            self.token = _sha1(raw_manifest)[:16]
+            self._source_stat = ("manifest", _stat_token(self.manifest_path))
+            return written
+
+
+_STORES: Dict[Path, MeasureStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_measure_store(data_dir: Path = DATA_DIR) -> MeasureStore:
+    """
+    Prozessweiter Store je Datenverzeichnis (hält die geladenen Shards).
+    """
+    key = Path(data_dir).resolve()
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = MeasureStore(key)
+            _STORES[key] = store
+        return store
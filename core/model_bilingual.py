@@ -0,0 +1,294 @@
+# core/model_bilingual.py
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping as MappingABC
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from core.glossary_match import build_glossary_matcher
+from core.types import Dimension, Level, MaturityModel, ProcessProfile, Question
+
+# Zweisprachiges Modell: ein sprachunabhängiges Gerüst (Kürzel, Kategorien, Zielwerte,
+# Stufennummern, Frage-IDs, Sortierung) und je Sprache eine Texttabelle. Die Texte liegen
+# flach in fester Slot-Reihenfolge (Gerüst durchlaufen, siehe text_table_of), ein Sprachwechsel
+# tauscht nur die Tabelle.
+
+_DIM_SLOTS = 6       # name, description, purpose, results, basic_practices, work_products
+_LEVEL_SLOTS = 5     # name, acceptance_criteria, implementation_text, benefit_text, comment_hint
+_QUESTION_SLOTS = 2  # text, help_text
+TEXT_SLOTS = (_DIM_SLOTS, _LEVEL_SLOTS, _QUESTION_SLOTS)
+
+
+@dataclass(frozen=True, slots=True)
+class LevelSkeleton:
+    level_number: int
+    question_ids: Tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class DimensionSkeleton:
+    code: str
+    category: str
+    default_target_level: float
+    levels: Tuple[LevelSkeleton, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ModelSkeleton:
+    """
+    Struktur des Modells in Modellreihenfolge; sorted_order = Indizes in Anzeigereihenfolge.
+    """
+    dimensions: Tuple[DimensionSkeleton, ...]
+    sorted_order: Tuple[int, ...]
+    glossary_size: int
+
+    @property
+    def slot_count(self) -> int:
+        return sum(
+            _DIM_SLOTS + sum(_LEVEL_SLOTS + _QUESTION_SLOTS * len(lvl.question_ids) for lvl in dim.levels)
+            for dim in self.dimensions
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class TextTable:
+    """
+    Texte einer Sprache: Modellkopf, Glossar (positionsgleich über alle Sprachen) und alle
+    Dimensions-/Stufen-/Fragetexte in Slot-Reihenfolge des Gerüsts.
+    """
+    language: str
+    name: str
+    description: str
+    levels_info: Tuple[Tuple[str, str], ...]
+    glossary: Tuple[Tuple[str, str], ...]
+    texts: Tuple[Optional[str], ...]
+
+
+class ModelDriftError(ValueError):
+    """
+    Sprachdateien eines Modells weichen in der Struktur voneinander ab.
+    problems: (Sprache, Ort, Meldung).
+    """
+
+    def __init__(self, problems: List[Tuple[str, str, str]]) -> None:
+        self.problems = problems
+        super().__init__(
+            f"Sprachversionen des Modells weichen ab ({len(problems)}): "
+            + "; ".join(f"{lang}:{loc}: {msg}" if loc else f"{lang}: {msg}" for lang, loc, msg in problems[:5])
+        )
+
+
+def skeleton_of(model: MaturityModel) -> ModelSkeleton:
+    position = {id(d): i for i, d in enumerate(model.dimensions)}
+    return ModelSkeleton(
+        dimensions=tuple(
+            DimensionSkeleton(
+                code=dim.code,
+                category=dim.category,
+                default_target_level=float(dim.default_target_level),
+                levels=tuple(LevelSkeleton(lvl.level_number, lvl.question_ids) for lvl in dim.levels),
+            )
+            for dim in model.dimensions
+        ),
+        sorted_order=tuple(position[id(d)] for d in model.sorted_dimensions),
+        glossary_size=len(model.glossary),
+    )
+
+
+def text_table_of(model: MaturityModel, language: str) -> TextTable:
+    texts: List[Optional[str]] = []
+    for dim in model.dimensions:
+        profile = dim.process_profile
+        texts.extend((dim.name, dim.description, profile.purpose, profile.results, profile.basic_practices, profile.work_products))
+        for lvl in dim.levels:
+            texts.extend((lvl.name, lvl.acceptance_criteria, lvl.implementation_text, lvl.benefit_text, lvl.comment_hint))
+            for q in lvl.questions:
+                texts.extend((q.text, q.help_text))
+    return TextTable(
+        language=language,
+        name=model.name,
+        description=model.description,
+        levels_info=tuple(model.levels_info.items()),
+        glossary=tuple(model.glossary.items()),
+        texts=tuple(texts),
+    )
+
+
+def skeleton_drift(base: ModelSkeleton, other: ModelSkeleton) -> List[Tuple[str, str]]:
+    """
+    Strukturelle Abweichungen (Ort, Meldung) einer Sprache gegenüber dem Gerüst der Basissprache.
+    """
+    problems: List[Tuple[str, str]] = []
+    base_codes = [d.code for d in base.dimensions]
+    codes = [d.code for d in other.dimensions]
+    if base_codes != codes:
+        missing = sorted(set(base_codes) - set(codes))
+        extra = sorted(set(codes) - set(base_codes))
+        if missing or extra:
+            problems.append(("", "Kürzel weichen ab: " + ", ".join((missing + extra)[:8])))
+        else:
+            problems.append(("", "Dimensionen in anderer Reihenfolge."))
+
+    by_code = {d.code: d for d in other.dimensions}
+    for dim in base.dimensions:
+        counterpart = by_code.get(dim.code)
+        if counterpart is None:
+            continue
+        if counterpart.category != dim.category:
+            problems.append((dim.code, f"Kategorie {counterpart.category!r} statt {dim.category!r}."))
+        if counterpart.default_target_level != dim.default_target_level:
+            problems.append((dim.code, f"Zielwert {counterpart.default_target_level:g} statt {dim.default_target_level:g}."))
+        numbers = [lvl.level_number for lvl in dim.levels]
+        other_numbers = [lvl.level_number for lvl in counterpart.levels]
+        if numbers != other_numbers:
+            problems.append((dim.code, f"Stufen {other_numbers} statt {numbers}."))
+            continue
+        for lvl, other_lvl in zip(dim.levels, counterpart.levels):
+            if lvl.question_ids != other_lvl.question_ids:
+                problems.append(
+                    (f"{dim.code}/L{lvl.level_number}", f"Frage-IDs {list(other_lvl.question_ids)} statt {list(lvl.question_ids)}.")
+                )
+    if other.glossary_size != base.glossary_size:
+        problems.append(
+            ("glossary", f"{other.glossary_size} Begriffe statt {base.glossary_size} (Zuordnung erfolgt über die Position).")
+        )
+    return problems
+
+
+def _assemble(skeleton: ModelSkeleton, table: TextTable) -> MaturityModel:
+    texts = table.texts
+    pos = 0
+    dims: List[Dimension] = []
+    for dim in skeleton.dimensions:
+        name, description, purpose, results, practices, products = texts[pos : pos + _DIM_SLOTS]
+        pos += _DIM_SLOTS
+        levels: List[Level] = []
+        for lvl in dim.levels:
+            lvl_name, acceptance, implementation, benefit, comment = texts[pos : pos + _LEVEL_SLOTS]
+            pos += _LEVEL_SLOTS
+            questions = []
+            for qid in lvl.question_ids:
+                questions.append(Question(id=qid, text=texts[pos], help_text=texts[pos + 1]))
+                pos += _QUESTION_SLOTS
+            levels.append(
+                Level(
+                    level_number=lvl.level_number,
+                    name=lvl_name,
+                    questions=tuple(questions),
+                    acceptance_criteria=acceptance,
+                    implementation_text=implementation,
+                    benefit_text=benefit,
+                    comment_hint=comment,
+                )
+            )
+        dims.append(
+            Dimension(
+                code=dim.code,
+                name=name,
+                category=dim.category,
+                description=description,
+                default_target_level=dim.default_target_level,
+                levels=tuple(levels),
+                process_profile=ProcessProfile(purpose, results, practices, products),
+            )
+        )
+
+    glossary = dict(table.glossary)
+    return MaturityModel(
+        name=table.name,
+        description=table.description,
+        levels_info=dict(table.levels_info),
+        dimensions=tuple(dims),
+        sorted_dimensions=tuple(dims[i] for i in skeleton.sorted_order),
+        glossary=glossary,
+        glossary_matcher=build_glossary_matcher(glossary),
+    )
+
+
+class BilingualModel:
+    """
+    Ein Gerüst, eine Texttabelle je Sprache. model(sprache) setzt das typisierte Modell
+    einmal je Sprache zusammen (danach geteilt); unbekannte Sprachen nutzen die Basissprache.
+    """
+
+    PICKLED_ATTRS = ("skeleton", "tables", "base_language")
+
+    def __init__(self, skeleton: ModelSkeleton, tables: Mapping[str, TextTable], base_language: str) -> None:
+        for table in tables.values():
+            if len(table.texts) != skeleton.slot_count:
+                raise ValueError(f"Texttabelle {table.language!r} passt nicht zum Gerüst.")
+        self.skeleton = skeleton
+        self.tables: Dict[str, TextTable] = dict(tables)
+        self.base_language = base_language
+        self._models: Dict[str, MaturityModel] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.PICKLED_ATTRS}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._models = {}
+        self._lock = threading.Lock()
+
+    @property
+    def languages(self) -> Tuple[str, ...]:
+        return tuple(self.tables)
+
+    def text_table(self, language: str) -> TextTable:
+        return self.tables.get(language) or self.tables[self.base_language]
+
+    def is_assembled(self, language: str) -> bool:
+        return self.text_table(language).language in self._models
+
+    def model(self, language: str) -> MaturityModel:
+        table = self.text_table(language)
+        model = self._models.get(table.language)
+        if model is None:
+            with self._lock:
+                model = self._models.get(table.language)
+                if model is None:
+                    model = self._models[table.language] = _assemble(self.skeleton, table)
+        return model
+
+    @property
+    def models(self) -> Mapping[str, MaturityModel]:
+        return _ModelsView(self)
+
+
+class _ModelsView(MappingABC):
+    # Sprache -> Modell, zusammengesetzt erst beim Zugriff
+    def __init__(self, owner: BilingualModel) -> None:
+        self._owner = owner
+
+    def __getitem__(self, language: str) -> MaturityModel:
+        if language not in self._owner.tables:
+            raise KeyError(language)
+        return self._owner.model(language)
+
+    def __iter__(self):
+        return iter(self._owner.tables)
+
+    def __len__(self) -> int:
+        return len(self._owner.tables)
+
+
+def merge_models(models: Mapping[str, MaturityModel], base_language: str = "de") -> BilingualModel:
+    """
+    Führt die Sprachfassungen eines Modells zusammen. Weicht eine Sprache in der Struktur
+    von der Basissprache ab, wird ModelDriftError mit allen Abweichungen ausgelöst.
+    """
+    if not models:
+        raise ValueError("Keine Sprachfassung übergeben.")
+    base = base_language if base_language in models else next(iter(models))
+    skeleton = skeleton_of(models[base])
+
+    problems: List[Tuple[str, str, str]] = []
+    for language, model in models.items():
+        if language != base:
+            problems.extend((language, loc, msg) for loc, msg in skeleton_drift(skeleton, skeleton_of(model)))
+    if problems:
+        raise ModelDriftError(problems)
+
+    return BilingualModel(skeleton, {lang: text_table_of(m, lang) for lang, m in models.items()}, base)
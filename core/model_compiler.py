@@ -0,0 +1,490 @@
+# core/model_compiler.py
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import pickle
+import re
+import struct
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Mapping, Optional, Tuple
+
+from core.glossary_match import build_glossary_matcher
+from core.model_bilingual import (
+    TEXT_SLOTS,
+    BilingualModel,
+    DimensionSkeleton,
+    LevelSkeleton,
+    ModelSkeleton,
+    TextTable,
+    merge_models,
+    skeleton_drift,
+    skeleton_of,
+)
+from core.model_search import ModelSearchIndex
+from core.overview import CATEGORY_ORDER, code_sort_key
+from core.types import Dimension, Level, MaturityModel, ProcessProfile, Question
+
+# Ohne Streamlit: wird auch von scripts/compile_model.py genutzt.
+# Das Artefakt enthält Pickle-Daten und darf nur aus eigenem Build (data/models/compiled/) stammen.
+
+ARTIFACT_MAGIC = b"RGMMODEL"
+ARTIFACT_FORMAT = "rgm_model_artifact"
+ARTIFACT_VERSION = 3
+BASE_LANGUAGE = "de"
+_HEADER_LEN = struct.Struct(">I")
+
+SEVERITY_ERROR = "error"
+SEVERITY_WARNING = "warning"
+
+
+# -----------------------------
+# Typisiertes Modell aus JSON
+# -----------------------------
+def _text(value: Any) -> str:
+    return str(value or "").strip()
+
+
+def _build_level(raw: Mapping[str, Any]) -> Level:
+    questions = tuple(
+        Question(id=_text(q.get("id")), text=_text(q.get("text")), help_text=q.get("help_text") or None)
+        for q in raw.get("questions", []) or []
+        if isinstance(q, Mapping)
+    )
+    return Level(
+        level_number=int(raw.get("level_number", 0) or 0),
+        name=_text(raw.get("name")),
+        questions=questions,
+        acceptance_criteria=_text(raw.get("acceptance_criteria")),
+        implementation_text=raw.get("implementation_text") or None,
+        benefit_text=_text(raw.get("benefit")) or None,
+        comment_hint=raw.get("comment_hint") or None,
+    )
+
+
+def _build_dimension(raw: Mapping[str, Any]) -> Dimension:
+    profile = raw.get("process_profile") or {}
+    levels = sorted(
+        (_build_level(lvl) for lvl in raw.get("levels", []) or [] if isinstance(lvl, Mapping)),
+        key=lambda lvl: lvl.level_number,
+    )
+    return Dimension(
+        code=_text(raw.get("code")),
+        name=_text(raw.get("name")),
+        category=_text(raw.get("category")),
+        description=_text(raw.get("description")),
+        default_target_level=float(raw.get("default_target_level", 3) or 3),
+        levels=tuple(levels),
+        process_profile=ProcessProfile(
+            purpose=_text(profile.get("purpose")),
+            results=_text(profile.get("results")),
+            basic_practices=_text(profile.get("basic_practices")),
+            work_products=_text(profile.get("work_products")),
+        ),
+    )
+
+
+def build_model(data: Mapping[str, Any]) -> MaturityModel:
+    """
+    Baut das typisierte Modell aus der JSON-Struktur (Level sortiert, Frage-IDs als Tupel,
+    Glossar-Matcher vorberechnet).
+    """
+    dims = tuple(_build_dimension(d) for d in data.get("dimensions", []) or [] if isinstance(d, Mapping))
+    glossary = data.get("glossary") or {}
+    glossary = dict(glossary) if isinstance(glossary, Mapping) else {}
+    return MaturityModel(
+        name=_text(data.get("name")),
+        description=_text(data.get("description")),
+        levels_info={str(k): str(v) for k, v in (data.get("levels_info") or {}).items()},
+        dimensions=dims,
+        sorted_dimensions=tuple(sorted(dims, key=lambda d: code_sort_key(d.code))),
+        glossary=glossary,
+        glossary_matcher=build_glossary_matcher(glossary),
+    )
+
+
+# -----------------------------
+# Validierung
+# -----------------------------
+@dataclass(frozen=True)
+class ModelIssue:
+    severity: str
+    language: str
+    location: str
+    message: str
+
+    def __str__(self) -> str:
+        where = f"{self.language}:{self.location}" if self.location else self.language
+        return f"[{self.severity}] {where}: {self.message}"
+
+
+class ModelValidationError(ValueError):
+    def __init__(self, issues: List[ModelIssue]) -> None:
+        self.issues = issues
+        errors = [i for i in issues if i.severity == SEVERITY_ERROR]
+        super().__init__(f"Modell ungültig ({len(errors)} Fehler): " + "; ".join(str(i) for i in errors[:5]))
+
+
+def _model_texts(model: MaturityModel):
+    for dim in model.dimensions:
+        profile = dim.process_profile
+        yield from (profile.purpose, profile.results, profile.basic_practices, profile.work_products)
+        for lvl in dim.levels:
+            yield lvl.acceptance_criteria
+            yield lvl.benefit_text or ""
+            yield from (q.text for q in lvl.questions)
+
+
+def validate_model(data: Any, language: str) -> List[ModelIssue]:
+    """
+    Prüft ein Modell (JSON-Struktur) auf Fehler, die sonst erst beim Rendern auffallen:
+    doppelte Kürzel/Frage-IDs, Stufennummerierung, fehlende Kategorien, Zielwerte, Glossar.
+    """
+    issues: List[ModelIssue] = []
+
+    def _issue(severity: str, location: str, message: str) -> None:
+        issues.append(ModelIssue(severity, language, location, message))
+
+    if not isinstance(data, Mapping):
+        _issue(SEVERITY_ERROR, "", "Modell muss ein JSON-Objekt sein.")
+        return issues
+
+    dims = data.get("dimensions")
+    if not isinstance(dims, list) or not dims:
+        _issue(SEVERITY_ERROR, "dimensions", "Keine Dimensionen vorhanden.")
+        dims = []
+
+    seen_codes: Dict[str, int] = {}
+    seen_questions: Dict[str, str] = {}
+
+    for d_idx, dim in enumerate(dims):
+        where = f"dimensions[{d_idx}]"
+        if not isinstance(dim, Mapping):
+            _issue(SEVERITY_ERROR, where, "Dimension muss ein Objekt sein.")
+            continue
+
+        code = _text(dim.get("code"))
+        if not code:
+            _issue(SEVERITY_ERROR, where, "Dimension ohne Kürzel (code).")
+        else:
+            where = code
+            if code in seen_codes:
+                _issue(SEVERITY_ERROR, where, f"Kürzel doppelt (auch dimensions[{seen_codes[code]}]).")
+            seen_codes.setdefault(code, d_idx)
+
+        if not _text(dim.get("name")):
+            _issue(SEVERITY_ERROR, where, "Dimension ohne Namen.")
+
+        category = _text(dim.get("category"))
+        prefix = re.match(r"^([A-Za-z]+)", code)
+        if not category:
+            _issue(SEVERITY_ERROR, where, "Kategorie fehlt.")
+        elif category.upper() not in CATEGORY_ORDER:
+            _issue(SEVERITY_WARNING, where, f"Unbekannte Kategorie {category!r} (erwartet: {', '.join(CATEGORY_ORDER)}).")
+        elif prefix and prefix.group(1).upper() != category.upper():
+            _issue(SEVERITY_WARNING, where, f"Kategorie {category!r} passt nicht zum Kürzel.")
+
+        try:
+            target = float(dim.get("default_target_level", 3))
+            if not 1 <= target <= 5:
+                raise ValueError
+        except (TypeError, ValueError):
+            _issue(SEVERITY_ERROR, where, f"default_target_level muss zwischen 1 und 5 liegen: {dim.get('default_target_level')!r}")
+
+        levels = dim.get("levels")
+        if not isinstance(levels, list) or not levels:
+            _issue(SEVERITY_ERROR, where, "Keine Stufen vorhanden.")
+            continue
+
+        numbers: List[int] = []
+        for l_idx, lvl in enumerate(levels):
+            lwhere = f"{where}/levels[{l_idx}]"
+            if not isinstance(lvl, Mapping):
+                _issue(SEVERITY_ERROR, lwhere, "Stufe muss ein Objekt sein.")
+                continue
+            try:
+                number = int(lvl.get("level_number"))
+            except (TypeError, ValueError):
+                _issue(SEVERITY_ERROR, lwhere, f"Ungültige level_number: {lvl.get('level_number')!r}")
+                continue
+            numbers.append(number)
+            lwhere = f"{where}/L{number}"
+
+            questions = lvl.get("questions")
+            if not isinstance(questions, list) or not questions:
+                _issue(SEVERITY_WARNING, lwhere, "Stufe ohne Fragen (zählt als nicht anwendbar).")
+                continue
+
+            for q_idx, q in enumerate(questions, start=1):
+                qwhere = f"{lwhere}/Q{q_idx}"
+                if not isinstance(q, Mapping):
+                    _issue(SEVERITY_ERROR, qwhere, "Frage muss ein Objekt sein.")
+                    continue
+                qid = _text(q.get("id"))
+                if not qid:
+                    _issue(SEVERITY_ERROR, qwhere, "Frage ohne ID.")
+                else:
+                    if qid in seen_questions:
+                        _issue(SEVERITY_ERROR, qwhere, f"Frage-ID {qid!r} doppelt (auch {seen_questions[qid]}).")
+                    seen_questions.setdefault(qid, qwhere)
+                    if code and not qid.startswith(code):
+                        _issue(SEVERITY_WARNING, qwhere, f"Frage-ID {qid!r} beginnt nicht mit dem Kürzel {code}.")
+                if not _text(q.get("text")):
+                    _issue(SEVERITY_ERROR, qwhere, "Frage ohne Text.")
+
+        if len(set(numbers)) != len(numbers):
+            _issue(SEVERITY_ERROR, where, f"Stufennummern doppelt: {sorted(numbers)}")
+        elif numbers and sorted(numbers) != list(range(1, len(numbers) + 1)):
+            _issue(SEVERITY_ERROR, where, f"Stufen müssen lückenlos bei 1 beginnen: {sorted(numbers)}")
+
+    glossary = data.get("glossary", {})
+    if not isinstance(glossary, Mapping):
+        _issue(SEVERITY_ERROR, "glossary", "Glossar muss ein Objekt (Begriff -> Definition) sein.")
+        return issues
+
+    for term, definition in glossary.items():
+        if not _text(term):
+            _issue(SEVERITY_ERROR, "glossary", "Leerer Glossarbegriff.")
+        elif not _text(definition):
+            _issue(SEVERITY_ERROR, f"glossary/{term}", "Glossarbegriff ohne Definition.")
+
+    if not any(i.severity == SEVERITY_ERROR for i in issues):
+        # Glossarbegriffe, auf die kein Modelltext verlinkt (gleiche Erkennung wie in der Erhebung)
+        model = build_model(data)
+        matcher = model.glossary_matcher
+        pattern = matcher.pattern
+        referenced = set()
+        if pattern is not None:
+            for text in _model_texts(model):
+                for m in pattern.finditer(text or ""):
+                    canonical = matcher.canonical(m.group(0))
+                    if canonical:
+                        referenced.add(canonical)
+        for term in glossary:
+            if _text(term) and term not in referenced:
+                _issue(SEVERITY_WARNING, f"glossary/{term}", "Begriff wird in keinem Modelltext verlinkt.")
+
+    return issues
+
+
+def validate_models(models: Mapping[str, Any]) -> List[ModelIssue]:
+    """
+    validate_model je Sprache plus Abgleich der Sprachen: gleiche Struktur (Kürzel, Kategorien,
+    Zielwerte, Stufen, Frage-IDs; Antworten gelten sprachübergreifend), Glossare positionsgleich.
+    """
+    issues: List[ModelIssue] = []
+    for language, data in models.items():
+        issues.extend(validate_model(data, language))
+
+    # Struktur je Sprache gegen die Basissprache (wie beim Zusammenführen, core.model_bilingual)
+    languages = [lang for lang, data in models.items() if isinstance(data, Mapping)]
+    if len(languages) > 1:
+        base = BASE_LANGUAGE if BASE_LANGUAGE in languages else languages[0]
+        base_skeleton = skeleton_of(build_model(models[base]))
+        for other in languages:
+            if other == base:
+                continue
+            for location, message in skeleton_drift(base_skeleton, skeleton_of(build_model(models[other]))):
+                issues.append(ModelIssue(SEVERITY_ERROR, other, location, f"{message} ({base} ist Basis)"))
+    return issues
+
+
+# -----------------------------
+# Artefakt
+# -----------------------------
+class ArtifactError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class ModelArtifact:
+    """
+    Kompiliertes Modell aller Sprachen: zweisprachiges Modell (ein Gerüst, je Sprache eine
+    Texttabelle; typisierte Modelle über models) und Suchindex. content_hash identifiziert
+    den Modellstand (Quelldateien + Format), unabhängig vom Build.
+    Aus einer Datei gelesen ist search_index None; read_search_index() lädt ihn bei Bedarf.
+    """
+    content_hash: str
+    sources: Mapping[str, Mapping[str, str]]  # Sprache -> {"file", "sha256"}
+    model: BilingualModel
+    search_index: Optional[ModelSearchIndex] = None
+    warnings: Tuple[ModelIssue, ...] = ()
+    version: int = ARTIFACT_VERSION
+    header: Mapping[str, Any] = field(default_factory=dict, compare=False)
+    path: Optional[Path] = field(default=None, compare=False)
+    payload_offset: int = field(default=0, compare=False)
+
+    @property
+    def models(self) -> Mapping[str, MaturityModel]:
+        # Sprache -> typisiertes Modell, zusammengesetzt beim ersten Zugriff
+        return self.model.models
+
+
+def _sha256(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+def schema_fingerprint() -> str:
+    """
+    Felder der gepickelten Klassen: ändert sich der Code, passt ein altes Artefakt nicht mehr.
+    """
+    parts = [
+        f"{cls.__name__}:{','.join(f.name for f in dataclasses.fields(cls))}"
+        for cls in (LevelSkeleton, DimensionSkeleton, ModelSkeleton, TextTable)
+    ]
+    parts.append("slots:" + ",".join(map(str, TEXT_SLOTS)))
+    parts.append("BilingualModel:" + ",".join(sorted(BilingualModel.PICKLED_ATTRS)))
+    parts.append("ModelSearchIndex:" + ",".join(sorted(ModelSearchIndex.PICKLED_ATTRS)))
+    return _sha256("|".join(parts).encode("utf-8"))[:16]
+
+
+def _content_hash(sources: Mapping[str, Mapping[str, str]]) -> str:
+    basis = {"version": ARTIFACT_VERSION, "schema": schema_fingerprint(), "sources": {k: sources[k]["sha256"] for k in sorted(sources)}}
+    return _sha256(json.dumps(basis, sort_keys=True).encode("utf-8"))
+
+
+def compile_models(sources: Mapping[str, Path]) -> ModelArtifact:
+    """
+    Validiert und kompiliert die Modelldateien (Sprache -> Pfad).
+    Fehler: ModelValidationError mit allen Befunden; Warnungen landen im Artefakt.
+    """
+    raw_models: Dict[str, Any] = {}
+    source_info: Dict[str, Dict[str, str]] = {}
+    for language, path in sources.items():
+        raw = Path(path).read_bytes()
+        source_info[language] = {"file": Path(path).name, "sha256": _sha256(raw)}
+        raw_models[language] = json.loads(raw.decode("utf-8"))
+
+    issues = validate_models(raw_models)
+    if any(i.severity == SEVERITY_ERROR for i in issues):
+        raise ModelValidationError(issues)
+
+    return ModelArtifact(
+        content_hash=_content_hash(source_info),
+        sources=source_info,
+        model=merge_models({lang: build_model(data) for lang, data in raw_models.items()}, BASE_LANGUAGE),
+        search_index=ModelSearchIndex(raw_models),
+        warnings=tuple(issues),
+    )
+
+
+def write_artifact(artifact: ModelArtifact, path: Path) -> int:
+    """
+    Schreibt das Artefakt atomar: Magic, Header (JSON) und Payload aus getrennt gepickelten
+    Sektionen (Modell, Suchindex), damit load_model() den Suchindex nicht mitlädt. Rückgabe: Bytes.
+    """
+    parts = {"model": pickle.dumps({"model": artifact.model, "warnings": artifact.warnings}, protocol=pickle.HIGHEST_PROTOCOL)}
+    if artifact.search_index is not None:
+        parts["search_index"] = pickle.dumps(artifact.search_index, protocol=pickle.HIGHEST_PROTOCOL)
+    # Sektion -> [Offset im Payload, Länge, SHA-256]
+    sections: Dict[str, List[Any]] = {}
+    position = 0
+    for name, raw in parts.items():
+        sections[name] = [position, len(raw), _sha256(raw)]
+        position += len(raw)
+    payload = b"".join(parts.values())
+    header = {
+        "format": ARTIFACT_FORMAT,
+        "version": ARTIFACT_VERSION,
+        "schema": schema_fingerprint(),
+        "content_hash": artifact.content_hash,
+        "sections": sections,
+        "sources": {k: dict(v) for k, v in artifact.sources.items()},
+        "created_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+    }
+    head = json.dumps(header, ensure_ascii=False, sort_keys=True).encode("utf-8")
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(ARTIFACT_MAGIC + _HEADER_LEN.pack(len(head)) + head + payload)
+    os.replace(tmp, path)
+    return len(ARTIFACT_MAGIC) + _HEADER_LEN.size + len(head) + len(payload)
+
+
+def read_artifact_header(f: BinaryIO) -> Tuple[Dict[str, Any], int]:
+    """
+    Liest Magic und Header ab Dateianfang. Rückgabe: Header und Offset des Payloads.
+    """
+    start = len(ARTIFACT_MAGIC) + _HEADER_LEN.size
+    prefix = f.read(start)
+    if len(prefix) < start or not prefix.startswith(ARTIFACT_MAGIC):
+        raise ArtifactError("Kein Modell-Artefakt (Magic fehlt).")
+    (length,) = _HEADER_LEN.unpack_from(prefix, len(ARTIFACT_MAGIC))
+    header = json.loads(f.read(length).decode("utf-8"))
+    if header.get("format") != ARTIFACT_FORMAT or header.get("version") != ARTIFACT_VERSION:
+        raise ArtifactError(f"Artefakt-Version {header.get('version')!r} wird nicht unterstützt.")
+    if header.get("schema") != schema_fingerprint():
+        raise ArtifactError("Artefakt passt nicht zum aktuellen Code (Schema geändert), bitte neu kompilieren.")
+    return header, start + length
+
+
+def verify_sources(recorded: Mapping[str, Mapping[str, str]], sources: Mapping[str, Path]) -> None:
+    """
+    Prüft aufgezeichnete Quelldateien (Sprache -> {"sha256"}) gegen die aktuellen Modelldateien.
+    """
+    for language, src in sources.items():
+        info = recorded.get(language)
+        if info is None:
+            raise ArtifactError(f"Artefakt enthält keine Sprache {language!r}.")
+        try:
+            digest = _sha256(Path(src).read_bytes())
+        except OSError as exc:
+            raise ArtifactError(f"Modelldatei nicht lesbar: {src}") from exc
+        if digest != info.get("sha256"):
+            raise ArtifactError(f"Artefakt ist veraltet ({Path(src).name} wurde geändert).")
+
+
+def _read_section(f: BinaryIO, header: Mapping[str, Any], offset: int, name: str) -> bytes:
+    section = header.get("sections", {}).get(name)
+    if section is None:
+        raise ArtifactError(f"Artefakt enthält keine Sektion {name!r}.")
+    position, length, digest = section
+    f.seek(offset + int(position))
+    raw = f.read(int(length))
+    if len(raw) != int(length) or _sha256(raw) != digest:
+        raise ArtifactError(f"Artefakt beschädigt (Prüfsumme der Sektion {name!r} stimmt nicht).")
+    return raw
+
+
+def read_artifact(path: Path, sources: Optional[Mapping[str, Path]] = None) -> ModelArtifact:
+    """
+    Liest Header und Modell-Sektion eines Artefakts (den Suchindex erst read_search_index()).
+    Mit sources wird geprüft, dass es zu den aktuellen Modelldateien passt (SHA-256 je Datei);
+    sonst ArtifactError (Aufrufer fällt auf JSON zurück).
+    """
+    path = Path(path)
+    with path.open("rb") as f:
+        header, offset = read_artifact_header(f)
+        recorded = header.get("sources", {})
+        verify_sources(recorded, sources or {})
+        data = pickle.loads(_read_section(f, header, offset, "model"))
+
+    return ModelArtifact(
+        content_hash=header["content_hash"],
+        sources=recorded,
+        model=data["model"],
+        warnings=tuple(data.get("warnings", ())),
+        header=header,
+        path=path,
+        payload_offset=offset,
+    )
+
+
+def read_search_index(artifact: ModelArtifact, token: str = "") -> Optional[ModelSearchIndex]:
+    """
+    Suchindex des Artefakts; aus der Datei erst beim ersten Bedarf entpickelt.
+    token wird als Dateistand in den Index übernommen. None, wenn das Artefakt keinen enthält.
+    """
+    if artifact.search_index is not None:
+        return artifact.search_index
+    if artifact.path is None or "search_index" not in artifact.header.get("sections", {}):
+        return None
+    with artifact.path.open("rb") as f:
+        index = pickle.loads(_read_section(f, artifact.header, artifact.payload_offset, "search_index"))
+    index.token = token
+    return index
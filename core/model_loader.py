@@ -1,27 +1,71 @@
 # core/model_loader.py
 from __future__ import annotations
 
+import functools
 import json
+import logging
+import threading
 from pathlib import Path
 
 import streamlit as st
 
+from core.file_watch import MISSING, FileWatcher, get_file_watcher
 from core.i18n import get_language, normalize_language
+from core.model_compiler import (
+    ArtifactError,
+    ModelArtifact,
+    ModelValidationError,
+    compile_models,
+    read_artifact,
+    write_artifact,
+)
+from core.model_mmap import MappedLanguage, MappedModel, write_mapped_model
+from core.model_registry import DEFAULT_MODEL_ID, ModelEntry, ModelRef, ModelRegistry, get_model_registry
+from core.types import MaturityModel
 
 
 # Basisverzeichnis: .../unidoku/
 BASE_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = BASE_DIR / "data"
+MODELS_DIR = DATA_DIR / "models"
 
+# Modell der Erhebung (Session/Snapshot), siehe active_model_ref()
+MODEL_ID_KEY = "model_id"
+MODEL_VERSION_KEY = "model_version"
 
-def _json_cache_token(path: Path) -> str:
-    try:
-        stat = path.stat()
-        return f"{stat.st_mtime_ns}:{stat.st_size}"
-    except OSError:
-        return "missing"
+# Kompiliertes Modell (scripts/compile_model.py); fehlt es oder ist es veraltet, wird JSON gelesen
+ARTIFACT_PATH = MODELS_DIR / "compiled" / "niro_td_model.rgmc"
+# Speicherabbild desselben Stands (core.model_mmap), von allen Prozessen eines Hosts geteilt
+MAPPED_PATH = ARTIFACT_PATH.with_suffix(".rgmm")
+
+# Vom Dateiwächter beobachtet (Modelle, Artefakte, Meta/Glossar, Maßnahmen-Shards)
+WATCHED_DIRS = (DATA_DIR, MODELS_DIR, ARTIFACT_PATH.parent, DATA_DIR / "measures")
+
+_log = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=1)
+def data_watcher() -> FileWatcher:
+    return get_file_watcher(WATCHED_DIRS)
 
 
-@st.cache_data
+def data_token(path: Path) -> str:
+    """
+    Stand einer Datei/eines Ordners unter data/: ändert sich nur, wenn der Dateiwächter dort
+    eine Änderung sieht (kein stat() je Aufruf). Ohne Wächter: mtime:size.
+    """
+    return data_watcher().token(path)
+
+
+def data_version() -> int:
+    """
+    Zähler aller Änderungen unter data/ seit Prozessstart; für abgeleitete Caches
+    (Suchindex, vorgerenderte Seiten, Exporte), die auf irgendeine Datenänderung reagieren.
+    """
+    return data_watcher().version
+
+
+@st.cache_data(max_entries=32)
 def _load_json_file(path_str: str, cache_token: str) -> dict:
     """Load JSON with a file-token argument so Streamlit Cloud cache refreshes."""
     path = Path(path_str)
@@ -35,12 +79,68 @@ def _load_json_file(path_str: str, cache_token: str) -> dict:
 
 
 def _load_json_file_uncached(path: Path) -> dict:
-    return _load_json_file(str(path), _json_cache_token(path))
+    return _load_json_file(str(path), data_token(path))
+
+
+@functools.lru_cache(maxsize=1)
+def model_registry() -> ModelRegistry:
+    return get_model_registry(MODELS_DIR, token=data_token)
+
+
+@functools.lru_cache(maxsize=32)
+def _warn_unknown_model(ref: str) -> None:
+    _log.warning("Modell %s der Erhebung nicht gefunden, nutze das aktuelle Standardmodell.", ref)
+
+
+def active_model_ref() -> ModelRef:
+    """
+    Modell (ID und Version) der laufenden Erhebung. Ohne Festlegung wird die neueste Version
+    des Standardmodells in der Session festgehalten und mit dem Snapshot gespeichert, damit
+    eine Erhebung auch nach einem Modell-Update gegen ihr eigenes Modell ausgewertet wird.
+    """
+    registry = model_registry()
+    model_id = str(st.session_state.get(MODEL_ID_KEY) or "").strip()
+    version = str(st.session_state.get(MODEL_VERSION_KEY) or "").strip()
+    if model_id and version:
+        ref = ModelRef(model_id, version)
+        if ref in registry.models():
+            return ref
+        _warn_unknown_model(str(ref))
+        return registry.latest()
+
+    ref = registry.latest(model_id or DEFAULT_MODEL_ID)
+    st.session_state[MODEL_ID_KEY] = ref.model_id
+    st.session_state[MODEL_VERSION_KEY] = ref.version
+    return ref
+
+
+def _active_entry(language: str | None = None) -> ModelEntry:
+    ref = active_model_ref()
+    return model_registry().resolve(ref.model_id, ref.version, normalize_language(language or get_language()))
+
+
+def _is_default_model(entry: ModelEntry) -> bool:
+    # Artefakt und Speicherabbild gibt es nur für die neueste Version des Standardmodells
+    return entry.ref == model_registry().latest()
 
 
 def _model_path_for_language(language: str) -> Path:
-    filename = "niro_td_model_en.json" if normalize_language(language) == "en" else "niro_td_model.json"
-    return BASE_DIR / "data" / "models" / filename
+    return _active_entry(language).path
+
+
+def model_sources() -> dict[str, Path]:
+    """
+    Sprache -> Datei der neuesten Version des Standardmodells (Basis für Artefakt und Suchindex).
+    """
+    return model_registry().sources()
+
+
+def model_file_token(language: str | None = None) -> str:
+    """
+    Dateitoken (data_token) des Modells einer Sprache, z. B. fuer abgeleitete Indizes.
+    """
+    path = _model_path_for_language(language)
+    return f"{path.name}={data_token(path)}"
 
 
 def load_model_config(language: str | None = None) -> dict:
@@ -48,12 +148,121 @@ def load_model_config(language: str | None = None) -> dict:
     Laedt die Reifegradmodell-Konfiguration aus data/models.
     Der Dateitoken verhindert stale Streamlit-Cloud-Caches nach Deployments.
     """
-    return _load_json_file_uncached(_model_path_for_language(normalize_language(language or get_language())))
+    return _load_json_file_uncached(_model_path_for_language(language))
+
+
+def load_source_configs() -> dict[str, dict]:
+    """
+    JSON aller Sprachen des Standardmodells (passend zu models_token()).
+    """
+    return {lang: _load_json_file_uncached(path) for lang, path in model_sources().items()}
+
+
+@functools.lru_cache(maxsize=2)
+def _artifact(artifact_token: str, sources_token: str) -> ModelArtifact | None:
+    if artifact_token == MISSING:
+        return None
+    try:
+        return read_artifact(ARTIFACT_PATH, model_sources())
+    except (ArtifactError, OSError, ValueError) as exc:
+        _log.warning("Kompiliertes Modell wird ignoriert (%s), lade JSON.", exc)
+        return None
+
+
+def models_token() -> str:
+    """
+    Dateistand aller Modellsprachen (z. B. für den Suchindex).
+    """
+    # Mit Dateinamen: Stände sind nur je Datei eindeutig (Versionswechsel -> andere Dateien)
+    return "|".join(f"{path.name}={data_token(path)}" for path in model_sources().values())
+
+
+def load_artifact() -> ModelArtifact | None:
+    """
+    Kompiliertes Modell, sofern vorhanden und passend zu den aktuellen JSON-Dateien (SHA-256).
+    Geprüft wird einmal je Dateistand.
+    """
+    return _artifact(data_token(ARTIFACT_PATH), models_token())
+
+
+@functools.lru_cache(maxsize=2)
+def _mapped(mapped_token: str, sources_token: str) -> MappedModel | None:
+    if mapped_token == MISSING:
+        return None
+    try:
+        return MappedModel(MAPPED_PATH, model_sources())
+    except (ArtifactError, OSError, ValueError, KeyError) as exc:
+        _log.warning("Modell-Speicherabbild wird ignoriert (%s).", exc)
+        return None
+
+
+_BUILD_LOCK = threading.Lock()
+_BUILD_STARTED = False
+
+
+def _build_compiled_model() -> None:
+    try:
+        artifact = compile_models(model_sources())
+        write_artifact(artifact, ARTIFACT_PATH)
+        write_mapped_model(artifact, MAPPED_PATH)
+        _log.info("Kompiliertes Modell gebaut: %s", ARTIFACT_PATH)
+    except ModelValidationError as exc:
+        _log.error("Modell ungültig, kein Artefakt gebaut:\n%s", "\n".join(str(i) for i in exc.issues))
+    except OSError as exc:
+        # z. B. schreibgeschütztes Deployment: es bleibt beim JSON-Pfad
+        _log.warning("Kompiliertes Modell konnte nicht geschrieben werden (%s).", exc)
+
+
+def ensure_compiled_model(background: bool = True) -> None:
+    """
+    Baut Artefakt und Speicherabbild einmal je Prozess, wenn sie fehlen oder nicht zu den
+    JSON-Dateien passen (Deployments ohne Build-Schritt, z. B. Streamlit Community Cloud).
+    Bis der Build fertig ist, wird JSON gelesen; der Dateiwächter meldet die neuen Dateien.
+    """
+    global _BUILD_STARTED
+    with _BUILD_LOCK:
+        if _BUILD_STARTED:
+            return
+        _BUILD_STARTED = True
+    if load_artifact() is not None and _mapped(data_token(MAPPED_PATH), models_token()) is not None:
+        return
+    if background:
+        threading.Thread(target=_build_compiled_model, name="rgm-model-compile", daemon=True).start()
+    else:
+        _build_compiled_model()
+
+
+def load_mapped_model(language: str | None = None) -> MappedLanguage | None:
+    """
+    Modell einer Sprache als Speicherabbild (Übersicht/Scoring ohne Python-Objekte je Prozess);
+    None, wenn keines vorliegt oder es nicht zu den JSON-Dateien passt (dann load_model()).
+    """
+    entry = _active_entry(language)
+    if not _is_default_model(entry):
+        return None
+    mapped = _mapped(data_token(MAPPED_PATH), models_token())
+    if mapped is None or entry.language not in mapped.languages:
+        return None
+    return mapped.language(entry.language)
+
+
+def load_model(language: str | None = None) -> MaturityModel:
+    """
+    Typisiertes, eingefrorenes Modell der laufenden Erhebung (active_model_ref) in einer Sprache;
+    aus dem kompilierten Artefakt, sonst aus der Registry (LRU, einmal je Dateistand gebaut).
+    Prozessweit geteilt (nicht veränderbar, daher ohne Kopie).
+    """
+    entry = _active_entry(language)
+    if _is_default_model(entry):
+        artifact = load_artifact()
+        if artifact is not None and entry.language in artifact.models:
+            return artifact.models[entry.language]
+    return model_registry().load(entry)
 
 
 def _meta_path_for_language(language: str) -> Path:
     filename = "niro_td_meta_en.json" if normalize_language(language) == "en" else "niro_td_meta.json"
-    return BASE_DIR / "data" / filename
+    return DATA_DIR / filename
 
 
 def load_tool_meta(language: str | None = None) -> dict:
@@ -62,14 +271,20 @@ def load_tool_meta(language: str | None = None) -> dict:
     (separate Datei, unabhaengig vom Modell)
     """
     path = _meta_path_for_language(normalize_language(language or get_language()))
-    if not path.exists():
+    token = data_token(path)
+    if token == MISSING:
         return {}
-    return _load_json_file_uncached(path)
+    return _load_json_file(str(path), token)
 
 
-@st.cache_data
 def load_glossary():
-    path = BASE_DIR / "data" / "glossary.json"
+    path = DATA_DIR / "glossary.json"
+    return _load_glossary_file(str(path), data_token(path))
+
+
+@st.cache_data(max_entries=4)
+def _load_glossary_file(path_str: str, cache_token: str):
+    path = Path(path_str)
     if not path.exists():
         return {}
 
@@ -0,0 +1,325 @@
+# core/model_mmap.py
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from core.model_compiler import ArtifactError, ModelArtifact, _sha256, verify_sources
+from core.overview import _infer_category
+from core.scoring import ScoringProfile, get_scoring_profile
+from core.simulation import _ModelMatrix, _score_vector, score_matrix
+from core.types import MaturityModel
+
+# Speicherabbild des kompilierten Modells (data/models/compiled/niro_td_model.rgmm):
+# flache Arrays statt Python-Objekten. Alle Prozesse eines Hosts, die dieselbe Datei
+# mappen, teilen sich die physischen Seiten (Page Cache); nichts davon landet im Heap.
+#
+# Aufbau: Magic, Header-Länge, Header (JSON mit Sektionstabelle), Sektionen (8-Byte-ausgerichtet).
+# - strings.offsets / strings.data: Stringtabelle (UTF-8, dedupliziert über beide Sprachen)
+# - skeleton.*: sprachunabhängiges Gerüst, einmal für alle Sprachen: Kürzel, Kategorien,
+#   Zielwerte, Stufennummern, Frage-IDs; dim.levels und level.questions sind Offsets
+#   (n + 1 Einträge); skeleton.score.* ist die Spaltenform für den vektorisierten Kernel
+#   (wie core.simulation._ModelMatrix)
+# - <lang>.dim.* / <lang>.level.* / <lang>.question.* / <lang>.glossary.*: Texte als
+#   Stringreferenzen (int32, -1 = None)
+
+MAPPED_MAGIC = b"RGMMAPPD"
+MAPPED_FORMAT = "rgm_model_mmap"
+MAPPED_VERSION = 2
+_HEADER_LEN = struct.Struct("<I")
+_ALIGN = 8
+_NONE = -1
+
+_STR = "<i4"
+_DIM_TEXTS = ("name", "description", "purpose", "results", "basic_practices", "work_products")
+_LEVEL_TEXTS = ("name", "acceptance_criteria", "implementation_text", "benefit_text", "comment_hint")
+_QUESTION_TEXTS = ("text", "help_text")
+
+
+# -----------------------------
+# Schreiben
+# -----------------------------
+class _StringTable:
+    def __init__(self) -> None:
+        self._index: Dict[str, int] = {}
+        self._chunks: List[bytes] = []
+        self._offsets: List[int] = [0]
+
+    def ref(self, value: Optional[str]) -> int:
+        if value is None:
+            return _NONE
+        idx = self._index.get(value)
+        if idx is None:
+            raw = value.encode("utf-8")
+            idx = self._index[value] = len(self._chunks)
+            self._chunks.append(raw)
+            self._offsets.append(self._offsets[-1] + len(raw))
+        return idx
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        return np.array(self._offsets, dtype="<u4"), np.frombuffer(b"".join(self._chunks), dtype="u1")
+
+
+def _skeleton_sections(model: MaturityModel, strings: _StringTable) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    # Sprachunabhängig (für alle Sprachen gleich, siehe core.model_bilingual): einmal gespeichert
+    dims = model.dimensions
+    levels = [lvl for dim in dims for lvl in dim.levels]
+    question_ids = [q for lvl in levels for q in lvl.question_ids]
+    by_identity = {id(dim): i for i, dim in enumerate(dims)}
+    max_levels = max((len(d.levels) for d in dims), default=0) or 1
+
+    sections: Dict[str, np.ndarray] = {
+        "dim.code": np.array([strings.ref(d.code) for d in dims], dtype=_STR),
+        "dim.category": np.array([strings.ref(d.category) for d in dims], dtype=_STR),
+        "dim.default_target_level": np.array([d.default_target_level for d in dims], dtype="<f8"),
+        "dim.levels": np.cumsum([0] + [len(d.levels) for d in dims]).astype("<i4"),
+        "dim.sorted": np.array([by_identity[id(d)] for d in model.sorted_dimensions], dtype="<i4"),
+        "level.level_number": np.array([lvl.level_number for lvl in levels], dtype="<i4"),
+        "level.questions": np.cumsum([0] + [len(lvl.questions) for lvl in levels]).astype("<i4"),
+        "question.id": np.array([strings.ref(q) for q in question_ids], dtype=_STR),
+    }
+
+    # Kernel-Spalten: Fragen liegen bereits in Modellreihenfolge, je Level ein Block
+    starts: List[int] = []
+    slots: List[int] = []
+    column = 0
+    for d_idx, dim in enumerate(dims):
+        for l_idx, lvl in enumerate(dim.levels):
+            if lvl.questions:
+                starts.append(column)
+                slots.append(d_idx * max_levels + l_idx)
+                column += len(lvl.questions)
+    sections["score.level_starts"] = np.array(starts, dtype="<i8")
+    sections["score.level_slots"] = np.array(slots, dtype="<i8")
+    sections["score.level_one_first"] = np.array(
+        [bool(d.levels) and d.levels[0].level_number == 1 for d in dims], dtype="?"
+    )
+    sections["score.has_levels"] = np.array([bool(d.levels) for d in dims], dtype="?")
+
+    meta = {"max_levels": max_levels, "dimensions": len(dims), "levels": len(levels), "questions": len(question_ids)}
+    return sections, meta
+
+
+def _text_sections(model: MaturityModel, strings: _StringTable) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    dims = model.dimensions
+    levels = [lvl for dim in dims for lvl in dim.levels]
+    questions = [q for lvl in levels for q in lvl.questions]
+
+    sections: Dict[str, np.ndarray] = {}
+    profile_fields = {"purpose", "results", "basic_practices", "work_products"}
+    for name in _DIM_TEXTS:
+        values = [getattr(d.process_profile if name in profile_fields else d, name) for d in dims]
+        sections[f"dim.{name}"] = np.array([strings.ref(v) for v in values], dtype=_STR)
+    for name in _LEVEL_TEXTS:
+        sections[f"level.{name}"] = np.array([strings.ref(getattr(lvl, name)) for lvl in levels], dtype=_STR)
+    for name in _QUESTION_TEXTS:
+        sections[f"question.{name}"] = np.array([strings.ref(getattr(q, name)) for q in questions], dtype=_STR)
+
+    sections["glossary.term"] = np.array([strings.ref(k) for k in model.glossary], dtype=_STR)
+    sections["glossary.definition"] = np.array([strings.ref(v) for v in model.glossary.values()], dtype=_STR)
+
+    meta = {"name": model.name, "description": model.description, "levels_info": dict(model.levels_info)}
+    return sections, meta
+
+
+def write_mapped_model(artifact: ModelArtifact, path: Path) -> int:
+    """
+    Schreibt das Speicherabbild der Modelle eines Artefakts atomar. Rückgabe: Bytes.
+    """
+    strings = _StringTable()
+    base = artifact.model.base_language
+    skeleton_sections, skeleton = _skeleton_sections(artifact.models[base], strings)
+    sections: Dict[str, np.ndarray] = {f"skeleton.{name}": arr for name, arr in skeleton_sections.items()}
+    languages: Dict[str, Any] = {}
+    for language, model in sorted(artifact.models.items()):
+        lang_sections, meta = _text_sections(model, strings)
+        sections.update({f"{language}.{name}": arr for name, arr in lang_sections.items()})
+        languages[language] = meta
+    sections["strings.offsets"], sections["strings.data"] = strings.arrays()
+
+    # Offsets relativ zum Payload (beginnt ausgerichtet direkt nach dem Header)
+    table: Dict[str, List[Any]] = {}
+    chunks: List[bytes] = []
+    position = 0
+    for name, arr in sections.items():
+        pad = -position % _ALIGN
+        chunks.append(b"\0" * pad)
+        position += pad
+        raw = np.ascontiguousarray(arr).tobytes()
+        table[name] = [position, arr.dtype.str, int(arr.size)]
+        chunks.append(raw)
+        position += len(raw)
+    payload = b"".join(chunks)
+
+    header: Dict[str, Any] = {
+        "format": MAPPED_FORMAT,
+        "version": MAPPED_VERSION,
+        "content_hash": artifact.content_hash,
+        "payload_sha256": _sha256(payload),
+        "sources": {k: dict(v) for k, v in artifact.sources.items()},
+        "skeleton": skeleton,
+        "languages": languages,
+        "sections": table,
+    }
+    head = json.dumps(header, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    offset = _payload_offset(len(head))
+    padding = b"\0" * (offset - len(MAPPED_MAGIC) - _HEADER_LEN.size - len(head))
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(MAPPED_MAGIC + _HEADER_LEN.pack(len(head)) + head + padding + payload)
+    os.replace(tmp, path)
+    return offset + len(payload)
+
+
+def _payload_offset(header_length: int) -> int:
+    end = len(MAPPED_MAGIC) + _HEADER_LEN.size + header_length
+    return end + (-end % _ALIGN)
+
+
+# -----------------------------
+# Lesen
+# -----------------------------
+class MappedModel:
+    """
+    Nur-lesendes Speicherabbild aller Modellsprachen. Die Arrays sind Sichten auf das
+    mmap (np.frombuffer, keine Kopie); Texte werden erst beim Zugriff dekodiert.
+    """
+
+    def __init__(self, path: Path, sources: Optional[Mapping[str, Path]] = None, verify: bool = True) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        mm = self._mm
+        if mm[: len(MAPPED_MAGIC)] != MAPPED_MAGIC:
+            raise ArtifactError("Kein Modell-Speicherabbild (Magic fehlt).")
+        (length,) = _HEADER_LEN.unpack_from(mm, len(MAPPED_MAGIC))
+        start = len(MAPPED_MAGIC) + _HEADER_LEN.size
+        header = json.loads(mm[start : start + length].decode("utf-8"))
+        if header.get("format") != MAPPED_FORMAT or header.get("version") != MAPPED_VERSION:
+            raise ArtifactError(f"Speicherabbild-Version {header.get('version')!r} wird nicht unterstützt.")
+        self.header: Dict[str, Any] = header
+        self.content_hash: str = header["content_hash"]
+
+        verify_sources(header.get("sources", {}), sources or {})
+        offset = _payload_offset(length)
+        if verify and _sha256(memoryview(mm)[offset:]) != header.get("payload_sha256"):
+            raise ArtifactError("Speicherabbild beschädigt (Prüfsumme stimmt nicht).")
+
+        self._arrays: Dict[str, np.ndarray] = {
+            name: np.frombuffer(mm, dtype=np.dtype(dtype), count=count, offset=offset + pos)
+            for name, (pos, dtype, count) in header["sections"].items()
+        }
+        self._string_offsets = self._arrays["strings.offsets"]
+        self._string_base = offset + int(header["sections"]["strings.data"][0])
+        # Je Sprache: Gerüst (geteilt) plus eigene Texte
+        shared = {name[len("skeleton."):]: arr for name, arr in self._arrays.items() if name.startswith("skeleton.")}
+        self._languages = {
+            lang: MappedLanguage(
+                self,
+                lang,
+                {**header.get("skeleton", {}), **meta},
+                {**shared, **{n[len(lang) + 1 :]: a for n, a in self._arrays.items() if n.startswith(f"{lang}.")}},
+            )
+            for lang, meta in header.get("languages", {}).items()
+        }
+
+    @property
+    def languages(self) -> Tuple[str, ...]:
+        return tuple(self._languages)
+
+    def language(self, language: str) -> MappedLanguage:
+        return self._languages[language]
+
+    def array(self, name: str) -> np.ndarray:
+        return self._arrays[name]
+
+    def string(self, ref: int) -> Optional[str]:
+        if ref < 0:
+            return None
+        start = self._string_base + int(self._string_offsets[ref])
+        end = self._string_base + int(self._string_offsets[ref + 1])
+        return self._mm[start:end].decode("utf-8")
+
+
+class MappedLanguage:
+    """
+    Modell einer Sprache im Speicherabbild. Für Übersicht und Kernel genügen Kürzel,
+    Namen, Kategorien und Zielwerte; längere Texte über dimension_text()/question_text().
+    """
+
+    def __init__(self, owner: MappedModel, language: str, meta: Mapping[str, Any], arrays: Dict[str, np.ndarray]) -> None:
+        self.owner = owner
+        self._arrays = arrays
+        self.language = language
+        self.name: str = meta.get("name", "")
+        self.description: str = meta.get("description", "")
+        self.levels_info: Mapping[str, str] = meta.get("levels_info", {})
+        self.max_levels: int = int(meta.get("max_levels", 1))
+        self.dimension_count: int = int(meta.get("dimensions", 0))
+        self.question_count: int = int(meta.get("questions", 0))
+        self._matrix: Optional[_ModelMatrix] = None
+
+    def array(self, name: str) -> np.ndarray:
+        return self._arrays[name]
+
+    def _strings(self, name: str) -> Tuple[Optional[str], ...]:
+        return tuple(self.owner.string(int(ref)) for ref in self.array(name))
+
+    def dimension_text(self, index: int, field: str) -> Optional[str]:
+        return self.owner.string(int(self.array(f"dim.{field}")[index]))
+
+    def level_range(self, index: int) -> range:
+        bounds = self.array("dim.levels")
+        return range(int(bounds[index]), int(bounds[index + 1]))
+
+    def question_range(self, level: int) -> range:
+        bounds = self.array("level.questions")
+        return range(int(bounds[level]), int(bounds[level + 1]))
+
+    def question_text(self, index: int, field: str = "text") -> Optional[str]:
+        return self.owner.string(int(self.array(f"question.{field}")[index]))
+
+    def matrix(self) -> _ModelMatrix:
+        """
+        Spaltenform für core.simulation: die Zahlenarrays sind Sichten auf das mmap,
+        dekodiert werden nur Kürzel, Namen, Kategorien und Frage-IDs (einmal je Prozess).
+        """
+        if self._matrix is None:
+            codes = self._strings("dim.code")
+            question_ids = self._strings("question.id")
+            positions: Dict[Any, List[int]] = {}
+            for col, q_id in enumerate(question_ids):
+                positions.setdefault(q_id, []).append(col)
+            self._matrix = _ModelMatrix(
+                codes=codes,
+                names=self._strings("dim.name"),
+                categories=tuple(_infer_category(c, cat or "") for c, cat in zip(codes, self._strings("dim.category"))),
+                default_targets=self.array("dim.default_target_level"),
+                question_ids=question_ids,
+                positions={k: tuple(v) for k, v in positions.items()},
+                level_starts=self.array("score.level_starts"),
+                level_slots=self.array("score.level_slots"),
+                level_one_first=self.array("score.level_one_first"),
+                has_levels=self.array("score.has_levels"),
+                max_levels=self.max_levels,
+            )
+        return self._matrix
+
+    def score(self, answers: Mapping[str, Any], profile: ScoringProfile | str | None = None) -> Dict[str, float]:
+        """
+        Ist-Reifegrad je Dimensionscode (gleiche Regeln wie core.scoring.score_model).
+        """
+        prof = get_scoring_profile(profile)
+        matrix = self.matrix()
+        ist = score_matrix(_score_vector(answers or {}, matrix, prof)[None, :], matrix, prof)[0]
+        return dict(zip(matrix.codes, ist.tolist()))
+
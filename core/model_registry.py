@@ -0,0 +1,318 @@
+# core/model_registry.py
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.model_bilingual import BilingualModel, merge_models
+from core.model_compiler import BASE_LANGUAGE, build_model
+from core.types import MaturityModel
+
+# Modelldateien in data/models: <id>[@<version>][_<sprache>].json
+#   niro_td_model.json            -> niro_td_model, Version 1, de
+#   niro_td_model_en.json         -> niro_td_model, Version 1, en
+#   niro_td_model@2026.1_en.json  -> niro_td_model, Version 2026.1, en
+# Ohne Sprachsuffix ist die Datei deutsch, ohne Version gilt DEFAULT_VERSION.
+
+DEFAULT_MODEL_ID = "niro_td_model"
+DEFAULT_VERSION = "1"
+
+_FILE_RE = re.compile(r"^(?P<id>[A-Za-z0-9][A-Za-z0-9_\-]*?)(?:@(?P<version>[A-Za-z0-9.\-]+))?(?:_(?P<lang>[a-z]{2}))?\.json$")
+
+_log = logging.getLogger(__name__)
+
+
+class UnknownModelError(KeyError):
+    pass
+
+
+@dataclass(frozen=True)
+class ModelRef:
+    """
+    Modell-ID und Version (sprachunabhängig), z. B. für Snapshots.
+    """
+    model_id: str
+    version: str
+
+    def __str__(self) -> str:
+        return f"{self.model_id}@{self.version}"
+
+
+@dataclass(frozen=True)
+class ModelEntry:
+    ref: ModelRef
+    language: str
+    path: Path
+
+
+@dataclass(frozen=True)
+class RegistryStats:
+    resident: int
+    resident_bytes: int
+    max_models: int
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+def version_sort_key(version: str) -> Tuple[Any, ...]:
+    # Natürlich sortiert: 2026.10 nach 2026.9, Zahlen vor Text
+    return tuple((0, int(p), "") if p.isdigit() else (1, 0, p) for p in re.split(r"[.\-]", version))
+
+
+def parse_model_filename(name: str) -> Optional[Tuple[str, str, str]]:
+    """
+    (model_id, version, sprache) aus einem Dateinamen; None, wenn er nicht dem Schema folgt.
+    """
+    m = _FILE_RE.match(name)
+    if not m:
+        return None
+    return m.group("id"), m.group("version") or DEFAULT_VERSION, m.group("lang") or BASE_LANGUAGE
+
+
+def _file_token(path: Path) -> str:
+    try:
+        stat = path.stat()
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+    except OSError:
+        return "missing"
+
+
+def estimate_size(obj: Any) -> int:
+    """
+    Speicherbedarf eines Objektgraphen in Bytes (sys.getsizeof über alle erreichbaren,
+    noch nicht gezählten Objekte; geteilte Strings/Objekte einmal).
+    """
+    seen: set[int] = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        cur = stack.pop()
+        if id(cur) in seen or cur is None or isinstance(cur, (bool, int, float, type)):
+            continue
+        seen.add(id(cur))
+        total += sys.getsizeof(cur)
+        if isinstance(cur, (str, bytes)):
+            continue
+        if isinstance(cur, (dict, MappingProxyType)):
+            for k, v in cur.items():
+                stack.append(k)
+                stack.append(v)
+        elif isinstance(cur, (tuple, list, set, frozenset)):
+            stack.extend(cur)
+        else:
+            for name in getattr(type(cur), "__slots__", ()):
+                stack.append(getattr(cur, name, None))
+            stack.extend(getattr(cur, "__dict__", {}).values())
+    return total
+
+
+class ModelRegistry:
+    """
+    Verzeichnis aller Modelle in einem Ordner: Dateien werden beim ersten Zugriff entdeckt
+    (erneut, sobald sich der Ordner ändert), Modelle erst bei Bedarf gebaut.
+
+    Geladen wird je Modell (ID und Version) mit allen Sprachfassungen als BilingualModel;
+    diese liegen in einem LRU, begrenzt auf max_models Modelle und max_bytes (geschätzt,
+    siehe estimate_size, inkl. zusammengesetzter Sprachfassungen); das zuletzt geladene
+    bleibt immer erhalten. Ändert sich eine Datei, wird das Modell beim nächsten Zugriff neu gebaut.
+
+    token(pfad) liefert den Dateistand (Standard: mtime:size per stat(); die App übergibt den
+    Dateiwächter, core.model_loader.data_token).
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_models: int = 6,
+        max_bytes: int = 64 * 1024 * 1024,
+        token: Callable[[Path], str] = _file_token,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_models = max(1, int(max_models))
+        self.max_bytes = max(0, int(max_bytes))
+        self._token = token
+        self._entries: Dict[Tuple[str, str, str], ModelEntry] = {}
+        self._models: Dict[ModelRef, Tuple[str, ...]] = {}
+        self._dir_token = ""
+        self._cache: "OrderedDict[Tuple[ModelRef, Tuple[Tuple[str, str], ...]], List[Any]]" = OrderedDict()  # [Modell, Bytes]
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    # --- Verzeichnis ---
+    def _scan(self) -> None:
+        token = self._token(self.directory)
+        if token == self._dir_token:
+            return
+        entries: Dict[Tuple[str, str, str], ModelEntry] = {}
+        try:
+            paths = sorted(p for p in self.directory.iterdir() if p.is_file())
+        except OSError:
+            paths = []
+        for path in paths:
+            parsed = parse_model_filename(path.name)
+            if parsed is None:
+                continue
+            model_id, version, language = parsed
+            entries[parsed] = ModelEntry(ModelRef(model_id, version), language, path)
+        languages: Dict[ModelRef, List[str]] = {}
+        for entry in entries.values():
+            languages.setdefault(entry.ref, []).append(entry.language)
+        order = sorted(languages, key=lambda r: (r.model_id, version_sort_key(r.version)))
+        self._entries = entries
+        self._models = {ref: tuple(sorted(languages[ref])) for ref in order}
+        self._dir_token = token
+
+    def entries(self) -> List[ModelEntry]:
+        with self._lock:
+            self._scan()
+            return list(self._entries.values())
+
+    def models(self) -> Dict[ModelRef, Tuple[str, ...]]:
+        """
+        Alle Modelle (ID, Version) mit ihren Sprachen, Versionen aufsteigend.
+        """
+        with self._lock:
+            self._scan()
+            return dict(self._models)
+
+    def latest(self, model_id: str = DEFAULT_MODEL_ID) -> ModelRef:
+        with self._lock:
+            self._scan()
+            versions = [ref for ref in self._models if ref.model_id == model_id]
+        if not versions:
+            raise UnknownModelError(f"Modell {model_id!r} nicht gefunden in {self.directory}.")
+        return versions[-1]
+
+    def resolve(self, model_id: Optional[str] = None, version: Optional[str] = None, language: str = BASE_LANGUAGE) -> ModelEntry:
+        """
+        Datei zu ID/Version/Sprache. Ohne ID das Standardmodell, ohne Version die neueste;
+        fehlt die Sprache, wird die deutsche Datei genutzt.
+        """
+        ref = ModelRef(model_id or DEFAULT_MODEL_ID, version) if version else self.latest(model_id or DEFAULT_MODEL_ID)
+        with self._lock:
+            self._scan()
+            entry = self._entries.get((ref.model_id, ref.version, language)) or self._entries.get(
+                (ref.model_id, ref.version, BASE_LANGUAGE)
+            )
+        if entry is None:
+            raise UnknownModelError(f"Modell {ref} ({language}) nicht gefunden in {self.directory}.")
+        return entry
+
+    def sources(self, ref: Optional[ModelRef] = None) -> Dict[str, Path]:
+        """
+        Sprache -> Datei eines Modells (Standard: neueste Version des Standardmodells).
+        """
+        ref = ref or self.latest()
+        return {e.language: e.path for e in self.entries() if e.ref == ref}
+
+    # --- Modelle ---
+    def bilingual(self, ref: ModelRef) -> BilingualModel:
+        """
+        Alle Sprachfassungen eines Modells, zusammengeführt (ein Gerüst, je Sprache eine
+        Texttabelle). Weichen die Sprachdateien in der Struktur ab: ModelDriftError.
+        """
+        sources = self.sources(ref)
+        if not sources:
+            raise UnknownModelError(f"Modell {ref} nicht gefunden in {self.directory}.")
+        key = (ref, tuple(sorted((lang, self._token(path)) for lang, path in sources.items())))
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return cached[0]
+            self._misses += 1
+
+        # Bauen ohne Lock (parallel mögliche Doppelarbeit ist harmlos)
+        models: Dict[str, MaturityModel] = {}
+        for language, path in sources.items():
+            with path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+            models[language] = build_model(data if isinstance(data, dict) else {})
+        merged = merge_models(models, BASE_LANGUAGE)
+        size = estimate_size(merged)
+
+        with self._lock:
+            # Alter Dateistand desselben Modells ist nicht mehr erreichbar
+            for stale in [k for k in self._cache if k[0] == ref and k != key]:
+                self._bytes -= self._cache.pop(stale)[1]
+            if key not in self._cache:
+                self._cache[key] = [merged, size]
+                self._bytes += size
+            self._cache.move_to_end(key)
+            while len(self._cache) > 1 and (len(self._cache) > self.max_models or self._bytes > self.max_bytes):
+                evicted, (_, evicted_size) = self._cache.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+                _log.info("Modell aus dem Speicher entfernt: %s (%d KiB)", evicted[0], evicted_size // 1024)
+            return self._cache[key][0]
+
+    def load(self, entry: ModelEntry) -> MaturityModel:
+        """
+        Typisiertes Modell einer Sprachfassung; ein Sprachwechsel setzt es nur aus der
+        Texttabelle des bereits geladenen Modells zusammen.
+        """
+        merged = self.bilingual(entry.ref)
+        if merged.is_assembled(entry.language):
+            return merged.model(entry.language)
+        model = merged.model(entry.language)
+        size = estimate_size(merged)
+        with self._lock:
+            for item in self._cache.values():
+                if item[0] is merged:
+                    self._bytes += size - item[1]
+                    item[1] = size
+        return model
+
+    def get(self, model_id: Optional[str] = None, version: Optional[str] = None, language: str = BASE_LANGUAGE) -> MaturityModel:
+        return self.load(self.resolve(model_id, version, language))
+
+    def stats(self) -> RegistryStats:
+        with self._lock:
+            return RegistryStats(
+                resident=len(self._cache),
+                resident_bytes=self._bytes,
+                max_models=self.max_models,
+                max_bytes=self.max_bytes,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
+
+
+_REGISTRIES: Dict[Path, ModelRegistry] = {}
+_REGISTRIES_LOCK = threading.Lock()
+
+
+def get_model_registry(directory: Path, token: Optional[Callable[[Path], str]] = None) -> ModelRegistry:
+    """
+    Prozessweite Registry je Modellordner. Grenzen per Umgebung:
+    RGM_MODEL_CACHE_MODELS (Anzahl), RGM_MODEL_CACHE_MB (MiB). token: siehe ModelRegistry
+    (gilt ab dem ersten Aufruf).
+    """
+    key = Path(directory).resolve()
+    with _REGISTRIES_LOCK:
+        registry = _REGISTRIES.get(key)
+        if registry is None:
+            registry = ModelRegistry(
+                key,
+                max_models=int(os.getenv("RGM_MODEL_CACHE_MODELS", "6") or 6),
+                max_bytes=int(float(os.getenv("RGM_MODEL_CACHE_MB", "64") or 64) * 1024 * 1024),
+                token=token or _file_token,
+            )
+            _REGISTRIES[key] = registry
+        return registry
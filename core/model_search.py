@@ -0,0 +1,402 @@
+# core/model_search.py
+from __future__ import annotations
+
+import re
+import threading
+import unicodedata
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+LANGUAGES = ("de", "en")
+
+KIND_DIMENSION = "dimension"
+KIND_PROFILE = "profile"
+KIND_LEVEL = "level"
+KIND_QUESTION = "question"
+KIND_GLOSSARY = "glossary"
+KINDS = (KIND_DIMENSION, KIND_PROFILE, KIND_LEVEL, KIND_QUESTION, KIND_GLOSSARY)
+
+# Gewicht je Feld (Kürzel/Namen schlagen Fließtext)
+_FIELD_WEIGHTS: Dict[str, float] = {
+    "code": 3.0,
+    "qid": 3.0,
+    "term": 3.0,
+    "name": 2.5,
+    "category": 1.5,
+    "level_name": 1.5,
+    "question": 1.2,
+    "description": 1.0,
+    "acceptance_criteria": 1.0,
+    "definition": 1.0,
+    "purpose": 0.9,
+    "results": 0.9,
+    "basic_practices": 0.9,
+    "work_products": 0.9,
+    "benefit": 0.8,
+}
+
+# Trefferart: ganzes Wort > Wortanfang > Wortteil (Kompositum)
+_EXACT = 1.0
+_PREFIX = 0.75
+_PART = 0.55
+
+# Nur Wörter ab dieser Länge werden in Wortteile zerlegt; Teile mindestens so lang
+_COMPOUND_MIN_LEN = 8
+_PART_MIN_LEN = 4
+_PART_MIN_OFFSET = 3
+
+# Obergrenze der Terme, auf die ein kurzes Präfix expandiert wird
+_MAX_PREFIX_TERMS = 400
+_TOKEN_CACHE_SIZE = 2048
+
+_STOPWORDS = frozenset(
+    """
+    der die das den dem des ein eine einer eines einem einen und oder in im ist sind wird werden
+    zu zum zur mit von vom für auf an am als auch bei es sich nicht wie wann was wer dass ob
+    the a an and or of to in on at is are be by for with as it its this that which when what who
+    """.split()
+)
+
+_TOKEN_RE = re.compile(r"\w+(?:[.\-/]\w+)*")
+_UMLAUTS = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+_UMLAUTS_PLAIN = str.maketrans({"ä": "a", "ö": "o", "ü": "u", "ß": "ss"})
+
+
+def _strip_accents(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def fold(token: str) -> str:
+    """
+    Normalform für Index und Anfrage: klein, ä/ö/ü -> ae/oe/ue, ß -> ss, Akzente entfernt.
+    """
+    return _strip_accents(str(token).lower().translate(_UMLAUTS))
+
+
+def _fold_variants(token: str) -> Tuple[str, ...]:
+    # "Prüfung" soll auch über die Eingabe "prufung" gefunden werden
+    primary = fold(token)
+    plain = _strip_accents(token.translate(_UMLAUTS_PLAIN))
+    return (primary,) if plain == primary else (primary, plain)
+
+
+def _raw_tokens(text: str) -> List[str]:
+    tokens: List[str] = []
+    for match in _TOKEN_RE.finditer(str(text or "").lower()):
+        token = match.group(0)
+        tokens.append(token)
+        if any(sep in token for sep in ".-/"):
+            # Bindestrich-Komposita und Kürzel zusätzlich in Teilen ("cross-functional", "td1.1")
+            tokens.extend(p for p in re.split(r"[.\-/]", token) if len(p) > 1 and not p.isdigit())
+    return tokens
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Anfrage-Tokens (gefaltet, ohne Stoppwörter – außer die Anfrage besteht nur aus solchen).
+    """
+    tokens = [fold(t) for t in _raw_tokens(text)]
+    useful = [t for t in tokens if t not in _STOPWORDS]
+    return list(dict.fromkeys(useful or tokens))
+
+
+def _compound_parts(token: str) -> Iterable[str]:
+    # Alle Wortenden ab Position 3: über die Präfixsuche findet "automatisierung"
+    # damit auch "testautomatisierung", "prozess" auch "redaktionsprozess".
+    if len(token) < _COMPOUND_MIN_LEN:
+        return ()
+    return (token[i:] for i in range(_PART_MIN_OFFSET, len(token) - _PART_MIN_LEN + 1))
+
+
+@dataclass(frozen=True)
+class SearchTarget:
+    """
+    Sprungziel eines Treffers (sprachunabhängig; Glossarbegriffe über ihre Position).
+    """
+    kind: str
+    code: str = ""
+    level: int = 0
+    qid: str = ""
+    glossary_pos: int = -1
+    # Frage, zu der gescrollt wird (bei Stufen: erste Frage der Stufe)
+    anchor_qid: str = ""
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    target: SearchTarget
+    score: float
+    language: str
+    field: str
+    title: str
+    snippet: str
+
+
+@dataclass
+class _Doc:
+    target: SearchTarget
+    language: str
+    fields: Dict[str, str]
+
+
+class ModelSearchIndex:
+    """
+    Invertierter Index über die Modellinhalte beider Sprachen: Dimensionen, Prozessprofile,
+    Stufenbeschreibungen, Fragen und Glossar.
+
+    - Tokenisierung mit Umlaut-Faltung; deutsche Komposita zusätzlich über ihre Wortenden
+    - Präfixsuche über die sortierte Termliste (bisect), alle Anfrage-Tokens müssen treffen
+    - Treffer je Sprungziel zusammengefasst (beste Sprache gewinnt)
+    """
+
+    # Gespeichert im kompilierten Modell (core.model_compiler); Lock und Anfrage-Cache nicht
+    PICKLED_ATTRS = ("token", "_docs", "_postings", "_titles", "_glossary_terms", "_terms")
+
+    def __init__(self, models: Mapping[str, Mapping[str, Any]], token: str = "") -> None:
+        self.token = token
+        self._docs: List[_Doc] = []
+        self._postings: Dict[str, Dict[int, Tuple[float, str]]] = {}
+        self._titles: Dict[Tuple[SearchTarget, str], str] = {}
+        self._glossary_terms: Dict[str, List[str]] = {}
+        self._token_cache: Dict[str, Dict[int, Tuple[float, str]]] = {}
+        self._lock = threading.Lock()
+
+        for language in LANGUAGES:
+            model = models.get(language)
+            if isinstance(model, Mapping):
+                self._add_model(model, language)
+        self._terms: List[str] = sorted(self._postings)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.PICKLED_ATTRS}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._token_cache = {}
+        self._lock = threading.Lock()
+
+    # --- Aufbau ---
+    def _add_doc(self, target: SearchTarget, language: str, fields: Dict[str, Any]) -> None:
+        fields = {k: " ".join(str(v or "").split()) for k, v in fields.items() if str(v or "").strip()}
+        if not fields:
+            return
+        doc_id = len(self._docs)
+        self._docs.append(_Doc(target, language, fields))
+
+        for field, text in fields.items():
+            weight = _FIELD_WEIGHTS.get(field, 1.0)
+            for raw in _raw_tokens(text):
+                for term in _fold_variants(raw):
+                    self._post(term, doc_id, weight, field)
+                    if language == "de":
+                        for part in _compound_parts(term):
+                            self._post(part, doc_id, weight * _PART, field)
+
+    def _post(self, term: str, doc_id: int, weight: float, field: str) -> None:
+        postings = self._postings.setdefault(term, {})
+        current = postings.get(doc_id)
+        if current is None or current[0] < weight:
+            postings[doc_id] = (weight, field)
+
+    def _add_model(self, model: Mapping[str, Any], language: str) -> None:
+        for dim in model.get("dimensions", []) or []:
+            code = str(dim.get("code", "")).strip()
+            if not code:
+                continue
+            name = str(dim.get("name", "")).strip()
+            dim_target = SearchTarget(KIND_DIMENSION, code=code)
+            self._titles[(dim_target, language)] = f"{code} – {name}".strip(" –")
+            self._add_doc(
+                dim_target,
+                language,
+                {"code": code, "name": name, "category": dim.get("category"), "description": dim.get("description")},
+            )
+
+            profile = dim.get("process_profile") or {}
+            profile_target = SearchTarget(KIND_PROFILE, code=code)
+            self._titles[(profile_target, language)] = self._titles[(dim_target, language)]
+            self._add_doc(
+                profile_target,
+                language,
+                {k: profile.get(k) for k in ("purpose", "results", "basic_practices", "work_products")},
+            )
+
+            for level in dim.get("levels", []) or []:
+                number = int(level.get("level_number", 0) or 0)
+                questions = [q for q in level.get("questions", []) or [] if str(q.get("id", "")).strip()]
+                first_qid = str(questions[0].get("id", "")).strip() if questions else ""
+                level_target = SearchTarget(KIND_LEVEL, code=code, level=number, anchor_qid=first_qid)
+                self._titles[(level_target, language)] = f"{code} · {number} – {level.get('name', '')}".strip(" –")
+                self._add_doc(
+                    level_target,
+                    language,
+                    {
+                        "level_name": level.get("name"),
+                        "acceptance_criteria": level.get("acceptance_criteria"),
+                        "benefit": level.get("benefit"),
+                    },
+                )
+
+                for q in questions:
+                    qid = str(q.get("id", "")).strip()
+                    q_target = SearchTarget(KIND_QUESTION, code=code, level=number, qid=qid, anchor_qid=qid)
+                    self._titles[(q_target, language)] = str(q.get("text", "")).strip()
+                    self._add_doc(q_target, language, {"qid": qid, "question": q.get("text")})
+
+        glossary = model.get("glossary") or {}
+        terms = [str(k) for k in glossary] if isinstance(glossary, Mapping) else []
+        self._glossary_terms[language] = terms
+        for pos, term in enumerate(terms):
+            g_target = SearchTarget(KIND_GLOSSARY, glossary_pos=pos)
+            self._titles[(g_target, language)] = term
+            self._add_doc(g_target, language, {"term": term, "definition": glossary.get(term)})
+
+    # --- Abfrage ---
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    @property
+    def term_count(self) -> int:
+        return len(self._terms)
+
+    def _token_scores(self, token: str) -> Dict[int, Tuple[float, str]]:
+        cached = self._token_cache.get(token)
+        if cached is not None:
+            return cached
+
+        scores: Dict[int, Tuple[float, str]] = {}
+        if len(token) < 2:
+            matched = [token] if token in self._postings else []
+        else:
+            start = bisect_left(self._terms, token)
+            stop = bisect_left(self._terms, token + "\uffff", lo=start)
+            matched = self._terms[start : min(stop, start + _MAX_PREFIX_TERMS)]
+            if token in self._postings and token not in matched:
+                matched.append(token)
+
+        for term in matched:
+            factor = _EXACT if term == token else _PREFIX
+            for doc_id, (weight, field) in self._postings[term].items():
+                score = weight * factor
+                current = scores.get(doc_id)
+                if current is None or current[0] < score:
+                    scores[doc_id] = (score, field)
+
+        with self._lock:
+            if len(self._token_cache) >= _TOKEN_CACHE_SIZE:
+                self._token_cache.clear()
+            self._token_cache[token] = scores
+        return scores
+
+    def search(
+        self,
+        query: str,
+        *,
+        language: Optional[str] = None,
+        kinds: Optional[Sequence[str]] = None,
+        limit: int = 20,
+    ) -> List[SearchHit]:
+        """
+        Treffer je Sprungziel, absteigend nach Relevanz. Titel in `language` (falls vorhanden),
+        Ausschnitt aus dem Feld, das getroffen hat.
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        per_token = sorted((self._token_scores(tok) for tok in tokens), key=len)
+        if not per_token[0]:
+            return []
+
+        wanted = set(kinds) if kinds else None
+        best: Dict[SearchTarget, Tuple[float, int, str]] = {}
+        for doc_id, (score, field) in per_token[0].items():
+            total = score
+            for other in per_token[1:]:
+                hit = other.get(doc_id)
+                if hit is None:
+                    break
+                total += hit[0]
+            else:
+                doc = self._docs[doc_id]
+                if wanted is not None and doc.target.kind not in wanted:
+                    continue
+                current = best.get(doc.target)
+                if current is None or current[0] < total:
+                    best[doc.target] = (total, doc_id, field)
+
+        ranked = sorted(best.items(), key=lambda kv: (-kv[1][0], KINDS.index(kv[0].kind), kv[1][1]))
+        lang = "en" if str(language or "").lower().startswith("en") else "de"
+        hits: List[SearchHit] = []
+        for target, (score, doc_id, field) in ranked[: max(0, int(limit))]:
+            doc = self._docs[doc_id]
+            title = self._titles.get((target, lang)) or self._titles.get((target, doc.language), "")
+            hits.append(
+                SearchHit(
+                    target=target,
+                    score=round(score, 4),
+                    language=doc.language,
+                    field=field,
+                    title=title,
+                    snippet=_snippet(doc.fields.get(field, ""), tokens),
+                )
+            )
+        return hits
+
+    def matching_codes(self, query: str, kinds: Sequence[str] = (KIND_DIMENSION,)) -> List[str]:
+        """
+        Dimensionscodes mit Treffern (für Filterlisten), in Relevanzreihenfolge.
+        """
+        codes: List[str] = []
+        for hit in self.search(query, kinds=kinds, limit=len(self._docs)):
+            if hit.target.code and hit.target.code not in codes:
+                codes.append(hit.target.code)
+        return codes
+
+    def glossary_term(self, pos: int, language: Optional[str] = None) -> str:
+        lang = "en" if str(language or "").lower().startswith("en") else "de"
+        terms = self._glossary_terms.get(lang) or []
+        return terms[pos] if 0 <= pos < len(terms) else ""
+
+
+def _snippet(text: str, tokens: Sequence[str], width: int = 140) -> str:
+    text = str(text or "")
+    if len(text) <= width:
+        return text
+    folded = fold(text)
+    positions = [p for p in (folded.find(tok) for tok in tokens) if p >= 0]
+    # Faltung verlängert ä/ö/ü/ß um ein Zeichen; für die Fensterwahl reicht die Näherung
+    center = min(positions) if positions else 0
+    start = max(0, min(center - width // 3, len(text) - width))
+    cut = text[start : start + width].strip()
+    return ("…" if start > 0 else "") + cut + ("…" if start + width < len(text) else "")
+
+
+_INDEX: Optional[ModelSearchIndex] = None
+_INDEX_LOCK = threading.Lock()
+
+
+def get_model_search_index() -> ModelSearchIndex:
+    """
+    Prozessweiter Suchindex über beide Modellsprachen; wird neu gebaut, sobald sich
+    eine Modelldatei ändert (Dateitoken aus core.model_loader). Liegt ein passendes
+    kompiliertes Modell vor, wird dessen Index-Sektion erst hier (beim ersten Suchen) geladen.
+    """
+    global _INDEX
+    from core.model_compiler import ArtifactError, read_search_index
+    from core.model_loader import load_artifact, load_source_configs, models_token
+
+    token = models_token()
+    with _INDEX_LOCK:
+        if _INDEX is None or _INDEX.token != token:
+            index = None
+            artifact = load_artifact()
+            if artifact is not None:
+                try:
+                    index = read_search_index(artifact, token)
+                except (ArtifactError, OSError, ValueError):
+                    index = None
+            _INDEX = index if index is not None else ModelSearchIndex(load_source_configs(), token)
+        return _INDEX
@@ -0,0 +1,247 @@
+# core/next_questions.py
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from .overview import code_sort_key
+from .scoring import (
+    CompiledDimension,
+    CompiledModel,
+    NOT_APPLICABLE,
+    ScoringProfile,
+    compile_model,
+    get_scoring_profile,
+    question_score,
+    round_maturity,
+)
+
+
+# Hypothetische Antwort, mit der eine offene Frage bewertet wird
+FULL_ANSWER = "Vollständig"
+
+
+@dataclass(frozen=True)
+class QuestionGain:
+    """
+    Eine Frage, deren vollständige Erfüllung den Ist-Reifegrad ihrer Dimension anhebt.
+
+    - gain: Zuwachs des (ungerundeten) Ist-Reifegrads, gedeckelt beim Soll
+    - effort: Abstand der aktuellen Antwort zu "Vollständig" (0..1)
+    - ist_level / new_ist_level: gerundeter Ist-Reifegrad vorher/nachher (wie in der UI)
+    """
+    code: str
+    question_id: str
+    level_number: int
+    current_answer: Optional[str]
+    ist_level: float
+    new_ist_level: float
+    target_level: float
+    gain: float
+    effort: float
+
+
+@dataclass
+class _LevelState:
+    level_number: int
+    total: float
+    count: int
+    # (Frage-ID, aktueller Score oder None wenn nicht gezählt, Antwort)
+    questions: List[Tuple[Any, Optional[float], Any]]
+
+    @property
+    def average(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def average_with(self, index: int, score: float) -> float:
+        """
+        Mittelwert, wenn Frage index den Score score hätte. Neu summiert in Fragenreihenfolge wie
+        core.scoring._level_average, damit das Ergebnis bitgleich zu einer Neubewertung ist.
+        """
+        total = 0.0
+        count = 0
+        for j, (_, current, _) in enumerate(self.questions):
+            value = score if j == index else current
+            if value is not None:
+                total += value
+                count += 1
+        return total / count
+
+
+def _level_states(
+    dim: CompiledDimension,
+    answers: Mapping[str, Any],
+    profile: ScoringProfile,
+) -> List[_LevelState]:
+    states: List[_LevelState] = []
+    for level in dim.levels:
+        total = 0.0
+        count = 0
+        questions = []
+        for q_id in level.question_ids:
+            ans = answers.get(q_id)
+            score = question_score(ans, profile)
+            if score is not None:
+                total += score
+                count += 1
+            questions.append((q_id, score, ans))
+        states.append(_LevelState(level.level_number, total, count, questions))
+    return states
+
+
+def _gated_tails(states: List[_LevelState], threshold: float) -> List[Tuple[int, float]]:
+    """
+    tails[i] = (voll erfüllte Level ab i, Teilerfüllung des ersten nicht erfüllten Levels), wenn alle
+    Level davor voll erfüllt sind. Einmal rückwärts berechnet, damit jede Hypothese nur ihr eigenes
+    Level neu bewertet; Zählung und Teilwert getrennt wie in maturity_from_levels.
+    """
+    tails: List[Tuple[int, float]] = [(0, 0.0)] * (len(states) + 1)
+    for i in range(len(states) - 1, -1, -1):
+        avg = states[i].average
+        if avg is None:
+            tails[i] = (0, 0.0)
+        elif avg >= threshold:
+            tails[i] = (1 + tails[i + 1][0], tails[i + 1][1])
+        else:
+            tails[i] = (0, avg)
+    return tails
+
+
+def _level_sum(averages: List[float]) -> float:
+    # Summe in Level-Reihenfolge wie maturity_from_levels (ohne Gating)
+    total = 0.0
+    for avg in averages:
+        total += avg
+    return total
+
+
+def _dimension_gains(
+    dim: CompiledDimension,
+    answers: Mapping[str, Any],
+    target: float,
+    profile: ScoringProfile,
+) -> List[QuestionGain]:
+    if not dim.levels:
+        return []
+
+    full_score = profile.answer_scores.get(FULL_ANSWER, 1.0) or 1.0
+    states = _level_states(dim, answers, profile)
+
+    if profile.gating:
+        if states[0].average is None:
+            # Stufe 1 n.a. => Dimension n.a., keine sinnvolle Empfehlung
+            return []
+        tails = _gated_tails(states, profile.full_threshold)
+        raw = float(tails[0][0]) + tails[0][1]
+        # Nur das erste nicht voll erfüllte Level kann den Reifegrad bewegen (Gating)
+        blocking = next(
+            (i for i, st in enumerate(states) if st.average is None or st.average < profile.full_threshold),
+            None,
+        )
+        if blocking is None or states[blocking].average is None:
+            return []
+        candidates = [blocking]
+    else:
+        averages = [st.average or 0.0 for st in states]
+        raw = _level_sum(averages)
+        candidates = list(range(len(states)))
+
+    if raw >= target:
+        return []
+
+    ist_level = round_maturity(raw, profile)
+    gains: List[QuestionGain] = []
+
+    for i in candidates:
+        st = states[i]
+        for j, (q_id, score, ans) in enumerate(st.questions):
+            if ans is not None and str(ans) == NOT_APPLICABLE:
+                continue
+            if score is not None and score >= full_score:
+                continue
+
+            new_avg = st.average_with(j, full_score)
+            if profile.gating:
+                if new_avg >= profile.full_threshold:
+                    new_raw = float(i + 1 + tails[i + 1][0]) + tails[i + 1][1]
+                else:
+                    new_raw = float(i) + new_avg
+            else:
+                new_raw = _level_sum(averages[:i] + [new_avg] + averages[i + 1 :])
+
+            gain = min(new_raw, target) - raw
+            if gain <= 1e-12:
+                continue
+
+            gains.append(
+                QuestionGain(
+                    code=dim.code,
+                    question_id=str(q_id),
+                    level_number=st.level_number,
+                    current_answer=None if ans is None else str(ans),
+                    ist_level=ist_level,
+                    new_ist_level=round_maturity(new_raw, profile),
+                    target_level=target,
+                    gain=gain,
+                    effort=full_score - (score or 0.0),
+                )
+            )
+
+    return gains
+
+
+def rank_next_questions(
+    model: Dict[str, Any] | CompiledModel,
+    answers: Mapping[str, Any],
+    targets: Optional[Mapping[str, float]] = None,
+    profile: ScoringProfile | str | None = None,
+    limit: Optional[int] = None,
+) -> List[QuestionGain]:
+    """
+    Rangliste der Fragen, deren vollständige Erfüllung den Ist-Reifegrad am stärksten
+    in Richtung Soll anhebt (größter Zuwachs zuerst, bei Gleichstand geringster Aufwand).
+
+    Es gelten die Gating-Regeln aus compute_dimension_maturity. Je Dimension werden die
+    Level-Mittelwerte nur einmal gebildet; jede Hypothese verändert genau ein Level, das in
+    derselben Summationsreihenfolge wie score_dimension neu gemittelt und gegen vorab
+    berechnete Restwerte ausgewertet wird. new_ist_level entspricht damit exakt score_model.
+
+    targets: Soll je Dimensionscode; fehlt ein Code, gilt default_target_level aus dem Modell.
+    """
+    prof = get_scoring_profile(profile)
+    compiled = compile_model(model)
+    answers = answers or {}
+    targets = targets or {}
+
+    gains: List[QuestionGain] = []
+    for dim in compiled.dimensions:
+        target = targets.get(dim.code, dim.default_target_level)
+        try:
+            target = float(target)
+        except (TypeError, ValueError):
+            continue
+        if math.isnan(target):
+            continue
+        gains.extend(_dimension_gains(dim, answers, target, prof))
+
+    gains.sort(key=lambda g: (-round(g.gain, 9), g.effort, code_sort_key(g.code), g.level_number))
+    return gains[:limit] if limit else gains
+
+
+def next_questions_by_dimension(
+    model: Dict[str, Any] | CompiledModel,
+    answers: Mapping[str, Any],
+    targets: Optional[Mapping[str, float]] = None,
+    profile: ScoringProfile | str | None = None,
+    per_dimension: Optional[int] = 3,
+) -> Dict[str, List[QuestionGain]]:
+    """
+    Wie rank_next_questions, aber gruppiert nach Dimensionscode (z. B. für die Priorisierung).
+    """
+    grouped: Dict[str, List[QuestionGain]] = {}
+    for gain in rank_next_questions(model, answers, targets=targets, profile=profile):
+        items = grouped.setdefault(gain.code, [])
+        if per_dimension is None or len(items) < per_dimension:
+            items.append(gain)
+    return grouped
@@ -1,12 +1,21 @@
 # core/overview.py
 from __future__ import annotations
 
-from typing import Dict, Any, Optional, Tuple
+import functools
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 import re
 
 import pandas as pd
 
-from .scoring import compute_dimension_maturity
+from .scoring import CompiledModel, compile_model, score_model
+from .types import MaturityModel
+
+if TYPE_CHECKING:
+    from .model_mmap import MappedLanguage
+
+
+# Kategorie-Order: TD vor OG, Rest danach
+CATEGORY_ORDER = {"TD": 0, "OG": 1}
 
 
 def _infer_category(code: str, category: str) -> str:
@@ -40,8 +49,37 @@ def _code_sort_parts(code: str) -> Tuple[str, int, int, int]:
     return prefix, nums[0], nums[1], nums[2]
 
 
+@functools.lru_cache(maxsize=4096)
+def code_sort_key(code: str, category: str = "") -> Tuple[int, str, int, int, int]:
+    """
+    Gemeinsamer Sortierschlüssel für Dimensionscodes (Übersicht, Export, alte Auswertung):
+    erst TD, dann OG, dann Rest; innerhalb natürlich nach Code.
+    Ohne Kategorie wird sie aus dem Code abgeleitet. Zwischengespeichert (zwei Regex je Code).
+    """
+    prefix, n1, n2, n3 = _code_sort_parts(code)
+    cat = _infer_category(code, category).upper()
+    return CATEGORY_ORDER.get(cat, 99), prefix, n1, n2, n3
+
+
+def _dimensions_and_scores(model: Any, answers: Dict[str, Any]) -> Tuple[List[Tuple[str, str, str, float]], Dict[str, float]]:
+    """
+    (code, name, category, default_target_level) je Dimension in Modellreihenfolge und Ist-Reifegrade.
+    Speicherabbilder (core.model_mmap) werden direkt auf ihren Arrays gescort.
+    """
+    from .model_mmap import MappedLanguage  # model_mmap importiert dieses Modul
+
+    if isinstance(model, MappedLanguage):
+        matrix = model.matrix()
+        dims = list(zip(matrix.codes, matrix.names, matrix.categories, matrix.default_targets.tolist()))
+        return dims, model.score(answers)
+
+    compiled = compile_model(model)
+    dims = [(d.code, d.name, d.category, d.default_target_level) for d in compiled.dimensions]
+    return dims, score_model(compiled, answers)
+
+
 def build_overview_table(
-    model: Dict[str, Any],
+    model: Dict[str, Any] | MaturityModel | CompiledModel | MappedLanguage,
     answers: Dict[str, Any],
     global_target_level: float = 3.0,
     per_dimension_targets: Optional[Dict[str, float]] = None,
@@ -64,14 +102,14 @@ def build_overview_table(
     per_dimension_targets = per_dimension_targets or {}
     priorities = priorities or {}
 
+    dimensions, ist_levels = _dimensions_and_scores(model, answers)
+
     rows = []
 
-    for dim in model.get("dimensions", []):
-        code = dim["code"]
-        name = dim["name"]
-        category = _infer_category(code, dim.get("category", ""))
+    for code, name, raw_category, default_target_level in dimensions:
+        category = _infer_category(code, raw_category)
 
-        ist_level = compute_dimension_maturity(dim, answers)
+        ist_level = ist_levels[code]
 
         # Ziel-Reifegrad: Dimension-spezifisch > global > default aus Modell
         if code in per_dimension_targets:
@@ -79,7 +117,7 @@ def build_overview_table(
         elif global_target_level is not None:
             target_level = float(global_target_level)
         else:
-            target_level = float(dim.get("default_target_level", 3))
+            target_level = float(default_target_level)
 
         # gap: NaN bleibt NaN (wenn ist_level n/a ist)
         gap = target_level - float(ist_level)
@@ -98,28 +136,8 @@ def build_overview_table(
         }
         rows.append(row)
 
-    df = pd.DataFrame(rows)
-
     # Sinnvolle Sortierung: erst TD, dann OG, innerhalb numerisch nach Code
-    if not df.empty:
-        # Kategorie-Order: TD vor OG, Rest danach
-        cat_order = {"TD": 0, "OG": 1}
-        df["_cat_sort"] = df["category"].map(cat_order).fillna(99).astype(int)
-
-        # Natürliche Codesortierung (TD2.10 nach TD2.2 etc.)
-        parts = df["code"].apply(_code_sort_parts)
-        df["_code_prefix"] = parts.apply(lambda t: t[0])
-        df["_code_n1"] = parts.apply(lambda t: t[1])
-        df["_code_n2"] = parts.apply(lambda t: t[2])
-        df["_code_n3"] = parts.apply(lambda t: t[3])
-
-        df = (
-            df.sort_values(
-                by=["_cat_sort", "_code_prefix", "_code_n1", "_code_n2", "_code_n3"],
-                ascending=[True, True, True, True, True],
-            )
-            .drop(columns=["_cat_sort", "_code_prefix", "_code_n1", "_code_n2", "_code_n3"])
-            .reset_index(drop=True)
-        )
-
-    return df
+    # (TD2.10 nach TD2.2 etc.)
+    rows.sort(key=lambda r: code_sort_key(r["code"], r["category"]))
+
+    return pd.DataFrame(rows)
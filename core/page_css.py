@@ -0,0 +1,2997 @@
+# core/page_css.py
+from __future__ import annotations
+
+import functools
+
+from core.theme import TU_GREEN, TU_ORANGE
+
+TD_BLUE = "#2F3DB8"
+OG_ORANGE = "#F28C28"
+
+# Seitenspezifisches CSS je Theme. app.load_page_module führt die Seitenmodule bei jedem
+# Rerun neu aus, ein lru_cache dort begänne jedes Mal leer; hier (einmal importiert)
+# entsteht jedes Stylesheet einmal pro Prozess und Theme.
+
+
+# --- Start ---
+@functools.lru_cache(maxsize=2)
+def start_css(dark: bool) -> str:
+    # Farben robust je nach Darkmode
+    border = "rgba(255,255,255,0.12)" if dark else "rgba(0,0,0,0.10)"
+    soft_bg = "rgba(255,255,255,0.06)" if dark else "rgba(0,0,0,0.03)"
+    hover_bg = "rgba(255,255,255,0.08)" if dark else "rgba(0,0,0,0.045)"
+    shadow = "0 12px 28px rgba(0,0,0,0.40)" if dark else "0 10px 24px rgba(0,0,0,0.06)"
+    card_bg = "var(--rgm-card-bg, #111)" if dark else "var(--rgm-card-bg, #ffffff)"
+    text_col = "var(--rgm-text, rgba(250,250,250,0.92))" if dark else "var(--rgm-text, #111)"
+
+    footer_bg = "rgba(16,16,16,0.92)" if dark else "#ffffff"
+    footer_border = "rgba(255,255,255,0.12)" if dark else "rgba(0,0,0,0.08)"
+
+    css = r"""
+<style>
+  :root{
+    --tu-green: __TU_GREEN__;
+    --tu-orange: __TU_ORANGE__;
+  }
+
+  /* Links im TU-Grün */
+  a { color: var(--tu-green) !important; }
+
+  /* Primary Buttons (TU-Grün / Hover Orange) */
+  div.stButton > button,
+  button[kind="primary"],
+  button[data-testid="baseButton-primary"]{
+    background: var(--tu-green) !important;
+    border: 1px solid var(--tu-green) !important;
+    color: #ffffff !important;
+    border-radius: 10px !important;
+    font-weight: 650 !important;
+  }
+  div.stButton > button:hover,
+  button[kind="primary"]:hover,
+  button[data-testid="baseButton-primary"]:hover{
+    background: var(--tu-orange) !important;
+    border-color: var(--tu-orange) !important;
+  }
+  div.stButton > button:focus{
+    outline: none !important;
+    box-shadow: 0 0 0 3px rgba(99,154,0,0.25) !important;
+  }
+
+  /* Layout: Platz für Footer */
+  .block-container{
+    padding-top: 2.3rem;
+    --rgm-footer-h: 108px;
+    padding-bottom: calc(var(--rgm-footer-h) + env(safe-area-inset-bottom) + 20px);
+    max-width: 1200px;
+    margin: 0 auto;
+  }
+  @media (max-width: 900px){ .block-container{ --rgm-footer-h: 100px; } }
+  @media (max-width: 600px){ .block-container{ --rgm-footer-h: 94px; } }
+
+  /* Page */
+  .rgm-page{
+    max-width: 1200px;
+    margin: 0 auto;
+  }
+
+  /* HERO */
+  .rgm-hero{
+    background: __CARD_BG__;
+    border: 1px solid __BORDER__;
+    border-radius: 16px;
+    padding: 18px 18px 14px 18px;
+    box-shadow: __SHADOW__;
+  }
+
+  .rgm-hero-top{
+    display: flex;
+    align-items: flex-start;
+    justify-content: space-between;
+    gap: 16px;
+    flex-wrap: wrap;
+  }
+
+  .rgm-h1{
+    font-size: 34px;
+    font-weight: 900;
+    line-height: 1.12;
+    margin: 0 0 8px 0;
+    color: __TEXT__;
+  }
+
+  .rgm-lead{
+    font-size: 15px;
+    line-height: 1.75;
+    margin: 0;
+    color: __TEXT__;
+    opacity: 0.92;
+    max-width: 880px;
+  }
+
+  .rgm-pill-group{
+    display: flex;
+    align-items: center;
+    justify-content: flex-end;
+    flex-wrap: wrap;
+    gap: 8px;
+  }
+
+  .rgm-pill{
+    display: inline-flex;
+    align-items: center;
+    gap: 8px;
+    padding: 8px 12px;
+    border-radius: 999px;
+    border: 1px solid __BORDER__;
+    background: __SOFT_BG__;
+    color: __TEXT__;
+    font-size: 13px;
+    font-weight: 750;
+    white-space: nowrap;
+  }
+  .rgm-time-pill{
+    font-weight: 700;
+  }
+  .rgm-dot{
+    width: 10px;
+    height: 10px;
+    border-radius: 999px;
+    background: var(--tu-green);
+    box-shadow: 0 0 0 3px rgba(99,154,0,0.18);
+  }
+
+  .rgm-accent-line{
+    height: 3px;
+    width: 140px;
+    border-radius: 999px;
+    margin: 10px 0 14px 0;
+    background: linear-gradient(90deg, __TD_BLUE__, __OG_ORANGE__);
+  }
+
+  /* GRID */
+  .rgm-grid{
+    display: grid;
+    grid-template-columns: 1fr 1fr;
+    gap: 14px;
+    margin-top: 16px;
+  }
+  @media (max-width: 900px){
+    .rgm-grid{ grid-template-columns: 1fr; }
+  }
+
+  .rgm-card{
+    background: __CARD_BG__;
+    border: 1px solid __BORDER__;
+    border-radius: 16px;
+    padding: 14px 16px;
+    box-shadow: __SHADOW__;
+    min-height: 96px;
+  }
+
+  .rgm-card-h{
+    display: flex;
+    align-items: center;
+    gap: 10px;
+    margin: 0 0 8px 0;
+  }
+
+  .rgm-ico{
+    width: 34px;
+    height: 34px;
+    border-radius: 12px;
+    display: inline-flex;
+    align-items: center;
+    justify-content: center;
+    border: 1px solid __BORDER__;
+    background: __SOFT_BG__;
+    color: __TEXT__;
+  }
+  .rgm-ico svg{ width: 18px; height: 18px; }
+
+  .rgm-card-title{
+    font-weight: 900;
+    font-size: 15px;
+    color: __TEXT__;
+    margin: 0;
+  }
+
+  .rgm-card-text{
+    margin: 0;
+    color: __TEXT__;
+    opacity: 0.90;
+    font-size: 13.5px;
+    line-height: 1.65;
+  }
+
+  /* META */
+  .rgm-meta{
+    margin-top: 16px;
+    background: __CARD_BG__;
+    border: 1px solid __BORDER__;
+    border-radius: 16px;
+    padding: 14px 16px;
+    box-shadow: __SHADOW__;
+  }
+  .rgm-meta-row{
+    display: grid;
+    grid-template-columns: minmax(140px, 180px) minmax(0, 1fr);
+    gap: 14px;
+    padding: 8px 0;
+    border-bottom: 1px solid __BORDER__;
+    align-items: center;
+  }
+  .rgm-meta-row:last-child{ border-bottom: none; }
+
+  .rgm-k{
+    font-weight: 850;
+    color: __TEXT__;
+    opacity: 0.92;
+    font-size: 13.5px;
+  }
+  .rgm-v{
+    min-width: 0;
+    color: __TEXT__;
+    font-size: 13.5px;
+  }
+  
+  /* META: 2-Spalten Layout (links: rows, rechts: validiert) */
+  .rgm-meta-grid{
+    position: relative;
+    display: grid;
+    grid-template-columns: minmax(0, 1fr) minmax(0, 1fr);
+    gap: 0;                           /* kein Grid-Gap -> Linie kann exakt mittig sein */
+    align-items: stretch;
+  }
+
+  /* mittlerer Trennstrich exakt 50% */
+  .rgm-meta-grid::before{
+    content: "";
+    position: absolute;
+    left: 50%;
+    top: 10px;
+    bottom: 10px;
+    width: 1px;
+    background: __BORDER__;
+    transform: translateX(-0.5px);
+    opacity: 0.9;
+    pointer-events: none;
+  }
+
+  /* linke Spalte: nur Padding (kein border-right mehr) */
+  .rgm-meta-left{
+    padding-right: 18px;   /* Abstand zur Mittellinie */
+  }
+
+  /* rechte Spalte: wie normale Rows (nicht Center-Text) */
+  .rgm-meta-right{
+    min-width: 0;
+    padding-left: 18px;
+    display: flex;
+    flex-direction: column;
+    justify-content: center;
+    align-items: stretch;     /* wichtig: volle Breite */
+    gap: 8px;
+    text-align: left;         /* wichtig: wie links */
+  }
+
+  /* Validiert-Row: gleiche Optik wie rgm-meta-row, aber etwas kleinere Label-Spalte */
+  .rgm-meta-right .rgm-validated-row{
+    grid-template-columns: minmax(130px, 150px) minmax(0, 1fr);
+    border-bottom: none;
+    padding: 8px 0 12px;
+  }
+
+  /* Logo darunter: sauber zentriert */
+  .rgm-validated-logo{
+    display: flex;
+    justify-content: center;
+    margin-top: 0px;
+  }
+
+  /* Logo im rechten Block größer & cleaner */
+  .rgm-meta-right .rgm-footer-logo{
+    box-shadow: 0 4px 12px rgba(0,0,0,0.07);
+    padding: 8px 12px;
+    border-radius: 16px;
+  }
+  .rgm-meta-right .rgm-footer-logo img{
+    height: 70px;           /* <- Größe hier steuern (z.B. 64–76) */
+    width: auto;
+    display: block;
+  }
+
+  /* Responsive: untereinander + Mittellinie ausblenden */
+  @media (max-width: 1100px){
+    .rgm-meta-grid{
+      grid-template-columns: 1fr;
+    }
+    .rgm-meta-grid::before{
+      display: none;
+    }
+    .rgm-meta-left{
+      padding-right: 0;
+      border-bottom: 1px solid __BORDER__;
+      padding-bottom: 12px;
+      margin-bottom: 10px;
+    }
+    .rgm-meta-right{
+      padding-left: 0;
+    }
+  }
+
+  /* Mail mini */
+  .rgm-mail{ display: inline-flex; align-items: center; gap: 8px; max-width: 100%; }
+  .rgm-mail > span{
+    min-width: 0;
+    overflow: hidden;
+    text-overflow: ellipsis;
+    white-space: nowrap;
+  }
+  .rgm-mail a{
+    display: inline-flex;
+    align-items: center;
+    justify-content: center;
+    width: 26px;
+    height: 26px;
+    border-radius: 9px;
+    border: 1px solid __BORDER__;
+    text-decoration: none;
+    color: inherit;
+    opacity: 0.95;
+    flex: 0 0 auto;
+  }
+  .rgm-mail a:hover{
+    opacity: 1;
+    transform: translateY(-0.5px);
+    border-color: var(--tu-green);
+  }
+  .rgm-mail svg{ width: 15px; height: 15px; }
+
+  .rgm-btn-wrap{ margin-top: 14px; margin-bottom: 10px; }
+  
+  /* FOOTER (Logos) */
+  .rgm-footer{
+    position: fixed;
+    left: 0;
+    right: 0;
+    bottom: 0;
+
+    background: __FOOTER_BG__;
+    padding: 10px 18px;
+
+    border-top: 1px solid __FOOTER_BORDER__;
+    z-index: 9999;
+    backdrop-filter: blur(8px);
+  }
+
+  /* Scrollfläche */
+  .rgm-footer-scroll{
+    overflow-x: auto;
+    overflow-y: hidden;
+    -webkit-overflow-scrolling: touch;
+    scrollbar-width: thin;
+
+    /* wichtig: genug Rand, damit das 1. Logo nie „klebt“/abgeschnitten wirkt */
+    padding-left: max(12px, env(safe-area-inset-left));
+    padding-right: max(12px, env(safe-area-inset-right));
+    box-sizing: border-box;
+
+    /* macht das Scrollen bis zum Rand sauber */
+    scroll-padding-left: max(12px, env(safe-area-inset-left));
+    scroll-padding-right: max(12px, env(safe-area-inset-right));
+  }
+
+  /* Track, der sich bei "passt rein" automatisch zentriert */
+  .rgm-footer-track{
+    display: flex;
+    align-items: center;
+    gap: 18px;
+
+    width: max-content;
+    margin: 0 auto;
+    padding: 0; /* Padding ist im Scroll-Container */
+  }
+
+  .rgm-footer-logo{
+    flex: 0 0 auto;
+    display: inline-flex;
+    align-items: center;
+    justify-content: center;
+
+    background: rgba(255,255,255,0.92);
+    border: 1px solid rgba(0,0,0,0.08);
+    border-radius: 14px;
+
+    padding: 8px 10px;
+    text-decoration: none;
+    color: inherit;
+
+    box-shadow: 0 10px 22px rgba(0,0,0,0.10);
+  }
+
+  .rgm-footer-logo:hover{ opacity: 0.96; transform: translateY(-0.5px); }
+
+  .rgm-footer-logo img{
+    height: 52px;
+    width: auto;
+    object-fit: contain;
+    display: block;
+  }
+
+  @media (max-width: 900px){
+    .rgm-footer-logo img{ height: 46px; }
+  }
+  @media (max-width: 600px){
+    .rgm-footer-logo img{ height: 42px; }
+  }
+
+  .rgm-footer-scroll::-webkit-scrollbar{ height: 6px; }
+  .rgm-footer-scroll::-webkit-scrollbar-thumb{ border-radius: 999px; }
+
+</style>
+"""
+    css = (
+        css.replace("__TU_GREEN__", TU_GREEN)
+        .replace("__TU_ORANGE__", TU_ORANGE)
+        .replace("__TD_BLUE__", TD_BLUE)
+        .replace("__OG_ORANGE__", OG_ORANGE)
+        .replace("__BORDER__", border)
+        .replace("__SOFT_BG__", soft_bg)
+        .replace("__HOVER_BG__", hover_bg)
+        .replace("__SHADOW__", shadow)
+        .replace("__CARD_BG__", card_bg)
+        .replace("__TEXT__", text_col)
+        .replace("__FOOTER_BG__", footer_bg)
+        .replace("__FOOTER_BORDER__", footer_border)
+    )
+    return css
+
+
+# --- Einführung ---
+@functools.lru_cache(maxsize=2)
+def einfuehrung_css(dark: bool) -> str:
+    # Farbtokens abhängig vom Darkmode
+    border = "rgba(255,255,255,0.12)" if dark else "rgba(0,0,0,0.10)"
+    soft_bg = "rgba(255,255,255,0.06)" if dark else "rgba(0,0,0,0.03)"
+    shadow = "0 12px 28px rgba(0,0,0,0.40)" if dark else "0 10px 24px rgba(0,0,0,0.06)"
+
+    # Secondary-Button Grundzustand (Zurück)
+    btn2_bg = "rgba(255,255,255,0.06)" if dark else "#ffffff"
+    btn2_text = "rgba(250,250,250,0.92)" if dark else "#111111"
+
+    return f"""
+<style>
+  /* Seite begrenzen -> wirkt „produktmäßig“ */
+  .rgm-page {{
+    max-width: 1200px;
+    margin: 0 auto;
+    padding-bottom: 6px;
+  }}
+
+  /* Typografie */
+  .rgm-h1 {{
+    font-size: 30px;
+    font-weight: 850;
+    line-height: 1.15;
+    margin: 0 0 6px 0;
+    color: var(--rgm-text, #111);
+  }}
+
+  .rgm-lead {{
+    font-size: 15px;
+    line-height: 1.75;
+    color: var(--rgm-text, #111);
+    opacity: 0.92;
+    margin: 0;
+  }}
+
+  .rgm-muted {{
+    font-size: 15px;
+    line-height: 1.75;
+    color: var(--rgm-text, #111);
+    opacity: 0.92;
+  }}
+
+  /* Hero */
+  .rgm-hero {{
+    background: var(--rgm-card-bg, #fff);
+    border: 1px solid {border};
+    border-radius: 14px;
+    padding: 18px 18px 14px 18px;
+    box-shadow: {shadow};
+  }}
+
+  .rgm-accent-line {{
+    height: 3px;
+    width: 96px;
+    border-radius: 999px;
+    margin: 10px 0 14px 0;
+    background: linear-gradient(90deg, {TD_BLUE}, {OG_ORANGE});
+  }}
+
+  /* Flex-Row für TD/OG (statt st.columns) */
+  .rgm-row {{
+    display: flex;
+    gap: 38px;
+    align-items: center;
+    margin-top: 18px;
+  }}
+
+  .rgm-left {{
+    flex: 0 0 36%;
+    min-width: 320px;
+  }}
+
+  .rgm-right {{
+    flex: 1 1 64%;
+  }}
+
+  @media (max-width: 980px) {{
+    .rgm-row {{
+      flex-direction: column;
+      align-items: stretch;
+      gap: 16px;
+    }}
+    .rgm-left {{
+      flex: 1 1 auto;
+      min-width: 0;
+    }}
+  }}
+
+  /* Section Heading */
+  .rgm-section-title {{
+    font-weight: 850;
+    font-size: 16px;
+    margin: 0 0 6px 0;
+  }}
+  .rgm-td-title {{ color: {TD_BLUE}; }}
+  .rgm-og-title {{ color: {OG_ORANGE}; }}
+
+  /* Cards (Basis-Rahmen für Konsistenz mit anderen Seiten) */
+  .rgm-card {{
+    background: var(--rgm-card-bg, #fff);
+    border: 1px solid {border};
+    border-radius: 14px;
+    padding: 16px 18px;
+    box-shadow: {shadow};
+  }}
+
+  .rgm-card-td {{
+    border: 2px solid {TD_BLUE};
+  }}
+  .rgm-card-og {{
+    border: 2px solid {OG_ORANGE};
+  }}
+
+  .rgm-card-head {{
+    text-align: center;
+    font-weight: 850;
+    margin: 0 0 12px 0;
+    font-size: 15px;
+    color: var(--rgm-text, #111);
+  }}
+
+  /* Liste wie „professionelle Chips“ */
+  .rgm-list {{
+    margin: 0;
+    padding-left: 0;
+    list-style: none;
+  }}
+
+  .rgm-li {{
+    display: flex;
+    align-items: center;
+    gap: 10px;
+    padding: 9px 10px;
+    border-radius: 10px;
+    margin: 7px 0;
+    background: {soft_bg};
+    color: var(--rgm-text, #111);
+    font-size: 15px;
+    line-height: 1.5;
+  }}
+
+  .rgm-li:hover {{
+    filter: brightness(1.02);
+  }}
+
+  /* Badges */
+  .rgm-badge {{
+    display: inline-flex;
+    align-items: center;
+    justify-content: center;
+    height: 24px;
+    min-width: 44px;
+    padding: 0 10px;
+    border-radius: 999px;
+    font-weight: 850;
+    font-size: 13px;
+    letter-spacing: 0.2px;
+    white-space: nowrap;
+  }}
+
+  .rgm-badge-td {{
+    color: {TD_BLUE};
+    border: 1.8px solid {TD_BLUE};
+    background: rgba(47, 61, 184, 0.08);
+  }}
+
+  .rgm-badge-og {{
+    color: {OG_ORANGE};
+    border: 1.8px solid {OG_ORANGE};
+    background: rgba(242, 140, 40, 0.10);
+  }}
+
+  .rgm-li-text {{
+    flex: 1;
+  }}
+
+  /* Trennlinie zwischen TD und OG */
+  .rgm-divider {{
+    height: 1px;
+    background: {border};
+    margin: 18px 0 8px 0;
+  }}
+
+  /* =========================================
+     NAV-BUTTONS: Secondary NUR im Nav-Bereich
+     (verhindert Styling von Download/Filter/etc.)
+     ========================================= */
+
+  .rgm-nav button[data-testid="baseButton-secondary"],
+  .rgm-nav div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]) {{
+    background: {btn2_bg} !important;
+    color: {btn2_text} !important;
+    border: 1px solid {border} !important;
+    border-radius: 10px !important;
+    font-weight: 650 !important;
+    opacity: 1 !important;
+    transition: background 120ms ease, border-color 120ms ease, color 120ms ease;
+  }}
+
+  .rgm-nav button[data-testid="baseButton-secondary"] *,
+  .rgm-nav div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]) * {{
+    color: inherit !important;
+  }}
+
+  .rgm-nav button[data-testid="baseButton-secondary"]:not(:disabled):hover,
+  .rgm-nav div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]):not(:disabled):hover {{
+    background: {TU_ORANGE} !important;
+    border-color: {TU_ORANGE} !important;
+    color: #ffffff !important;
+  }}
+
+  .rgm-nav button[data-testid="baseButton-secondary"]:not(:disabled):hover *,
+  .rgm-nav div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]):not(:disabled):hover * {{
+    color: #ffffff !important;
+  }}
+
+  .rgm-nav button[data-testid="baseButton-secondary"]:focus,
+  .rgm-nav div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]):focus {{
+    outline: none !important;
+    box-shadow: 0 0 0 3px rgba(99,154,0,0.25) !important;
+  }}
+</style>
+"""
+
+
+# --- Ausfüllhinweise ---
+@functools.lru_cache(maxsize=2)
+def ausfuellhinweise_css(dark: bool) -> str:
+    border = "rgba(255,255,255,0.12)" if dark else "rgba(0,0,0,0.10)"
+    soft_bg = "rgba(255,255,255,0.06)" if dark else "rgba(0,0,0,0.03)"
+    header_bg = "rgba(255,255,255,0.08)" if dark else "rgba(127,127,127,0.10)"
+    zebra_bg = "rgba(255,255,255,0.04)" if dark else "rgba(0,0,0,0.018)"
+    hover_bg = "rgba(255,255,255,0.07)" if dark else "rgba(0,0,0,0.035)"
+    shadow = "0 12px 28px rgba(0,0,0,0.40)" if dark else "0 10px 24px rgba(0,0,0,0.06)"
+
+    # Secondary-Button Grundzustand (Zurück)
+    btn2_bg = "rgba(255,255,255,0.06)" if dark else "#ffffff"
+    btn2_text = "rgba(250,250,250,0.92)" if dark else "#111111"
+
+    return f"""
+<style>
+  .rgm-page {{
+    max-width: 1200px;
+    margin: 0 auto;
+    padding-bottom: 6px;
+  }}
+
+  .rgm-h1 {{
+    font-size: 30px;
+    font-weight: 850;
+    line-height: 1.15;
+    margin: 0 0 6px 0;
+    color: var(--rgm-text, #111);
+  }}
+
+  .rgm-lead {{
+    font-size: 15px;
+    line-height: 1.75;
+    color: var(--rgm-text, #111);
+    opacity: 0.92;
+    margin: 0;
+  }}
+
+  .rgm-muted {{
+    font-size: 15px;
+    line-height: 1.75;
+    color: var(--rgm-text, #111);
+    opacity: 0.92;
+  }}
+
+  .rgm-hero {{
+    background: var(--rgm-card-bg, #fff);
+    border: 1px solid {border};
+    border-radius: 14px;
+    padding: 18px 18px 14px 18px;
+    box-shadow: {shadow};
+  }}
+
+  .rgm-accent-line {{
+    height: 3px;
+    width: 96px;
+    border-radius: 999px;
+    margin: 10px 0 14px 0;
+    background: linear-gradient(90deg, {TD_BLUE}, {OG_ORANGE});
+  }}
+
+  /* Schnellnavigation */
+  .rgm-chips {{
+    display: flex;
+    flex-wrap: wrap;
+    gap: 8px;
+    margin-top: 10px;
+  }}
+  .rgm-chip {{
+    display: inline-flex;
+    align-items: center;
+    gap: 8px;
+    padding: 7px 10px;
+    border-radius: 999px;
+    border: 1px solid {border};
+    background: {soft_bg};
+    color: var(--rgm-text, #111);
+    font-size: 13px;
+    font-weight: 750;
+    text-decoration: none;
+  }}
+  .rgm-chip:hover {{
+    background: {hover_bg};
+  }}
+
+  .rgm-card {{
+    background: var(--rgm-card-bg, #fff);
+    border: 1px solid {border};
+    border-radius: 14px;
+    padding: 14px 16px;
+    box-shadow: {shadow};
+    margin-top: 16px;
+  }}
+
+  .rgm-card-title {{
+    font-weight: 850;
+    font-size: 15px;
+    margin: 0 0 10px 0;
+    color: var(--rgm-text, #111);
+  }}
+
+  .rgm-text {{
+    margin: 10px 0 0 0;
+  }}
+
+  .rgm-table-wrap {{
+    width: 100%;
+    overflow-x: auto;
+    -webkit-overflow-scrolling: touch;
+    border-radius: 12px;
+  }}
+
+  .rgm-table {{
+    width: 100%;
+    border-collapse: separate;
+    border-spacing: 0;
+    min-width: 760px;
+    background: var(--rgm-card-bg, #fff);
+    border: 1px solid {border};
+    border-radius: 12px;
+    overflow: hidden;
+  }}
+
+  /* Sticky Header */
+  .rgm-table thead th {{
+    position: sticky;
+    top: 0;
+    z-index: 2;
+    text-align: left;
+    padding: 10px 10px;
+    font-weight: 850;
+    font-size: 13px;
+    color: var(--rgm-text, #111);
+    background: {header_bg};
+    border-bottom: 1px solid {border};
+    vertical-align: top;
+    white-space: nowrap;
+  }}
+
+  .rgm-table tbody td {{
+    padding: 10px 10px;
+    font-size: 13px;
+    color: var(--rgm-text, #111);
+    border-bottom: 1px solid {border};
+    vertical-align: top;
+    background: transparent;
+  }}
+
+  /* Zebra + Hover */
+  .rgm-table tbody tr:nth-child(even) td {{
+    background: {zebra_bg};
+  }}
+  .rgm-table tbody tr:hover td {{
+    background: {hover_bg};
+  }}
+
+  .rgm-table tr:last-child td {{
+    border-bottom: none;
+  }}
+
+  .rgm-strong {{
+    font-weight: 850;
+  }}
+
+  .rgm-warning {{
+    margin-top: 14px;
+    padding: 14px 14px;
+    border-radius: 14px;
+    border: 1px solid rgba(242, 140, 40, 0.60);
+    background: rgba(242, 140, 40, 0.10);
+    box-shadow: {shadow};
+  }}
+
+  .rgm-warning-title {{
+    font-weight: 900;
+    font-size: 14px;
+    color: #c0392b;
+    margin: 0 0 6px 0;
+  }}
+
+  .rgm-warning ul {{
+    margin: 0;
+    padding-left: 18px;
+    color: var(--rgm-text, #111);
+    font-size: 13px;
+    line-height: 1.65;
+  }}
+
+  .rgm-warning li {{
+    margin: 0;
+  }}
+
+  /* =========================================
+     NAV-BUTTONS: Secondary NUR im Nav-Bereich
+     ========================================= */
+  .rgm-nav button[data-testid="baseButton-secondary"],
+  .rgm-nav div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]) {{
+    background: {btn2_bg} !important;
+    color: {btn2_text} !important;
+    border: 1px solid {border} !important;
+    border-radius: 10px !important;
+    font-weight: 650 !important;
+    opacity: 1 !important;
+    transition: background 120ms ease, border-color 120ms ease, color 120ms ease;
+  }}
+
+  .rgm-nav button[data-testid="baseButton-secondary"] *,
+  .rgm-nav div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]) * {{
+    color: inherit !important;
+  }}
+
+  .rgm-nav button[data-testid="baseButton-secondary"]:not(:disabled):hover,
+  .rgm-nav div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]):not(:disabled):hover {{
+    background: {TU_ORANGE} !important;
+    border-color: {TU_ORANGE} !important;
+    color: #ffffff !important;
+  }}
+
+  .rgm-nav button[data-testid="baseButton-secondary"]:not(:disabled):hover *,
+  .rgm-nav div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]):not(:disabled):hover * {{
+    color: #ffffff !important;
+  }}
+
+  .rgm-nav button[data-testid="baseButton-secondary"]:focus,
+  .rgm-nav div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]):focus {{
+    outline: none !important;
+    box-shadow: 0 0 0 3px rgba(99,154,0,0.25) !important;
+  }}
+
+  @media (max-width: 900px) {{
+    .rgm-h1 {{ font-size: 26px; }}
+    .rgm-hero {{ padding: 16px; }}
+    .rgm-card {{ padding: 12px 12px; }}
+  }}
+</style>
+"""
+
+
+# --- Erhebung ---
+@functools.lru_cache(maxsize=2)
+def erhebung_page_css(dark: bool) -> str:
+    border = "rgba(255,255,255,0.12)" if dark else "rgba(0,0,0,0.10)"
+    soft_bg = "rgba(255,255,255,0.06)" if dark else "rgba(0,0,0,0.03)"
+    header_bg = "rgba(255,255,255,0.08)" if dark else "rgba(127,127,127,0.10)"
+    shadow = "0 12px 28px rgba(0,0,0,0.40)" if dark else "0 10px 24px rgba(0,0,0,0.06)"
+
+    uploader_bg = "rgba(255,255,255,0.06)" if dark else "rgba(0,0,0,0.02)"
+
+    # Tooltip (help=...)
+    if dark:
+        tip_icon_bg = "rgba(255,255,255,0.06)"
+        tip_icon_hover = "rgba(255,255,255,0.12)"
+        tip_icon_fg = "rgba(255,255,255,0.92)"
+        tip_pop_bg = "rgba(17,24,39,0.98)"
+        tip_pop_fg = "rgba(250,250,250,0.92)"
+        tip_pop_border = "rgba(255,255,255,0.18)"
+        tip_pop_shadow = "0 12px 28px rgba(0,0,0,0.55)"
+    else:
+        tip_icon_bg = "rgba(17,24,39,0.06)"
+        tip_icon_hover = "rgba(17,24,39,0.10)"
+        tip_icon_fg = "rgba(17,24,39,0.82)"
+        tip_pop_bg = "#ffffff"
+        tip_pop_fg = "rgba(17,24,39,0.92)"
+        tip_pop_border = "rgba(0,0,0,0.12)"
+        tip_pop_shadow = "0 10px 24px rgba(0,0,0,0.10)"
+
+    # Secondary-Button Grundzustand (Erhebung)
+    btn2_bg = "rgba(255,255,255,0.06)" if dark else "#ffffff"
+    btn2_text = "rgba(250,250,250,0.92)" if dark else "#111111"
+
+    return f"""
+<style>
+  /* =========================
+     Tokens (nur für diese Seite)
+     ========================= */
+  div[data-testid="stAppViewContainer"] {{
+    --tu-orange: #CA7406;
+
+    --rgm-td-blue: {TD_BLUE};
+    --rgm-og-orange: {OG_ORANGE};
+    --rgm-border: {border};
+    --rgm-soft: {soft_bg};
+    --rgm-header-bg: {header_bg};
+    --rgm-shadow: {shadow};
+
+    --rgm-uploader-bg: {uploader_bg};
+
+    --rgm-tip-icon-bg: {tip_icon_bg};
+    --rgm-tip-icon-hover: {tip_icon_hover};
+    --rgm-tip-icon-fg: {tip_icon_fg};
+
+    --rgm-tip-pop-bg: {tip_pop_bg};
+    --rgm-tip-pop-fg: {tip_pop_fg};
+    --rgm-tip-pop-border: {tip_pop_border};
+    --rgm-tip-pop-shadow: {tip_pop_shadow};
+  }}
+
+  /* Content Breite wie andere Seiten */
+  div[data-testid="stAppViewContainer"] .block-container {{
+    max-width: 1200px;
+    margin: 0 auto;
+    padding-top: 1.0rem;
+    padding-bottom: 6.0rem;
+  }}
+
+  /* Anchor-Icon neben Überschriften ausblenden */
+  a.anchor-link,
+  a.header-anchor,
+  a[data-testid="stHeaderLink"],
+  a[aria-label="Anchor link"],
+  a[data-testid="stMarkdownAnchorLink"],
+  svg[data-testid="stMarkdownAnchorIcon"] {{
+    display: none !important;
+  }}
+
+  /* =========================
+     HERO
+     ========================= */
+  .rgm-hero {{
+    background: var(--rgm-card-bg, #fff);
+    border: 1px solid var(--rgm-border);
+    border-radius: 14px;
+    padding: 18px 18px 14px 18px;
+    box-shadow: var(--rgm-shadow);
+    margin-top: 6px;
+  }}
+
+  .rgm-h1 {{
+    font-size: 30px;
+    font-weight: 850;
+    line-height: 1.15;
+    margin: 0 0 6px 0;
+    color: var(--rgm-text, #111);
+  }}
+
+  .rgm-lead,
+  .rgm-muted {{
+    font-size: 15px;
+    line-height: 1.75;
+    color: var(--rgm-text, #111);
+    opacity: 0.92;
+    margin: 0;
+  }}
+
+  .rgm-accent-line {{
+    height: 3px;
+    width: 96px;
+    border-radius: 999px;
+    margin: 10px 0 14px 0;
+    background: linear-gradient(90deg, var(--rgm-td-blue), var(--rgm-og-orange));
+  }}
+
+  .rgm-badges {{
+    display: flex;
+    flex-wrap: wrap;
+    gap: 8px;
+    margin-top: 12px;
+  }}
+  .rgm-badge {{
+    display: inline-flex;
+    align-items: center;
+    gap: 6px;
+    padding: 6px 10px;
+    border-radius: 999px;
+    border: 1px solid var(--rgm-border);
+    background: var(--rgm-soft);
+    color: var(--rgm-text, #111);
+    font-size: 12.5px;
+    line-height: 1.3;
+    white-space: nowrap;
+  }}
+  .rgm-badge b {{ font-weight: 850; }}
+
+  .rgm-time-notice {{
+    display: flex;
+    align-items: flex-start;
+    gap: 10px;
+    margin: 12px 0 14px 0;
+    padding: 12px 14px;
+    border: 1px solid var(--rgm-border);
+    border-left: 4px solid var(--tu-orange);
+    border-radius: 12px;
+    background: var(--rgm-soft);
+    color: var(--rgm-text, #111);
+    box-shadow: var(--rgm-shadow);
+  }}
+  .rgm-time-notice-icon {{
+    flex: 0 0 auto;
+    width: 26px;
+    height: 26px;
+    border-radius: 999px;
+    display: inline-flex;
+    align-items: center;
+    justify-content: center;
+    background: rgba(202,116,6,0.12);
+    color: var(--tu-orange);
+    font-size: 16px;
+    line-height: 1;
+  }}
+  .rgm-time-notice-text {{
+    font-size: 14px;
+    line-height: 1.55;
+    margin: 0;
+  }}
+  .rgm-time-notice-text b {{ font-weight: 850; }}
+
+  /* =========================
+     Step 0: Meta-Card
+     ========================= */
+  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
+    div[data-testid="stVerticalBlock"]:has(#rgm-erhebung-meta-card):has(.rgm-hero) {{
+      border: 0 !important;
+      background: transparent !important;
+      box-shadow: none !important;
+      padding: 0 !important;
+      margin: 0 !important;
+  }}
+
+  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
+    div[data-testid="stVerticalBlock"]:has(#rgm-erhebung-meta-card):not(:has(.rgm-hero)) {{
+      border: 1px solid var(--rgm-border) !important;
+      border-radius: 14px !important;
+      background: var(--rgm-card-bg, #fff) !important;
+      box-shadow: var(--rgm-shadow) !important;
+      padding: 14px 16px 12px 16px !important;
+      margin: 0 !important;
+  }}
+
+  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
+    div[data-testid="stVerticalBlock"]:has(#rgm-erhebung-meta-card):not(:has(.rgm-hero)) label {{
+      font-weight: 750 !important;
+  }}
+
+  /* Focus: Inputs/Select (TU-Orange) */
+  div[data-testid="stTextInput"] input:focus {{
+    border-color: var(--tu-orange) !important;
+    box-shadow: 0 0 0 2px rgba(202,116,6,0.28) !important;
+  }}
+  div[data-baseweb="select"]:focus-within > div {{
+    border-color: var(--tu-orange) !important;
+    box-shadow: 0 0 0 2px rgba(202,116,6,0.28) !important;
+  }}
+
+  /* Fragenlayout */
+  .rgm-q {{ margin: 6px 0; line-height: 1.40; }}
+  .rgm-qno {{
+    display: inline-flex;
+    align-items: center;
+    justify-content: center;
+    min-width: 44px;
+    padding: 2px 10px;
+    border-radius: 999px;
+    border: 1px solid var(--rgm-border);
+    background: var(--rgm-soft);
+    font-weight: 850;
+    margin-right: 8px;
+    white-space: nowrap;
+  }}
+
+  /* Tabellen/Key-Value Boxen */
+  .rgm-kv-wrap {{
+    border: 1px solid var(--rgm-border);
+    border-radius: 14px;
+    overflow: hidden;
+    background: var(--rgm-card-bg, #fff);
+    box-shadow: var(--rgm-shadow);
+  }}
+  .rgm-kv-row {{
+    display: grid;
+    grid-template-columns: 190px 1fr;
+    border-bottom: 1px solid var(--rgm-border);
+  }}
+  .rgm-kv-row:last-child {{ border-bottom: none; }}
+  .rgm-kv-l {{
+    background: var(--rgm-header-bg);
+    padding: 10px 12px;
+    font-weight: 800;
+    color: var(--rgm-text, #111);
+  }}
+  .rgm-kv-r {{
+    padding: 10px 12px;
+    color: var(--rgm-text, #111);
+  }}
+
+  /* Radios kompakter */
+  div[data-testid="stRadio"] > div {{ gap: 0.35rem; }}
+
+  .rgm-split-title {{
+    font-size: 18px;
+    font-weight: 850;
+    margin: 2px 0 10px 0;
+    color: var(--rgm-text, #111);
+  }}
+
+  @media (max-width: 900px) {{
+    .rgm-h1 {{ font-size: 26px; }}
+    .rgm-hero {{ padding: 16px; }}
+  }}
+
+  /* File Uploader */
+  div[data-testid="stFileUploader"] section[data-testid="stFileUploaderDropzone"],
+  div[data-testid="stFileUploader"] section[aria-label="File uploader"] {{
+    background: var(--rgm-uploader-bg) !important;
+    border: 1px dashed var(--rgm-border) !important;
+    border-radius: 12px !important;
+  }}
+
+  /* Tooltip Icon */
+  div[data-testid="stTooltipIcon"] button {{
+    background: var(--rgm-tip-icon-bg) !important;
+    border: 1px solid var(--rgm-tip-pop-border) !important;
+    border-radius: 999px !important;
+    width: 26px !important;
+    height: 26px !important;
+    padding: 0 !important;
+    line-height: 0 !important;
+    display: inline-flex !important;
+    align-items: center !important;
+    justify-content: center !important;
+  }}
+  div[data-testid="stTooltipIcon"] button:hover {{
+    background: var(--rgm-tip-icon-hover) !important;
+  }}
+  div[data-testid="stTooltipIcon"] svg {{
+    color: var(--rgm-tip-icon-fg) !important;
+    fill: none !important;
+    stroke: currentColor !important;
+    opacity: 1 !important;
+  }}
+
+  /* Tooltip Popup */
+  *[data-baseweb="tooltip"],
+  *[role="tooltip"] {{
+    background: var(--rgm-tip-pop-bg) !important;
+    color: var(--rgm-tip-pop-fg) !important;
+    border: 1px solid var(--rgm-tip-pop-border) !important;
+    border-radius: 12px !important;
+    box-shadow: var(--rgm-tip-pop-shadow) !important;
+    max-width: 560px !important;
+    padding: 10px 12px !important;
+  }}
+  *[data-baseweb="tooltip"] * ,
+  *[role="tooltip"] * {{
+    color: var(--rgm-tip-pop-fg) !important;
+  }}
+
+  /* Secondary Buttons – NUR Erhebung (Marker) */
+  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
+    button[data-testid="baseButton-secondary"],
+  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
+    div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]) {{
+    background: {btn2_bg} !important;
+    color: {btn2_text} !important;
+    border: 1px solid var(--rgm-border) !important;
+    border-radius: 10px !important;
+    font-weight: 650 !important;
+    opacity: 1 !important;
+    transition: background 120ms ease, border-color 120ms ease, color 120ms ease;
+  }}
+  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
+    button[data-testid="baseButton-secondary"]:not(:disabled):hover,
+  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
+    div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]):not(:disabled):hover {{
+    background: var(--tu-orange) !important;
+    border-color: var(--tu-orange) !important;
+    color: #ffffff !important;
+  }}
+
+  /* Selectbox Dropdown Hover – scoped auf Erhebung */
+  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
+    div[data-baseweb="popover"] li[role="option"]:hover,
+  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
+    div[data-baseweb="popover"] div[role="option"]:hover,
+  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
+    div[data-baseweb="menu"] li:hover,
+  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
+    div[data-baseweb="menu"] div[role="option"]:hover {{
+      background: var(--tu-orange) !important;
+      color: #ffffff !important;
+  }}
+  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
+    div[data-baseweb="popover"] li[role="option"]:hover *,
+  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
+    div[data-baseweb="popover"] div[role="option"]:hover *,
+  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
+    div[data-baseweb="menu"] li:hover *,
+  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
+    div[data-baseweb="menu"] div[role="option"]:hover * {{
+      color: #ffffff !important;
+  }}
+
+</style>
+"""
+
+@functools.lru_cache(maxsize=2)
+def erhebung_footer_css(dark: bool) -> str:
+    border = "rgba(255,255,255,0.12)" if dark else "rgba(0,0,0,0.10)"
+    bg = "rgba(17,24,39,0.96)" if dark else "rgba(246,247,249,0.96)"
+    shadow = "0 -10px 24px rgba(0,0,0,0.35)" if dark else "0 -10px 24px rgba(0,0,0,0.06)"
+
+    seg_bg = "rgba(255,255,255,0.18)" if dark else "rgba(0,0,0,0.12)"
+    txt = "rgba(250,250,250,0.92)" if dark else "#111111"
+    muted = "rgba(250,250,250,0.75)" if dark else "rgba(17,24,39,0.75)"
+
+    return f"""
+<style>
+  div#rgm-erhebung-footer-anchor + div {{
+    position: fixed;
+    left: 0;
+    right: 0;
+    bottom: 0;
+
+    z-index: 9999;
+    background: {bg};
+    border-top: 1px solid {border};
+    box-shadow: {shadow};
+    backdrop-filter: blur(6px);
+    padding: 12px 18px 10px 18px;
+  }}
+
+  div#rgm-erhebung-footer-anchor + div > div {{
+    max-width: 1200px;
+    margin: 0 auto;
+  }}
+
+  .rgm-footer-title {{
+    font-weight: 850;
+    margin-bottom: 8px;
+    color: {txt};
+  }}
+
+  .rgm-progress-wrap{{ margin-top: 10px; }}
+  .rgm-progress-top{{
+    display:flex;
+    align-items:center;
+    justify-content:space-between;
+    gap:12px;
+    margin-bottom:6px;
+  }}
+  .rgm-progress-label{{
+    font-size:12px;
+    font-weight:750;
+    color: {muted};
+  }}
+
+  .rgm-pipe{{
+    display:flex;
+    gap:6px;
+    width:100%;
+  }}
+
+  .rgm-pipe .rgm-seg {{
+    flex: 1 1 0;
+    min-width: 0;
+    height: 10px;
+    border-radius: 999px;
+    background-color: {seg_bg} !important;
+  }}
+
+  .rgm-pipe .rgm-seg.rgm-seg-done {{
+    background-color: #7FB800 !important;
+  }}
+</style>
+"""
+
+
+# --- Dashboard ---
+@functools.lru_cache(maxsize=2)
+def dashboard_css(dark: bool) -> str:
+    border = "rgba(255,255,255,0.12)" if dark else "rgba(0,0,0,0.10)"
+    soft_bg = "rgba(255,255,255,0.06)" if dark else "rgba(0,0,0,0.03)"
+    header_bg = "rgba(255,255,255,0.08)" if dark else "rgba(127,127,127,0.10)"
+    shadow = "0 12px 28px rgba(0,0,0,0.40)" if dark else "0 10px 24px rgba(0,0,0,0.06)"
+
+    card_bg = "rgba(255,255,255,0.05)" if dark else "rgba(255,255,255,1.00)"
+    card_solid = "#111827" if dark else "#ffffff"
+    text_color = "rgba(255,255,255,0.92)" if dark else "#111111"
+
+    df_bg = "#0f172a" if dark else "#ffffff"
+    df_header = "#0b1220" if dark else "#f3f4f6"
+    df_grid = "rgba(255,255,255,0.10)" if dark else "rgba(0,0,0,0.10)"
+    df_hover = "rgba(202,116,6,0.18)" if dark else "rgba(202,116,6,0.10)"
+    df_text = "rgba(250,250,250,0.92)" if dark else "#111111"
+    df_muted = "rgba(250,250,250,0.70)" if dark else "rgba(0,0,0,0.60)"
+
+    toolbar_bg = "rgba(17,24,39,0.85)" if dark else "rgba(255,255,255,0.92)"
+    toolbar_hover = "rgba(202,116,6,0.25)" if dark else "rgba(202,116,6,0.14)"
+    icon_green = "#639A00"
+
+    return f"""
+<style>
+  /* =========================
+     BASE-LOOK (wie Gesamtübersicht)
+     ========================= */
+  .rgm-page {{
+    max-width: 1200px;
+    margin: 0 auto;
+    padding-bottom: 6px;
+  }}
+
+  .rgm-h1 {{
+    font-size: 30px;
+    font-weight: 850;
+    line-height: 1.15;
+    margin: 0 0 6px 0;
+    color: var(--rgm-text, #111);
+  }}
+
+  .rgm-lead {{
+    font-size: 15px;
+    line-height: 1.75;
+    color: var(--rgm-text, #111);
+    opacity: 0.92;
+    margin: 0;
+  }}
+
+  .rgm-muted {{
+    font-size: 15px;
+    line-height: 1.75;
+    color: var(--rgm-text, #111);
+    opacity: 0.92;
+  }}
+
+  .rgm-hero {{
+    background: var(--rgm-card-solid, #fff);
+    border: 1px solid var(--rgm-border);
+    border-radius: 14px;
+    padding: 18px 18px 14px 18px;
+    box-shadow: var(--rgm-shadow);
+  }}
+
+  .rgm-accent-line {{
+    height: 3px;
+    width: 96px;
+    border-radius: 999px;
+    margin: 10px 0 14px 0;
+    background: linear-gradient(90deg, var(--rgm-td-blue), var(--rgm-og-orange));
+  }}
+
+  .rgm-divider {{
+    height: 1px;
+    width: 100%;
+    background: var(--rgm-border);
+    margin: 22px 0 16px 0;
+  }}
+
+  .rgm-section-title {{
+    font-weight: 850;
+    font-size: 16px;
+    margin: 0 0 14px 0;
+    color: var(--rgm-text);
+  }}
+
+  .rgm-maturity-grid {{
+    display: grid;
+    grid-template-columns: repeat(3, minmax(0, 1fr));
+    gap: 14px;
+    margin-top: 14px;
+  }}
+
+  .rgm-maturity-section {{
+    margin-top: 20px;
+  }}
+
+  .rgm-maturity-card {{
+    position: relative;
+    background: var(--rgm-card-solid);
+    border: 1px solid var(--rgm-border);
+    border-radius: 14px;
+    box-shadow: var(--rgm-shadow);
+    padding: 14px 16px;
+    min-height: 78px;
+    overflow: hidden;
+  }}
+
+  .rgm-maturity-card-total::before {{
+    content: "";
+    position: absolute;
+    top: 0;
+    left: 0;
+    right: 0;
+    height: 3px;
+    background: linear-gradient(90deg, var(--rgm-td-blue), var(--rgm-og-orange));
+  }}
+
+  .rgm-maturity-card-td {{ border: 2px solid var(--rgm-td-blue); }}
+  .rgm-maturity-card-og {{ border: 2px solid var(--rgm-og-orange); }}
+
+  .rgm-maturity-title {{
+    font-size: 14px;
+    font-weight: 850;
+    color: var(--rgm-text);
+    margin: 0 0 8px 0;
+    line-height: 1.25;
+  }}
+
+  .rgm-maturity-value {{
+    font-size: 18px;
+    font-weight: 900;
+    line-height: 1.2;
+    color: var(--rgm-text);
+    font-variant-numeric: tabular-nums;
+  }}
+
+  /* =========================
+     Tokens + Container
+     ========================= */
+  div[data-testid="stAppViewContainer"] {{
+    --rgm-td-blue: {TD_BLUE};
+    --rgm-og-orange: {OG_ORANGE};
+    --rgm-border: {border};
+    --rgm-soft: {soft_bg};
+    --rgm-header-bg: {header_bg};
+    --rgm-card-bg: {card_bg};
+    --rgm-card-solid: {card_solid};
+    --rgm-text: {text_color};
+    --rgm-df-bg: {df_bg};
+    --rgm-df-header: {df_header};
+    --rgm-df-grid: {df_grid};
+    --rgm-df-hover: {df_hover};
+    --rgm-df-text: {df_text};
+    --rgm-df-muted: {df_muted};
+    --rgm-toolbar-bg: {toolbar_bg};
+    --rgm-toolbar-hover: {toolbar_hover};
+    --rgm-icon-green: {icon_green};
+    --rgm-shadow: {shadow};
+  }}
+
+  div[data-testid="stAppViewContainer"] .block-container {{
+    max-width: 1200px;
+    margin: 0 auto;
+    padding-top: 1.0rem;
+    padding-bottom: 6.0rem;
+  }}
+
+  /* Anchor links aus */
+  a.anchor-link,
+  a.header-anchor,
+  a[data-testid="stHeaderLink"],
+  a[aria-label="Anchor link"],
+  a[data-testid="stMarkdownAnchorLink"],
+  svg[data-testid="stMarkdownAnchorIcon"] {{
+    display: none !important;
+  }}
+
+  button[kind="primary"] {{
+    border-radius: 12px !important;
+    font-weight: 850 !important;
+  }}
+
+  .rgm-modal-body table.rgm-measures-table {{
+    min-width: 980px;
+  }}
+
+  @media (max-width: 900px) {{
+    div[data-testid="stAppViewContainer"] .block-container {{
+      padding-left: 0.7rem;
+      padding-right: 0.7rem;
+    }}
+    .rgm-h1 {{ font-size: 26px; }}
+    .rgm-hero {{ padding: 16px; }}
+    .rgm-maturity-grid {{ grid-template-columns: 1fr; }}
+  }}
+</style>
+"""
+
+
+# --- Priorisierung ---
+@functools.lru_cache(maxsize=2)
+def priorisierung_css(dark: bool) -> str:
+    border = "rgba(255,255,255,0.12)" if dark else "rgba(0,0,0,0.10)"
+    soft_bg = "rgba(255,255,255,0.06)" if dark else "rgba(0,0,0,0.03)"
+    header_bg = "rgba(255,255,255,0.08)" if dark else "rgba(127,127,127,0.10)"
+    hover_bg = "rgba(255,255,255,0.07)" if dark else "rgba(0,0,0,0.035)"
+    shadow = "0 12px 28px rgba(0,0,0,0.40)" if dark else "0 10px 24px rgba(0,0,0,0.06)"
+
+    # Wie in 05_Gesamtuebersicht.py
+    card_bg = "rgba(255,255,255,0.05)" if dark else "rgba(255,255,255,1.00)"
+    card_solid = "#111827" if dark else "#ffffff"
+    text_color = "rgba(255,255,255,0.92)" if dark else "#111111"
+
+    df_bg = "#0f172a" if dark else "#ffffff"
+    df_header = "#0b1220" if dark else "#f3f4f6"
+    df_grid = "rgba(255,255,255,0.10)" if dark else "rgba(0,0,0,0.10)"
+    df_text = "rgba(250,250,250,0.92)" if dark else "#111111"
+    df_muted = "rgba(250,250,250,0.70)" if dark else "rgba(0,0,0,0.60)"
+    
+    dlg_overlay = "rgba(2, 6, 23, 0.82)" if dark else "rgba(15, 23, 42, 0.24)"
+    dlg_bg = "#0b1120" if dark else "#ffffff"
+    dlg_surface = "#111827" if dark else "#f8fafc"
+    dlg_row_bg = "#0f172a" if dark else "#ffffff"
+    dlg_row_hover = "#1e293b" if dark else "#f3f4f6"
+    dlg_row_selected = "#2a1b0f" if dark else "#fff7ed"
+    dlg_row_selected_border = "#CA7406"
+
+    btn2_bg = df_bg if dark else "#ffffff"
+    btn2_text = df_text if dark else "#111111"
+
+    return f"""
+<style>
+  /* =========================
+     Tokens / Container
+     ========================= */
+  div[data-testid="stAppViewContainer"] {{
+    --rgm-td-blue: {TD_BLUE};
+    --rgm-og-orange: {OG_ORANGE};
+    --rgm-border: {border};
+    --rgm-soft: {soft_bg};
+    --rgm-header-bg: {header_bg};
+    --rgm-card-bg: {card_bg};
+    --rgm-card-solid: {card_solid};
+    --rgm-text: {text_color};
+    --rgm-df-bg: {df_bg};
+    --rgm-df-header: {df_header};
+    --rgm-df-grid: {df_grid};
+    --rgm-df-text: {df_text};
+    --rgm-df-muted: {df_muted};
+    --rgm-shadow: {shadow};
+  }}
+
+  div[data-testid="stAppViewContainer"] .block-container {{
+    max-width: 1200px;
+    margin: 0 auto;
+    padding-top: 1rem;
+    padding-bottom: 6rem;
+  }}
+
+  .rgm-page {{
+    max-width: 1200px;
+    margin: 0 auto;
+    padding-bottom: 6px;
+  }}
+
+  .rgm-h1 {{
+    font-size: 30px;
+    font-weight: 850;
+    line-height: 1.15;
+    margin: 0 0 6px 0;
+    color: var(--rgm-text, #111);
+  }}
+
+  .rgm-lead {{
+    font-size: 15px;
+    line-height: 1.75;
+    color: var(--rgm-text, #111);
+    opacity: 0.92;
+    margin: 0;
+  }}
+
+  .rgm-muted {{
+    font-size: 15px;
+    line-height: 1.75;
+    color: var(--rgm-text, #111);
+    opacity: 0.92;
+  }}
+
+  .rgm-hero {{
+    background: var(--rgm-card-solid, #fff);
+    border: 1px solid var(--rgm-border);
+    border-radius: 14px;
+    padding: 18px 18px 14px 18px;
+    box-shadow: var(--rgm-shadow);
+  }}
+
+  .rgm-accent-line {{
+    height: 3px;
+    width: 96px;
+    border-radius: 999px;
+    margin: 10px 0 14px 0;
+    background: linear-gradient(90deg, var(--rgm-td-blue), var(--rgm-og-orange));
+  }}
+
+  .rgm-card {{
+    background: var(--rgm-card-solid, #fff);
+    border: 1px solid var(--rgm-border);
+    border-radius: 14px;
+    padding: 14px 16px;
+    box-shadow: var(--rgm-shadow);
+    margin-top: 16px;
+  }}
+
+  .rgm-card-title {{
+    font-weight: 850;
+    font-size: 15px;
+    margin: 0 0 10px 0;
+    color: var(--rgm-text, #111);
+  }}
+
+  .rgm-subtle {{
+    font-size: 13px;
+    line-height: 1.6;
+    color: var(--rgm-text, #111);
+    opacity: 0.85;
+    margin: 0;
+  }}
+
+  .rgm-divider {{
+    height: 1px;
+    background: var(--rgm-border);
+    margin: 16px 0 8px 0;
+  }}
+
+  /* =========================
+     Expander
+     ========================= */
+  div[data-testid="stExpander"] {{
+    border: 1px solid var(--rgm-border);
+    border-radius: 14px;
+    overflow: hidden;
+    box-shadow: var(--rgm-shadow);
+    background: var(--rgm-card-solid, #fff);
+  }}
+
+  div[data-testid="stExpander"] summary {{
+    padding: 12px 14px !important;
+    font-weight: 850 !important;
+    color: var(--rgm-text, #111) !important;
+    background: var(--rgm-header-bg) !important;
+  }}
+
+  div[data-testid="stExpander"] summary:hover {{
+    background: {hover_bg} !important;
+  }}
+
+  div[data-testid="stExpander"] details {{
+    border-radius: 14px;
+  }}
+
+  div[data-testid="stExpander"] div[data-testid="stExpanderDetails"] {{
+    padding: 12px 14px 14px 14px;
+    background: var(--rgm-card-solid, #fff);
+  }}
+
+  .rgm-pill {{
+    display: inline-flex;
+    align-items: center;
+    gap: 8px;
+    padding: 6px 10px;
+    border-radius: 999px;
+    border: 1px solid var(--rgm-border);
+    background: var(--rgm-soft);
+    color: var(--rgm-text, #111);
+    font-size: 13px;
+    font-weight: 750;
+    margin: 8px 0 8px 0;
+    width: fit-content;
+  }}
+
+  .rgm-field-label {{
+    font-size: 15px;
+    line-height: 1.2;
+    font-weight: 600;
+    margin: 0 0 0.45rem 0;
+    color: var(--rgm-text, #111);
+  }}
+
+  div[data-testid="stTextInput"],
+  div[data-testid="stSelectbox"],
+  div[data-testid="stButton"] {{
+    margin-top: 0 !important;
+  }}
+
+  /* =========================
+     Feldgeometrie
+     ========================= */
+  :root {{
+    --rgm-field-h: 48px;
+    --rgm-field-radius: 12px;
+    --rgm-field-px: 0.85rem;
+  }}
+
+  /* -------------------------
+     TextInput
+     ------------------------- */
+  div[data-testid="stTextInput"] div[data-baseweb="input"] {{
+    height: var(--rgm-field-h) !important;
+    min-height: var(--rgm-field-h) !important;
+    max-height: var(--rgm-field-h) !important;
+  }}
+
+  div[data-testid="stTextInput"] div[data-baseweb="input"] > div {{
+    height: var(--rgm-field-h) !important;
+    min-height: var(--rgm-field-h) !important;
+    max-height: var(--rgm-field-h) !important;
+    border-radius: var(--rgm-field-radius) !important;
+    box-sizing: border-box !important;
+    display: flex !important;
+    align-items: center !important;
+    padding: 0 !important;
+    overflow: hidden !important;
+
+    background: var(--rgm-df-bg) !important;
+    border: 1px solid var(--rgm-border) !important;
+    color: var(--rgm-df-text) !important;
+  }}
+
+  div[data-testid="stTextInput"] input {{
+    height: 100% !important;
+    min-height: 0 !important;
+    max-height: 100% !important;
+    width: 100% !important;
+    margin: 0 !important;
+    padding: 0 var(--rgm-field-px) !important;
+    border: 0 !important;
+    line-height: 1.2 !important;
+    box-shadow: none !important;
+    background: transparent !important;
+
+    color: var(--rgm-df-text) !important;
+    -webkit-text-fill-color: var(--rgm-df-text) !important;
+    caret-color: var(--rgm-df-text) !important;
+  }}
+
+  div[data-testid="stTextInput"] input::placeholder {{
+    color: var(--rgm-df-muted) !important;
+    opacity: 1 !important;
+  }}
+
+  /* -------------------------
+     Selectbox
+     ------------------------- */
+  div[data-testid="stSelectbox"] div[data-baseweb="select"] {{
+    height: var(--rgm-field-h) !important;
+    min-height: var(--rgm-field-h) !important;
+    max-height: var(--rgm-field-h) !important;
+  }}
+
+  div[data-testid="stSelectbox"] div[data-baseweb="select"] > div {{
+    height: var(--rgm-field-h) !important;
+    min-height: var(--rgm-field-h) !important;
+    max-height: var(--rgm-field-h) !important;
+    border-radius: var(--rgm-field-radius) !important;
+    box-sizing: border-box !important;
+    display: flex !important;
+    align-items: center !important;
+    padding: 0 !important;
+    overflow: hidden !important;
+
+    background: var(--rgm-df-bg) !important;
+    border: 1px solid var(--rgm-border) !important;
+    color: var(--rgm-df-text) !important;
+  }}
+
+  div[data-testid="stSelectbox"] [role="combobox"] {{
+    height: 100% !important;
+    min-height: 0 !important;
+    max-height: 100% !important;
+    display: flex !important;
+    align-items: center !important;
+    margin: 0 !important;
+    padding-top: 0 !important;
+    padding-bottom: 0 !important;
+    padding-left: var(--rgm-field-px) !important;
+    padding-right: 2.1rem !important;
+    line-height: 1.2 !important;
+
+    color: var(--rgm-df-text) !important;
+  }}
+
+  div[data-testid="stSelectbox"] [role="combobox"] > * {{
+    height: 100% !important;
+    min-height: 0 !important;
+    display: flex !important;
+    align-items: center !important;
+    margin: 0 !important;
+  }}
+
+  div[data-testid="stSelectbox"] [role="combobox"] span,
+  div[data-testid="stSelectbox"] [role="combobox"] div {{
+    line-height: 1.2 !important;
+    color: var(--rgm-df-text) !important;
+  }}
+
+  /* Hover / Focus auf Feldern */
+  div[data-testid="stTextInput"] div[data-baseweb="input"] > div:hover,
+  div[data-testid="stSelectbox"] div[data-baseweb="select"] > div:hover {{
+    border-color: {TU_ORANGE} !important;
+  }}
+
+  div[data-testid="stTextInput"] div[data-baseweb="input"] > div:focus-within,
+  div[data-testid="stSelectbox"] div[data-baseweb="select"] > div:focus-within {{
+    border-color: {TU_ORANGE} !important;
+    box-shadow: 0 0 0 3px rgba(202,116,6,0.18) !important;
+  }}
+
+  /* Browser Autofill sauber dunkel halten */
+  input:-webkit-autofill,
+  input:-webkit-autofill:hover,
+  input:-webkit-autofill:focus,
+  textarea:-webkit-autofill,
+  textarea:-webkit-autofill:hover,
+  textarea:-webkit-autofill:focus {{
+    -webkit-text-fill-color: var(--rgm-df-text) !important;
+    -webkit-box-shadow: 0 0 0px 1000px var(--rgm-df-bg) inset !important;
+    transition: background-color 9999s ease-in-out 0s !important;
+  }}
+
+  /* -------------------------
+     Dropdown / Popover
+     ------------------------- */
+  div[data-baseweb="popover"] {{
+    color: var(--rgm-df-text) !important;
+  }}
+
+  div[data-baseweb="popover"] ul,
+  div[data-baseweb="popover"] [role="listbox"] {{
+    background: var(--rgm-card-solid) !important;
+    border: 1px solid var(--rgm-border) !important;
+    box-shadow: var(--rgm-shadow) !important;
+  }}
+
+  div[data-baseweb="popover"] li,
+  div[data-baseweb="popover"] [role="option"] {{
+    background: transparent !important;
+    color: var(--rgm-df-text) !important;
+  }}
+
+  div[data-baseweb="popover"] li:hover,
+  div[data-baseweb="popover"] [role="option"]:hover {{
+    background: rgba(202,116,6,0.14) !important;
+  }}
+
+  /* -------------------------
+     Icon-Button neben Maßnahme
+     ------------------------- */
+  div[data-testid="stExpanderDetails"] div[data-testid="stButton"] {{
+    margin: 0 !important;
+    padding: 0 !important;
+  }}
+
+  div[data-testid="stExpanderDetails"] div[data-testid="stButton"] > div {{
+    height: var(--rgm-field-h) !important;
+    min-height: var(--rgm-field-h) !important;
+    max-height: var(--rgm-field-h) !important;
+  }}
+
+  div[data-testid="stExpanderDetails"] div[data-testid="stButton"] button,
+  div[data-testid="stExpanderDetails"] div[data-testid="stButton"] button[kind] {{
+    height: var(--rgm-field-h) !important;
+    min-height: var(--rgm-field-h) !important;
+    max-height: var(--rgm-field-h) !important;
+
+    width: var(--rgm-field-h) !important;
+    min-width: var(--rgm-field-h) !important;
+    max-width: var(--rgm-field-h) !important;
+
+    padding: 0 !important;
+    margin: 0 !important;
+    border-radius: var(--rgm-field-radius) !important;
+    box-sizing: border-box !important;
+
+    display: flex !important;
+    align-items: center !important;
+    justify-content: center !important;
+    line-height: 1 !important;
+  }}
+
+  div[data-testid="stExpanderDetails"] div[data-testid="stButton"] button > div,
+  div[data-testid="stExpanderDetails"] div[data-testid="stButton"] button span,
+  div[data-testid="stExpanderDetails"] div[data-testid="stButton"] button p {{
+    margin: 0 !important;
+    padding: 0 !important;
+    line-height: 1 !important;
+
+    display: flex !important;
+    align-items: center !important;
+    justify-content: center !important;
+  }}
+
+  .stApp button[data-testid="baseButton-secondary"],
+  .stApp div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]) {{
+    background: {btn2_bg} !important;
+    color: {btn2_text} !important;
+    border: 1px solid var(--rgm-border) !important;
+    border-radius: var(--rgm-field-radius) !important;
+    font-weight: 650 !important;
+    opacity: 1 !important;
+    transition: background 120ms ease, border-color 120ms ease, color 120ms ease;
+  }}
+
+  .stApp button[data-testid="baseButton-secondary"] *,
+  .stApp div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]) * {{
+    color: inherit !important;
+  }}
+
+  .stApp button[data-testid="baseButton-secondary"]:not(:disabled):hover,
+  .stApp div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]):not(:disabled):hover {{
+    background: {TU_ORANGE} !important;
+    border-color: {TU_ORANGE} !important;
+    color: #ffffff !important;
+  }}
+
+  .stApp button[data-testid="baseButton-secondary"]:not(:disabled):hover *,
+  .stApp div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]):not(:disabled):hover * {{
+    color: #ffffff !important;
+  }}
+
+  .stApp button[data-testid="baseButton-secondary"]:focus,
+  .stApp div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]):focus {{
+    outline: none !important;
+    box-shadow: 0 0 0 3px rgba(99,154,0,0.25) !important;
+  }}
+
+  /* =========================
+     Dialog / Maßnahmen-Vorschläge
+     ========================= */
+
+  /* Overlay im Hintergrund */
+  div[data-testid="stDialog"] {{
+    background: {dlg_overlay} !important;
+    backdrop-filter: blur(6px) !important;
+  }}
+
+  /* eigentliche Dialog-Karte: komplett deckend */
+  div[data-testid="stDialog"] > div[role="dialog"],
+  div[data-testid="stModal"] > div[role="dialog"],
+  div[data-testid="stDialog"] div[role="dialog"],
+  div[data-testid="stModal"] div[role="dialog"] {{
+    width: min(920px, calc(100vw - 48px)) !important;
+    max-width: 920px !important;
+    height: auto !important;
+    max-height: 84vh !important;
+
+    background: {dlg_bg} !important;
+    opacity: 1 !important;
+    color: var(--rgm-text) !important;
+    border: 1px solid var(--rgm-border) !important;
+    border-radius: 18px !important;
+    box-shadow: 0 24px 70px rgba(0,0,0,0.45) !important;
+  }}
+
+div[data-testid="stDialog"] div[role="dialog"] section,
+div[data-testid="stModal"] div[role="dialog"] section {{
+  max-height: 84vh !important;
+  overflow: hidden !important;
+  background: {dlg_bg} !important;
+  opacity: 1 !important;
+  color: var(--rgm-text) !important;
+  padding: 0.25rem 0.25rem 0.6rem 0.25rem !important;
+}}
+
+  /* Titel + Texte */
+  div[data-testid="stDialog"] div[role="dialog"] h1,
+  div[data-testid="stDialog"] div[role="dialog"] h2,
+  div[data-testid="stDialog"] div[role="dialog"] h3,
+  div[data-testid="stModal"] div[role="dialog"] h1,
+  div[data-testid="stModal"] div[role="dialog"] h2,
+  div[data-testid="stModal"] div[role="dialog"] h3,
+  div[data-testid="stDialog"] div[role="dialog"] p,
+  div[data-testid="stDialog"] div[role="dialog"] span,
+  div[data-testid="stDialog"] div[role="dialog"] label,
+  div[data-testid="stModal"] div[role="dialog"] p,
+  div[data-testid="stModal"] div[role="dialog"] span,
+  div[data-testid="stModal"] div[role="dialog"] label {{
+    color: var(--rgm-text) !important;
+    opacity: 1 !important;
+  }}
+
+  .rgm-dialog-meta {{
+    font-size: 14px;
+    color: var(--rgm-df-muted);
+    margin: 0.15rem 0 0.8rem 0;
+  }}
+  
+/* =========================
+   Dialog / Maßnahmen-Vorschläge
+   stabiler Scroll-Host + keine Karten-Überlappung
+   ========================= */
+
+/* Der Radio-Widget-Block selbst wird zum Scroll-Host */
+div[data-testid="stDialog"] div[role="dialog"] [class*="st-key-dlg_pick_"],
+div[data-testid="stModal"] div[role="dialog"] [class*="st-key-dlg_pick_"] {{
+  max-height: min(420px, calc(84vh - 170px)) !important;
+  overflow-y: auto !important;
+  overflow-x: hidden !important;
+  overscroll-behavior: contain !important;
+  -webkit-overflow-scrolling: touch !important;
+  padding-right: 0.25rem !important;
+  box-sizing: border-box !important;
+  min-height: 0 !important;
+}}
+
+/* Scrollbar nur für den Maßnahmen-Block */
+div[data-testid="stDialog"] div[role="dialog"] [class*="st-key-dlg_pick_"]::-webkit-scrollbar,
+div[data-testid="stModal"] div[role="dialog"] [class*="st-key-dlg_pick_"]::-webkit-scrollbar {{
+  width: 10px;
+}}
+
+div[data-testid="stDialog"] div[role="dialog"] [class*="st-key-dlg_pick_"]::-webkit-scrollbar-thumb,
+div[data-testid="stModal"] div[role="dialog"] [class*="st-key-dlg_pick_"]::-webkit-scrollbar-thumb {{
+  background: rgba(202,116,6,0.45);
+  border-radius: 999px;
+}}
+
+/* Radiogroup sauber vertikal, ohne Shrink/Überlagerung */
+div[data-testid="stDialog"] div[role="dialog"] [class*="st-key-dlg_pick_"] [role="radiogroup"],
+div[data-testid="stModal"] div[role="dialog"] [class*="st-key-dlg_pick_"] [role="radiogroup"] {{
+  display: flex !important;
+  flex-direction: column !important;
+  align-items: stretch !important;
+  gap: 0.55rem !important;
+
+  background: {dlg_surface} !important;
+  border: 1px solid var(--rgm-border) !important;
+  border-radius: 16px !important;
+  padding: 0.5rem !important;
+  color: var(--rgm-df-text) !important;
+  box-sizing: border-box !important;
+}}
+
+/* Jede Karte bleibt ein eigener Block */
+div[data-testid="stDialog"] div[role="dialog"] [class*="st-key-dlg_pick_"] [role="radiogroup"] label[data-baseweb="radio"],
+div[data-testid="stModal"] div[role="dialog"] [class*="st-key-dlg_pick_"] [role="radiogroup"] label[data-baseweb="radio"] {{
+  display: flex !important;
+  align-items: flex-start !important;
+  gap: 0.85rem !important;
+
+  width: 100% !important;
+  min-height: 64px !important;
+  margin: 0 !important;
+  padding: 0.95rem 1rem !important;
+
+  flex: 0 0 auto !important;
+  box-sizing: border-box !important;
+  position: relative !important;
+
+  background: {dlg_row_bg} !important;
+  border: 1px solid transparent !important;
+  border-radius: 14px !important;
+  opacity: 1 !important;
+  transition: background 120ms ease, border-color 120ms ease, box-shadow 120ms ease;
+}}
+
+div[data-testid="stDialog"] div[role="dialog"] [class*="st-key-dlg_pick_"] [role="radiogroup"] label[data-baseweb="radio"]:hover,
+div[data-testid="stModal"] div[role="dialog"] [class*="st-key-dlg_pick_"] [role="radiogroup"] label[data-baseweb="radio"]:hover {{
+  background: {dlg_row_hover} !important;
+  border-color: rgba(202,116,6,0.22) !important;
+}}
+
+div[data-testid="stDialog"] div[role="dialog"] [class*="st-key-dlg_pick_"] [role="radiogroup"] label[data-baseweb="radio"]:has(input:checked),
+div[data-testid="stModal"] div[role="dialog"] [class*="st-key-dlg_pick_"] [role="radiogroup"] label[data-baseweb="radio"]:has(input:checked) {{
+  background: {dlg_row_selected} !important;
+  border-color: {dlg_row_selected_border} !important;
+  box-shadow: 0 0 0 2px rgba(202,116,6,0.12) inset !important;
+}}
+
+/* Radio-Layout innen */
+div[data-testid="stDialog"] div[role="dialog"] [class*="st-key-dlg_pick_"] [role="radiogroup"] label[data-baseweb="radio"] > div,
+div[data-testid="stModal"] div[role="dialog"] [class*="st-key-dlg_pick_"] [role="radiogroup"] label[data-baseweb="radio"] > div {{
+  margin: 0 !important;
+  position: static !important;
+}}
+
+div[data-testid="stDialog"] div[role="dialog"] [class*="st-key-dlg_pick_"] [role="radiogroup"] label[data-baseweb="radio"] > div:first-child,
+div[data-testid="stModal"] div[role="dialog"] [class*="st-key-dlg_pick_"] [role="radiogroup"] label[data-baseweb="radio"] > div:first-child {{
+  flex: 0 0 auto !important;
+  display: flex !important;
+  align-items: flex-start !important;
+  justify-content: center !important;
+  padding-top: 0.1rem !important;
+}}
+
+div[data-testid="stDialog"] div[role="dialog"] [class*="st-key-dlg_pick_"] [role="radiogroup"] label[data-baseweb="radio"] > div:last-child,
+div[data-testid="stModal"] div[role="dialog"] [class*="st-key-dlg_pick_"] [role="radiogroup"] label[data-baseweb="radio"] > div:last-child {{
+  flex: 1 1 auto !important;
+  min-width: 0 !important;
+}}
+
+/* Text sauber umbrechen */
+div[data-testid="stDialog"] div[role="dialog"] [class*="st-key-dlg_pick_"] [role="radiogroup"] p,
+div[data-testid="stDialog"] div[role="dialog"] [class*="st-key-dlg_pick_"] [role="radiogroup"] span,
+div[data-testid="stModal"] div[role="dialog"] [class*="st-key-dlg_pick_"] [role="radiogroup"] p,
+div[data-testid="stModal"] div[role="dialog"] [class*="st-key-dlg_pick_"] [role="radiogroup"] span {{
+  margin: 0 !important;
+  color: var(--rgm-df-text) !important;
+  opacity: 1 !important;
+  white-space: normal !important;
+  word-break: break-word !important;
+  overflow-wrap: anywhere !important;
+  line-height: 1.5 !important;
+  font-size: 15px !important;
+  font-weight: 500 !important;
+}}
+
+/* Radiogroup nur als äußerer Block */
+div[data-testid="stDialog"] div[role="dialog"] [role="radiogroup"],
+div[data-testid="stModal"] div[role="dialog"] [role="radiogroup"] {{
+  display: block !important;
+  background: {dlg_surface} !important;
+  border: 1px solid var(--rgm-border) !important;
+  border-radius: 16px !important;
+  padding: 0.5rem !important;
+  color: var(--rgm-df-text) !important;
+  box-sizing: border-box !important;
+}}
+
+/* NUR die echten Radio-Karten stylen */
+div[data-testid="stDialog"] div[role="dialog"] [role="radiogroup"] label[data-baseweb="radio"],
+div[data-testid="stModal"] div[role="dialog"] [role="radiogroup"] label[data-baseweb="radio"] {{
+  display: flex !important;
+  align-items: flex-start !important;
+  gap: 0.85rem !important;
+
+  width: 100% !important;
+  min-height: 64px !important;
+  margin: 0 0 0.55rem 0 !important;
+  padding: 0.95rem 1rem !important;
+
+  box-sizing: border-box !important;
+  position: relative !important;
+
+  background: {dlg_row_bg} !important;
+  border: 1px solid transparent !important;
+  border-radius: 14px !important;
+  opacity: 1 !important;
+  transition: background 120ms ease, border-color 120ms ease, box-shadow 120ms ease;
+}}
+
+div[data-testid="stDialog"] div[role="dialog"] [role="radiogroup"] label[data-baseweb="radio"]:last-of-type,
+div[data-testid="stModal"] div[role="dialog"] [role="radiogroup"] label[data-baseweb="radio"]:last-of-type {{
+  margin-bottom: 0 !important;
+}}
+
+div[data-testid="stDialog"] div[role="dialog"] [role="radiogroup"] label[data-baseweb="radio"]:hover,
+div[data-testid="stModal"] div[role="dialog"] [role="radiogroup"] label[data-baseweb="radio"]:hover {{
+  background: {dlg_row_hover} !important;
+  border-color: rgba(202,116,6,0.22) !important;
+}}
+
+div[data-testid="stDialog"] div[role="dialog"] [role="radiogroup"] label[data-baseweb="radio"]:has(input:checked),
+div[data-testid="stModal"] div[role="dialog"] [role="radiogroup"] label[data-baseweb="radio"]:has(input:checked) {{
+  background: {dlg_row_selected} !important;
+  border-color: {dlg_row_selected_border} !important;
+  box-shadow: 0 0 0 2px rgba(202,116,6,0.12) inset !important;
+}}
+
+/* Innere Radio-Struktur sauber ausrichten */
+div[data-testid="stDialog"] div[role="dialog"] [role="radiogroup"] label[data-baseweb="radio"] > div,
+div[data-testid="stModal"] div[role="dialog"] [role="radiogroup"] label[data-baseweb="radio"] > div {{
+  margin: 0 !important;
+  position: static !important;
+}}
+
+div[data-testid="stDialog"] div[role="dialog"] [role="radiogroup"] label[data-baseweb="radio"] > div:first-child,
+div[data-testid="stModal"] div[role="dialog"] [role="radiogroup"] label[data-baseweb="radio"] > div:first-child {{
+  flex: 0 0 auto !important;
+  display: flex !important;
+  align-items: flex-start !important;
+  justify-content: center !important;
+  padding-top: 0.1rem !important;
+}}
+
+div[data-testid="stDialog"] div[role="dialog"] [role="radiogroup"] label[data-baseweb="radio"] > div:last-child,
+div[data-testid="stModal"] div[role="dialog"] [role="radiogroup"] label[data-baseweb="radio"] > div:last-child {{
+  flex: 1 1 auto !important;
+  min-width: 0 !important;
+}}
+
+/* Text NUR in den echten Radio-Karten */
+div[data-testid="stDialog"] div[role="dialog"] [role="radiogroup"] label[data-baseweb="radio"] p,
+div[data-testid="stDialog"] div[role="dialog"] [role="radiogroup"] label[data-baseweb="radio"] span,
+div[data-testid="stModal"] div[role="dialog"] [role="radiogroup"] label[data-baseweb="radio"] p,
+div[data-testid="stModal"] div[role="dialog"] [role="radiogroup"] label[data-baseweb="radio"] span {{
+  margin: 0 !important;
+  color: var(--rgm-df-text) !important;
+  opacity: 1 !important;
+  white-space: normal !important;
+  word-break: break-word !important;
+  overflow-wrap: anywhere !important;
+  line-height: 1.5 !important;
+  font-size: 15px !important;
+  font-weight: 500 !important;
+}}
+
+/* Radio-Farbe */
+div[data-testid="stDialog"] input[type="radio"],
+div[data-testid="stModal"] input[type="radio"] {{
+  accent-color: #639A00 !important;
+}}
+
+  /* Clipboard-Button / "Vorschläge anzeigen" im Expander sichtbarer */
+  div[data-testid="stExpanderDetails"] div[data-testid="stButton"] button {{
+    background: var(--rgm-df-bg) !important;
+    color: var(--rgm-df-text) !important;
+    border: 1px solid var(--rgm-border) !important;
+  }}
+
+  div[data-testid="stExpanderDetails"] div[data-testid="stButton"] button:hover {{
+    background: {TU_ORANGE} !important;
+    border-color: {TU_ORANGE} !important;
+    color: #ffffff !important;
+  }}
+
+  div[data-testid="stExpanderDetails"] div[data-testid="stButton"] button * {{
+    color: inherit !important;
+  }}
+
+  @media (max-width: 700px) {{
+    div[data-testid="stDialog"] > div[role="dialog"],
+    div[data-testid="stModal"] > div[role="dialog"],
+    div[data-testid="stDialog"] div[role="dialog"],
+    div[data-testid="stModal"] div[role="dialog"] {{
+      width: calc(100vw - 20px) !important;
+      max-width: calc(100vw - 20px) !important;
+      max-height: 88vh !important;
+      border-radius: 16px !important;
+    }}
+
+    div[data-testid="stDialog"] div[role="dialog"] section,
+    div[data-testid="stModal"] div[role="dialog"] section {{
+      max-height: 88vh !important;
+    }}
+  }}
+</style>
+"""
+
+
+# --- Glossar ---
+@functools.lru_cache(maxsize=2)
+def glossar_css(dark: bool) -> str:
+    border = "rgba(255,255,255,0.12)" if dark else "rgba(0,0,0,0.10)"
+    shadow = "0 12px 28px rgba(0,0,0,0.40)" if dark else "0 10px 24px rgba(0,0,0,0.06)"
+
+    btn2_bg = "rgba(255,255,255,0.06)" if dark else "#ffffff"
+    btn2_text = "rgba(250,250,250,0.92)" if dark else "#111111"
+
+    return f"""
+<style>
+  .rgm-page {{
+    max-width: 1200px;
+    margin: 0 auto;
+    padding-bottom: 6px;
+  }}
+
+  .rgm-h1 {{
+    font-size: 30px;
+    font-weight: 850;
+    line-height: 1.15;
+    margin: 0 0 6px 0;
+    color: var(--rgm-text, #111);
+  }}
+
+  .rgm-lead {{
+    font-size: 15px;
+    line-height: 1.75;
+    color: var(--rgm-text, #111);
+    opacity: 0.92;
+    margin: 0;
+  }}
+
+  .rgm-hero {{
+    background: var(--rgm-card-bg, #fff);
+    border: 1px solid {border};
+    border-radius: 14px;
+    padding: 18px 18px 14px 18px;
+    box-shadow: {shadow};
+  }}
+
+  .rgm-accent-line {{
+    height: 3px;
+    width: 96px;
+    border-radius: 999px;
+    margin: 10px 0 14px 0;
+    background: linear-gradient(90deg, {TD_BLUE}, {OG_ORANGE});
+  }}
+
+  div#rgm_glossary_tools + div {{
+    margin-top: 14px;
+  }}
+
+  .stApp button[data-testid="baseButton-secondary"],
+  .stApp div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]) {{
+    background: {btn2_bg} !important;
+    color: {btn2_text} !important;
+    border: 1px solid {border} !important;
+    border-radius: 10px !important;
+    font-weight: 650 !important;
+    opacity: 1 !important;
+    transition: background 120ms ease, border-color 120ms ease, color 120ms ease;
+  }}
+
+  .stApp button[data-testid="baseButton-secondary"] *,
+  .stApp div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]) * {{
+    color: inherit !important;
+  }}
+
+  .stApp button[data-testid="baseButton-secondary"]:not(:disabled):hover,
+  .stApp div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]):not(:disabled):hover {{
+    background: {TU_ORANGE} !important;
+    border-color: {TU_ORANGE} !important;
+    color: #ffffff !important;
+  }}
+
+  .stApp button[data-testid="baseButton-secondary"]:not(:disabled):hover *,
+  .stApp div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]):not(:disabled):hover * {{
+    color: #ffffff !important;
+  }}
+
+  @media (max-width: 900px) {{
+    .rgm-h1 {{ font-size: 26px; }}
+    .rgm-hero {{ padding: 16px; }}
+  }}
+</style>
+"""
+
+
+# --- Gesamtübersicht ---
+@functools.lru_cache(maxsize=2)
+def gesamtuebersicht_css(dark: bool) -> str:
+    border = "rgba(255,255,255,0.12)" if dark else "rgba(0,0,0,0.10)"
+    soft_bg = "rgba(255,255,255,0.06)" if dark else "rgba(0,0,0,0.03)"
+    header_bg = "rgba(255,255,255,0.08)" if dark else "rgba(127,127,127,0.10)"
+    shadow = "0 12px 28px rgba(0,0,0,0.40)" if dark else "0 10px 24px rgba(0,0,0,0.06)"
+
+    card_bg = "rgba(255,255,255,0.05)" if dark else "rgba(255,255,255,1.00)"
+    card_solid = "#111827" if dark else "#ffffff"
+    text_color = "rgba(255,255,255,0.92)" if dark else "#111111"
+
+    df_bg = "#0f172a" if dark else "#ffffff"
+    df_header = "#0b1220" if dark else "#f3f4f6"
+    df_grid = "rgba(255,255,255,0.10)" if dark else "rgba(0,0,0,0.10)"
+    df_hover = "rgba(202,116,6,0.18)" if dark else "rgba(202,116,6,0.10)"
+    df_text = "rgba(250,250,250,0.92)" if dark else "#111111"
+    df_muted = "rgba(250,250,250,0.70)" if dark else "rgba(0,0,0,0.60)"
+
+    # Toolbar-Look (wie Tabelle) + grüne Icons
+    toolbar_bg = "rgba(17,24,39,0.85)" if dark else "rgba(255,255,255,0.92)"
+    toolbar_hover = "rgba(202,116,6,0.25)" if dark else "rgba(202,116,6,0.14)"
+    icon_green = "#639A00"
+
+    return f"""
+<style>
+   /* =========================
+   BASE-LOOK (wie fertige Seiten)
+   ========================= */
+  .rgm-page {{
+    max-width: 1200px;
+    margin: 0 auto;
+    padding-bottom: 6px;
+  }}
+
+  .rgm-h1 {{
+    font-size: 30px;
+    font-weight: 850;
+    line-height: 1.15;
+    margin: 0 0 6px 0;
+    color: var(--rgm-text, #111);
+  }}
+
+  .rgm-lead {{
+    font-size: 15px;
+    line-height: 1.75;
+    color: var(--rgm-text, #111);
+    opacity: 0.92;
+    margin: 0;
+  }}
+
+  .rgm-muted {{
+    font-size: 15px;
+    line-height: 1.75;
+    color: var(--rgm-text, #111);
+    opacity: 0.92;
+  }}
+
+  .rgm-hero {{
+    background: var(--rgm-card-solid, #fff);
+    border: 1px solid var(--rgm-border);
+    border-radius: 14px;
+    padding: 18px 18px 14px 18px;
+    box-shadow: var(--rgm-shadow);
+  }}
+
+  .rgm-accent-line {{
+    height: 3px;
+    width: 96px;
+    border-radius: 999px;
+    margin: 10px 0 14px 0;
+    background: linear-gradient(90deg, var(--rgm-td-blue), var(--rgm-og-orange));
+  }}
+
+  .rgm-card-title {{
+    font-weight: 850;
+    font-size: 15px;
+    margin: 0 0 10px 0;
+    color: var(--rgm-text);
+  }}
+
+  /* =========================
+     Tokens + Container
+     ========================= */
+  div[data-testid="stAppViewContainer"] {{
+    --rgm-td-blue: {TD_BLUE};
+    --rgm-og-orange: {OG_ORANGE};
+    --rgm-border: {border};
+    --rgm-soft: {soft_bg};
+    --rgm-header-bg: {header_bg};
+    --rgm-card-bg: {card_bg};
+    --rgm-card-solid: {card_solid};
+    --rgm-text: {text_color};
+    --rgm-df-bg: {df_bg};
+    --rgm-df-header: {df_header};
+    --rgm-df-grid: {df_grid};
+    --rgm-df-hover: {df_hover};
+    --rgm-df-text: {df_text};
+    --rgm-df-muted: {df_muted};
+    --rgm-toolbar-bg: {toolbar_bg};
+    --rgm-toolbar-hover: {toolbar_hover};
+    --rgm-icon-green: {icon_green};
+    --rgm-shadow: {shadow};
+  }}
+
+  div[data-testid="stAppViewContainer"] .block-container {{
+    max-width: 1200px;
+    margin: 0 auto;
+    padding-top: 1.0rem;
+    padding-bottom: 6.0rem;
+  }}
+
+  /* Anchor links aus */
+  a.anchor-link,
+  a.header-anchor,
+  a[data-testid="stHeaderLink"],
+  a[aria-label="Anchor link"],
+  a[data-testid="stMarkdownAnchorLink"],
+  svg[data-testid="stMarkdownAnchorIcon"] {{
+    display: none !important;
+  }}
+
+  .rgm-divider {{
+    height: 1px;
+    width: 100%;
+    background: var(--rgm-border);
+    margin: 22px 0 16px 0;
+  }}
+
+  .rgm-section-title {{
+    font-weight: 850;
+    font-size: 16px;
+    margin: 0 0 14px 0;
+    color: var(--rgm-text);
+  }}
+
+  @media (max-width: 900px){{
+    div[data-testid="stPlotlyChart"] .js-plotly-plot .modebar{{
+      top: 8px !important;
+      right: 8px !important;
+    }}
+  }}
+
+
+  button[kind="primary"] {{
+    border-radius: 12px !important;
+    font-weight: 850 !important;
+  }}
+  
+    /* =========================
+     Export: Download Buttons (PDF + JSON) -> TU Grün / Hover TU-Orange (ROBUST)
+     Marker steht DIREKT vor dem Download-Widget.
+     ========================= */
+
+  /* ----- Base Button (PDF + JSON) ----- */
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_pdf)
+    + div[data-testid="stElementContainer"]
+    div[data-testid="stDownloadButton"] button,
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_json)
+    + div[data-testid="stElementContainer"]
+    div[data-testid="stDownloadButton"] button,
+  div.element-container:has(div#rgm_overview_export_btn_pdf)
+    + div.element-container
+    div[data-testid="stDownloadButton"] button,
+  div.element-container:has(div#rgm_overview_export_btn_json)
+    + div.element-container
+    div[data-testid="stDownloadButton"] button,
+
+  /* Fallback: manche Versionen nutzen .stDownloadButton */
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_pdf)
+    + div[data-testid="stElementContainer"]
+    div.stDownloadButton button,
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_json)
+    + div[data-testid="stElementContainer"]
+    div.stDownloadButton button,
+  div.element-container:has(div#rgm_overview_export_btn_pdf)
+    + div.element-container
+    div.stDownloadButton button,
+  div.element-container:has(div#rgm_overview_export_btn_json)
+    + div.element-container
+    div.stDownloadButton button {{
+
+    background: var(--rgm-icon-green) !important;
+    background-color: var(--rgm-icon-green) !important;
+    color: #ffffff !important;
+
+    border: 1px solid rgba(0,0,0,0.10) !important;
+    border-radius: 12px !important;
+    font-weight: 850 !important;
+
+    box-shadow: 0 10px 22px rgba(0,0,0,0.12) !important;
+    filter: none !important;
+  }}
+
+  /* Text/Spans im Button auch weiß erzwingen */
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_pdf)
+    + div[data-testid="stElementContainer"]
+    div[data-testid="stDownloadButton"] button *,
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_json)
+    + div[data-testid="stElementContainer"]
+    div[data-testid="stDownloadButton"] button *,
+  div.element-container:has(div#rgm_overview_export_btn_pdf)
+    + div.element-container
+    div[data-testid="stDownloadButton"] button *,
+  div.element-container:has(div#rgm_overview_export_btn_json)
+    + div.element-container
+    div[data-testid="stDownloadButton"] button *,
+
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_pdf)
+    + div[data-testid="stElementContainer"]
+    div.stDownloadButton button *,
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_json)
+    + div[data-testid="stElementContainer"]
+    div.stDownloadButton button *,
+  div.element-container:has(div#rgm_overview_export_btn_pdf)
+    + div.element-container
+    div.stDownloadButton button *,
+  div.element-container:has(div#rgm_overview_export_btn_json)
+    + div.element-container
+    div.stDownloadButton button * {{
+
+    color: #ffffff !important;
+  }}
+
+  /* Hover: kräftig TU-Orange (#CA7406) */
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_pdf)
+    + div[data-testid="stElementContainer"]
+    div[data-testid="stDownloadButton"] button:hover,
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_json)
+    + div[data-testid="stElementContainer"]
+    div[data-testid="stDownloadButton"] button:hover,
+  div.element-container:has(div#rgm_overview_export_btn_pdf)
+    + div.element-container
+    div[data-testid="stDownloadButton"] button:hover,
+  div.element-container:has(div#rgm_overview_export_btn_json)
+    + div.element-container
+    div[data-testid="stDownloadButton"] button:hover,
+
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_pdf)
+    + div[data-testid="stElementContainer"]
+    div.stDownloadButton button:hover,
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_json)
+    + div[data-testid="stElementContainer"]
+    div.stDownloadButton button:hover,
+  div.element-container:has(div#rgm_overview_export_btn_pdf)
+    + div.element-container
+    div.stDownloadButton button:hover,
+  div.element-container:has(div#rgm_overview_export_btn_json)
+    + div.element-container
+    div.stDownloadButton button:hover {{
+
+    background: #CA7406 !important;
+    background-color: #CA7406 !important;
+    border-color: #CA7406 !important;
+    color: #ffffff !important;
+    filter: none !important;
+  }}
+
+  /* Active: leicht dunkler */
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_pdf)
+    + div[data-testid="stElementContainer"]
+    div[data-testid="stDownloadButton"] button:active,
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_json)
+    + div[data-testid="stElementContainer"]
+    div[data-testid="stDownloadButton"] button:active,
+  div.element-container:has(div#rgm_overview_export_btn_pdf)
+    + div.element-container
+    div[data-testid="stDownloadButton"] button:active,
+  div.element-container:has(div#rgm_overview_export_btn_json)
+    + div.element-container
+    div[data-testid="stDownloadButton"] button:active,
+
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_pdf)
+    + div[data-testid="stElementContainer"]
+    div.stDownloadButton button:active,
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_json)
+    + div[data-testid="stElementContainer"]
+    div.stDownloadButton button:active,
+  div.element-container:has(div#rgm_overview_export_btn_pdf)
+    + div.element-container
+    div.stDownloadButton button:active,
+  div.element-container:has(div#rgm_overview_export_btn_json)
+    + div.element-container
+    div.stDownloadButton button:active {{
+
+    background: #CA7406 !important;
+    background-color: #CA7406 !important;
+    border-color: #CA7406 !important;
+    filter: brightness(0.92) !important;
+  }}
+
+  /* Disabled */
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_pdf)
+    + div[data-testid="stElementContainer"]
+    div[data-testid="stDownloadButton"] button:disabled,
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_json)
+    + div[data-testid="stElementContainer"]
+    div[data-testid="stDownloadButton"] button:disabled,
+  div.element-container:has(div#rgm_overview_export_btn_pdf)
+    + div.element-container
+    div[data-testid="stDownloadButton"] button:disabled,
+  div.element-container:has(div#rgm_overview_export_btn_json)
+    + div.element-container
+    div[data-testid="stDownloadButton"] button:disabled {{
+
+    opacity: 0.55 !important;
+    cursor: not-allowed !important;
+  }}
+
+
+  /* =========================
+   SECTION-CARDS (Marker -> nächstes Element)
+   ========================= */
+
+  /* Marker selbst soll keinen Platz belegen */
+  #rgm_overview_meta,
+  #rgm_overview_kpis,
+  #rgm_overview_filters,
+  #rgm_overview_export,
+  #rgm_overview_export_btn_pdf,
+  #rgm_overview_export_btn_json,
+  #rgm_overview_empty {{
+    height: 0 !important;
+    margin: 0 !important;
+    padding: 0 !important;
+    overflow: hidden !important;
+  }}
+
+  /* Der Block NACH dem Marker wird als Card gestylt */
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_meta) + div[data-testid="stElementContainer"] > div,
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_kpis) + div[data-testid="stElementContainer"] > div,
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_filters) + div[data-testid="stElementContainer"] > div,
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_export) + div[data-testid="stElementContainer"] > div,
+  div[data-testid="stElementContainer"]:has(div#rgm_overview_empty) + div[data-testid="stElementContainer"] > div,
+
+  /* Fallback für manche Streamlit-Versionen */
+  div.element-container:has(div#rgm_overview_meta) + div.element-container > div,
+  div.element-container:has(div#rgm_overview_kpis) + div.element-container > div,
+  div.element-container:has(div#rgm_overview_filters) + div.element-container > div,
+  div.element-container:has(div#rgm_overview_export) + div.element-container > div,
+  div.element-container:has(div#rgm_overview_empty) + div.element-container > div {{
+    background: var(--rgm-card-solid);
+    border: 1px solid var(--rgm-border);
+    border-radius: 14px;
+    box-shadow: var(--rgm-shadow);
+    padding: 14px 16px;
+    margin-top: 12px;
+    overflow: hidden;
+  }}
+  
+  /* Key-Value Grid für "Angaben zur Erhebung" */
+  .rgm-kv {{
+    display: grid;
+    grid-template-columns: 1fr 1fr;
+    gap: 6px 28px;
+    margin-top: 6px;
+  }}
+  .rgm-kv-row{{
+    display:flex;
+    justify-content: space-between;
+    gap: 12px;
+    padding: 8px 0;
+    border-bottom: 1px solid var(--rgm-border);
+  }}
+  
+  .rgm-kv-col{{ min-width: 0; }}
+  .rgm-kv-col .rgm-kv-row:last-child{{ border-bottom: 0; }}
+  .rgm-kv-row{{ align-items: center; }}
+  .rgm-k{{ min-width: 0; white-space: normal; }}
+  .rgm-v{{ max-width: 55%; }}
+
+  .rgm-k {{
+    font-weight: 500;
+    color: var(--rgm-text);
+    opacity: 0.78;
+    white-space: nowrap;
+  }}
+  .rgm-v {{
+    font-weight: 500;
+    font-variant-numeric: tabular-nums;
+    color: var(--rgm-text);
+    opacity: 0.92;
+    text-align: right;
+  }}
+
+  /* Mobile: einspaltig */
+  @media (max-width: 900px){{
+    .rgm-kv {{ grid-template-columns: 1fr; }}
+    .rgm-v {{ text-align: left; }}
+  }}
+  
+  /* =========================
+     KPI-LOOK (st.metric) wie Dashboard-Kacheln
+     ========================= */
+  div[data-testid="stMetric"],
+  div[data-testid="stMetric"] > div {{
+    background: var(--rgm-soft) !important;
+    border: 1px solid var(--rgm-border) !important;
+    border-radius: 14px !important;
+  }}
+
+  div[data-testid="stMetric"] {{
+    padding: 14px 14px !important;
+    box-shadow: 0 10px 22px rgba(0,0,0,0.08) !important;
+  }}
+
+  /* Label */
+  div[data-testid="stMetric"] [data-testid="stMetricLabel"] p {{
+    margin: 0 !important;
+    font-weight: 800 !important;
+    opacity: 0.78 !important;
+    color: var(--rgm-text) !important;
+    letter-spacing: 0.2px;
+  }}
+
+  /* Value */
+  div[data-testid="stMetric"] [data-testid="stMetricValue"] {{
+    margin-top: 6px !important;
+  }}
+  div[data-testid="stMetric"] [data-testid="stMetricValue"] > div {{
+    font-weight: 900 !important;
+    font-size: 34px !important;
+    line-height: 1.1 !important;
+    color: var(--rgm-text) !important;
+  }}
+  
+  /* Mini-Panels für TD/OG-Kennzahlen (kompakt, elegant) */
+  .rgm-kpi-mini{{
+    padding: 12px 14px;
+  }}
+
+  .rgm-kpi-mini-title{{
+    font-weight: 850;
+    font-size: 13px;
+    margin: 0 0 8px 0;
+    color: var(--rgm-text);
+  }}
+
+  .rgm-kpi-line{{
+    display:flex;
+    justify-content: space-between;
+    gap: 12px;
+    padding: 8px 0;
+    border-top: 1px solid var(--rgm-border);
+  }}
+
+  .rgm-kpi-line:first-of-type{{ border-top: 0; }}
+
+  .rgm-kpi-line .k{{
+    font-weight: 500;
+    opacity: 0.78;
+    color: var(--rgm-text);
+  }}
+
+  .rgm-kpi-line .v{{
+    font-weight: 850;
+    color: var(--rgm-text);
+  }}
+  
+  /* Grid innerhalb der Kennzahlen-Card (2 Spalten, mobil 1 Spalte) */
+  .rgm-kpi-grid{{
+    display: grid;
+    grid-template-columns: repeat(2, minmax(0, 1fr));
+    gap: 14px;
+    padding: 6px;
+    box-sizing: border-box;
+  }}
+
+  .rgm-kpi-stack{{
+    display: grid;
+    gap: 14px;
+  }}
+
+  .rgm-kpi-overall{{
+    margin: 6px;
+  }}
+
+  .rgm-maturity-card{{
+    position: relative;
+    background: var(--rgm-card-solid);
+    border: 1px solid var(--rgm-border);
+    border-radius: 14px;
+    box-shadow: var(--rgm-shadow);
+    padding: 14px 16px;
+    overflow: hidden;
+  }}
+
+  .rgm-maturity-card-total::before{{
+    content: "";
+    position: absolute;
+    top: 0;
+    left: 0;
+    right: 0;
+    height: 3px;
+    background: linear-gradient(90deg, var(--rgm-td-blue), var(--rgm-og-orange));
+  }}
+
+  .rgm-maturity-eyebrow{{
+    font-size: 12px;
+    font-weight: 800;
+    color: var(--rgm-text);
+    opacity: 0.70;
+    margin: 0 0 3px 0;
+  }}
+
+  .rgm-maturity-row{{
+    display: flex;
+    align-items: flex-end;
+    justify-content: space-between;
+    gap: 16px;
+  }}
+
+  .rgm-maturity-title{{
+    font-size: 14px;
+    font-weight: 850;
+    color: var(--rgm-text);
+    margin: 0;
+    line-height: 1.25;
+  }}
+
+  .rgm-maturity-value{{
+    font-size: 18px;
+    font-weight: 900;
+    line-height: 1.2;
+    color: var(--rgm-text);
+    font-variant-numeric: tabular-nums;
+  }}
+
+  @media (max-width: 900px){{
+    .rgm-kpi-grid{{ grid-template-columns: 1fr; }}
+    .rgm-maturity-row{{ align-items: flex-start; flex-direction: column; }}
+  }}
+  
+  /* Cards wie in 00_Einfuehrung.py */
+  .rgm-card{{
+    background: var(--rgm-card-solid);
+    border: 1px solid var(--rgm-border);
+    border-radius: 14px;
+    padding: 16px 18px;
+    box-shadow: var(--rgm-shadow);
+  }}
+
+  .rgm-card-td{{ border: 2px solid var(--rgm-td-blue); }}
+  .rgm-card-og{{ border: 2px solid var(--rgm-og-orange); }}
+
+  /* =========================
+     Alerts (st.warning/info/error) optisch ruhiger
+     ========================= */
+  div[data-testid="stAlert"] {{
+    border-radius: 14px !important;
+    border: 1px solid var(--rgm-border) !important;
+    box-shadow: 0 10px 22px rgba(0,0,0,0.06) !important;
+  }}
+  div[data-testid="stAlert"] p {{
+    margin: 0.15rem 0 !important;
+  }}
+
+
+  /* Im Modal horizontal scrollen, falls nötig */
+  .rgm-modal-body table.rgm-measures-table {{
+    min-width: 1180px;
+  }}
+
+  @media (max-width: 900px) {{
+    div[data-testid="stAppViewContainer"] .block-container {{
+    padding-left: 0.7rem;
+    padding-right: 0.7rem;}}
+    .rgm-h1 {{ font-size: 26px; }}
+    .rgm-hero {{ padding: 16px; }}
+  }}
+
+  /* Row mit components.html: Columns müssen strecken und wirklich gleich breit sein */
+  div[data-testid="stHorizontalBlock"]:has(iframe[srcdoc]),
+  div[data-testid="stHorizontalBlock"]:has(iframe[title="streamlit.components.v1.html"]) {{
+    width: 100% !important;
+    align-items: stretch !important;
+    justify-content: stretch !important;
+    gap: 0.9rem !important;
+  }}
+
+  div[data-testid="stHorizontalBlock"]:has(iframe[srcdoc]) > div,
+  div[data-testid="stHorizontalBlock"]:has(iframe[title="streamlit.components.v1.html"]) > div,
+  div[data-testid="stHorizontalBlock"]:has(iframe[srcdoc]) > div[data-testid="column"],
+  div[data-testid="stHorizontalBlock"]:has(iframe[title="streamlit.components.v1.html"]) > div[data-testid="column"] {{
+    flex: 1 1 0% !important;
+    min-width: 0 !important;
+    width: 0 !important;         /* sorgt für wirklich gleiche Breite */
+    max-width: none !important;
+  }}
+
+  /* Wrapper der Custom-Component in der Row auf 100% zwingen */
+  div[data-testid="stHorizontalBlock"]:has(iframe[srcdoc]) div[data-testid="stCustomComponentV1"],
+  div[data-testid="stHorizontalBlock"]:has(iframe[srcdoc]) div[data-testid="stCustomComponentV1"] > div,
+  div[data-testid="stHorizontalBlock"]:has(iframe[title="streamlit.components.v1.html"]) div[data-testid="stCustomComponentV1"],
+  div[data-testid="stHorizontalBlock"]:has(iframe[title="streamlit.components.v1.html"]) div[data-testid="stCustomComponentV1"] > div {{
+    width: 100% !important;
+    max-width: 100% !important;
+    min-width: 0 !important;
+    display: block !important;
+  }}
+
+  /* Fallback: Column-Umgebung darf nicht "shrink" werden */
+  div[data-testid="column"] div[data-testid="stElementContainer"],
+  div[data-testid="column"] div[data-testid="stElementContainer"] > div,
+  div[data-testid="column"] div[data-testid="stCustomComponentV1"],
+  div[data-testid="column"] div[data-testid="stCustomComponentV1"] > div {{
+    width: 100% !important;
+    max-width: 100% !important;
+    min-width: 0 !important;
+  }}
+
+</style>
+"""
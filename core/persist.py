@@ -1,8 +1,10 @@
 # core/persist.py
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import pickle
 import tempfile
 import time
 import uuid
@@ -226,6 +228,9 @@ def save(aid: str | None = None) -> None:
         "erhebung_dim_idx_ui": int(st.session_state.get("erhebung_dim_idx_ui", 0) or 0),
         "erhebung_own_target_defined": bool(st.session_state.get("erhebung_own_target_defined", False)),
         "nav_page": st.session_state.get("nav_page", None),
+        # Modell, gegen das die Erhebung ausgewertet wird (core.model_loader.active_model_ref)
+        "model_id": st.session_state.get("model_id"),
+        "model_version": st.session_state.get("model_version"),
     }
 
     path = _snap_path(aid)
@@ -312,6 +317,8 @@ def restore(aid: str | None = None) -> None:
         "erhebung_dim_idx_ui",
         "erhebung_own_target_defined",
         "nav_page",
+        "model_id",
+        "model_version",
     ]:
         if key not in st.session_state and key in snap:
             st.session_state[key] = snap.get(key)
@@ -319,10 +326,7 @@ def restore(aid: str | None = None) -> None:
 # ============================================================
 # Export / Import: Savefile (JSON) für "später fortsetzen" / "jährliche Wiedererhebung"
 # ============================================================
-def export_snapshot_bytes(aid: str | None = None, *, pretty: bool = True) -> bytes:
-    """
-    Savefile (JSON) für Download: enthält den kompletten relevanten Session-State.
-    """
+def _export_snapshot_dict(aid: str | None = None) -> dict[str, Any]:
     aid = str(aid or get_or_create_aid()).strip()
     if not aid:
         aid = get_or_create_aid()
@@ -331,7 +335,7 @@ def export_snapshot_bytes(aid: str | None = None, *, pretty: bool = True) -> byt
     if not isinstance(meta, dict):
         meta = {}
 
-    snap: dict[str, Any] = {
+    return {
         "schema": "rgm_export_v1",
         "updated_at": int(time.time()),
         "aid": aid,
@@ -346,8 +350,31 @@ def export_snapshot_bytes(aid: str | None = None, *, pretty: bool = True) -> byt
         "erhebung_dim_idx_ui": int(st.session_state.get("erhebung_dim_idx_ui", 0) or 0),
         "erhebung_own_target_defined": bool(st.session_state.get("erhebung_own_target_defined", False)),
         "nav_page": st.session_state.get("nav_page", None),
+        # Modell, gegen das die Erhebung ausgewertet wird (core.model_loader.active_model_ref)
+        "model_id": st.session_state.get("model_id"),
+        "model_version": st.session_state.get("model_version"),
     }
 
+
+def snapshot_fingerprint(aid: str | None = None) -> str:
+    """
+    Fingerabdruck des Savefile-Inhalts (ohne Zeitstempel), z. B. als Cache-Key für Downloads.
+    """
+    snap = _export_snapshot_dict(aid)
+    snap.pop("updated_at", None)
+    try:
+        raw = pickle.dumps(snap, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        raw = repr(snap).encode("utf-8", "replace")
+    return hashlib.sha1(raw).hexdigest()[:16]
+
+
+def export_snapshot_bytes(aid: str | None = None, *, pretty: bool = True) -> bytes:
+    """
+    Savefile (JSON) für Download: enthält den kompletten relevanten Session-State.
+    """
+    snap = _export_snapshot_dict(aid)
+
     if pretty:
         return json.dumps(snap, ensure_ascii=False, indent=2).encode("utf-8")
     return json.dumps(snap, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -458,6 +485,11 @@ def apply_snapshot_dict(
     if mode == "overwrite" and "language" in snap:
         st.session_state["language"] = snap.get("language") or "de"
 
+    # Modell der Erhebung: alte Savefiles ohne Angabe laufen gegen das aktuelle Standardmodell
+    if mode == "overwrite":
+        st.session_state["model_id"] = snap.get("model_id")
+        st.session_state["model_version"] = snap.get("model_version")
+
 def rerun_with_save(aid: str | None = None) -> None:
     """
     Vor st.rerun() immer speichern (wichtig bei Navigation).
@@ -1,10 +1,13 @@
 # core/scoring.py
 from __future__ import annotations
 
+import functools
 import math
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterable, Mapping, Optional, Tuple
 
 from core.types import Dimension as DimensionDC
+from core.types import MaturityModel as MaturityModelDC
 
 
 # Antwort-Skala (Text -> numerischer Score)
@@ -17,97 +20,273 @@ ANSWER_SCORES: Dict[str, Optional[float]] = {
     "Nicht anwendbar": None,
 }
 
+NOT_APPLICABLE = "Nicht anwendbar"
 
-def _iter_levels(dimension: DimensionDC | Dict[str, Any]):
+
+@dataclass(frozen=True)
+class ScoringProfile:
+    """
+    Parameter des Scoring-Kernels.
+
+    - answer_scores: Antworttext -> Score (None = nicht anwendbar, aus dem Nenner)
+    - unanswered_score / unknown_score: Score für fehlende bzw. unbekannte Antworten
+      (None = Frage wird ignoriert)
+    - gating: Abbruch beim ersten nicht vollständig erfüllten Level
+    - round_down_step: ABRUNDEN auf Vielfache (z. B. 0.25); sonst round(decimals)
+    """
+    name: str
+    answer_scores: Mapping[str, Optional[float]]
+    unanswered_score: Optional[float] = 0.0
+    unknown_score: Optional[float] = 0.0
+    gating: bool = True
+    full_threshold: float = 0.99
+    round_down_step: Optional[float] = 0.25
+    decimals: int = 2
+
+
+# UI-Logik (Excel 20251209): Gating, unbeantwortet = 0.0, Abrunden auf 0.25
+STANDARD_PROFILE = ScoringProfile(name="standard", answer_scores=ANSWER_SCORES)
+
+# Alte Auswertung aus core.evaluation: andere Skala, kein Gating, Summe der Stufenmittel
+LEGACY_PROFILE = ScoringProfile(
+    name="legacy",
+    answer_scores={**ANSWER_SCORES, "In ein paar Fällen": 0.25},
+    unanswered_score=None,
+    unknown_score=None,
+    gating=False,
+    round_down_step=None,
+    decimals=2,
+)
+
+SCORING_PROFILES: Dict[str, ScoringProfile] = {
+    STANDARD_PROFILE.name: STANDARD_PROFILE,
+    LEGACY_PROFILE.name: LEGACY_PROFILE,
+}
+
+
+def get_scoring_profile(profile: ScoringProfile | str | None = None) -> ScoringProfile:
+    if isinstance(profile, ScoringProfile):
+        return profile
+    key = str(profile or STANDARD_PROFILE.name).strip().lower()
+    if key not in SCORING_PROFILES:
+        raise ValueError(f"Unbekanntes Scoring-Profil: {profile!r}")
+    return SCORING_PROFILES[key]
+
+
+# -----------------------------
+# Kompiliertes Modell
+# -----------------------------
+@dataclass(frozen=True)
+class CompiledLevel:
+    level_number: int
+    question_ids: Tuple[Any, ...]
+
+
+@dataclass(frozen=True)
+class CompiledDimension:
+    code: str
+    name: str
+    category: str
+    default_target_level: float
+    levels: Tuple[CompiledLevel, ...]
+
+
+@dataclass(frozen=True)
+class CompiledModel:
+    dimensions: Tuple[CompiledDimension, ...]
+    by_code: Dict[str, CompiledDimension] = field(default_factory=dict, compare=False, repr=False)
+
+
+def compile_dimension(dimension: DimensionDC | Dict[str, Any]) -> CompiledDimension:
     """
-    Liefert eine sortierte Liste von Level-Objekten (egal ob Dataclass oder Dict).
+    Bringt eine Dimension in die Form, die der Kernel erwartet:
+    Level sortiert, je Level ein Tupel der Frage-IDs.
     """
     if isinstance(dimension, DimensionDC):
-        levels = sorted(dimension.levels, key=lambda lvl: lvl.level_number)
-        for lvl in levels:
-            yield {
-                "level_number": lvl.level_number,
-                "questions": [{"id": q.id} for q in lvl.questions],
-            }
-    else:
-        levels_raw = sorted(
-            dimension.get("levels", []),
-            key=lambda lvl: lvl.get("level_number", 0),
+        # Typisiertes Modell: Level sind bereits sortiert, Frage-IDs liegen als Tupel vor
+        return CompiledDimension(
+            code=dimension.code,
+            name=dimension.name,
+            category=dimension.category,
+            default_target_level=float(dimension.default_target_level),
+            levels=tuple(CompiledLevel(lvl.level_number, lvl.question_ids) for lvl in dimension.levels),
+        )
+
+    levels_raw = sorted(
+        dimension.get("levels", []),
+        key=lambda lvl: lvl.get("level_number", 0),
+    )
+    levels = tuple(
+        CompiledLevel(
+            level_number=int(level.get("level_number", 0) or 0),
+            question_ids=tuple([(q or {}).get("id") for q in (level.get("questions", []) or [])]),
         )
-        for lvl in levels_raw:
-            yield {
-                "level_number": lvl.get("level_number", 0),
-                "questions": lvl.get("questions", []),
-            }
+        for level in levels_raw
+    )
 
+    return CompiledDimension(
+        code=str(dimension.get("code", "")).strip(),
+        name=str(dimension.get("name", "")).strip(),
+        category=str(dimension.get("category", "") or "").strip(),
+        default_target_level=float(dimension.get("default_target_level", 3) or 3),
+        levels=levels,
+    )
 
-def compute_dimension_maturity(
-    dimension: DimensionDC | Dict[str, Any],
-    answers: Dict[str, Any],
-) -> float:
+
+def _compile_dimensions(raw_dims: Iterable[Any]) -> CompiledModel:
+    dims = tuple(compile_dimension(dim) for dim in raw_dims)
+    return CompiledModel(dimensions=dims, by_code={d.code: d for d in dims})
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_typed_model(model: MaturityModelDC) -> CompiledModel:
+    # Schlüssel ist die Modellinstanz (Identität): einmal je Modellstand
+    return _compile_dimensions(model.dimensions)
+
+
+def compile_model(model: MaturityModelDC | Dict[str, Any] | CompiledModel) -> CompiledModel:
     """
-    Berechnet den Ist-Reifegrad einer Dimension (neue Excel-Logik 20251209):
+    Kompiliert alle Dimensionen eines Modells (Dict aus JSON oder typisiertes Modell).
+    Typisierte Modelle werden nur einmal kompiliert.
+    """
+    if isinstance(model, CompiledModel):
+        return model
 
-    - "Nicht anwendbar" wird NICHT als erfüllt gezählt, sondern aus dem Nenner entfernt.
-    - Unbeantwortet (None) zählt als 0.0 (wie "Gar nicht"), damit nichts schöngerechnet wird.
-    - Wenn Level 1 ausschließlich NA ist => Ergebnis = NaN (entspricht n/a/#N/A).
-    - Gating: sobald ein Level nicht vollständig erfüllt ist, wird abgebrochen.
-    - Rundung: immer ABRUNDEN auf 0.25-Schritte.
+    if isinstance(model, MaturityModelDC):
+        return _compile_typed_model(model)
+
+    return _compile_dimensions((model or {}).get("dimensions", []) or [])
+
+
+# -----------------------------
+# Kernel
+# -----------------------------
+def question_score(answer: Any, profile: ScoringProfile = STANDARD_PROFILE) -> Optional[float]:
     """
-    levels = list(_iter_levels(dimension))
-    if not levels:
-        return 0.0
+    Score einer einzelnen Antwort; None = zählt nicht (nicht anwendbar bzw. vom Profil ignoriert).
+    """
+    if answer is None:
+        return profile.unanswered_score
+    if str(answer) == NOT_APPLICABLE:
+        return None
+    return profile.answer_scores.get(str(answer), profile.unknown_score)
 
-    fully_reached = 0
-    partial_fraction = 0.0
-    partial_found = False
 
-    for level in levels:
-        q_ids = [q["id"] for q in level["questions"]]
+def _level_average(
+    question_ids: Tuple[Any, ...],
+    answers: Mapping[str, Any],
+    profile: ScoringProfile,
+) -> Optional[float]:
+    """
+    Mittelwert der anwendbaren Fragen eines Levels; None, wenn keine anwendbar ist.
+    """
+    total = 0.0
+    count = 0
+
+    for q_id in question_ids:
+        score = question_score(answers.get(q_id), profile)
+        if score is None:
+            continue
+        total += score
+        count += 1
+
+    if count == 0:
+        return None
+    return total / count
+
+
+def level_is_full(average: Optional[float], profile: ScoringProfile = STANDARD_PROFILE) -> bool:
+    """
+    Gating-Regel (Scoring und Freischaltung in der Erhebung): ein Level ist erfüllt, wenn der
+    Mittelwert seiner anwendbaren Fragen die Schwelle erreicht. Ohne anwendbare Frage
+    (alles "Nicht anwendbar" oder leeres Level) ist es nicht erfüllt.
+    """
+    return average is not None and average >= profile.full_threshold
+
 
-        # Scores dieses Levels (anwendbar)
-        applicable_scores: List[float] = []
+def round_maturity(value: float, profile: ScoringProfile) -> float:
+    if profile.round_down_step:
+        step = float(profile.round_down_step)
+        return math.floor(value / step) * step
+    return round(value, profile.decimals)
 
-        for q_id in q_ids:
-            ans = answers.get(q_id)
 
-            # Unbeantwortet zählt als 0.0 (wichtig: nicht "continue")
-            if ans is None:
-                applicable_scores.append(0.0)
-                continue
+def score_dimension(
+    dimension: CompiledDimension,
+    answers: Mapping[str, Any],
+    profile: ScoringProfile = STANDARD_PROFILE,
+) -> float:
+    """
+    Kernel für den Ist-Reifegrad einer kompilierten Dimension (siehe compute_dimension_maturity).
+    """
+    if not dimension.levels:
+        return 0.0
 
-            # Text-Antworten (Single-Choice)
-            score = ANSWER_SCORES.get(str(ans))
+    # Lazy: beim Gating werden Level nach dem ersten nicht erfüllten nicht mehr gemittelt
+    return maturity_from_levels(
+        ((level.level_number, _level_average(level.question_ids, answers, profile)) for level in dimension.levels),
+        profile,
+    )
 
-            # Nicht anwendbar -> None -> aus Nenner entfernen
-            if score is None and str(ans) == "Nicht anwendbar":
-                continue
 
-            # Unbekannter Text -> konservativ 0.0
-            if score is None:
-                score = 0.0
+def maturity_from_levels(levels: Iterable[Tuple[int, Optional[float]]], profile: ScoringProfile) -> float:
+    """
+    Ist-Reifegrad aus (Stufennummer, Mittelwert der anwendbaren Fragen) je Level in
+    Modellreihenfolge; geteilt von score_dimension und core.gating.GatingEngine.
+    """
+    if not profile.gating:
+        total = 0.0
+        for _, avg in levels:
+            total += avg if avg is not None else 0.0
+        return round_maturity(total, profile)
 
-            applicable_scores.append(score)
+    fully_reached = 0
+    partial_fraction = 0.0
 
+    for level_number, avg in levels:
         # Wenn gar keine anwendbaren Fragen im Level übrig bleiben => Level ist "n.a."
-        if not applicable_scores:
-            if level["level_number"] == 1:
+        if avg is None:
+            if level_number == 1:
                 return float("nan")  # Excel: Stufe 1 n.a. => gesamte Subdimension n.a.
             break
 
-        avg_score = sum(applicable_scores) / len(applicable_scores)
-
-        if avg_score >= 0.99:
+        if level_is_full(avg, profile):
             fully_reached += 1
         else:
-            partial_fraction = avg_score
-            partial_found = True
+            partial_fraction = avg
             break
 
-    maturity = float(fully_reached)
-    if partial_found:
-        maturity += partial_fraction
+    return round_maturity(float(fully_reached) + partial_fraction, profile)
+
+
+def score_model(
+    model: CompiledModel,
+    answers: Mapping[str, Any],
+    profile: ScoringProfile | str | None = None,
+) -> Dict[str, float]:
+    """
+    Ist-Reifegrad je Dimensionscode für ein kompiliertes Modell.
+    """
+    prof = get_scoring_profile(profile)
+    answers = answers or {}
+    return {dim.code: score_dimension(dim, answers, prof) for dim in model.dimensions}
+
 
-    # Excel neu: ROUNDDOWN auf 0.25-Schritte
-    maturity = math.floor(maturity * 4.0) / 4.0
-    return maturity
+def compute_dimension_maturity(
+    dimension: DimensionDC | Dict[str, Any] | CompiledDimension,
+    answers: Dict[str, Any],
+    profile: ScoringProfile | str | None = None,
+) -> float:
+    """
+    Berechnet den Ist-Reifegrad einer Dimension (neue Excel-Logik 20251209):
+
+    - "Nicht anwendbar" wird NICHT als erfüllt gezählt, sondern aus dem Nenner entfernt.
+    - Unbeantwortet (None) zählt als 0.0 (wie "Gar nicht"), damit nichts schöngerechnet wird.
+    - Wenn Level 1 ausschließlich NA ist => Ergebnis = NaN (entspricht n/a/#N/A).
+    - Gating: sobald ein Level nicht vollständig erfüllt ist, wird abgebrochen.
+    - Rundung: immer ABRUNDEN auf 0.25-Schritte.
+
+    Mit profile="legacy" gelten die Regeln der alten Auswertung (siehe LEGACY_PROFILE).
+    """
+    compiled = dimension if isinstance(dimension, CompiledDimension) else compile_dimension(dimension)
+    return score_dimension(compiled, answers or {}, get_scoring_profile(profile))
@@ -0,0 +1,294 @@
+# core/simulation.py
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .overview import _infer_category, code_sort_key
+from .scoring import (
+    CompiledModel,
+    ScoringProfile,
+    compile_model,
+    get_scoring_profile,
+    question_score,
+)
+
+# Szenario-Codes, die auf eines dieser Zeichen enden, gelten als Präfix ("TD1." -> TD1.x)
+_PREFIX_SEPARATORS = (".", "-", "_", "/")
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    Was-wäre-wenn-Szenario: Antworten, die die Basiserhebung überschreiben.
+    Eine Override-Antwort None bedeutet "unbeantwortet".
+    """
+    name: str
+    overrides: Mapping[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class _ModelMatrix:
+    """
+    Spaltenform eines kompilierten Modells: Fragen in Modellreihenfolge, je Level
+    ein zusammenhängender Block, Level je Dimension auf max_levels aufgefüllt.
+    """
+    codes: Tuple[str, ...]
+    names: Tuple[str, ...]
+    categories: Tuple[str, ...]
+    default_targets: np.ndarray           # (D,)
+    question_ids: Tuple[Any, ...]         # (Q,)
+    positions: Dict[Any, Tuple[int, ...]]  # Frage-ID -> Spalten (IDs können mehrfach vorkommen)
+    level_starts: np.ndarray              # Startspalte je nicht-leerem Level
+    level_slots: np.ndarray               # Slot (dim * max_levels + idx) je nicht-leerem Level
+    level_one_first: np.ndarray           # (D,) erstes Level ist Stufe 1
+    has_levels: np.ndarray                # (D,)
+    max_levels: int
+
+
+def _model_matrix(model: CompiledModel) -> _ModelMatrix:
+    question_ids: List[Any] = []
+    starts: List[int] = []
+    slots: List[int] = []
+    max_levels = max((len(d.levels) for d in model.dimensions), default=0) or 1
+
+    for d_idx, dim in enumerate(model.dimensions):
+        for l_idx, level in enumerate(dim.levels):
+            if not level.question_ids:
+                continue
+            starts.append(len(question_ids))
+            slots.append(d_idx * max_levels + l_idx)
+            question_ids.extend(level.question_ids)
+
+    positions: Dict[Any, List[int]] = {}
+    for col, q_id in enumerate(question_ids):
+        positions.setdefault(q_id, []).append(col)
+
+    return _ModelMatrix(
+        codes=tuple(d.code for d in model.dimensions),
+        names=tuple(d.name for d in model.dimensions),
+        categories=tuple(_infer_category(d.code, d.category) for d in model.dimensions),
+        default_targets=np.array([d.default_target_level for d in model.dimensions], dtype=float),
+        question_ids=tuple(question_ids),
+        positions={k: tuple(v) for k, v in positions.items()},
+        level_starts=np.array(starts, dtype=np.intp),
+        level_slots=np.array(slots, dtype=np.intp),
+        level_one_first=np.array(
+            [bool(d.levels) and d.levels[0].level_number == 1 for d in model.dimensions], dtype=bool
+        ),
+        has_levels=np.array([bool(d.levels) for d in model.dimensions], dtype=bool),
+        max_levels=max_levels,
+    )
+
+
+def _score_vector(answers: Mapping[str, Any], matrix: _ModelMatrix, profile: ScoringProfile) -> np.ndarray:
+    scores = [question_score(answers.get(q_id), profile) for q_id in matrix.question_ids]
+    return np.array([np.nan if s is None else s for s in scores], dtype=float)
+
+
+def _py_round(values: np.ndarray, decimals: int) -> np.ndarray:
+    return np.frompyfunc(lambda v: v if v != v else round(v, decimals), 1, 1)(values)
+
+
+def score_matrix(scores: np.ndarray, matrix: _ModelMatrix, profile: ScoringProfile) -> np.ndarray:
+    """
+    Ist-Reifegrade für viele Antwortsätze auf einmal.
+
+    scores: (N, Q) Frage-Scores, NaN = zählt nicht. Rückgabe: (N, D), gleiche Regeln
+    wie compute_dimension_maturity (Gating, Stufe 1 n.a. => NaN, Rundung laut Profil).
+    """
+    n = scores.shape[0]
+    n_dims = len(matrix.codes)
+    counted = ~np.isnan(scores)
+
+    avg = np.full((n, n_dims * matrix.max_levels), np.nan)
+    if matrix.level_starts.size:
+        sums = np.add.reduceat(np.where(counted, scores, 0.0), matrix.level_starts, axis=1)
+        counts = np.add.reduceat(counted, matrix.level_starts, axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            avg[:, matrix.level_slots] = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+    avg = avg.reshape(n, n_dims, matrix.max_levels)
+
+    if profile.gating:
+        with np.errstate(invalid="ignore"):
+            full = avg >= profile.full_threshold
+        reached_mask = np.cumprod(full, axis=2).astype(bool)
+        fully_reached = reached_mask.sum(axis=2)
+        blocking = np.minimum(fully_reached, matrix.max_levels - 1)
+        partial = np.take_along_axis(avg, blocking[..., None], axis=2)[..., 0]
+        partial = np.where((fully_reached < matrix.max_levels) & ~np.isnan(partial), partial, 0.0)
+        raw = fully_reached + partial
+        raw = np.where(matrix.level_one_first & np.isnan(avg[:, :, 0]), np.nan, raw)
+    else:
+        raw = np.nansum(avg, axis=2)
+
+    if profile.round_down_step:
+        step = float(profile.round_down_step)
+        ist = np.floor(raw / step) * step
+    else:
+        # Python-round statt np.round, damit Grenzfälle (x.xx5) identisch zum Kernel runden
+        ist = _py_round(raw, profile.decimals).astype(float)
+
+    return np.where(matrix.has_levels, ist, 0.0)
+
+
+@dataclass
+class SimulationResult:
+    """
+    Ergebnis einer Simulation: Basis und Szenarien als Matrizen (Szenario x Dimension).
+    """
+    scenario_names: List[str]
+    codes: Tuple[str, ...]
+    names: Tuple[str, ...]
+    categories: Tuple[str, ...]
+    targets: np.ndarray        # (D,)
+    base_ist: np.ndarray       # (D,)
+    ist: np.ndarray            # (N, D)
+
+    @property
+    def base_gap(self) -> np.ndarray:
+        return self.targets - self.base_ist
+
+    @property
+    def gap(self) -> np.ndarray:
+        return self.targets[None, :] - self.ist
+
+    def overview(self, scenario: int | str) -> pd.DataFrame:
+        """
+        Übersicht eines Szenarios (Spalten wie build_overview_table, ohne Priorisierung)
+        plus ist_delta / gap_delta gegenüber der Basis.
+        """
+        idx = self.scenario_names.index(scenario) if isinstance(scenario, str) else int(scenario)
+        ist = self.ist[idx]
+        df = pd.DataFrame(
+            {
+                "code": list(self.codes),
+                "name": list(self.names),
+                "category": list(self.categories),
+                "ist_level": ist,
+                "target_level": self.targets,
+                "gap": self.targets - ist,
+                "ist_delta": ist - self.base_ist,
+                "gap_delta": (self.targets - ist) - self.base_gap,
+            }
+        )
+        order = sorted(range(len(df)), key=lambda i: code_sort_key(self.codes[i], self.categories[i]))
+        return df.iloc[order].reset_index(drop=True)
+
+    def gap_deltas(self) -> pd.DataFrame:
+        """
+        Veränderung des Gaps je Szenario (Zeilen) und Dimension (Spalten); negativ = Gap kleiner.
+        """
+        return pd.DataFrame(self.gap - self.base_gap[None, :], index=self.scenario_names, columns=list(self.codes))
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Kennzahlen je Szenario: Summe der positiven Gaps vorher/nachher und erreichte Ziele.
+        """
+        base_open = np.nansum(np.clip(self.base_gap, 0, None))
+        open_gap = np.nansum(np.clip(self.gap, 0, None), axis=1)
+        return pd.DataFrame(
+            {
+                "scenario": self.scenario_names,
+                "open_gap_before": base_open,
+                "open_gap_after": open_gap,
+                "gap_reduction": base_open - open_gap,
+                "targets_met_before": int(np.sum(self.base_gap <= 0)),
+                "targets_met_after": np.sum(self.gap <= 0, axis=1),
+                "changed_dimensions": np.sum(
+                    ~np.isclose(self.ist, self.base_ist[None, :], equal_nan=True), axis=1
+                ),
+            }
+        )
+
+
+def _resolve_targets(
+    matrix: _ModelMatrix,
+    global_target_level: Optional[float],
+    per_dimension_targets: Mapping[str, float],
+) -> np.ndarray:
+    # Ziel-Reifegrad wie in build_overview_table: Dimension > global > Modell
+    targets = matrix.default_targets.copy()
+    if global_target_level is not None:
+        targets[:] = float(global_target_level)
+    for i, code in enumerate(matrix.codes):
+        if code in per_dimension_targets:
+            targets[i] = float(per_dimension_targets[code])
+    return targets
+
+
+def simulate_scenarios(
+    model: Dict[str, Any] | CompiledModel,
+    base_answers: Mapping[str, Any],
+    scenarios: Sequence[Scenario | Mapping[str, Any]],
+    global_target_level: Optional[float] = 3.0,
+    per_dimension_targets: Optional[Mapping[str, float]] = None,
+    profile: ScoringProfile | str | None = None,
+) -> SimulationResult:
+    """
+    Bewertet viele Was-wäre-wenn-Szenarien in einem Durchlauf.
+
+    Die Basis wird einmal in Scores übersetzt, je Szenario werden nur die
+    überschriebenen Spalten ersetzt; gescort wird die ganze Matrix vektorisiert.
+    Szenarien dürfen Scenario-Objekte oder reine Override-Dicts sein.
+    """
+    prof = get_scoring_profile(profile)
+    matrix = _model_matrix(compile_model(model))
+    base_answers = base_answers or {}
+
+    base = _score_vector(base_answers, matrix, prof)
+    scores = np.repeat(base[None, :], len(scenarios), axis=0)
+
+    names: List[str] = []
+    for row, scenario in enumerate(scenarios):
+        if isinstance(scenario, Scenario):
+            names.append(scenario.name)
+            overrides = scenario.overrides
+        else:
+            names.append(f"#{row + 1}")
+            overrides = scenario
+        for q_id, answer in (overrides or {}).items():
+            cols = matrix.positions.get(q_id)
+            if not cols:
+                continue
+            score = question_score(answer, prof)
+            scores[row, list(cols)] = np.nan if score is None else score
+
+    return SimulationResult(
+        scenario_names=names,
+        codes=matrix.codes,
+        names=matrix.names,
+        categories=matrix.categories,
+        targets=_resolve_targets(matrix, global_target_level, per_dimension_targets or {}),
+        base_ist=score_matrix(base[None, :], matrix, prof)[0],
+        ist=score_matrix(scores, matrix, prof),
+    )
+
+
+def level_scenario(
+    model: Dict[str, Any] | CompiledModel,
+    codes: Iterable[str],
+    level_number: int,
+    answer: str = "Vollständig",
+    name: Optional[str] = None,
+) -> Scenario:
+    """
+    Szenario "Stufe X in den Dimensionen ... vollständig umsetzen".
+    Codes gelten exakt; Präfix nur mit Trennzeichen am Ende (z. B. "TD1." für alle TD1.x,
+    aber nicht "TD1.1" für TD1.10).
+    """
+    compiled = compile_model(model)
+    wanted = tuple(str(c).strip() for c in codes if str(c).strip())
+    exact = {c for c in wanted if not c.endswith(_PREFIX_SEPARATORS)}
+    prefixes = tuple(c for c in wanted if c.endswith(_PREFIX_SEPARATORS))
+    overrides: Dict[str, Any] = {}
+    for dim in compiled.dimensions:
+        if dim.code not in exact and not dim.code.startswith(prefixes):
+            continue
+        for level in dim.levels:
+            if level.level_number == int(level_number):
+                overrides.update({q_id: answer for q_id in level.question_ids})
+    return Scenario(name=name or f"{', '.join(wanted)} · L{int(level_number)}", overrides=overrides)
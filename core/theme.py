@@ -0,0 +1,714 @@
+# core/theme.py
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+TU_GREEN = "#639A00"
+TU_ORANGE = "#CA7406"
+
+# Style-Element im Parent-Dokument, das das globale Bundle hält (überlebt Reruns)
+_BUNDLE_STYLE_ID = "rgm-global-theme"
+
+# Session-Keys: Token des ausgelieferten bzw. im laufenden Run gesendeten Bundles
+_BUNDLE_SENT_KEY = "_rgm_theme_bundle_sent"
+_BUNDLE_PENDING_KEY = "_rgm_theme_bundle_pending"
+
+
+def _theme_css(dark: bool) -> str:
+    bg = "#0e1117" if dark else "#ffffff"
+    text = "rgba(250,250,250,0.92)" if dark else "#111111"
+    sidebar_bg = "#0b0f16" if dark else "#f6f7f9"
+    card_bg = "#111827" if dark else "#ffffff"
+    border = "rgba(255,255,255,0.10)" if dark else "rgba(0,0,0,0.10)"
+
+    btn2_bg = "rgba(255,255,255,0.06)" if dark else "#ffffff"
+    btn2_text = "rgba(250,250,250,0.92)" if dark else "#111111"
+
+    pop_hover = "rgba(202,116,6,0.22)" if dark else "rgba(202,116,6,0.14)"
+    pop_sel = "rgba(255,255,255,0.08)" if dark else "rgba(0,0,0,0.04)"
+
+    pipe_inactive = "rgba(255,255,255,0.14)" if dark else "rgba(0,0,0,0.10)"
+
+    return f"""
+  :root {{
+    --rgm-bg: {bg};
+    --rgm-text: {text};
+    --rgm-sidebar-bg: {sidebar_bg};
+    --rgm-card-bg: {card_bg};
+    --rgm-border: {border};
+
+    --rgm-footer-bg: {("#0e1117" if dark else "#ffffff")};
+
+    --rgm-logo-bg: {("rgba(255,255,255,0.95)" if dark else "#ffffff")};
+    --rgm-logo-border: {("rgba(255,255,255,0.14)" if dark else "rgba(0,0,0,0.10)")};
+    --rgm-logo-shadow: {("0 6px 18px rgba(0,0,0,0.35)" if dark else "0 6px 18px rgba(0,0,0,0.20)")};
+
+    --tu-green: {TU_GREEN};
+    --tu-orange: {TU_ORANGE};
+
+    --rgm-pipe-inactive: {pipe_inactive};
+  }}
+
+  div[data-testid="stAppViewContainer"] {{
+    background: var(--rgm-bg) !important;
+    color: var(--rgm-text) !important;
+  }}
+  header[data-testid="stHeader"] {{
+    background: transparent !important;
+  }}
+  section[data-testid="stMain"] {{
+    background: var(--rgm-bg) !important;
+  }}
+
+  section[data-testid="stSidebar"] {{
+    background: var(--rgm-sidebar-bg) !important;
+    border-right: 1px solid var(--rgm-border) !important;
+  }}
+  section[data-testid="stSidebar"] > div {{
+    background: var(--rgm-sidebar-bg) !important;
+  }}
+
+  html, body,
+  .stMarkdown, .stText, p, li, span, label,
+  div[data-testid="stCaptionContainer"],
+  div[data-testid="stMarkdownContainer"] {{
+    color: var(--rgm-text) !important;
+  }}
+
+  hr {{
+    border-color: var(--rgm-border) !important;
+  }}
+
+  a {{
+    color: var(--tu-green) !important;
+  }}
+
+  div[data-baseweb="input"] input,
+  div[data-baseweb="textarea"] textarea,
+  div[data-baseweb="select"] > div {{
+    background-color: var(--rgm-card-bg) !important;
+    color: var(--rgm-text) !important;
+    border-color: var(--rgm-border) !important;
+  }}
+
+  div[data-baseweb="select"] svg {{
+    color: var(--rgm-text) !important;
+  }}
+
+  div[role="radiogroup"] label,
+  div[data-testid="stSidebar"] label {{
+    color: var(--rgm-text) !important;
+  }}
+
+  div[data-baseweb="popover"] div[data-baseweb="menu"],
+  div[data-baseweb="popover"] ul {{
+    background: var(--rgm-card-bg) !important;
+    border: 1px solid var(--rgm-border) !important;
+    box-shadow: 0 12px 28px rgba(0,0,0,0.35) !important;
+  }}
+
+  div[data-baseweb="popover"] div[role="option"],
+  div[data-baseweb="popover"] div[role="option"] *,
+  div[data-baseweb="popover"] li,
+  div[data-baseweb="popover"] li * {{
+    color: var(--rgm-text) !important;
+  }}
+
+  div[data-baseweb="popover"] div[role="option"]:hover,
+  div[data-baseweb="popover"] li:hover {{
+    background: rgba(202,116,6,0.18) !important;
+  }}
+
+  div[data-baseweb="popover"] div[role="option"][aria-selected="true"],
+  div[data-baseweb="popover"] li[aria-selected="true"] {{
+    background: rgba(99,154,0,0.18) !important;
+  }}
+
+  div[data-baseweb="popover"] > div {{
+    background: var(--rgm-card-bg) !important;
+    color: var(--rgm-text) !important;
+    border: 1px solid var(--rgm-border) !important;
+    border-radius: 12px !important;
+    overflow: hidden !important;
+  }}
+
+  div[data-baseweb="popover"] ul[role="listbox"],
+  div[data-baseweb="popover"] div[role="listbox"],
+  div[data-baseweb="menu"] {{
+    background: var(--rgm-card-bg) !important;
+    color: var(--rgm-text) !important;
+  }}
+
+  div[data-baseweb="popover"] li[role="option"],
+  div[data-baseweb="menu"] li {{
+    background: transparent !important;
+    color: var(--rgm-text) !important;
+  }}
+
+  div[data-baseweb="popover"] li[role="option"]:hover,
+  div[data-baseweb="menu"] li:hover {{
+    background: {pop_hover} !important;
+  }}
+
+  div[data-baseweb="popover"] li[aria-selected="true"],
+  div[data-baseweb="menu"] li[aria-selected="true"] {{
+    background: {pop_sel} !important;
+  }}
+
+  .rgm-sidebar-logo {{
+    width: 100%;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+
+    background: var(--rgm-logo-bg);
+    border: 1px solid var(--rgm-logo-border);
+    border-radius: 14px;
+    padding: 10px 14px;
+    box-shadow: var(--rgm-logo-shadow);
+
+    text-decoration: none;
+    color: inherit;
+    margin: 4px 0 14px 0;
+  }}
+  .rgm-sidebar-logo:hover {{
+    opacity: 0.94;
+  }}
+  .rgm-sidebar-logo img {{
+    height: 64px;
+    width: auto;
+    max-width: 100%;
+    object-fit: contain;
+    display: block;
+  }}
+
+  .stApp button[kind="primary"],
+  .stApp button[data-testid="baseButton-primary"] {{
+    background: var(--tu-green) !important;
+    border: 1px solid var(--tu-green) !important;
+    color: #ffffff !important;
+    border-radius: 10px !important;
+    font-weight: 650 !important;
+    opacity: 1 !important;
+  }}
+
+  .stApp button[kind="secondary"],
+  .stApp button[data-testid="baseButton-secondary"] {{
+    background: {btn2_bg} !important;
+    border: 1px solid var(--rgm-border) !important;
+    color: {btn2_text} !important;
+    border-radius: 10px !important;
+    font-weight: 650 !important;
+    opacity: 1 !important;
+  }}
+
+  .stApp div.stButton > button *,
+  .stApp button[data-testid^="baseButton-"] * {{
+    color: inherit !important;
+  }}
+
+  .stApp div.stButton > button:not(:disabled):hover,
+  .stApp button[data-testid^="baseButton-"]:not(:disabled):hover,
+  .stApp div[data-testid="stFormSubmitButton"] button:not(:disabled):hover,
+  .stApp div[data-testid="stDownloadButton"] button:not(:disabled):hover,
+  .stApp div[data-testid="stFileUploader"] [data-baseweb="button"] button:not(:disabled):hover {{
+    background: var(--tu-orange) !important;
+    background-color: var(--tu-orange) !important;
+    background-image: none !important;
+    border-color: var(--tu-orange) !important;
+    color: #ffffff !important;
+    opacity: 1 !important;
+  }}
+
+  .stApp div.stButton > button:not(:disabled):hover *,
+  .stApp button[data-testid^="baseButton-"]:not(:disabled):hover *,
+  .stApp div[data-testid="stFormSubmitButton"] button:not(:disabled):hover *,
+  .stApp div[data-testid="stDownloadButton"] button:not(:disabled):hover *,
+  .stApp div[data-testid="stFileUploader"] [data-baseweb="button"] button:not(:disabled):hover * {{
+    color: #ffffff !important;
+    fill: currentColor !important;
+    stroke: currentColor !important;
+  }}
+
+  .stApp div.stButton > button:disabled,
+  .stApp button[data-testid^="baseButton-"]:disabled {{
+    opacity: 0.55 !important;
+    cursor: not-allowed !important;
+  }}
+
+  .stApp div.stButton > button:focus,
+  .stApp button[data-testid^="baseButton-"]:focus {{
+    outline: none !important;
+    box-shadow: 0 0 0 3px rgba(99,154,0,0.25) !important;
+  }}
+
+  .stApp div.stButton > button,
+  .stApp button[data-testid^="baseButton-"] {{
+    transition: background 120ms ease, border-color 120ms ease, color 120ms ease;
+  }}
+
+  section[data-testid="stSidebar"] div[role="radiogroup"] label {{
+    padding: 6px 10px;
+    border-radius: 10px;
+    transition: background 120ms ease, color 120ms ease;
+  }}
+  section[data-testid="stSidebar"] div[role="radiogroup"] label:hover {{
+    background: rgba(202,116,6,0.14);
+  }}
+  section[data-testid="stSidebar"] div[role="radiogroup"] label:hover span {{
+    color: var(--tu-orange) !important;
+  }}
+  section[data-testid="stSidebar"] div[role="radiogroup"] label:hover svg {{
+    color: var(--tu-orange) !important;
+  }}
+
+  div[data-testid="stAppViewContainer"] .rgm-seg {{
+    background: var(--rgm-pipe-inactive) !important;
+  }}
+  div[data-testid="stAppViewContainer"] .rgm-seg.active,
+  div[data-testid="stAppViewContainer"] .rgm-seg.filled,
+  div[data-testid="stAppViewContainer"] .rgm-seg--active,
+  div[data-testid="stAppViewContainer"] .rgm-seg--filled {{
+    background: var(--tu-green) !important;
+  }}
+
+  div[data-testid="stExpander"],
+  details[data-testid="stExpander"],
+  .stExpander {{
+    border: 1px solid var(--rgm-border) !important;
+    border-radius: 14px !important;
+    background: transparent !important;
+    overflow: hidden !important;
+  }}
+
+  div[data-testid="stExpander"] summary,
+  details[data-testid="stExpander"] summary,
+  .stExpander summary {{
+    background: var(--rgm-card-bg) !important;
+    color: var(--rgm-text) !important;
+    padding: 10px 14px !important;
+    border-radius: 14px !important;
+  }}
+
+  div[data-testid="stExpander"] summary *,
+  details[data-testid="stExpander"] summary *,
+  .stExpander summary * {{
+    color: var(--rgm-text) !important;
+  }}
+
+  div[data-testid="stExpander"] summary svg,
+  details[data-testid="stExpander"] summary svg,
+  .stExpander summary svg {{
+    color: var(--rgm-text) !important;
+    fill: currentColor !important;
+  }}
+
+  div[data-testid="stExpander"] summary:hover,
+  details[data-testid="stExpander"] summary:hover,
+  .stExpander summary:hover {{
+    box-shadow: 0 0 0 2px rgba(202,116,6,0.28) !important;
+  }}
+
+  div[data-testid="stExpander"] .streamlit-expanderContent,
+  details[data-testid="stExpander"] .streamlit-expanderContent,
+  .stExpander .streamlit-expanderContent,
+  div[data-testid="stExpander"] > div,
+  details[data-testid="stExpander"] > div {{
+    background: var(--rgm-card-bg) !important;
+    color: var(--rgm-text) !important;
+    padding: 12px 14px 14px 14px !important;
+  }}
+
+  div[data-testid="stExpander"] div[role="region"],
+  details[data-testid="stExpander"] div[role="region"],
+  .stExpander div[role="region"] {{
+    background: transparent !important;
+  }}
+"""
+
+
+# Gemeinsame Regeln aus Dashboard und Gesamtübersicht (Plotly-Cards, Maßnahmen-Tabelle,
+# Modal, components.html). Alle Selektoren sind klassen-/komponentengebunden und
+# wirken daher nur dort, wo die Seiten die entsprechenden Elemente rendern.
+_SHARED_PAGE_CSS = """
+  /* =========================
+     Plotly-Card wie Gesamtübersicht
+     (für st.plotly_chart – falls irgendwo verwendet)
+     ========================= */
+  div[data-testid="stPlotlyChart"]{
+    background: var(--rgm-card-solid);
+    border: 1px solid var(--rgm-border);
+    border-radius: 14px;
+    box-shadow: var(--rgm-shadow);
+    padding: 12px 12px 10px 12px;
+    margin-top: 12px;
+    overflow: hidden;
+  }
+
+  /* Modebar Look wie Gesamtübersicht */
+  div[data-testid="stPlotlyChart"] .js-plotly-plot .modebar{
+    top: 10px !important;
+    right: 10px !important;
+    z-index: 50 !important;
+  }
+  div[data-testid="stPlotlyChart"] .modebar{ background: transparent !important; }
+  div[data-testid="stPlotlyChart"] .modebar-group{
+    background: var(--rgm-toolbar-bg) !important;
+    border: 1px solid var(--rgm-border) !important;
+    border-radius: 10px !important;
+    padding: 2px 4px !important;
+    box-shadow: 0 10px 22px rgba(0,0,0,0.25) !important;
+    backdrop-filter: blur(8px);
+    margin: 0 !important;
+  }
+  div[data-testid="stPlotlyChart"] .modebar-btn path{ fill: var(--rgm-text) !important; }
+  div[data-testid="stPlotlyChart"] .modebar-btn:hover{
+    background: var(--rgm-toolbar-hover) !important;
+    border-radius: 8px !important;
+  }
+
+  /* =========================
+     Measures/Result-Card + Toolbar + Modal
+     ========================= */
+  .rgm-measures-card {
+    position: relative;
+    --rgm-measures-toolbar-space: 44px;
+    padding-top: var(--rgm-measures-toolbar-space);
+    background: var(--rgm-card-solid);
+    border: 1px solid var(--rgm-border);
+    border-radius: 14px;
+    box-shadow: var(--rgm-shadow);
+    overflow: hidden;
+    margin-top: 12px;
+  }
+
+  .rgm-measures-toolbar {
+    position: absolute;
+    top: 2px;
+    right: 2px;
+    z-index: 30;
+    display: flex;
+    gap: 8px;
+    background: var(--rgm-toolbar-bg);
+    border: 1px solid var(--rgm-border);
+    border-radius: 10px;
+    padding: 4px 6px;
+    box-shadow: 0 10px 22px rgba(0,0,0,0.25);
+    backdrop-filter: blur(8px);
+  }
+
+  a.rgm-tool-btn {
+    width: 34px;
+    height: 30px;
+    border-radius: 8px;
+    border: 0;
+    background: transparent;
+    color: var(--rgm-icon-green);
+    text-decoration: none;
+    display: inline-flex;
+    align-items: center;
+    justify-content: center;
+    cursor: pointer;
+  }
+  a.rgm-tool-btn:hover { background: var(--rgm-toolbar-hover); }
+  .rgm-icon {
+    width: 18px;
+    height: 18px;
+    display: block;
+  }
+
+  .rgm-measures-scroll {
+    max-height: calc(420px - var(--rgm-measures-toolbar-space));
+    overflow: auto;
+    background: var(--rgm-card-solid);
+  }
+
+  table.rgm-measures-table thead th{
+    background-color: var(--rgm-df-header) !important;
+    color: var(--rgm-df-text) !important;
+    opacity: 1 !important;
+    position: sticky;
+    top: 0;
+    z-index: 50;
+    border-bottom: 1px solid var(--rgm-df-grid) !important;
+    background-clip: padding-box;
+  }
+
+  table.rgm-measures-table{
+    width: 100%;
+    table-layout: fixed;
+  }
+
+  td.rgm-num {
+    text-align: right;
+    font-variant-numeric: tabular-nums;
+    white-space: nowrap;
+  }
+
+  td.rgm-wrap {
+    white-space: normal;
+    word-break: break-word;
+    overflow-wrap: anywhere;
+    line-height: 1.35;
+  }
+
+  td.rgm-nowrap { white-space: nowrap; }
+  .rgm-nowrap-cell{
+    white-space: nowrap;
+    overflow: hidden;
+    text-overflow: ellipsis;
+    display: block;
+  }
+
+  /* Clamp (nur inneres DIV) */
+  .rgm-cell {
+    display: block;
+    white-space: normal;
+    word-break: break-word;
+    overflow-wrap: anywhere;
+    line-height: 1.35;
+  }
+  .rgm-clamp-1 {
+    display: -webkit-box;
+    -webkit-box-orient: vertical;
+    -webkit-line-clamp: 1;
+    overflow: hidden;
+  }
+  .rgm-clamp-2 {
+    display: -webkit-box;
+    -webkit-box-orient: vertical;
+    -webkit-line-clamp: 2;
+    overflow: hidden;
+  }
+  .rgm-clamp-3 {
+    display: -webkit-box;
+    -webkit-box-orient: vertical;
+    -webkit-line-clamp: 3;
+    overflow: hidden;
+  }
+  .rgm-clamp-4 {
+    display: -webkit-box;
+    -webkit-box-orient: vertical;
+    -webkit-line-clamp: 4;
+    overflow: hidden;
+  }
+  .rgm-clamp-6 {
+    display: -webkit-box;
+    -webkit-box-orient: vertical;
+    -webkit-line-clamp: 6;
+    overflow: hidden;
+  }
+  .rgm-clamp-8 {
+    display: -webkit-box;
+    -webkit-box-orient: vertical;
+    -webkit-line-clamp: 8;
+    overflow: hidden;
+  }
+  .rgm-clamp-10 {
+    display: -webkit-box;
+    -webkit-box-orient: vertical;
+    -webkit-line-clamp: 10;
+    overflow: hidden;
+  }
+
+  /* Scrollbar */
+  .rgm-measures-scroll::-webkit-scrollbar { height: 10px; width: 10px; }
+  .rgm-measures-scroll::-webkit-scrollbar-thumb {
+    background: var(--rgm-df-grid);
+    border-radius: 999px;
+  }
+  .rgm-measures-scroll::-webkit-scrollbar-track { background: transparent; }
+
+  /* ===== Modal robust ===== */
+  #rgm-close {
+    position: fixed;
+    top: 0;
+    left: 0;
+    width: 1px;
+    height: 1px;
+    opacity: 0;
+    pointer-events: none;
+  }
+
+  .rgm-modal {
+    display: none;
+    position: fixed;
+    inset: 0;
+    z-index: 2147483647;
+  }
+  .rgm-modal:target {
+    display: block;
+  }
+
+  .rgm-modal-backdrop {
+    position: absolute;
+    inset: 0;
+    background: rgba(0,0,0,0.55);
+    z-index: 0;
+    display: block;
+    text-decoration: none;
+  }
+
+  .rgm-modal-content {
+    position: absolute;
+    inset: 14px;
+    background: var(--rgm-card-solid);
+    border: 1px solid var(--rgm-border);
+    border-radius: 16px;
+    box-shadow: 0 16px 42px rgba(0,0,0,0.55);
+    overflow: hidden;
+    z-index: 1;
+  }
+
+  .rgm-modal-header {
+    display: flex;
+    align-items: center;
+    justify-content: space-between;
+    padding: 10px 12px;
+    border-bottom: 1px solid var(--rgm-border);
+    background: rgba(255,255,255,0.04);
+  }
+
+  .rgm-modal-title {
+    font-weight: 900;
+    color: var(--rgm-text);
+    font-size: 16px;
+  }
+
+  a.rgm-modal-close {
+    width: 40px;
+    height: 34px;
+    border-radius: 10px;
+    border: 1px solid var(--rgm-border);
+    background: var(--rgm-toolbar-bg);
+    color: var(--rgm-icon-green);
+    text-decoration: none;
+    display: inline-flex;
+    align-items: center;
+    justify-content: center;
+  }
+  a.rgm-modal-close:hover {
+    background: var(--rgm-toolbar-hover);
+  }
+
+  .rgm-modal-body {
+    height: calc(100% - 56px);
+    overflow: auto;
+    background: var(--rgm-card-solid);
+  }
+
+  .rgm-modal-body table.rgm-measures-table thead th {
+    position: sticky;
+    top: 0;
+    z-index: 20;
+    background-color: var(--rgm-df-header) !important;
+    border-bottom: 1px solid var(--rgm-df-grid) !important;
+    box-shadow: 0 1px 0 var(--rgm-df-grid);
+  }
+
+  /* =========================================================
+     components.html / iframe – ROBUST (wie Gesamtübersicht)
+     ========================================================= */
+  div[data-testid="stAppViewContainer"] div[data-testid="stHtml"],
+  div[data-testid="stAppViewContainer"] div[data-testid="stHtml"] > div,
+  div[data-testid="stAppViewContainer"] div[data-testid="stCustomComponentV1"],
+  div[data-testid="stAppViewContainer"] div[data-testid="stCustomComponentV1"] > div,
+  div[data-testid="stAppViewContainer"] div[data-testid="stIFrame"],
+  div[data-testid="stAppViewContainer"] div[data-testid="stIFrame"] > div,
+  div[data-testid="stAppViewContainer"] div[data-testid="stIframe"],
+  div[data-testid="stAppViewContainer"] div[data-testid="stIframe"] > div {
+    width: 100% !important;
+    max-width: 100% !important;
+    min-width: 0 !important;
+  }
+
+  div[data-testid="stAppViewContainer"] div.element-container:has(iframe[title="streamlit.components.v1.html"]),
+  div[data-testid="stAppViewContainer"] div[data-testid="stElementContainer"]:has(iframe[title="streamlit.components.v1.html"]),
+  div[data-testid="stAppViewContainer"] div:has(> iframe[title="streamlit.components.v1.html"]) {
+    width: 100% !important;
+    max-width: 100% !important;
+    display: block !important;
+    flex: 1 1 0% !important;
+    min-width: 0 !important;
+  }
+
+  div[data-testid="stAppViewContainer"] iframe[title="streamlit.components.v1.html"],
+  div[data-testid="stAppViewContainer"] iframe[srcdoc] {
+    width: 100% !important;
+    max-width: 100% !important;
+    min-width: 0 !important;
+    display: block !important;
+    border: 0 !important;
+  }
+"""
+
+
+@functools.lru_cache(maxsize=2)
+def global_css_bundle(dark: bool) -> str:
+    """
+    Globales Stylesheet (Theme-Tokens + gemeinsame Seitenregeln).
+    Wird einmal pro Prozess und Theme gebaut und danach nur noch aus dem Cache gelesen.
+    """
+    return _theme_css(dark) + _SHARED_PAGE_CSS
+
+
+@functools.lru_cache(maxsize=2)
+def _bundle_token(dark: bool) -> str:
+    return hashlib.sha1(global_css_bundle(dark).encode("utf-8")).hexdigest()[:12]
+
+
+@functools.lru_cache(maxsize=2)
+def _bundle_loader_html(dark: bool) -> str:
+    """
+    Mini-Dokument für components.html: legt das Bundle als <style> im Parent-Dokument ab.
+    Das Element steht vor dem App-Root, damit seitenspezifisches CSS (st.markdown) wie
+    bisher in der Kaskade danach kommt und gewinnt.
+    """
+    return f"""
+<script>
+(function() {{
+  const doc = (window.parent || window).document;
+  const token = {json.dumps(_bundle_token(dark))};
+  let style = doc.getElementById({json.dumps(_BUNDLE_STYLE_ID)});
+  if (!style) {{
+    style = doc.createElement("style");
+    style.id = {json.dumps(_BUNDLE_STYLE_ID)};
+    doc.body.insertBefore(style, doc.body.firstChild);
+  }}
+  if (style.dataset.token !== token) {{
+    style.textContent = {json.dumps(global_css_bundle(dark))};
+    style.dataset.token = token;
+  }}
+}})();
+</script>
+"""
+
+
+def inject_global_css(dark: bool) -> None:
+    """
+    Liefert das globale Bundle nur aus, wenn die Session es für dieses Theme noch nicht hat.
+
+    Der <style>-Block lebt im Parent-Dokument und überlebt Reruns; erneut gesendet wird
+    nur nach einem Theme-Wechsel oder in einer neuen Session (Browser-Reload).
+    """
+    token = _bundle_token(dark)
+    if st.session_state.get(_BUNDLE_SENT_KEY) == token:
+        return
+
+    components.html(_bundle_loader_html(dark), height=0)
+    st.session_state[_BUNDLE_PENDING_KEY] = token
+
+
+def mark_global_css_delivered() -> None:
+    """
+    Am Ende eines vollständigen Laufs aufrufen. Bricht ein Lauf per st.rerun() ab,
+    bleibt das Bundle "pending" und wird im nächsten Lauf erneut gesendet.
+    """
+    token = st.session_state.pop(_BUNDLE_PENDING_KEY, None)
+    if token:
+        st.session_state[_BUNDLE_SENT_KEY] = token
@@ -1,11 +1,18 @@
 # core/types.py
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
+from core.glossary_match import EMPTY_MATCHER, GlossaryMatcher
 
-@dataclass
+
+# Typisierte Modellobjekte: eingefroren und mit __slots__ (kein __dict__ je Instanz).
+# Gebaut werden sie einmal je Modellstand in core.model_loader.load_model().
+
+
+@dataclass(frozen=True, slots=True)
 class Question:
     """
     Eine "Frage" entspricht i. d. R. der Kontrollfrage inkl. ggf. Kriterien/Unterpunkten im help_text.
@@ -15,7 +22,22 @@ class Question:
     help_text: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class ProcessProfile:
+    """
+    Prozessprofil einer Dimension (Zweck, Ergebnisse, Basispraktiken, Arbeitsprodukte).
+    """
+    purpose: str = ""
+    results: str = ""
+    basic_practices: str = ""
+    work_products: str = ""
+
+    @property
+    def has_content(self) -> bool:
+        return any(s.strip() for s in (self.purpose, self.results, self.basic_practices, self.work_products))
+
+
+@dataclass(frozen=True, slots=True)
 class Level:
     """
     Ein Reifegrad-Level innerhalb einer Dimension/Subdimension.
@@ -25,36 +47,102 @@ class Level:
     - comment_hint: "Kommentar/Hinweis"
 
     Optional bleiben die Felder, damit ältere Modelle/JSONs weiterhin funktionieren.
+    question_ids wird aus questions abgeleitet (Reihenfolge wie im Modell).
     """
     level_number: int
     name: str
-    questions: List[Question]
+    questions: Tuple[Question, ...]
 
+    acceptance_criteria: str = ""               # Akzeptanzkriterien der Stufe
     # optionaler Level-Metatext (je nach Modellstruktur)
     implementation_text: Optional[str] = None  # z. B. "Umsetzung"
     benefit_text: Optional[str] = None         # neu: Nutzen bei Erreichen der Stufe
     comment_hint: Optional[str] = None         # neu: Kommentar/Hinweis
 
+    question_ids: Tuple[str, ...] = field(init=False, repr=False, compare=False)
 
-@dataclass
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "question_ids", tuple(q.id for q in self.questions))
+
+
+@dataclass(frozen=True, slots=True)
 class Dimension:
     """
-    Eine Dimension/Subdimension im Modell.
+    Eine Dimension/Subdimension im Modell. levels ist nach level_number sortiert.
     """
     code: str
     name: str
     category: str   # "TD" oder "OG"
     description: str
-    default_target_level: int
-    levels: List[Level]
+    default_target_level: float
+    levels: Tuple[Level, ...]
+    process_profile: ProcessProfile = ProcessProfile()
 
+    question_ids: Tuple[str, ...] = field(init=False, repr=False, compare=False)
 
-@dataclass
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "question_ids", tuple(q for lvl in self.levels for q in lvl.question_ids))
+
+
+@dataclass(frozen=True, slots=True)
+class QuestionRef:
+    """
+    Fundstelle einer Frage: Dimension, Stufe und laufende Nummer in der Stufe (1-basiert, "Stufe.Nummer").
+    """
+    code: str
+    level_number: int
+    number: int
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class MaturityModel:
+    """
+    Gesamtmodell einer Sprache. dimensions in Modellreihenfolge, sorted_dimensions in
+    Anzeigereihenfolge (TD vor OG, Codes natürlich sortiert).
+
+    Vergleich/Hash über die Identität: je Modellstand gibt es genau eine Instanz
+    (dient u. a. als Cache-Schlüssel für das kompilierte Modell in core.scoring).
+    """
     name: str
     description: str
-    levels_info: Dict[str, str]      # z.B. {"1": "initial", ...}
-    dimensions: List[Dimension]
+    levels_info: Mapping[str, str]      # z.B. {"1": "initial", ...}
+    dimensions: Tuple[Dimension, ...]
+    sorted_dimensions: Tuple[Dimension, ...] = ()
+    glossary: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    glossary_matcher: GlossaryMatcher = field(default=EMPTY_MATCHER, repr=False)
+
+    by_code: Mapping[str, Dimension] = field(init=False, repr=False)
+    question_index: Mapping[str, QuestionRef] = field(init=False, repr=False)
+    question_count: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if not self.sorted_dimensions:
+            object.__setattr__(self, "sorted_dimensions", self.dimensions)
+        for name in ("levels_info", "glossary"):
+            value = getattr(self, name)
+            if not isinstance(value, MappingProxyType):
+                object.__setattr__(self, name, MappingProxyType(dict(value or {})))
+        object.__setattr__(self, "by_code", MappingProxyType({d.code: d for d in self.dimensions}))
+
+        index: Dict[str, QuestionRef] = {}
+        for dim in self.dimensions:
+            for lvl in dim.levels:
+                for number, qid in enumerate(lvl.question_ids, start=1):
+                    if qid:
+                        index.setdefault(qid, QuestionRef(dim.code, lvl.level_number, number))
+        object.__setattr__(self, "question_index", MappingProxyType(index))
+        object.__setattr__(self, "question_count", sum(len(d.question_ids) for d in self.dimensions))
+
+    # Pickle (kompiliertes Modell): MappingProxyType ist nicht picklebar, daher als dict
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            name: dict(value) if isinstance(value, MappingProxyType) else value
+            for name, value in ((n, getattr(self, n)) for n in self.__slots__)
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, MappingProxyType(value) if isinstance(value, dict) else value)
 
 
 @dataclass
@@ -4,11 +4,7 @@ from __future__ import annotations
 import streamlit as st
 from core.state import init_session_state
 from core.i18n import get_language, t
-
-TU_GREEN = "#639A00"
-TU_ORANGE = "#CA7406"
-TD_BLUE = "#2F3DB8"
-OG_ORANGE = "#F28C28"
+from core.page_css import ausfuellhinweise_css
 
 
 def main() -> None:
@@ -18,242 +14,7 @@ def main() -> None:
     # Darkmode robust (wie in 00_Einfuehrung.py)
     dark = bool(st.session_state.get("ui_dark_mode", st.session_state.get("dark_mode", False)))
 
-    border = "rgba(255,255,255,0.12)" if dark else "rgba(0,0,0,0.10)"
-    soft_bg = "rgba(255,255,255,0.06)" if dark else "rgba(0,0,0,0.03)"
-    header_bg = "rgba(255,255,255,0.08)" if dark else "rgba(127,127,127,0.10)"
-    zebra_bg = "rgba(255,255,255,0.04)" if dark else "rgba(0,0,0,0.018)"
-    hover_bg = "rgba(255,255,255,0.07)" if dark else "rgba(0,0,0,0.035)"
-    shadow = "0 12px 28px rgba(0,0,0,0.40)" if dark else "0 10px 24px rgba(0,0,0,0.06)"
-
-    # Secondary-Button Grundzustand (Zurück)
-    btn2_bg = "rgba(255,255,255,0.06)" if dark else "#ffffff"
-    btn2_text = "rgba(250,250,250,0.92)" if dark else "#111111"
-
-    st.markdown(
-        f"""
-<style>
-  .rgm-page {{
-    max-width: 1200px;
-    margin: 0 auto;
-    padding-bottom: 6px;
-  }}
-
-  .rgm-h1 {{
-    font-size: 30px;
-    font-weight: 850;
-    line-height: 1.15;
-    margin: 0 0 6px 0;
-    color: var(--rgm-text, #111);
-  }}
-
-  .rgm-lead {{
-    font-size: 15px;
-    line-height: 1.75;
-    color: var(--rgm-text, #111);
-    opacity: 0.92;
-    margin: 0;
-  }}
-
-  .rgm-muted {{
-    font-size: 15px;
-    line-height: 1.75;
-    color: var(--rgm-text, #111);
-    opacity: 0.92;
-  }}
-
-  .rgm-hero {{
-    background: var(--rgm-card-bg, #fff);
-    border: 1px solid {border};
-    border-radius: 14px;
-    padding: 18px 18px 14px 18px;
-    box-shadow: {shadow};
-  }}
-
-  .rgm-accent-line {{
-    height: 3px;
-    width: 96px;
-    border-radius: 999px;
-    margin: 10px 0 14px 0;
-    background: linear-gradient(90deg, {TD_BLUE}, {OG_ORANGE});
-  }}
-
-  /* Schnellnavigation */
-  .rgm-chips {{
-    display: flex;
-    flex-wrap: wrap;
-    gap: 8px;
-    margin-top: 10px;
-  }}
-  .rgm-chip {{
-    display: inline-flex;
-    align-items: center;
-    gap: 8px;
-    padding: 7px 10px;
-    border-radius: 999px;
-    border: 1px solid {border};
-    background: {soft_bg};
-    color: var(--rgm-text, #111);
-    font-size: 13px;
-    font-weight: 750;
-    text-decoration: none;
-  }}
-  .rgm-chip:hover {{
-    background: {hover_bg};
-  }}
-
-  .rgm-card {{
-    background: var(--rgm-card-bg, #fff);
-    border: 1px solid {border};
-    border-radius: 14px;
-    padding: 14px 16px;
-    box-shadow: {shadow};
-    margin-top: 16px;
-  }}
-
-  .rgm-card-title {{
-    font-weight: 850;
-    font-size: 15px;
-    margin: 0 0 10px 0;
-    color: var(--rgm-text, #111);
-  }}
-
-  .rgm-text {{
-    margin: 10px 0 0 0;
-  }}
-
-  .rgm-table-wrap {{
-    width: 100%;
-    overflow-x: auto;
-    -webkit-overflow-scrolling: touch;
-    border-radius: 12px;
-  }}
-
-  .rgm-table {{
-    width: 100%;
-    border-collapse: separate;
-    border-spacing: 0;
-    min-width: 760px;
-    background: var(--rgm-card-bg, #fff);
-    border: 1px solid {border};
-    border-radius: 12px;
-    overflow: hidden;
-  }}
-
-  /* Sticky Header */
-  .rgm-table thead th {{
-    position: sticky;
-    top: 0;
-    z-index: 2;
-    text-align: left;
-    padding: 10px 10px;
-    font-weight: 850;
-    font-size: 13px;
-    color: var(--rgm-text, #111);
-    background: {header_bg};
-    border-bottom: 1px solid {border};
-    vertical-align: top;
-    white-space: nowrap;
-  }}
-
-  .rgm-table tbody td {{
-    padding: 10px 10px;
-    font-size: 13px;
-    color: var(--rgm-text, #111);
-    border-bottom: 1px solid {border};
-    vertical-align: top;
-    background: transparent;
-  }}
-
-  /* Zebra + Hover */
-  .rgm-table tbody tr:nth-child(even) td {{
-    background: {zebra_bg};
-  }}
-  .rgm-table tbody tr:hover td {{
-    background: {hover_bg};
-  }}
-
-  .rgm-table tr:last-child td {{
-    border-bottom: none;
-  }}
-
-  .rgm-strong {{
-    font-weight: 850;
-  }}
-
-  .rgm-warning {{
-    margin-top: 14px;
-    padding: 14px 14px;
-    border-radius: 14px;
-    border: 1px solid rgba(242, 140, 40, 0.60);
-    background: rgba(242, 140, 40, 0.10);
-    box-shadow: {shadow};
-  }}
-
-  .rgm-warning-title {{
-    font-weight: 900;
-    font-size: 14px;
-    color: #c0392b;
-    margin: 0 0 6px 0;
-  }}
-
-  .rgm-warning ul {{
-    margin: 0;
-    padding-left: 18px;
-    color: var(--rgm-text, #111);
-    font-size: 13px;
-    line-height: 1.65;
-  }}
-
-  .rgm-warning li {{
-    margin: 0;
-  }}
-
-  /* =========================================
-     NAV-BUTTONS: Secondary NUR im Nav-Bereich
-     ========================================= */
-  .rgm-nav button[data-testid="baseButton-secondary"],
-  .rgm-nav div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]) {{
-    background: {btn2_bg} !important;
-    color: {btn2_text} !important;
-    border: 1px solid {border} !important;
-    border-radius: 10px !important;
-    font-weight: 650 !important;
-    opacity: 1 !important;
-    transition: background 120ms ease, border-color 120ms ease, color 120ms ease;
-  }}
-
-  .rgm-nav button[data-testid="baseButton-secondary"] *,
-  .rgm-nav div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]) * {{
-    color: inherit !important;
-  }}
-
-  .rgm-nav button[data-testid="baseButton-secondary"]:not(:disabled):hover,
-  .rgm-nav div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]):not(:disabled):hover {{
-    background: {TU_ORANGE} !important;
-    border-color: {TU_ORANGE} !important;
-    color: #ffffff !important;
-  }}
-
-  .rgm-nav button[data-testid="baseButton-secondary"]:not(:disabled):hover *,
-  .rgm-nav div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]):not(:disabled):hover * {{
-    color: #ffffff !important;
-  }}
-
-  .rgm-nav button[data-testid="baseButton-secondary"]:focus,
-  .rgm-nav div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]):focus {{
-    outline: none !important;
-    box-shadow: 0 0 0 3px rgba(99,154,0,0.25) !important;
-  }}
-
-  @media (max-width: 900px) {{
-    .rgm-h1 {{ font-size: 26px; }}
-    .rgm-hero {{ padding: 16px; }}
-    .rgm-card {{ padding: 12px 12px; }}
-  }}
-</style>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(ausfuellhinweise_css(dark), unsafe_allow_html=True)
 
     st.markdown('<div class="rgm-page">', unsafe_allow_html=True)
 
@@ -10,11 +10,8 @@ import streamlit as st
 from core.state import init_session_state
 from core.model_loader import load_tool_meta
 from core.i18n import get_language, t
+from core.page_css import start_css
 
-TU_GREEN = "#639A00"
-TU_ORANGE = "#CA7406"
-TD_BLUE = "#2F3DB8"
-OG_ORANGE = "#F28C28"
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 IMAGES_DIR = BASE_DIR / "images"
@@ -51,436 +48,7 @@ def _name_with_mail(name: str | None, email: str | None) -> str:
 
 
 def _inject_start_css(dark: bool) -> None:
-    # Farben robust je nach Darkmode
-    border = "rgba(255,255,255,0.12)" if dark else "rgba(0,0,0,0.10)"
-    soft_bg = "rgba(255,255,255,0.06)" if dark else "rgba(0,0,0,0.03)"
-    hover_bg = "rgba(255,255,255,0.08)" if dark else "rgba(0,0,0,0.045)"
-    shadow = "0 12px 28px rgba(0,0,0,0.40)" if dark else "0 10px 24px rgba(0,0,0,0.06)"
-    card_bg = "var(--rgm-card-bg, #111)" if dark else "var(--rgm-card-bg, #ffffff)"
-    text_col = "var(--rgm-text, rgba(250,250,250,0.92))" if dark else "var(--rgm-text, #111)"
-
-    footer_bg = "rgba(16,16,16,0.92)" if dark else "#ffffff"
-    footer_border = "rgba(255,255,255,0.12)" if dark else "rgba(0,0,0,0.08)"
-
-    css = r"""
-<style>
-  :root{
-    --tu-green: __TU_GREEN__;
-    --tu-orange: __TU_ORANGE__;
-  }
-
-  /* Links im TU-Grün */
-  a { color: var(--tu-green) !important; }
-
-  /* Primary Buttons (TU-Grün / Hover Orange) */
-  div.stButton > button,
-  button[kind="primary"],
-  button[data-testid="baseButton-primary"]{
-    background: var(--tu-green) !important;
-    border: 1px solid var(--tu-green) !important;
-    color: #ffffff !important;
-    border-radius: 10px !important;
-    font-weight: 650 !important;
-  }
-  div.stButton > button:hover,
-  button[kind="primary"]:hover,
-  button[data-testid="baseButton-primary"]:hover{
-    background: var(--tu-orange) !important;
-    border-color: var(--tu-orange) !important;
-  }
-  div.stButton > button:focus{
-    outline: none !important;
-    box-shadow: 0 0 0 3px rgba(99,154,0,0.25) !important;
-  }
-
-  /* Layout: Platz für Footer */
-  .block-container{
-    padding-top: 2.3rem;
-    --rgm-footer-h: 108px;
-    padding-bottom: calc(var(--rgm-footer-h) + env(safe-area-inset-bottom) + 20px);
-    max-width: 1200px;
-    margin: 0 auto;
-  }
-  @media (max-width: 900px){ .block-container{ --rgm-footer-h: 100px; } }
-  @media (max-width: 600px){ .block-container{ --rgm-footer-h: 94px; } }
-
-  /* Page */
-  .rgm-page{
-    max-width: 1200px;
-    margin: 0 auto;
-  }
-
-  /* HERO */
-  .rgm-hero{
-    background: __CARD_BG__;
-    border: 1px solid __BORDER__;
-    border-radius: 16px;
-    padding: 18px 18px 14px 18px;
-    box-shadow: __SHADOW__;
-  }
-
-  .rgm-hero-top{
-    display: flex;
-    align-items: flex-start;
-    justify-content: space-between;
-    gap: 16px;
-    flex-wrap: wrap;
-  }
-
-  .rgm-h1{
-    font-size: 34px;
-    font-weight: 900;
-    line-height: 1.12;
-    margin: 0 0 8px 0;
-    color: __TEXT__;
-  }
-
-  .rgm-lead{
-    font-size: 15px;
-    line-height: 1.75;
-    margin: 0;
-    color: __TEXT__;
-    opacity: 0.92;
-    max-width: 880px;
-  }
-
-  .rgm-pill-group{
-    display: flex;
-    align-items: center;
-    justify-content: flex-end;
-    flex-wrap: wrap;
-    gap: 8px;
-  }
-
-  .rgm-pill{
-    display: inline-flex;
-    align-items: center;
-    gap: 8px;
-    padding: 8px 12px;
-    border-radius: 999px;
-    border: 1px solid __BORDER__;
-    background: __SOFT_BG__;
-    color: __TEXT__;
-    font-size: 13px;
-    font-weight: 750;
-    white-space: nowrap;
-  }
-  .rgm-time-pill{
-    font-weight: 700;
-  }
-  .rgm-dot{
-    width: 10px;
-    height: 10px;
-    border-radius: 999px;
-    background: var(--tu-green);
-    box-shadow: 0 0 0 3px rgba(99,154,0,0.18);
-  }
-
-  .rgm-accent-line{
-    height: 3px;
-    width: 140px;
-    border-radius: 999px;
-    margin: 10px 0 14px 0;
-    background: linear-gradient(90deg, __TD_BLUE__, __OG_ORANGE__);
-  }
-
-  /* GRID */
-  .rgm-grid{
-    display: grid;
-    grid-template-columns: 1fr 1fr;
-    gap: 14px;
-    margin-top: 16px;
-  }
-  @media (max-width: 900px){
-    .rgm-grid{ grid-template-columns: 1fr; }
-  }
-
-  .rgm-card{
-    background: __CARD_BG__;
-    border: 1px solid __BORDER__;
-    border-radius: 16px;
-    padding: 14px 16px;
-    box-shadow: __SHADOW__;
-    min-height: 96px;
-  }
-
-  .rgm-card-h{
-    display: flex;
-    align-items: center;
-    gap: 10px;
-    margin: 0 0 8px 0;
-  }
-
-  .rgm-ico{
-    width: 34px;
-    height: 34px;
-    border-radius: 12px;
-    display: inline-flex;
-    align-items: center;
-    justify-content: center;
-    border: 1px solid __BORDER__;
-    background: __SOFT_BG__;
-    color: __TEXT__;
-  }
-  .rgm-ico svg{ width: 18px; height: 18px; }
-
-  .rgm-card-title{
-    font-weight: 900;
-    font-size: 15px;
-    color: __TEXT__;
-    margin: 0;
-  }
-
-  .rgm-card-text{
-    margin: 0;
-    color: __TEXT__;
-    opacity: 0.90;
-    font-size: 13.5px;
-    line-height: 1.65;
-  }
-
-  /* META */
-  .rgm-meta{
-    margin-top: 16px;
-    background: __CARD_BG__;
-    border: 1px solid __BORDER__;
-    border-radius: 16px;
-    padding: 14px 16px;
-    box-shadow: __SHADOW__;
-  }
-  .rgm-meta-row{
-    display: grid;
-    grid-template-columns: minmax(140px, 180px) minmax(0, 1fr);
-    gap: 14px;
-    padding: 8px 0;
-    border-bottom: 1px solid __BORDER__;
-    align-items: center;
-  }
-  .rgm-meta-row:last-child{ border-bottom: none; }
-
-  .rgm-k{
-    font-weight: 850;
-    color: __TEXT__;
-    opacity: 0.92;
-    font-size: 13.5px;
-  }
-  .rgm-v{
-    min-width: 0;
-    color: __TEXT__;
-    font-size: 13.5px;
-  }
-  
-  /* META: 2-Spalten Layout (links: rows, rechts: validiert) */
-  .rgm-meta-grid{
-    position: relative;
-    display: grid;
-    grid-template-columns: minmax(0, 1fr) minmax(0, 1fr);
-    gap: 0;                           /* kein Grid-Gap -> Linie kann exakt mittig sein */
-    align-items: stretch;
-  }
-
-  /* mittlerer Trennstrich exakt 50% */
-  .rgm-meta-grid::before{
-    content: "";
-    position: absolute;
-    left: 50%;
-    top: 10px;
-    bottom: 10px;
-    width: 1px;
-    background: __BORDER__;
-    transform: translateX(-0.5px);
-    opacity: 0.9;
-    pointer-events: none;
-  }
-
-  /* linke Spalte: nur Padding (kein border-right mehr) */
-  .rgm-meta-left{
-    padding-right: 18px;   /* Abstand zur Mittellinie */
-  }
-
-  /* rechte Spalte: wie normale Rows (nicht Center-Text) */
-  .rgm-meta-right{
-    min-width: 0;
-    padding-left: 18px;
-    display: flex;
-    flex-direction: column;
-    justify-content: center;
-    align-items: stretch;     /* wichtig: volle Breite */
-    gap: 8px;
-    text-align: left;         /* wichtig: wie links */
-  }
-
-  /* Validiert-Row: gleiche Optik wie rgm-meta-row, aber etwas kleinere Label-Spalte */
-  .rgm-meta-right .rgm-validated-row{
-    grid-template-columns: minmax(130px, 150px) minmax(0, 1fr);
-    border-bottom: none;
-    padding: 8px 0 12px;
-  }
-
-  /* Logo darunter: sauber zentriert */
-  .rgm-validated-logo{
-    display: flex;
-    justify-content: center;
-    margin-top: 0px;
-  }
-
-  /* Logo im rechten Block größer & cleaner */
-  .rgm-meta-right .rgm-footer-logo{
-    box-shadow: 0 4px 12px rgba(0,0,0,0.07);
-    padding: 8px 12px;
-    border-radius: 16px;
-  }
-  .rgm-meta-right .rgm-footer-logo img{
-    height: 70px;           /* <- Größe hier steuern (z.B. 64–76) */
-    width: auto;
-    display: block;
-  }
-
-  /* Responsive: untereinander + Mittellinie ausblenden */
-  @media (max-width: 1100px){
-    .rgm-meta-grid{
-      grid-template-columns: 1fr;
-    }
-    .rgm-meta-grid::before{
-      display: none;
-    }
-    .rgm-meta-left{
-      padding-right: 0;
-      border-bottom: 1px solid __BORDER__;
-      padding-bottom: 12px;
-      margin-bottom: 10px;
-    }
-    .rgm-meta-right{
-      padding-left: 0;
-    }
-  }
-
-  /* Mail mini */
-  .rgm-mail{ display: inline-flex; align-items: center; gap: 8px; max-width: 100%; }
-  .rgm-mail > span{
-    min-width: 0;
-    overflow: hidden;
-    text-overflow: ellipsis;
-    white-space: nowrap;
-  }
-  .rgm-mail a{
-    display: inline-flex;
-    align-items: center;
-    justify-content: center;
-    width: 26px;
-    height: 26px;
-    border-radius: 9px;
-    border: 1px solid __BORDER__;
-    text-decoration: none;
-    color: inherit;
-    opacity: 0.95;
-    flex: 0 0 auto;
-  }
-  .rgm-mail a:hover{
-    opacity: 1;
-    transform: translateY(-0.5px);
-    border-color: var(--tu-green);
-  }
-  .rgm-mail svg{ width: 15px; height: 15px; }
-
-  .rgm-btn-wrap{ margin-top: 14px; margin-bottom: 10px; }
-  
-  /* FOOTER (Logos) */
-  .rgm-footer{
-    position: fixed;
-    left: 0;
-    right: 0;
-    bottom: 0;
-
-    background: __FOOTER_BG__;
-    padding: 10px 18px;
-
-    border-top: 1px solid __FOOTER_BORDER__;
-    z-index: 9999;
-    backdrop-filter: blur(8px);
-  }
-
-  /* Scrollfläche */
-  .rgm-footer-scroll{
-    overflow-x: auto;
-    overflow-y: hidden;
-    -webkit-overflow-scrolling: touch;
-    scrollbar-width: thin;
-
-    /* wichtig: genug Rand, damit das 1. Logo nie „klebt“/abgeschnitten wirkt */
-    padding-left: max(12px, env(safe-area-inset-left));
-    padding-right: max(12px, env(safe-area-inset-right));
-    box-sizing: border-box;
-
-    /* macht das Scrollen bis zum Rand sauber */
-    scroll-padding-left: max(12px, env(safe-area-inset-left));
-    scroll-padding-right: max(12px, env(safe-area-inset-right));
-  }
-
-  /* Track, der sich bei "passt rein" automatisch zentriert */
-  .rgm-footer-track{
-    display: flex;
-    align-items: center;
-    gap: 18px;
-
-    width: max-content;
-    margin: 0 auto;
-    padding: 0; /* Padding ist im Scroll-Container */
-  }
-
-  .rgm-footer-logo{
-    flex: 0 0 auto;
-    display: inline-flex;
-    align-items: center;
-    justify-content: center;
-
-    background: rgba(255,255,255,0.92);
-    border: 1px solid rgba(0,0,0,0.08);
-    border-radius: 14px;
-
-    padding: 8px 10px;
-    text-decoration: none;
-    color: inherit;
-
-    box-shadow: 0 10px 22px rgba(0,0,0,0.10);
-  }
-
-  .rgm-footer-logo:hover{ opacity: 0.96; transform: translateY(-0.5px); }
-
-  .rgm-footer-logo img{
-    height: 52px;
-    width: auto;
-    object-fit: contain;
-    display: block;
-  }
-
-  @media (max-width: 900px){
-    .rgm-footer-logo img{ height: 46px; }
-  }
-  @media (max-width: 600px){
-    .rgm-footer-logo img{ height: 42px; }
-  }
-
-  .rgm-footer-scroll::-webkit-scrollbar{ height: 6px; }
-  .rgm-footer-scroll::-webkit-scrollbar-thumb{ border-radius: 999px; }
-
-</style>
-"""
-    css = (
-        css.replace("__TU_GREEN__", TU_GREEN)
-        .replace("__TU_ORANGE__", TU_ORANGE)
-        .replace("__TD_BLUE__", TD_BLUE)
-        .replace("__OG_ORANGE__", OG_ORANGE)
-        .replace("__BORDER__", border)
-        .replace("__SOFT_BG__", soft_bg)
-        .replace("__HOVER_BG__", hover_bg)
-        .replace("__SHADOW__", shadow)
-        .replace("__CARD_BG__", card_bg)
-        .replace("__TEXT__", text_col)
-        .replace("__FOOTER_BG__", footer_bg)
-        .replace("__FOOTER_BORDER__", footer_border)
-    )
-    st.markdown(css, unsafe_allow_html=True)
+    st.markdown(start_css(dark), unsafe_allow_html=True)
 
 def _feature_card(title: str, text: str, icon_svg: str) -> str:
     return f"""
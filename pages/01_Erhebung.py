@@ -8,18 +8,23 @@ import re
 import html
 import textwrap
 from datetime import datetime
+from typing import Sequence
 from urllib.parse import quote_plus
 
 import streamlit as st
 import streamlit.components.v1 as components
 
 from core.state import init_session_state
-from core.model_loader import load_model_config
+from core.downloads import deferred_download_button, state_fingerprint
+from core.gating import GatingEngine
+from core.model_loader import load_model
+from core.model_search import KIND_GLOSSARY, SearchTarget, get_model_search_index
+from core.scoring import compile_model
+from core.glossary_match import GlossaryMatcher
+from core.types import Dimension, Level, MaturityModel, ProcessProfile
 import core.persist as persist
-from core.i18n import answer_option_label, get_language, target_option_label, t
-
-TD_BLUE = "#2F3DB8"
-OG_ORANGE = "#F28C28"
+from core.i18n import get_language, target_option_label, t, translator
+from core.page_css import erhebung_page_css, erhebung_footer_css
 
 
 # -----------------------------
@@ -51,362 +56,7 @@ ANSWER_OPTIONS = [
 def _inject_erhebung_page_css() -> None:
     """Einheitliches Design für Erhebung (Cards/Typografie/Abstände) – kompatibel mit globalem Theme."""
     dark = bool(st.session_state.get("ui_dark_mode", st.session_state.get("dark_mode", False)))
-
-    border = "rgba(255,255,255,0.12)" if dark else "rgba(0,0,0,0.10)"
-    soft_bg = "rgba(255,255,255,0.06)" if dark else "rgba(0,0,0,0.03)"
-    header_bg = "rgba(255,255,255,0.08)" if dark else "rgba(127,127,127,0.10)"
-    shadow = "0 12px 28px rgba(0,0,0,0.40)" if dark else "0 10px 24px rgba(0,0,0,0.06)"
-
-    uploader_bg = "rgba(255,255,255,0.06)" if dark else "rgba(0,0,0,0.02)"
-
-    # Tooltip (help=...)
-    if dark:
-        tip_icon_bg = "rgba(255,255,255,0.06)"
-        tip_icon_hover = "rgba(255,255,255,0.12)"
-        tip_icon_fg = "rgba(255,255,255,0.92)"
-        tip_pop_bg = "rgba(17,24,39,0.98)"
-        tip_pop_fg = "rgba(250,250,250,0.92)"
-        tip_pop_border = "rgba(255,255,255,0.18)"
-        tip_pop_shadow = "0 12px 28px rgba(0,0,0,0.55)"
-    else:
-        tip_icon_bg = "rgba(17,24,39,0.06)"
-        tip_icon_hover = "rgba(17,24,39,0.10)"
-        tip_icon_fg = "rgba(17,24,39,0.82)"
-        tip_pop_bg = "#ffffff"
-        tip_pop_fg = "rgba(17,24,39,0.92)"
-        tip_pop_border = "rgba(0,0,0,0.12)"
-        tip_pop_shadow = "0 10px 24px rgba(0,0,0,0.10)"
-
-    # Secondary-Button Grundzustand (Erhebung)
-    btn2_bg = "rgba(255,255,255,0.06)" if dark else "#ffffff"
-    btn2_text = "rgba(250,250,250,0.92)" if dark else "#111111"
-
-    st.markdown(
-        f"""
-<style>
-  /* =========================
-     Tokens (nur für diese Seite)
-     ========================= */
-  div[data-testid="stAppViewContainer"] {{
-    --tu-orange: #CA7406;
-
-    --rgm-td-blue: {TD_BLUE};
-    --rgm-og-orange: {OG_ORANGE};
-    --rgm-border: {border};
-    --rgm-soft: {soft_bg};
-    --rgm-header-bg: {header_bg};
-    --rgm-shadow: {shadow};
-
-    --rgm-uploader-bg: {uploader_bg};
-
-    --rgm-tip-icon-bg: {tip_icon_bg};
-    --rgm-tip-icon-hover: {tip_icon_hover};
-    --rgm-tip-icon-fg: {tip_icon_fg};
-
-    --rgm-tip-pop-bg: {tip_pop_bg};
-    --rgm-tip-pop-fg: {tip_pop_fg};
-    --rgm-tip-pop-border: {tip_pop_border};
-    --rgm-tip-pop-shadow: {tip_pop_shadow};
-  }}
-
-  /* Content Breite wie andere Seiten */
-  div[data-testid="stAppViewContainer"] .block-container {{
-    max-width: 1200px;
-    margin: 0 auto;
-    padding-top: 1.0rem;
-    padding-bottom: 6.0rem;
-  }}
-
-  /* Anchor-Icon neben Überschriften ausblenden */
-  a.anchor-link,
-  a.header-anchor,
-  a[data-testid="stHeaderLink"],
-  a[aria-label="Anchor link"],
-  a[data-testid="stMarkdownAnchorLink"],
-  svg[data-testid="stMarkdownAnchorIcon"] {{
-    display: none !important;
-  }}
-
-  /* =========================
-     HERO
-     ========================= */
-  .rgm-hero {{
-    background: var(--rgm-card-bg, #fff);
-    border: 1px solid var(--rgm-border);
-    border-radius: 14px;
-    padding: 18px 18px 14px 18px;
-    box-shadow: var(--rgm-shadow);
-    margin-top: 6px;
-  }}
-
-  .rgm-h1 {{
-    font-size: 30px;
-    font-weight: 850;
-    line-height: 1.15;
-    margin: 0 0 6px 0;
-    color: var(--rgm-text, #111);
-  }}
-
-  .rgm-lead,
-  .rgm-muted {{
-    font-size: 15px;
-    line-height: 1.75;
-    color: var(--rgm-text, #111);
-    opacity: 0.92;
-    margin: 0;
-  }}
-
-  .rgm-accent-line {{
-    height: 3px;
-    width: 96px;
-    border-radius: 999px;
-    margin: 10px 0 14px 0;
-    background: linear-gradient(90deg, var(--rgm-td-blue), var(--rgm-og-orange));
-  }}
-
-  .rgm-badges {{
-    display: flex;
-    flex-wrap: wrap;
-    gap: 8px;
-    margin-top: 12px;
-  }}
-  .rgm-badge {{
-    display: inline-flex;
-    align-items: center;
-    gap: 6px;
-    padding: 6px 10px;
-    border-radius: 999px;
-    border: 1px solid var(--rgm-border);
-    background: var(--rgm-soft);
-    color: var(--rgm-text, #111);
-    font-size: 12.5px;
-    line-height: 1.3;
-    white-space: nowrap;
-  }}
-  .rgm-badge b {{ font-weight: 850; }}
-
-  .rgm-time-notice {{
-    display: flex;
-    align-items: flex-start;
-    gap: 10px;
-    margin: 12px 0 14px 0;
-    padding: 12px 14px;
-    border: 1px solid var(--rgm-border);
-    border-left: 4px solid var(--tu-orange);
-    border-radius: 12px;
-    background: var(--rgm-soft);
-    color: var(--rgm-text, #111);
-    box-shadow: var(--rgm-shadow);
-  }}
-  .rgm-time-notice-icon {{
-    flex: 0 0 auto;
-    width: 26px;
-    height: 26px;
-    border-radius: 999px;
-    display: inline-flex;
-    align-items: center;
-    justify-content: center;
-    background: rgba(202,116,6,0.12);
-    color: var(--tu-orange);
-    font-size: 16px;
-    line-height: 1;
-  }}
-  .rgm-time-notice-text {{
-    font-size: 14px;
-    line-height: 1.55;
-    margin: 0;
-  }}
-  .rgm-time-notice-text b {{ font-weight: 850; }}
-
-  /* =========================
-     Step 0: Meta-Card
-     ========================= */
-  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
-    div[data-testid="stVerticalBlock"]:has(#rgm-erhebung-meta-card):has(.rgm-hero) {{
-      border: 0 !important;
-      background: transparent !important;
-      box-shadow: none !important;
-      padding: 0 !important;
-      margin: 0 !important;
-  }}
-
-  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
-    div[data-testid="stVerticalBlock"]:has(#rgm-erhebung-meta-card):not(:has(.rgm-hero)) {{
-      border: 1px solid var(--rgm-border) !important;
-      border-radius: 14px !important;
-      background: var(--rgm-card-bg, #fff) !important;
-      box-shadow: var(--rgm-shadow) !important;
-      padding: 14px 16px 12px 16px !important;
-      margin: 0 !important;
-  }}
-
-  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
-    div[data-testid="stVerticalBlock"]:has(#rgm-erhebung-meta-card):not(:has(.rgm-hero)) label {{
-      font-weight: 750 !important;
-  }}
-
-  /* Focus: Inputs/Select (TU-Orange) */
-  div[data-testid="stTextInput"] input:focus {{
-    border-color: var(--tu-orange) !important;
-    box-shadow: 0 0 0 2px rgba(202,116,6,0.28) !important;
-  }}
-  div[data-baseweb="select"]:focus-within > div {{
-    border-color: var(--tu-orange) !important;
-    box-shadow: 0 0 0 2px rgba(202,116,6,0.28) !important;
-  }}
-
-  /* Fragenlayout */
-  .rgm-q {{ margin: 6px 0; line-height: 1.40; }}
-  .rgm-qno {{
-    display: inline-flex;
-    align-items: center;
-    justify-content: center;
-    min-width: 44px;
-    padding: 2px 10px;
-    border-radius: 999px;
-    border: 1px solid var(--rgm-border);
-    background: var(--rgm-soft);
-    font-weight: 850;
-    margin-right: 8px;
-    white-space: nowrap;
-  }}
-
-  /* Tabellen/Key-Value Boxen */
-  .rgm-kv-wrap {{
-    border: 1px solid var(--rgm-border);
-    border-radius: 14px;
-    overflow: hidden;
-    background: var(--rgm-card-bg, #fff);
-    box-shadow: var(--rgm-shadow);
-  }}
-  .rgm-kv-row {{
-    display: grid;
-    grid-template-columns: 190px 1fr;
-    border-bottom: 1px solid var(--rgm-border);
-  }}
-  .rgm-kv-row:last-child {{ border-bottom: none; }}
-  .rgm-kv-l {{
-    background: var(--rgm-header-bg);
-    padding: 10px 12px;
-    font-weight: 800;
-    color: var(--rgm-text, #111);
-  }}
-  .rgm-kv-r {{
-    padding: 10px 12px;
-    color: var(--rgm-text, #111);
-  }}
-
-  /* Radios kompakter */
-  div[data-testid="stRadio"] > div {{ gap: 0.35rem; }}
-
-  .rgm-split-title {{
-    font-size: 18px;
-    font-weight: 850;
-    margin: 2px 0 10px 0;
-    color: var(--rgm-text, #111);
-  }}
-
-  @media (max-width: 900px) {{
-    .rgm-h1 {{ font-size: 26px; }}
-    .rgm-hero {{ padding: 16px; }}
-  }}
-
-  /* File Uploader */
-  div[data-testid="stFileUploader"] section[data-testid="stFileUploaderDropzone"],
-  div[data-testid="stFileUploader"] section[aria-label="File uploader"] {{
-    background: var(--rgm-uploader-bg) !important;
-    border: 1px dashed var(--rgm-border) !important;
-    border-radius: 12px !important;
-  }}
-
-  /* Tooltip Icon */
-  div[data-testid="stTooltipIcon"] button {{
-    background: var(--rgm-tip-icon-bg) !important;
-    border: 1px solid var(--rgm-tip-pop-border) !important;
-    border-radius: 999px !important;
-    width: 26px !important;
-    height: 26px !important;
-    padding: 0 !important;
-    line-height: 0 !important;
-    display: inline-flex !important;
-    align-items: center !important;
-    justify-content: center !important;
-  }}
-  div[data-testid="stTooltipIcon"] button:hover {{
-    background: var(--rgm-tip-icon-hover) !important;
-  }}
-  div[data-testid="stTooltipIcon"] svg {{
-    color: var(--rgm-tip-icon-fg) !important;
-    fill: none !important;
-    stroke: currentColor !important;
-    opacity: 1 !important;
-  }}
-
-  /* Tooltip Popup */
-  *[data-baseweb="tooltip"],
-  *[role="tooltip"] {{
-    background: var(--rgm-tip-pop-bg) !important;
-    color: var(--rgm-tip-pop-fg) !important;
-    border: 1px solid var(--rgm-tip-pop-border) !important;
-    border-radius: 12px !important;
-    box-shadow: var(--rgm-tip-pop-shadow) !important;
-    max-width: 560px !important;
-    padding: 10px 12px !important;
-  }}
-  *[data-baseweb="tooltip"] * ,
-  *[role="tooltip"] * {{
-    color: var(--rgm-tip-pop-fg) !important;
-  }}
-
-  /* Secondary Buttons – NUR Erhebung (Marker) */
-  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
-    button[data-testid="baseButton-secondary"],
-  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
-    div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]) {{
-    background: {btn2_bg} !important;
-    color: {btn2_text} !important;
-    border: 1px solid var(--rgm-border) !important;
-    border-radius: 10px !important;
-    font-weight: 650 !important;
-    opacity: 1 !important;
-    transition: background 120ms ease, border-color 120ms ease, color 120ms ease;
-  }}
-  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
-    button[data-testid="baseButton-secondary"]:not(:disabled):hover,
-  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
-    div.stButton > button:not([data-testid="baseButton-primary"]):not([kind="primary"]):not(:disabled):hover {{
-    background: var(--tu-orange) !important;
-    border-color: var(--tu-orange) !important;
-    color: #ffffff !important;
-  }}
-
-  /* Selectbox Dropdown Hover – scoped auf Erhebung */
-  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
-    div[data-baseweb="popover"] li[role="option"]:hover,
-  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
-    div[data-baseweb="popover"] div[role="option"]:hover,
-  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
-    div[data-baseweb="menu"] li:hover,
-  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
-    div[data-baseweb="menu"] div[role="option"]:hover {{
-      background: var(--tu-orange) !important;
-      color: #ffffff !important;
-  }}
-  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
-    div[data-baseweb="popover"] li[role="option"]:hover *,
-  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
-    div[data-baseweb="popover"] div[role="option"]:hover *,
-  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
-    div[data-baseweb="menu"] li:hover *,
-  div[data-testid="stAppViewContainer"]:has(#rgm-erhebung-page-marker)
-    div[data-baseweb="menu"] div[role="option"]:hover * {{
-      color: #ffffff !important;
-  }}
-
-</style>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(erhebung_page_css(dark), unsafe_allow_html=True)
 
 
 def _render_hero(title: str, lead: str = "", body: str = "", extra_html: str = "") -> None:
@@ -450,40 +100,22 @@ def _qid_key(qid) -> str:
     """Normiert Question-IDs konsistent auf String."""
     return str(qid).strip()
 
-def _get_answer(answers: dict, qid) -> str | None:
-    """Liest Antwort robust aus answers (String-Key) oder Widget-State."""
-    qk = _qid_key(qid)
-    # 1) Source of truth: answers dict
-    v = answers.get(qk)
-    if v in ANSWER_OPTIONS:
-        return v
-    # 2) Fallback: Widget-State (falls answers nicht synchron ist)
-    wk = f"q_{qk}"
-    v2 = st.session_state.get(wk)
-    return v2 if v2 in ANSWER_OPTIONS else None
 
+_GATING_KEY = "_rgm_gating"
 
-def _code_sort_key(code: str):
+
+def _session_gating(model: MaturityModel) -> GatingEngine:
     """
-    Sortierung wie Excel: TD zuerst, dann OG; danach numerisch.
-    Beispiele: TD1.1 < TD1.2 < ... < TD4.4 < OG1.1 < ... < OG4.4
+    Freischalt-Zähler der Session (core.gating): einmal je Modell aufgebaut, danach nur mit
+    den Antworten abgeglichen; Radio-Antworten bucht _render_dimension direkt um.
     """
-    c = (code or "").strip()
-    m = re.match(r"^([A-Za-z]+)(\d+)(?:\.(\d+))?$", c)
-    if not m:
-        return (99, c, 999, 999)
-
-    prefix = m.group(1).upper()
-    major = int(m.group(2))
-    minor = int(m.group(3) or 0)
-
-    prefix_order = {"TD": 0, "OG": 1}.get(prefix, 50)
-    return (prefix_order, prefix, major, minor)
-
-
-def _dims_sorted_from_model(model: dict) -> list[dict]:
-    dims = model.get("dimensions", []) or []
-    return sorted(dims, key=lambda d: _code_sort_key(str(d.get("code", ""))))
+    answers = st.session_state.get("answers")
+    engine = st.session_state.get(_GATING_KEY)
+    if not isinstance(engine, GatingEngine) or engine.model is not compile_model(model):
+        engine = GatingEngine(model)
+        st.session_state[_GATING_KEY] = engine
+    engine.sync(answers if isinstance(answers, dict) else {})
+    return engine
 
 
 def _safe_filename(s: str) -> str:
@@ -674,128 +306,10 @@ def _inject_glossary_link_css() -> None:
     )
 
 
-def _build_glossary_alias_index(glossary: dict) -> tuple[list[str], dict[str, str]]:
-    aliases: list[str] = []
-    alias_to_canonical: dict[str, str] = {}
-
-    def _add(alias: str, canonical: str):
-        a = (alias or "").strip()
-        c = (canonical or "").strip()
-        if not a or not c:
-            return
-        al = a.lower()
-        if al in alias_to_canonical:
-            return
-        alias_to_canonical[al] = c
-        aliases.append(a)
-
-    def _add_adj_variants(phrase: str, canonical: str):
-        endings = ["e", "en", "er", "es", "em"]
-        tokens = (phrase or "").split()
-        if len(tokens) < 2:
-            return
-
-        for i in range(len(tokens) - 1):
-            t = tokens[i]
-            if not t:
-                continue
-            if not re.match(r"^[a-zäöüß]", t):
-                continue
-
-            for end in endings:
-                if t.endswith(end) and len(t) > len(end) + 3:
-                    stem = t[: -len(end)]
-                    for e in endings:
-                        variant_tokens = tokens[:]
-                        variant_tokens[i] = stem + e
-                        _add(" ".join(variant_tokens), canonical)
-                    break
-
-    if not isinstance(glossary, dict):
-        return [], {}
-
-    for canonical in glossary.keys():
-        if not isinstance(canonical, str):
-            continue
-        c = canonical.strip()
-        if not c:
-            continue
-
-        _add(c, c)
-
-        if "," in c:
-            left, right = [p.strip() for p in c.split(",", 1)]
-            if left and right:
-                swapped = f"{right} {left}"
-                _add(swapped, c)
-                _add_adj_variants(swapped, c)
-
-        if "(" in c:
-            left = c.split("(", 1)[0].strip()
-            _add(left, c)
-
-            if ")" in c:
-                inside = c.split("(", 1)[1].rsplit(")", 1)[0].strip()
-                if inside:
-                    _add(inside, c)
-
-        for sep in ["–", "-", ":"]:
-            if sep in c:
-                _add(c.split(sep, 1)[0].strip(), c)
-
-        for abbr in re.findall(r"\b[A-ZÄÖÜ]{3,}\b", c):
-            _add(abbr, c)
-
-        _add_adj_variants(c, c)
-
-    aliases_sorted = sorted(aliases, key=len, reverse=True)
-    return aliases_sorted, alias_to_canonical
-
-
-def _glossary_linkify(text: str, glossary: dict, return_page: str, return_payload: dict) -> str:
+def _glossary_linkify(text: str, glossary: GlossaryMatcher, return_page: str, return_payload: dict) -> str:
     raw = (text or "")
-    if not raw.strip() or not isinstance(glossary, dict) or not glossary:
-        return html.escape(raw).replace("\n", "<br>")
-
-    aliases_sorted, alias_to_canonical = _build_glossary_alias_index(glossary)
-    if not aliases_sorted or not isinstance(alias_to_canonical, dict):
-        return html.escape(raw).replace("\n", "<br>")
-
-    word_chars = r"A-Za-z0-9ÄÖÜäöüß_"
-    suffix_chars = r"A-Za-zÄÖÜäöüß"
-
-    parts_pat: list[str] = []
-    for alias in aliases_sorted:
-        a = (alias or "").strip()
-        if not a:
-            continue
-
-        esc = re.escape(a)
-
-        starts_word = re.match(rf"^[{word_chars}]", a) is not None
-        ends_word = re.match(rf".*[{word_chars}]$", a) is not None
-
-        tokens = a.split()
-        last_token = tokens[-1] if tokens else ""
-        allow_compound_suffix = (len(tokens) >= 2) and bool(re.match(r"^[A-ZÄÖÜ]", last_token))
-
-        if starts_word:
-            esc = rf"(?<![{word_chars}]){esc}"
-
-        if ends_word:
-            if allow_compound_suffix:
-                esc = rf"{esc}(?:[{suffix_chars}]+)?"
-            else:
-                esc = rf"{esc}(?![{word_chars}])"
-
-        parts_pat.append(esc)
-
-    if not parts_pat:
-        return html.escape(raw).replace("\n", "<br>")
-
-    try:
-        pattern = re.compile("|".join(parts_pat), flags=re.IGNORECASE)
-    except Exception:
+    pattern = glossary.pattern if raw.strip() else None
+    if pattern is None:
         return html.escape(raw).replace("\n", "<br>")
 
     ret_step = str(return_payload.get("erhebung_step", "")) if isinstance(return_payload, dict) else ""
@@ -830,12 +344,6 @@ def _glossary_linkify(text: str, glossary: dict, return_page: str, return_payloa
     
         return "?" + "&".join(qs)
 
-    alias_items = sorted(
-        ((a.lower(), c) for a, c in alias_to_canonical.items() if isinstance(a, str) and isinstance(c, str)),
-        key=lambda x: len(x[0]),
-        reverse=True,
-    )
-
     out: list[str] = []
     last = 0
 
@@ -845,16 +353,9 @@ def _glossary_linkify(text: str, glossary: dict, return_page: str, return_payloa
             out.append(html.escape(raw[last:start]).replace("\n", "<br>"))
 
         matched = m.group(0)
-        ml = matched.lower()
-
-        canonical = alias_to_canonical.get(ml)
-        if not canonical:
-            for al, canon in alias_items:
-                if ml.startswith(al):
-                    canonical = canon
-                    break
+        canonical = glossary.canonical(matched)
 
-        if canonical and canonical in glossary:
+        if canonical:
             out.append(
                 f'<a class="rgm-glossary-link" href="{_href(canonical)}" target="_self" rel="noopener noreferrer">'
                 f"{html.escape(matched)}"
@@ -904,15 +405,15 @@ def _render_save_resume_panel(aid: str) -> None:
             f"rgm_save_{_safe_filename(meta.get('org',''))}_"
             f"{_safe_filename(meta.get('date_str','')) or datetime.now().strftime('%Y-%m-%d')}.json"
         )
-        data = persist.export_snapshot_bytes(aid, pretty=True)
-
-        st.download_button(
-            t("assessment.download_state"),
-            data=data,
-            file_name=fn,
-            mime="application/json",
-            use_container_width=True,
-        )
+        # Savefile erst auf Klick serialisieren (gemerkt bis sich der Zustand ändert)
+        deferred_download_button(
+            t("assessment.download_state"),
+            lambda: persist.export_snapshot_bytes(aid, pretty=True),
+            fingerprint=persist.snapshot_fingerprint(aid),
+            file_name=fn,
+            mime="application/json",
+            key="rgm_download_state",
+        )
         st.info(t("assessment.save_json_info"))
 
         st.markdown("---")
@@ -993,15 +494,12 @@ def _render_save_resume_panel(aid: str) -> None:
 # -----------------------------
 # Excel-Look Renderer
 # -----------------------------
-def _render_process_profile(profile: dict, glossary: dict, return_page: str, return_payload: dict) -> None:
-    if not isinstance(profile, dict):
-        profile = {}
-
-    rows = [
-        (t("assessment.profile.purpose"), profile.get("purpose", "")),
-        (t("assessment.profile.results"), profile.get("results", "")),
-        (t("assessment.profile.basic_practices"), profile.get("basic_practices", "")),
-        (t("assessment.profile.work_products"), profile.get("work_products", "")),
+def _render_process_profile(profile: ProcessProfile, glossary: GlossaryMatcher, return_page: str, return_payload: dict) -> None:
+    rows = [
+        (t("assessment.profile.purpose"), profile.purpose),
+        (t("assessment.profile.results"), profile.results),
+        (t("assessment.profile.basic_practices"), profile.basic_practices),
+        (t("assessment.profile.work_products"), profile.work_products),
     ]
 
     parts = ['<div class="rgm-kv-wrap">']
@@ -1019,7 +517,7 @@ def _render_process_profile(profile: dict, glossary: dict, return_page: str, ret
     st.markdown("".join(parts), unsafe_allow_html=True)
 
 
-def _render_excel_text_box(title_left: str, text_right: str, glossary: dict, return_page: str, return_payload: dict) -> None:
+def _render_excel_text_box(title_left: str, text_right: str, glossary: GlossaryMatcher, return_page: str, return_payload: dict) -> None:
     left = html.escape((title_left or "").strip())
     right = _glossary_linkify(str(text_right or ""), glossary, return_page, return_payload)
 
@@ -1036,9 +534,9 @@ def _render_excel_text_box(title_left: str, text_right: str, glossary: dict, ret
     )
 
 
-def _render_level_info_expander(lvl: dict, glossary: dict, return_page: str, return_payload: dict) -> None:
-    acceptance = str(lvl.get("acceptance_criteria", "") or "").strip()
-    benefit = str(lvl.get("benefit", "") or "").strip()
+def _render_level_info_expander(lvl: Level, glossary: GlossaryMatcher, return_page: str, return_payload: dict) -> None:
+    acceptance = lvl.acceptance_criteria
+    benefit = lvl.benefit_text or ""
 
     if not acceptance and not benefit:
         return
@@ -1061,7 +559,7 @@ def _reset_erhebung_answers() -> None:
             del st.session_state[k]
 
 
-def _export_own_targets_json(targets: dict[str, float], model: dict, meta: dict) -> bytes:
+def _export_own_targets_json(targets: dict[str, float], model: MaturityModel, meta: dict) -> bytes:
     payload = {
         "schema": "rgm_own_target_v1",
         "created_at": datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
@@ -1069,7 +567,7 @@ def _export_own_targets_json(targets: dict[str, float], model: dict, meta: dict)
         "area": meta.get("area", ""),
         "date_str": meta.get("date_str", ""),
         "targets": {k: int(round(float(v))) for k, v in targets.items()},
-        "codes": [str(d.get("code", "")).strip() for d in _dims_sorted_from_model(model)],
+        "codes": [d.code for d in model.sorted_dimensions],
     }
     return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
 
@@ -1140,7 +638,7 @@ def _parse_own_targets_upload(file_name: str, raw: bytes) -> dict[str, int]:
     raise ValueError(t("assessment.upload_json_csv"))
 
 
-def _apply_imported_targets(imported: dict[str, int], dims_sorted: list[dict]) -> tuple[int, list[str]]:
+def _apply_imported_targets(imported: dict[str, int], dims_sorted: Sequence[Dimension]) -> tuple[int, list[str]]:
     options = [1, 2, 3, 4, 5]
 
     base_default = int(round(float(st.session_state.get("global_target_level", 3.0))))
@@ -1151,7 +649,7 @@ def _apply_imported_targets(imported: dict[str, int], dims_sorted: list[dict]) -
     used = 0
 
     for d in dims_sorted:
-        code = str(d.get("code", "")).strip()
+        code = d.code
         if not code:
             continue
 
@@ -1177,81 +675,10 @@ def _apply_imported_targets(imported: dict[str, int], dims_sorted: list[dict]) -
 # -----------------------------
 def _inject_erhebung_css_for_footer() -> None:
     dark = bool(st.session_state.get("ui_dark_mode", st.session_state.get("dark_mode", False)))
+    st.markdown(erhebung_footer_css(dark), unsafe_allow_html=True)
 
-    border = "rgba(255,255,255,0.12)" if dark else "rgba(0,0,0,0.10)"
-    bg = "rgba(17,24,39,0.96)" if dark else "rgba(246,247,249,0.96)"
-    shadow = "0 -10px 24px rgba(0,0,0,0.35)" if dark else "0 -10px 24px rgba(0,0,0,0.06)"
-
-    seg_bg = "rgba(255,255,255,0.18)" if dark else "rgba(0,0,0,0.12)"
-    txt = "rgba(250,250,250,0.92)" if dark else "#111111"
-    muted = "rgba(250,250,250,0.75)" if dark else "rgba(17,24,39,0.75)"
-
-    st.markdown(
-        f"""
-<style>
-  div#rgm-erhebung-footer-anchor + div {{
-    position: fixed;
-    left: 0;
-    right: 0;
-    bottom: 0;
-
-    z-index: 9999;
-    background: {bg};
-    border-top: 1px solid {border};
-    box-shadow: {shadow};
-    backdrop-filter: blur(6px);
-    padding: 12px 18px 10px 18px;
-  }}
-
-  div#rgm-erhebung-footer-anchor + div > div {{
-    max-width: 1200px;
-    margin: 0 auto;
-  }}
-
-  .rgm-footer-title {{
-    font-weight: 850;
-    margin-bottom: 8px;
-    color: {txt};
-  }}
-
-  .rgm-progress-wrap{{ margin-top: 10px; }}
-  .rgm-progress-top{{
-    display:flex;
-    align-items:center;
-    justify-content:space-between;
-    gap:12px;
-    margin-bottom:6px;
-  }}
-  .rgm-progress-label{{
-    font-size:12px;
-    font-weight:750;
-    color: {muted};
-  }}
-
-  .rgm-pipe{{
-    display:flex;
-    gap:6px;
-    width:100%;
-  }}
 
-  .rgm-pipe .rgm-seg {{
-    flex: 1 1 0;
-    min-width: 0;
-    height: 10px;
-    border-radius: 999px;
-    background-color: {seg_bg} !important;
-  }}
-
-  .rgm-pipe .rgm-seg.rgm-seg-done {{
-    background-color: #7FB800 !important;
-  }}
-</style>
-        """,
-        unsafe_allow_html=True,
-    )
-
-
-def _footer_navigation(model: dict, aid: str) -> None:
+def _footer_navigation(model: MaturityModel, aid: str, gating: GatingEngine) -> None:
     """
     Footer-Layout:
     Navigation
@@ -1260,11 +687,11 @@ def _footer_navigation(model: dict, aid: str) -> None:
     [Zurück] [Weiter]
     Fortschritt (Pipe)
     """
-    dims = model.get("dimensions", []) or []
+    dims = model.sorted_dimensions
     if not dims:
         return
 
-    labels = [f"{d.get('code','')} – {d.get('name','')}".strip(" –") for d in dims]
+    labels = [f"{d.code} – {d.name}".strip(" –") for d in dims]
     n = len(dims)
 
     idx = int(st.session_state.get("erhebung_dim_idx", 0))
@@ -1332,23 +759,9 @@ def _footer_navigation(model: dict, aid: str) -> None:
         # PIPELINE IMMER RENDERN (NICHT in Button-Block, NICHT nach rerun)
         # ------------------------------------------------------------
         answers = st.session_state.get("answers", {})
-        if not isinstance(answers, dict):
-            answers = {}
-
-        dim_done_flags: list[bool] = []
-        for d in dims:
-            any_answered = False
-            for lvl in (d.get("levels", []) or []):
-                for q in (lvl.get("questions", []) or []):
-                    qid = q.get("id")
-                    if not qid:
-                        continue
-                    if _get_answer(answers, qid) is not None:
-                        any_answered = True
-                        break
-                if any_answered:
-                    break
-            dim_done_flags.append(any_answered)
+        gating.sync(answers if isinstance(answers, dict) else {})
+
+        dim_done_flags: list[bool] = [gating.has_answers(d.code) for d in dims]
 
         pipe: list[str] = []
         pipe.append('<div class="rgm-progress-wrap">')
@@ -1602,8 +1015,8 @@ def _own_target_step(aid: str) -> None:
     st.markdown("")
     st.markdown('<div id="rgm-own-target-marker"></div>', unsafe_allow_html=True)
 
-    model = load_model_config()
-    dims_sorted = _dims_sorted_from_model(model)
+    model = load_model()
+    dims_sorted = model.sorted_dimensions
     if not dims_sorted:
         st.error(t("assessment.no_dimensions"))
         return
@@ -1655,16 +1068,15 @@ def _own_target_step(aid: str) -> None:
 
         meta = st.session_state.meta
         fn = f"eigenes_ziel_{_safe_filename(meta.get('org',''))}_{_safe_filename(meta.get('date_str',''))}.json"
-        data = _export_own_targets_json(targets_now, model, meta) if can_export else b""
-
-        st.download_button(
-            t("assessment.download_custom_target"),
-            data=data,
-            file_name=fn,
-            mime="application/json",
-            use_container_width=True,
-            disabled=not can_export,
-        )
+        deferred_download_button(
+            t("assessment.download_custom_target"),
+            lambda: _export_own_targets_json(targets_now, model, meta),
+            fingerprint=state_fingerprint(targets_now, dict(meta), model.name),
+            file_name=fn,
+            mime="application/json",
+            key="rgm_download_own_target_step",
+            disabled=not can_export,
+        )
         st.caption(t("assessment.download_available"))
 
 
@@ -1684,11 +1096,16 @@ def _own_target_step(aid: str) -> None:
         placeholder=t("assessment.search_placeholder"),
     )
 
-    def _match(d: dict) -> bool:
+    # Kürzel/Name/Beschreibung über den Suchindex (Wortanfänge, Umlaute, Komposita, beide Sprachen)
+    index_codes = set(get_model_search_index().matching_codes(query)) if query.strip() else set()
+
+    def _match(d: Dimension) -> bool:
         if not query.strip():
             return True
         q = query.strip().lower()
-        return q in str(d.get("code", "")).lower() or q in str(d.get("name", "")).lower()
+        if d.code in index_codes:
+            return True
+        return q in d.code.lower() or q in d.name.lower()
 
     filtered = [d for d in dims_sorted if _match(d)]
 
@@ -1699,7 +1116,7 @@ def _own_target_step(aid: str) -> None:
     base_default = max(1, min(5, base_default))
 
     for dd in dims_sorted:
-        c = str(dd.get("code", "")).strip()
+        c = dd.code
         if not c:
             continue
         k_all = f"own_target_val_{c}"
@@ -1726,8 +1143,8 @@ def _own_target_step(aid: str) -> None:
             st.markdown(f"**{t('assessment.custom_target')}**")
 
         for d in filtered:
-            code = str(d.get("code", "")).strip()
-            name = str(d.get("name", "")).strip()
+            code = d.code
+            name = d.name
             k = f"own_target_val_{code}"
 
             r1, r2, r3 = st.columns([0.18, 0.52, 0.30], vertical_alignment="center")
@@ -1744,7 +1161,7 @@ def _own_target_step(aid: str) -> None:
     # Dirty auch VOR dem ersten Speichern erkennen
     dirty = False
     for dd in dims_sorted:
-        c = str(dd.get("code", "")).strip()
+        c = dd.code
         if not c:
             continue
 
@@ -1786,7 +1203,7 @@ def _own_target_step(aid: str) -> None:
     if save_clicked:
         targets: dict[str, float] = {}
         for d in dims_sorted:
-            code = str(d.get("code", "")).strip()
+            code = d.code
             val = st.session_state.get(f"own_target_val_{code}", None)
             if val not in options:
                 val = base_default
@@ -1832,9 +1249,10 @@ def _own_target_step(aid: str) -> None:
 # -----------------------------
 # Step 2: Fragen
 # -----------------------------
-def _render_dimension(dim: dict, glossary: dict, dim_idx: int, aid: str) -> None:
-    code = str(dim.get("code", "")).strip()
-    name = str(dim.get("name", "")).strip()
+def _render_dimension(dim: Dimension, glossary: GlossaryMatcher, dim_idx: int, aid: str, gating: GatingEngine) -> None:
+    code = dim.code
+    name = dim.name
+    tr = translator()
 
     st.subheader(f"{code} – {name}")
     _inject_glossary_link_css()
@@ -1850,9 +1268,8 @@ def _render_dimension(dim: dict, glossary: dict, dim_idx: int, aid: str) -> None
         "dim_code": code,
     }
 
-    process_profile = dim.get("process_profile", {}) or {}
-    has_any_profile = any(str(process_profile.get(k, "") or "").strip() for k in ["purpose", "results", "basic_practices", "work_products"])
-    if has_any_profile:
+    process_profile = dim.process_profile
+    if process_profile.has_content:
         with st.expander(t("assessment.process_profile"), expanded=False):
             _render_process_profile(process_profile, glossary, return_page, return_payload_base)
 
@@ -1879,96 +1296,35 @@ def _render_dimension(dim: dict, glossary: dict, dim_idx: int, aid: str) -> None
     st.markdown("---")
 
     dirty = False
-    levels = dim.get("levels", []) or []
-
-    def _prev_level_gate(prev_lvl: dict) -> tuple[bool, list[str], bool]:
-        """
-        Freischaltlogik für die nächste Stufe (auf Basis der Vorstufe):
-
-        OK (True), wenn:
-        - alle Fragen der Vorstufe entweder "Vollständig" oder "Nicht anwendbar" sind
-        - und mindestens eine Frage "Vollständig" ist
-
-        NICHT OK (False), wenn:
-        - mindestens eine Frage anders beantwortet wurde (oder unbeantwortet ist)
-        - oder wenn alle Fragen "Nicht anwendbar" sind
-
-        Returns:
-          ok: bool
-          blocking_nums: list[str]  -> Fragenummern, die das Freischalten verhindern
-          all_na: bool              -> True, wenn ALLE Fragen "Nicht anwendbar" sind
-        """
-        prev_no = int(prev_lvl.get("level_number", 0) or 0)
-        prev_questions = prev_lvl.get("questions", []) or []
-
-        total = 0
-        cnt_full = 0
-        cnt_na = 0
-        blocking: list[str] = []
-
-        for i, q in enumerate(prev_questions, start=1):
-            qid = q.get("id")
-            if not qid:
-                continue
-            total += 1
-
-            a = _get_answer(answers, qid)
-
-            if a == "Vollständig":
-                cnt_full += 1
-            elif a == "Nicht anwendbar":
-                cnt_na += 1
-            else:
-                # Alles andere (inkl. None/unbeantwortet) blockiert
-                blocking.append(f"{prev_no}.{i}")
-
-        # Edge: Keine Fragen in der Vorstufe -> freischalten
-        if total == 0:
-            return True, [], False
-
-        # Sonderfall: ALLES "Nicht anwendbar" -> NICHT freischalten
-        if cnt_na == total and cnt_full == 0 and not blocking:
-            return False, [], True
-
-        # Normalfall: Nur "Vollständig"/"Nicht anwendbar" und mind. 1x "Vollständig"
-        if not blocking and cnt_full >= 1 and (cnt_full + cnt_na == total):
-            return True, [], False
-
-        # Sonst blockiert (fehlend/andere Antworten/keine Vollständig)
-        return False, blocking, False
-
+    levels = dim.levels
 
     for li, lvl in enumerate(levels):
-        level_no = int(lvl.get("level_number", 0) or 0)
-        level_name = str(lvl.get("name", "") or "").strip()
+        level_no = lvl.level_number
+        level_name = lvl.name
 
         # ---------------------------------------------------------
         # Freischaltlogik:
         # ---------------------------------------------------------
-        if li > 0:
-            prev_lvl = levels[li - 1]
-            ok, _, _ = _prev_level_gate(prev_lvl)
-        
-            if not ok:
-                prev_no = int(prev_lvl.get("level_number", li) or li)
-                st.info(t("assessment.level_locked").format(level=level_no, prev=prev_no))
-                break  # weitere Stufen nicht rendern
+        # Stufe frei, wenn alle Stufen darunter erfüllt sind (nur "Vollständig"/"Nicht anwendbar",
+        # mind. einmal "Vollständig"); Regel und Zähler: core.gating / core.scoring.level_is_full
+        if li > 0 and not gating.is_unlocked(code, li):
+            prev_no = levels[li - 1].level_number or li
+            st.info(t("assessment.level_locked").format(level=level_no, prev=prev_no))
+            break  # weitere Stufen nicht rendern
 
         # --- ab hier dein bestehender Code für die Stufe ---
         st.markdown(f"**{t('assessment.level')} {level_no} – {level_name}**" if level_name else f"**{t('assessment.level')} {level_no}**")
         _render_level_info_expander(lvl, glossary, return_page, return_payload_base)
 
-        questions = lvl.get("questions", []) or []
-        for i, q in enumerate(questions, start=1):
-            qid_raw = q.get("id")
-            if not qid_raw:
+        for i, q in enumerate(lvl.questions, start=1):
+            if not q.id:
                 continue
-            qid = _qid_key(qid_raw)
+            qid = _qid_key(q.id)
 
             anchor_id = f"rgm-q-{_safe_dom_id(str(qid))}"
             st.markdown(f'<div id="{anchor_id}"></div>', unsafe_allow_html=True)
 
-            qtext = str(q.get("text", "") or "").strip()
+            qtext = q.text
 
             return_payload_q = dict(return_payload_base)
             return_payload_q["qid"] = str(qid)
@@ -1998,13 +1354,14 @@ def _render_dimension(dim: dict, glossary: dict, dim_idx: int, aid: str) -> None
                 index=(None if has_state else default_index),
                 key=k_widget,
                 label_visibility="collapsed",
-                format_func=answer_option_label,
+                format_func=tr.answer_option_label,
             )
 
             # --- Synchronisation: nur schreiben, wenn wirklich eine gültige Auswahl da ist ---
             if choice in ANSWER_OPTIONS:
                 if answers.get(qid) != choice:
                     answers[qid] = choice
+                    gating.set_answer(qid, choice)
                     dirty = True
             
         if li < len(levels) - 1:
@@ -2017,13 +1374,77 @@ def _render_dimension(dim: dict, glossary: dict, dim_idx: int, aid: str) -> None
     if dirty:
         persist.save(aid)
 
-def _questions_step(aid: str) -> None:
-    model = load_model_config()
-    glossary = model.get("glossary", {}) or {}
+_MODEL_SEARCH_KEY = "erhebung_model_search"
+_MODEL_SEARCH_LIMIT = 8
+
+
+def _jump_to_search_hit(target: SearchTarget, dim_idx: int | None, aid: str) -> None:
+    """
+    on_click eines Suchtreffers: springt zur Dimension (und ggf. Frage) oder ins Glossar.
+    """
+    st.session_state[_MODEL_SEARCH_KEY] = ""
+
+    if target.kind == KIND_GLOSSARY:
+        term = get_model_search_index().glossary_term(target.glossary_pos, get_language())
+        if not term:
+            return
+        cur_idx = int(st.session_state.get("erhebung_dim_idx", 0))
+        st.session_state["glossary_focus_term"] = term
+        st.session_state["nav_return_page"] = "Erhebung"
+        st.session_state["nav_return_payload"] = {
+            "erhebung_step": int(st.session_state.get("erhebung_step", 2)),
+            "erhebung_dim_idx": cur_idx,
+        }
+        st.session_state["nav_request"] = "Glossar"
+        persist.save(aid)
+        return
+
+    if dim_idx is None:
+        return
+    st.session_state["erhebung_dim_idx"] = int(dim_idx)
+    st.session_state["erhebung_dim_idx_ui"] = int(dim_idx)
+    if target.anchor_qid:
+        _request_scroll_to_qid(target.anchor_qid)
+    else:
+        _request_scroll_to_top()
+    persist.save(aid)
 
-    dims_sorted = _dims_sorted_from_model(model)
-    model_sorted = dict(model)
-    model_sorted["dimensions"] = dims_sorted
+
+def _render_model_search(dims_sorted: Sequence[Dimension], aid: str) -> None:
+    query = st.text_input(
+        t("assessment.model_search_label"),
+        key=_MODEL_SEARCH_KEY,
+        placeholder=t("assessment.model_search_placeholder"),
+    )
+    if not (query or "").strip():
+        return
+
+    hits = get_model_search_index().search(query, language=get_language(), limit=_MODEL_SEARCH_LIMIT)
+    if not hits:
+        st.info(t("assessment.no_search_results"))
+        return
+
+    idx_by_code = {d.code: i for i, d in enumerate(dims_sorted)}
+    for n, hit in enumerate(hits):
+        target = hit.target
+        label = f"{t(f'assessment.model_search_kind.{target.kind}')} · {hit.title}"
+        if target.kind != KIND_GLOSSARY and target.code and not hit.title.startswith(target.code):
+            label = f"{t(f'assessment.model_search_kind.{target.kind}')} · {target.code} · {hit.title}"
+        st.button(
+            label if len(label) <= 120 else label[:119] + "…",
+            key=f"erhebung_model_search_hit_{n}",
+            use_container_width=True,
+            on_click=_jump_to_search_hit,
+            args=(target, idx_by_code.get(target.code), aid),
+        )
+        if hit.snippet and hit.snippet != hit.title:
+            st.caption(hit.snippet)
+
+
+def _questions_step(aid: str) -> None:
+    model = load_model()
+    glossary = model.glossary_matcher
+    dims_sorted = model.sorted_dimensions
 
     st.markdown('<div id="rgm-page-top"></div>', unsafe_allow_html=True)
 
@@ -2076,29 +1497,32 @@ def _questions_step(aid: str) -> None:
         if target_label == "Eigenes Ziel" and st.session_state.get("erhebung_own_target_defined", False):
             targets_now: dict[str, float] = st.session_state.get("dimension_targets", {})
             fn = f"eigenes_ziel_{_safe_filename(meta.get('org',''))}_{_safe_filename(meta.get('date_str',''))}.json"
-            data = _export_own_targets_json(targets_now, model, meta)
-            st.download_button(
-                t("assessment.download_custom_target"),
-                data=data,
-                file_name=fn,
-                mime="application/json",
-                use_container_width=True,
-            )
+            deferred_download_button(
+                t("assessment.download_custom_target"),
+                lambda: _export_own_targets_json(targets_now, model, meta),
+                fingerprint=state_fingerprint(targets_now, dict(meta), model.name),
+                file_name=fn,
+                mime="application/json",
+                key="rgm_download_own_target",
+            )
         else:
             st.button(t("assessment.download_custom_target"), disabled=True, use_container_width=True, key="noop_download_own_target")
 
     st.markdown("---")
 
-    if not dims_sorted:
-        st.error(t("assessment.no_dimensions"))
-        return
+    if not dims_sorted:
+        st.error(t("assessment.no_dimensions"))
+        return
+
+    _render_model_search(dims_sorted, aid)
 
     idx = int(st.session_state.get("erhebung_dim_idx", 0))
     idx = min(max(idx, 0), len(dims_sorted) - 1)
     st.session_state.erhebung_dim_idx = idx
 
-    _render_dimension(dims_sorted[idx], glossary, idx, aid)
-    _footer_navigation(model_sorted, aid)
+    gating = _session_gating(model)
+    _render_dimension(dims_sorted[idx], glossary, idx, aid, gating)
+    _footer_navigation(model, aid, gating)
 
     _apply_scroll_request()
 
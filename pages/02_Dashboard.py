@@ -1,7 +1,6 @@
 # pages/02_Dashboard.py
 from __future__ import annotations
 
-import base64
 import html
 from typing import Any
 
@@ -9,13 +8,14 @@ import pandas as pd
 import streamlit as st
 import streamlit.components.v1 as components
 
-from core.model_loader import load_model_config
+from core.model_loader import load_mapped_model, load_model
 from core.overview import build_overview_table
 from core.charts import radar_ist_soll
 from core.state import init_session_state
-from core.exporter import make_csv_bytes
+from core.downloads import csv_data_href
 from core.i18n import get_language, t
 from core.maturity import calculate_current_maturity_averages
+from core.page_css import dashboard_css
 
 TD_BLUE = "#2F3DB8"
 OG_ORANGE = "#F28C28"
@@ -27,498 +27,7 @@ OG_ORANGE = "#F28C28"
 def _inject_dashboard_css() -> None:
     """Dashboard exakt wie Gesamtübersicht (Cards/Typo) + Measures-Table-Style + robustes components.html Layout."""
     dark = bool(st.session_state.get("ui_dark_mode", st.session_state.get("dark_mode", False)))
-
-    border = "rgba(255,255,255,0.12)" if dark else "rgba(0,0,0,0.10)"
-    soft_bg = "rgba(255,255,255,0.06)" if dark else "rgba(0,0,0,0.03)"
-    header_bg = "rgba(255,255,255,0.08)" if dark else "rgba(127,127,127,0.10)"
-    shadow = "0 12px 28px rgba(0,0,0,0.40)" if dark else "0 10px 24px rgba(0,0,0,0.06)"
-
-    card_bg = "rgba(255,255,255,0.05)" if dark else "rgba(255,255,255,1.00)"
-    card_solid = "#111827" if dark else "#ffffff"
-    text_color = "rgba(255,255,255,0.92)" if dark else "#111111"
-
-    df_bg = "#0f172a" if dark else "#ffffff"
-    df_header = "#0b1220" if dark else "#f3f4f6"
-    df_grid = "rgba(255,255,255,0.10)" if dark else "rgba(0,0,0,0.10)"
-    df_hover = "rgba(202,116,6,0.18)" if dark else "rgba(202,116,6,0.10)"
-    df_text = "rgba(250,250,250,0.92)" if dark else "#111111"
-    df_muted = "rgba(250,250,250,0.70)" if dark else "rgba(0,0,0,0.60)"
-
-    toolbar_bg = "rgba(17,24,39,0.85)" if dark else "rgba(255,255,255,0.92)"
-    toolbar_hover = "rgba(202,116,6,0.25)" if dark else "rgba(202,116,6,0.14)"
-    icon_green = "#639A00"
-
-    st.markdown(
-        f"""
-<style>
-  /* =========================
-     BASE-LOOK (wie Gesamtübersicht)
-     ========================= */
-  .rgm-page {{
-    max-width: 1200px;
-    margin: 0 auto;
-    padding-bottom: 6px;
-  }}
-
-  .rgm-h1 {{
-    font-size: 30px;
-    font-weight: 850;
-    line-height: 1.15;
-    margin: 0 0 6px 0;
-    color: var(--rgm-text, #111);
-  }}
-
-  .rgm-lead {{
-    font-size: 15px;
-    line-height: 1.75;
-    color: var(--rgm-text, #111);
-    opacity: 0.92;
-    margin: 0;
-  }}
-
-  .rgm-muted {{
-    font-size: 15px;
-    line-height: 1.75;
-    color: var(--rgm-text, #111);
-    opacity: 0.92;
-  }}
-
-  .rgm-hero {{
-    background: var(--rgm-card-solid, #fff);
-    border: 1px solid var(--rgm-border);
-    border-radius: 14px;
-    padding: 18px 18px 14px 18px;
-    box-shadow: var(--rgm-shadow);
-  }}
-
-  .rgm-accent-line {{
-    height: 3px;
-    width: 96px;
-    border-radius: 999px;
-    margin: 10px 0 14px 0;
-    background: linear-gradient(90deg, var(--rgm-td-blue), var(--rgm-og-orange));
-  }}
-
-  .rgm-divider {{
-    height: 1px;
-    width: 100%;
-    background: var(--rgm-border);
-    margin: 22px 0 16px 0;
-  }}
-
-  .rgm-section-title {{
-    font-weight: 850;
-    font-size: 16px;
-    margin: 0 0 14px 0;
-    color: var(--rgm-text);
-  }}
-
-  .rgm-maturity-grid {{
-    display: grid;
-    grid-template-columns: repeat(3, minmax(0, 1fr));
-    gap: 14px;
-    margin-top: 14px;
-  }}
-
-  .rgm-maturity-section {{
-    margin-top: 20px;
-  }}
-
-  .rgm-maturity-card {{
-    position: relative;
-    background: var(--rgm-card-solid);
-    border: 1px solid var(--rgm-border);
-    border-radius: 14px;
-    box-shadow: var(--rgm-shadow);
-    padding: 14px 16px;
-    min-height: 78px;
-    overflow: hidden;
-  }}
-
-  .rgm-maturity-card-total::before {{
-    content: "";
-    position: absolute;
-    top: 0;
-    left: 0;
-    right: 0;
-    height: 3px;
-    background: linear-gradient(90deg, var(--rgm-td-blue), var(--rgm-og-orange));
-  }}
-
-  .rgm-maturity-card-td {{ border: 2px solid var(--rgm-td-blue); }}
-  .rgm-maturity-card-og {{ border: 2px solid var(--rgm-og-orange); }}
-
-  .rgm-maturity-title {{
-    font-size: 14px;
-    font-weight: 850;
-    color: var(--rgm-text);
-    margin: 0 0 8px 0;
-    line-height: 1.25;
-  }}
-
-  .rgm-maturity-value {{
-    font-size: 18px;
-    font-weight: 900;
-    line-height: 1.2;
-    color: var(--rgm-text);
-    font-variant-numeric: tabular-nums;
-  }}
-
-  /* =========================
-     Tokens + Container
-     ========================= */
-  div[data-testid="stAppViewContainer"] {{
-    --rgm-td-blue: {TD_BLUE};
-    --rgm-og-orange: {OG_ORANGE};
-    --rgm-border: {border};
-    --rgm-soft: {soft_bg};
-    --rgm-header-bg: {header_bg};
-    --rgm-card-bg: {card_bg};
-    --rgm-card-solid: {card_solid};
-    --rgm-text: {text_color};
-    --rgm-df-bg: {df_bg};
-    --rgm-df-header: {df_header};
-    --rgm-df-grid: {df_grid};
-    --rgm-df-hover: {df_hover};
-    --rgm-df-text: {df_text};
-    --rgm-df-muted: {df_muted};
-    --rgm-toolbar-bg: {toolbar_bg};
-    --rgm-toolbar-hover: {toolbar_hover};
-    --rgm-icon-green: {icon_green};
-    --rgm-shadow: {shadow};
-  }}
-
-  div[data-testid="stAppViewContainer"] .block-container {{
-    max-width: 1200px;
-    margin: 0 auto;
-    padding-top: 1.0rem;
-    padding-bottom: 6.0rem;
-  }}
-
-  /* Anchor links aus */
-  a.anchor-link,
-  a.header-anchor,
-  a[data-testid="stHeaderLink"],
-  a[aria-label="Anchor link"],
-  a[data-testid="stMarkdownAnchorLink"],
-  svg[data-testid="stMarkdownAnchorIcon"] {{
-    display: none !important;
-  }}
-
-  button[kind="primary"] {{
-    border-radius: 12px !important;
-    font-weight: 850 !important;
-  }}
-
-  /* =========================
-     Plotly-Card wie Gesamtübersicht
-     (für st.plotly_chart – falls irgendwo verwendet)
-     ========================= */
-  div[data-testid="stPlotlyChart"]{{
-    background: var(--rgm-card-solid);
-    border: 1px solid var(--rgm-border);
-    border-radius: 14px;
-    box-shadow: var(--rgm-shadow);
-    padding: 12px 12px 10px 12px;
-    margin-top: 12px;
-    overflow: hidden;
-  }}
-
-  /* Modebar Look wie Gesamtübersicht */
-  div[data-testid="stPlotlyChart"] .js-plotly-plot .modebar{{
-    top: 10px !important;
-    right: 10px !important;
-    z-index: 50 !important;
-  }}
-  div[data-testid="stPlotlyChart"] .modebar{{ background: transparent !important; }}
-  div[data-testid="stPlotlyChart"] .modebar-group{{
-    background: var(--rgm-toolbar-bg) !important;
-    border: 1px solid var(--rgm-border) !important;
-    border-radius: 10px !important;
-    padding: 2px 4px !important;
-    box-shadow: 0 10px 22px rgba(0,0,0,0.25) !important;
-    backdrop-filter: blur(8px);
-    margin: 0 !important;
-  }}
-  div[data-testid="stPlotlyChart"] .modebar-btn path{{ fill: var(--rgm-text) !important; }}
-  div[data-testid="stPlotlyChart"] .modebar-btn:hover{{
-    background: var(--rgm-toolbar-hover) !important;
-    border-radius: 8px !important;
-  }}
-
-  /* =========================
-     Measures/Result-Card + Toolbar + Modal
-     ========================= */
-  .rgm-measures-card {{
-    position: relative;
-    --rgm-measures-toolbar-space: 44px;
-    padding-top: var(--rgm-measures-toolbar-space);
-    background: var(--rgm-card-solid);
-    border: 1px solid var(--rgm-border);
-    border-radius: 14px;
-    box-shadow: var(--rgm-shadow);
-    overflow: hidden;
-    margin-top: 12px;
-  }}
-
-  .rgm-measures-toolbar {{
-    position: absolute;
-    top: 2px;
-    right: 2px;
-    z-index: 30;
-    display: flex;
-    gap: 8px;
-    background: var(--rgm-toolbar-bg);
-    border: 1px solid var(--rgm-border);
-    border-radius: 10px;
-    padding: 4px 6px;
-    box-shadow: 0 10px 22px rgba(0,0,0,0.25);
-    backdrop-filter: blur(8px);
-  }}
-
-  a.rgm-tool-btn {{
-    width: 34px;
-    height: 30px;
-    border-radius: 8px;
-    border: 0;
-    background: transparent;
-    color: var(--rgm-icon-green);
-    text-decoration: none;
-    display: inline-flex;
-    align-items: center;
-    justify-content: center;
-    cursor: pointer;
-  }}
-  a.rgm-tool-btn:hover {{ background: var(--rgm-toolbar-hover); }}
-  .rgm-icon {{
-    width: 18px;
-    height: 18px;
-    display: block;
-  }}
-
-  .rgm-measures-scroll {{
-    max-height: calc(420px - var(--rgm-measures-toolbar-space));
-    overflow: auto;
-    background: var(--rgm-card-solid);
-  }}
-
-  table.rgm-measures-table thead th{{
-    background-color: var(--rgm-df-header) !important;
-    color: var(--rgm-df-text) !important;
-    opacity: 1 !important;
-    position: sticky;
-    top: 0;
-    z-index: 50;
-    border-bottom: 1px solid var(--rgm-df-grid) !important;
-    background-clip: padding-box;
-  }}
-
-  table.rgm-measures-table{{
-    width: 100%;
-    table-layout: fixed;
-  }}
-
-  td.rgm-num {{
-    text-align: right;
-    font-variant-numeric: tabular-nums;
-    white-space: nowrap;
-  }}
-
-  td.rgm-wrap {{
-    white-space: normal;
-    word-break: break-word;
-    overflow-wrap: anywhere;
-    line-height: 1.35;
-  }}
-
-  td.rgm-nowrap {{ white-space: nowrap; }}
-  .rgm-nowrap-cell{{
-    white-space: nowrap;
-    overflow: hidden;
-    text-overflow: ellipsis;
-    display: block;
-  }}
-
-  /* Clamp (nur inneres DIV) */
-  .rgm-cell {{
-    display: block;
-    white-space: normal;
-    word-break: break-word;
-    overflow-wrap: anywhere;
-    line-height: 1.35;
-  }}
-  .rgm-clamp-2 {{
-    display: -webkit-box;
-    -webkit-box-orient: vertical;
-    -webkit-line-clamp: 2;
-    overflow: hidden;
-  }}
-  .rgm-clamp-3 {{
-    display: -webkit-box;
-    -webkit-box-orient: vertical;
-    -webkit-line-clamp: 3;
-    overflow: hidden;
-  }}
-  .rgm-clamp-6 {{
-    display: -webkit-box;
-    -webkit-box-orient: vertical;
-    -webkit-line-clamp: 6;
-    overflow: hidden;
-  }}
-  .rgm-clamp-8 {{
-    display: -webkit-box;
-    -webkit-box-orient: vertical;
-    -webkit-line-clamp: 8;
-    overflow: hidden;
-  }}
-
-  /* Scrollbar */
-  .rgm-measures-scroll::-webkit-scrollbar {{ height: 10px; width: 10px; }}
-  .rgm-measures-scroll::-webkit-scrollbar-thumb {{
-    background: var(--rgm-df-grid);
-    border-radius: 999px;
-  }}
-  .rgm-measures-scroll::-webkit-scrollbar-track {{ background: transparent; }}
-
-  /* ===== Modal robust ===== */
-  #rgm-close {{
-    position: fixed;
-    top: 0;
-    left: 0;
-    width: 1px;
-    height: 1px;
-    opacity: 0;
-    pointer-events: none;
-  }}
-
-  .rgm-modal {{
-    display: none;
-    position: fixed;
-    inset: 0;
-    z-index: 2147483647;
-  }}
-  .rgm-modal:target {{
-    display: block;
-  }}
-
-  .rgm-modal-backdrop {{
-    position: absolute;
-    inset: 0;
-    background: rgba(0,0,0,0.55);
-    z-index: 0;
-    display: block;
-    text-decoration: none;
-  }}
-
-  .rgm-modal-content {{
-    position: absolute;
-    inset: 14px;
-    background: var(--rgm-card-solid);
-    border: 1px solid var(--rgm-border);
-    border-radius: 16px;
-    box-shadow: 0 16px 42px rgba(0,0,0,0.55);
-    overflow: hidden;
-    z-index: 1;
-  }}
-
-  .rgm-modal-header {{
-    display: flex;
-    align-items: center;
-    justify-content: space-between;
-    padding: 10px 12px;
-    border-bottom: 1px solid var(--rgm-border);
-    background: rgba(255,255,255,0.04);
-  }}
-
-  .rgm-modal-title {{
-    font-weight: 900;
-    color: var(--rgm-text);
-    font-size: 16px;
-  }}
-
-  a.rgm-modal-close {{
-    width: 40px;
-    height: 34px;
-    border-radius: 10px;
-    border: 1px solid var(--rgm-border);
-    background: var(--rgm-toolbar-bg);
-    color: var(--rgm-icon-green);
-    text-decoration: none;
-    display: inline-flex;
-    align-items: center;
-    justify-content: center;
-  }}
-  a.rgm-modal-close:hover {{
-    background: var(--rgm-toolbar-hover);
-  }}
-
-  .rgm-modal-body {{
-    height: calc(100% - 56px);
-    overflow: auto;
-    background: var(--rgm-card-solid);
-  }}
-
-  .rgm-modal-body table.rgm-measures-table thead th {{
-    position: sticky;
-    top: 0;
-    z-index: 20;
-    background-color: var(--rgm-df-header) !important;
-    border-bottom: 1px solid var(--rgm-df-grid) !important;
-    box-shadow: 0 1px 0 var(--rgm-df-grid);
-  }}
-
-  .rgm-modal-body table.rgm-measures-table {{
-    min-width: 980px;
-  }}
-
-  @media (max-width: 900px) {{
-    div[data-testid="stAppViewContainer"] .block-container {{
-      padding-left: 0.7rem;
-      padding-right: 0.7rem;
-    }}
-    .rgm-h1 {{ font-size: 26px; }}
-    .rgm-hero {{ padding: 16px; }}
-    .rgm-maturity-grid {{ grid-template-columns: 1fr; }}
-  }}
-
-  /* =========================================================
-     components.html / iframe – ROBUST (wie Gesamtübersicht)
-     ========================================================= */
-  div[data-testid="stAppViewContainer"] div[data-testid="stHtml"],
-  div[data-testid="stAppViewContainer"] div[data-testid="stHtml"] > div,
-  div[data-testid="stAppViewContainer"] div[data-testid="stCustomComponentV1"],
-  div[data-testid="stAppViewContainer"] div[data-testid="stCustomComponentV1"] > div,
-  div[data-testid="stAppViewContainer"] div[data-testid="stIFrame"],
-  div[data-testid="stAppViewContainer"] div[data-testid="stIFrame"] > div,
-  div[data-testid="stAppViewContainer"] div[data-testid="stIframe"],
-  div[data-testid="stAppViewContainer"] div[data-testid="stIframe"] > div {{
-    width: 100% !important;
-    max-width: 100% !important;
-    min-width: 0 !important;
-  }}
-
-  div[data-testid="stAppViewContainer"] div.element-container:has(iframe[title="streamlit.components.v1.html"]),
-  div[data-testid="stAppViewContainer"] div[data-testid="stElementContainer"]:has(iframe[title="streamlit.components.v1.html"]),
-  div[data-testid="stAppViewContainer"] div:has(> iframe[title="streamlit.components.v1.html"]) {{
-    width: 100% !important;
-    max-width: 100% !important;
-    display: block !important;
-    flex: 1 1 0% !important;
-    min-width: 0 !important;
-  }}
-
-  div[data-testid="stAppViewContainer"] iframe[title="streamlit.components.v1.html"],
-  div[data-testid="stAppViewContainer"] iframe[srcdoc] {{
-    width: 100% !important;
-    max-width: 100% !important;
-    min-width: 0 !important;
-    display: block !important;
-    border: 0 !important;
-  }}
-</style>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(dashboard_css(dark), unsafe_allow_html=True)
 
 
 # ---------------------------------------------------------------------
@@ -713,14 +222,11 @@ def _build_dashboard_result_table_html(df_view: pd.DataFrame, compact: bool) ->
 
 
 def _render_dashboard_result_table(df_view: pd.DataFrame, csv_filename: str = "ergebnis_tabelle.csv") -> None:
-    csv_bytes = make_csv_bytes(df_view)
+    csv_href = csv_data_href(df_view, key="dashboard_results_csv")
 
     if not str(csv_filename).lower().endswith(".csv"):
         csv_filename = f"{csv_filename}.csv"
 
-    csv_b64 = base64.b64encode(csv_bytes).decode("utf-8")
-    csv_href = f"data:text/csv;charset=utf-8;base64,{csv_b64}"
-
     modal_id = "rgmDashboardResultModal"
     download_svg, fullscreen_svg, close_svg = _icons_svg()
 
@@ -1535,7 +1041,8 @@ def main() -> None:
         unsafe_allow_html=True,
     )
 
-    model = load_model_config()
+    # Für die Übersicht genügt das Speicherabbild; ohne kompiliertes Modell das typisierte
+    model = load_mapped_model() or load_model()
 
     answers = get_answers()
     has_answers = bool(answers)
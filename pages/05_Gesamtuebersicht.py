@@ -1,7 +1,6 @@
 # /workspaces/unidoku/pages/05_Gesamtuebersicht.py
 from __future__ import annotations
 
-import base64
 import html
 from typing import Optional
 import json
@@ -12,12 +11,16 @@ import streamlit as st
 import streamlit.components.v1 as components
 
 from core.state import init_session_state
-from core.model_loader import load_model_config
+from core.model_loader import data_version, load_mapped_model, load_model
 from core.overview import build_overview_table
 from core.charts import radar_ist_soll
-from core.exporter import df_results_for_export, make_csv_bytes, make_pdf_bytes
-from core.i18n import get_language, priority_value_label, t, target_option_label
+from core.downloads import csv_data_href
+from core.downloads import state_fingerprint
+from core.export_jobs import ExportInputs, ensure_export_job, get_export_queue
+from core.exporter import df_results_for_export
+from core.i18n import get_language, priority_value_label, t, target_option_label, translator
 from core.maturity import calculate_current_maturity_averages
+from core.page_css import gesamtuebersicht_css
 
 TD_BLUE = "#2F3DB8"
 OG_ORANGE = "#F28C28"
@@ -41,953 +44,7 @@ def _pick_first_col(df: pd.DataFrame, candidates: list[str]) -> Optional[str]:
 def _inject_gesamtuebersicht_css() -> None:
     """Gesamtübersicht-Design (Cards/Typo) + Measures-Tabelle (Sticky Header + Toolbar) + Modal robust."""
     dark = bool(st.session_state.get("ui_dark_mode", st.session_state.get("dark_mode", False)))
-
-    border = "rgba(255,255,255,0.12)" if dark else "rgba(0,0,0,0.10)"
-    soft_bg = "rgba(255,255,255,0.06)" if dark else "rgba(0,0,0,0.03)"
-    header_bg = "rgba(255,255,255,0.08)" if dark else "rgba(127,127,127,0.10)"
-    shadow = "0 12px 28px rgba(0,0,0,0.40)" if dark else "0 10px 24px rgba(0,0,0,0.06)"
-
-    card_bg = "rgba(255,255,255,0.05)" if dark else "rgba(255,255,255,1.00)"
-    card_solid = "#111827" if dark else "#ffffff"
-    text_color = "rgba(255,255,255,0.92)" if dark else "#111111"
-
-    df_bg = "#0f172a" if dark else "#ffffff"
-    df_header = "#0b1220" if dark else "#f3f4f6"
-    df_grid = "rgba(255,255,255,0.10)" if dark else "rgba(0,0,0,0.10)"
-    df_hover = "rgba(202,116,6,0.18)" if dark else "rgba(202,116,6,0.10)"
-    df_text = "rgba(250,250,250,0.92)" if dark else "#111111"
-    df_muted = "rgba(250,250,250,0.70)" if dark else "rgba(0,0,0,0.60)"
-
-    # Toolbar-Look (wie Tabelle) + grüne Icons
-    toolbar_bg = "rgba(17,24,39,0.85)" if dark else "rgba(255,255,255,0.92)"
-    toolbar_hover = "rgba(202,116,6,0.25)" if dark else "rgba(202,116,6,0.14)"
-    icon_green = "#639A00"
-
-    st.markdown(
-        f"""
-<style>
-   /* =========================
-   BASE-LOOK (wie fertige Seiten)
-   ========================= */
-  .rgm-page {{
-    max-width: 1200px;
-    margin: 0 auto;
-    padding-bottom: 6px;
-  }}
-
-  .rgm-h1 {{
-    font-size: 30px;
-    font-weight: 850;
-    line-height: 1.15;
-    margin: 0 0 6px 0;
-    color: var(--rgm-text, #111);
-  }}
-
-  .rgm-lead {{
-    font-size: 15px;
-    line-height: 1.75;
-    color: var(--rgm-text, #111);
-    opacity: 0.92;
-    margin: 0;
-  }}
-
-  .rgm-muted {{
-    font-size: 15px;
-    line-height: 1.75;
-    color: var(--rgm-text, #111);
-    opacity: 0.92;
-  }}
-
-  .rgm-hero {{
-    background: var(--rgm-card-solid, #fff);
-    border: 1px solid var(--rgm-border);
-    border-radius: 14px;
-    padding: 18px 18px 14px 18px;
-    box-shadow: var(--rgm-shadow);
-  }}
-
-  .rgm-accent-line {{
-    height: 3px;
-    width: 96px;
-    border-radius: 999px;
-    margin: 10px 0 14px 0;
-    background: linear-gradient(90deg, var(--rgm-td-blue), var(--rgm-og-orange));
-  }}
-
-  .rgm-card-title {{
-    font-weight: 850;
-    font-size: 15px;
-    margin: 0 0 10px 0;
-    color: var(--rgm-text);
-  }}
-
-  /* =========================
-     Tokens + Container
-     ========================= */
-  div[data-testid="stAppViewContainer"] {{
-    --rgm-td-blue: {TD_BLUE};
-    --rgm-og-orange: {OG_ORANGE};
-    --rgm-border: {border};
-    --rgm-soft: {soft_bg};
-    --rgm-header-bg: {header_bg};
-    --rgm-card-bg: {card_bg};
-    --rgm-card-solid: {card_solid};
-    --rgm-text: {text_color};
-    --rgm-df-bg: {df_bg};
-    --rgm-df-header: {df_header};
-    --rgm-df-grid: {df_grid};
-    --rgm-df-hover: {df_hover};
-    --rgm-df-text: {df_text};
-    --rgm-df-muted: {df_muted};
-    --rgm-toolbar-bg: {toolbar_bg};
-    --rgm-toolbar-hover: {toolbar_hover};
-    --rgm-icon-green: {icon_green};
-    --rgm-shadow: {shadow};
-  }}
-
-  div[data-testid="stAppViewContainer"] .block-container {{
-    max-width: 1200px;
-    margin: 0 auto;
-    padding-top: 1.0rem;
-    padding-bottom: 6.0rem;
-  }}
-
-  /* Anchor links aus */
-  a.anchor-link,
-  a.header-anchor,
-  a[data-testid="stHeaderLink"],
-  a[aria-label="Anchor link"],
-  a[data-testid="stMarkdownAnchorLink"],
-  svg[data-testid="stMarkdownAnchorIcon"] {{
-    display: none !important;
-  }}
-
-  .rgm-divider {{
-    height: 1px;
-    width: 100%;
-    background: var(--rgm-border);
-    margin: 22px 0 16px 0;
-  }}
-
-  .rgm-section-title {{
-    font-weight: 850;
-    font-size: 16px;
-    margin: 0 0 14px 0;
-    color: var(--rgm-text);
-  }}
-
-
-  /* =========================
-   Plotly-Card wie Dashboard
-   ========================= */
-  div[data-testid="stPlotlyChart"]{{
-    background: var(--rgm-card-solid);
-    border: 1px solid var(--rgm-border);
-    border-radius: 14px;
-    box-shadow: var(--rgm-shadow);
-    padding: 12px 12px 10px 12px;
-    margin-top: 12px;
-    overflow: hidden; /* wie Dashboard (Modebar wird nach innen verschoben) */
-  }}
-
-  /* =========================
-     Plotly Modebar wie Dashboard (Download + Fullscreen sauber sichtbar)
-     ========================= */
-  div[data-testid="stPlotlyChart"] .js-plotly-plot .modebar{{
-    top: 10px !important;
-    right: 10px !important;
-    z-index: 50 !important;
-  }}
-
-  div[data-testid="stPlotlyChart"] .modebar{{
-    background: transparent !important;
-  }}
-
-  div[data-testid="stPlotlyChart"] .modebar-group{{
-    background: var(--rgm-toolbar-bg) !important;
-    border: 1px solid var(--rgm-border) !important;
-    border-radius: 10px !important;
-    padding: 2px 4px !important;
-    box-shadow: 0 10px 22px rgba(0,0,0,0.25) !important;
-    backdrop-filter: blur(8px);
-    margin: 0 !important;
-  }}
-
-  div[data-testid="stPlotlyChart"] .modebar-btn path{{
-    fill: var(--rgm-text) !important;
-  }}
-  div[data-testid="stPlotlyChart"] .modebar-btn:hover{{
-    background: var(--rgm-toolbar-hover) !important;
-    border-radius: 8px !important;
-  }}
-
-  @media (max-width: 900px){{
-    div[data-testid="stPlotlyChart"] .js-plotly-plot .modebar{{
-      top: 8px !important;
-      right: 8px !important;
-    }}
-  }}
-
-
-  button[kind="primary"] {{
-    border-radius: 12px !important;
-    font-weight: 850 !important;
-  }}
-  
-    /* =========================
-     Export: Download Buttons (PDF + JSON) -> TU Grün / Hover TU-Orange (ROBUST)
-     Marker steht DIREKT vor dem Download-Widget.
-     ========================= */
-
-  /* ----- Base Button (PDF + JSON) ----- */
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_pdf)
-    + div[data-testid="stElementContainer"]
-    div[data-testid="stDownloadButton"] button,
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_json)
-    + div[data-testid="stElementContainer"]
-    div[data-testid="stDownloadButton"] button,
-  div.element-container:has(div#rgm_overview_export_btn_pdf)
-    + div.element-container
-    div[data-testid="stDownloadButton"] button,
-  div.element-container:has(div#rgm_overview_export_btn_json)
-    + div.element-container
-    div[data-testid="stDownloadButton"] button,
-
-  /* Fallback: manche Versionen nutzen .stDownloadButton */
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_pdf)
-    + div[data-testid="stElementContainer"]
-    div.stDownloadButton button,
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_json)
-    + div[data-testid="stElementContainer"]
-    div.stDownloadButton button,
-  div.element-container:has(div#rgm_overview_export_btn_pdf)
-    + div.element-container
-    div.stDownloadButton button,
-  div.element-container:has(div#rgm_overview_export_btn_json)
-    + div.element-container
-    div.stDownloadButton button {{
-
-    background: var(--rgm-icon-green) !important;
-    background-color: var(--rgm-icon-green) !important;
-    color: #ffffff !important;
-
-    border: 1px solid rgba(0,0,0,0.10) !important;
-    border-radius: 12px !important;
-    font-weight: 850 !important;
-
-    box-shadow: 0 10px 22px rgba(0,0,0,0.12) !important;
-    filter: none !important;
-  }}
-
-  /* Text/Spans im Button auch weiß erzwingen */
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_pdf)
-    + div[data-testid="stElementContainer"]
-    div[data-testid="stDownloadButton"] button *,
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_json)
-    + div[data-testid="stElementContainer"]
-    div[data-testid="stDownloadButton"] button *,
-  div.element-container:has(div#rgm_overview_export_btn_pdf)
-    + div.element-container
-    div[data-testid="stDownloadButton"] button *,
-  div.element-container:has(div#rgm_overview_export_btn_json)
-    + div.element-container
-    div[data-testid="stDownloadButton"] button *,
-
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_pdf)
-    + div[data-testid="stElementContainer"]
-    div.stDownloadButton button *,
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_json)
-    + div[data-testid="stElementContainer"]
-    div.stDownloadButton button *,
-  div.element-container:has(div#rgm_overview_export_btn_pdf)
-    + div.element-container
-    div.stDownloadButton button *,
-  div.element-container:has(div#rgm_overview_export_btn_json)
-    + div.element-container
-    div.stDownloadButton button * {{
-
-    color: #ffffff !important;
-  }}
-
-  /* Hover: kräftig TU-Orange (#CA7406) */
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_pdf)
-    + div[data-testid="stElementContainer"]
-    div[data-testid="stDownloadButton"] button:hover,
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_json)
-    + div[data-testid="stElementContainer"]
-    div[data-testid="stDownloadButton"] button:hover,
-  div.element-container:has(div#rgm_overview_export_btn_pdf)
-    + div.element-container
-    div[data-testid="stDownloadButton"] button:hover,
-  div.element-container:has(div#rgm_overview_export_btn_json)
-    + div.element-container
-    div[data-testid="stDownloadButton"] button:hover,
-
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_pdf)
-    + div[data-testid="stElementContainer"]
-    div.stDownloadButton button:hover,
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_json)
-    + div[data-testid="stElementContainer"]
-    div.stDownloadButton button:hover,
-  div.element-container:has(div#rgm_overview_export_btn_pdf)
-    + div.element-container
-    div.stDownloadButton button:hover,
-  div.element-container:has(div#rgm_overview_export_btn_json)
-    + div.element-container
-    div.stDownloadButton button:hover {{
-
-    background: #CA7406 !important;
-    background-color: #CA7406 !important;
-    border-color: #CA7406 !important;
-    color: #ffffff !important;
-    filter: none !important;
-  }}
-
-  /* Active: leicht dunkler */
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_pdf)
-    + div[data-testid="stElementContainer"]
-    div[data-testid="stDownloadButton"] button:active,
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_json)
-    + div[data-testid="stElementContainer"]
-    div[data-testid="stDownloadButton"] button:active,
-  div.element-container:has(div#rgm_overview_export_btn_pdf)
-    + div.element-container
-    div[data-testid="stDownloadButton"] button:active,
-  div.element-container:has(div#rgm_overview_export_btn_json)
-    + div.element-container
-    div[data-testid="stDownloadButton"] button:active,
-
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_pdf)
-    + div[data-testid="stElementContainer"]
-    div.stDownloadButton button:active,
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_json)
-    + div[data-testid="stElementContainer"]
-    div.stDownloadButton button:active,
-  div.element-container:has(div#rgm_overview_export_btn_pdf)
-    + div.element-container
-    div.stDownloadButton button:active,
-  div.element-container:has(div#rgm_overview_export_btn_json)
-    + div.element-container
-    div.stDownloadButton button:active {{
-
-    background: #CA7406 !important;
-    background-color: #CA7406 !important;
-    border-color: #CA7406 !important;
-    filter: brightness(0.92) !important;
-  }}
-
-  /* Disabled */
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_pdf)
-    + div[data-testid="stElementContainer"]
-    div[data-testid="stDownloadButton"] button:disabled,
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_export_btn_json)
-    + div[data-testid="stElementContainer"]
-    div[data-testid="stDownloadButton"] button:disabled,
-  div.element-container:has(div#rgm_overview_export_btn_pdf)
-    + div.element-container
-    div[data-testid="stDownloadButton"] button:disabled,
-  div.element-container:has(div#rgm_overview_export_btn_json)
-    + div.element-container
-    div[data-testid="stDownloadButton"] button:disabled {{
-
-    opacity: 0.55 !important;
-    cursor: not-allowed !important;
-  }}
-
-
-  /* =========================
-   SECTION-CARDS (Marker -> nächstes Element)
-   ========================= */
-
-  /* Marker selbst soll keinen Platz belegen */
-  #rgm_overview_meta,
-  #rgm_overview_kpis,
-  #rgm_overview_filters,
-  #rgm_overview_export,
-  #rgm_overview_export_btn_pdf,
-  #rgm_overview_export_btn_json,
-  #rgm_overview_empty {{
-    height: 0 !important;
-    margin: 0 !important;
-    padding: 0 !important;
-    overflow: hidden !important;
-  }}
-
-  /* Der Block NACH dem Marker wird als Card gestylt */
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_meta) + div[data-testid="stElementContainer"] > div,
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_kpis) + div[data-testid="stElementContainer"] > div,
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_filters) + div[data-testid="stElementContainer"] > div,
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_export) + div[data-testid="stElementContainer"] > div,
-  div[data-testid="stElementContainer"]:has(div#rgm_overview_empty) + div[data-testid="stElementContainer"] > div,
-
-  /* Fallback für manche Streamlit-Versionen */
-  div.element-container:has(div#rgm_overview_meta) + div.element-container > div,
-  div.element-container:has(div#rgm_overview_kpis) + div.element-container > div,
-  div.element-container:has(div#rgm_overview_filters) + div.element-container > div,
-  div.element-container:has(div#rgm_overview_export) + div.element-container > div,
-  div.element-container:has(div#rgm_overview_empty) + div.element-container > div {{
-    background: var(--rgm-card-solid);
-    border: 1px solid var(--rgm-border);
-    border-radius: 14px;
-    box-shadow: var(--rgm-shadow);
-    padding: 14px 16px;
-    margin-top: 12px;
-    overflow: hidden;
-  }}
-  
-  /* Key-Value Grid für "Angaben zur Erhebung" */
-  .rgm-kv {{
-    display: grid;
-    grid-template-columns: 1fr 1fr;
-    gap: 6px 28px;
-    margin-top: 6px;
-  }}
-  .rgm-kv-row{{
-    display:flex;
-    justify-content: space-between;
-    gap: 12px;
-    padding: 8px 0;
-    border-bottom: 1px solid var(--rgm-border);
-  }}
-  
-  .rgm-kv-col{{ min-width: 0; }}
-  .rgm-kv-col .rgm-kv-row:last-child{{ border-bottom: 0; }}
-  .rgm-kv-row{{ align-items: center; }}
-  .rgm-k{{ min-width: 0; white-space: normal; }}
-  .rgm-v{{ max-width: 55%; }}
-
-  .rgm-k {{
-    font-weight: 500;
-    color: var(--rgm-text);
-    opacity: 0.78;
-    white-space: nowrap;
-  }}
-  .rgm-v {{
-    font-weight: 500;
-    font-variant-numeric: tabular-nums;
-    color: var(--rgm-text);
-    opacity: 0.92;
-    text-align: right;
-  }}
-
-  /* Mobile: einspaltig */
-  @media (max-width: 900px){{
-    .rgm-kv {{ grid-template-columns: 1fr; }}
-    .rgm-v {{ text-align: left; }}
-  }}
-  
-  /* =========================
-     KPI-LOOK (st.metric) wie Dashboard-Kacheln
-     ========================= */
-  div[data-testid="stMetric"],
-  div[data-testid="stMetric"] > div {{
-    background: var(--rgm-soft) !important;
-    border: 1px solid var(--rgm-border) !important;
-    border-radius: 14px !important;
-  }}
-
-  div[data-testid="stMetric"] {{
-    padding: 14px 14px !important;
-    box-shadow: 0 10px 22px rgba(0,0,0,0.08) !important;
-  }}
-
-  /* Label */
-  div[data-testid="stMetric"] [data-testid="stMetricLabel"] p {{
-    margin: 0 !important;
-    font-weight: 800 !important;
-    opacity: 0.78 !important;
-    color: var(--rgm-text) !important;
-    letter-spacing: 0.2px;
-  }}
-
-  /* Value */
-  div[data-testid="stMetric"] [data-testid="stMetricValue"] {{
-    margin-top: 6px !important;
-  }}
-  div[data-testid="stMetric"] [data-testid="stMetricValue"] > div {{
-    font-weight: 900 !important;
-    font-size: 34px !important;
-    line-height: 1.1 !important;
-    color: var(--rgm-text) !important;
-  }}
-  
-  /* Mini-Panels für TD/OG-Kennzahlen (kompakt, elegant) */
-  .rgm-kpi-mini{{
-    padding: 12px 14px;
-  }}
-
-  .rgm-kpi-mini-title{{
-    font-weight: 850;
-    font-size: 13px;
-    margin: 0 0 8px 0;
-    color: var(--rgm-text);
-  }}
-
-  .rgm-kpi-line{{
-    display:flex;
-    justify-content: space-between;
-    gap: 12px;
-    padding: 8px 0;
-    border-top: 1px solid var(--rgm-border);
-  }}
-
-  .rgm-kpi-line:first-of-type{{ border-top: 0; }}
-
-  .rgm-kpi-line .k{{
-    font-weight: 500;
-    opacity: 0.78;
-    color: var(--rgm-text);
-  }}
-
-  .rgm-kpi-line .v{{
-    font-weight: 850;
-    color: var(--rgm-text);
-  }}
-  
-  /* Grid innerhalb der Kennzahlen-Card (2 Spalten, mobil 1 Spalte) */
-  .rgm-kpi-grid{{
-    display: grid;
-    grid-template-columns: repeat(2, minmax(0, 1fr));
-    gap: 14px;
-    padding: 6px;
-    box-sizing: border-box;
-  }}
-
-  .rgm-kpi-stack{{
-    display: grid;
-    gap: 14px;
-  }}
-
-  .rgm-kpi-overall{{
-    margin: 6px;
-  }}
-
-  .rgm-maturity-card{{
-    position: relative;
-    background: var(--rgm-card-solid);
-    border: 1px solid var(--rgm-border);
-    border-radius: 14px;
-    box-shadow: var(--rgm-shadow);
-    padding: 14px 16px;
-    overflow: hidden;
-  }}
-
-  .rgm-maturity-card-total::before{{
-    content: "";
-    position: absolute;
-    top: 0;
-    left: 0;
-    right: 0;
-    height: 3px;
-    background: linear-gradient(90deg, var(--rgm-td-blue), var(--rgm-og-orange));
-  }}
-
-  .rgm-maturity-eyebrow{{
-    font-size: 12px;
-    font-weight: 800;
-    color: var(--rgm-text);
-    opacity: 0.70;
-    margin: 0 0 3px 0;
-  }}
-
-  .rgm-maturity-row{{
-    display: flex;
-    align-items: flex-end;
-    justify-content: space-between;
-    gap: 16px;
-  }}
-
-  .rgm-maturity-title{{
-    font-size: 14px;
-    font-weight: 850;
-    color: var(--rgm-text);
-    margin: 0;
-    line-height: 1.25;
-  }}
-
-  .rgm-maturity-value{{
-    font-size: 18px;
-    font-weight: 900;
-    line-height: 1.2;
-    color: var(--rgm-text);
-    font-variant-numeric: tabular-nums;
-  }}
-
-  @media (max-width: 900px){{
-    .rgm-kpi-grid{{ grid-template-columns: 1fr; }}
-    .rgm-maturity-row{{ align-items: flex-start; flex-direction: column; }}
-  }}
-  
-  /* Cards wie in 00_Einfuehrung.py */
-  .rgm-card{{
-    background: var(--rgm-card-solid);
-    border: 1px solid var(--rgm-border);
-    border-radius: 14px;
-    padding: 16px 18px;
-    box-shadow: var(--rgm-shadow);
-  }}
-
-  .rgm-card-td{{ border: 2px solid var(--rgm-td-blue); }}
-  .rgm-card-og{{ border: 2px solid var(--rgm-og-orange); }}
-
-  /* =========================
-     Alerts (st.warning/info/error) optisch ruhiger
-     ========================= */
-  div[data-testid="stAlert"] {{
-    border-radius: 14px !important;
-    border: 1px solid var(--rgm-border) !important;
-    box-shadow: 0 10px 22px rgba(0,0,0,0.06) !important;
-  }}
-  div[data-testid="stAlert"] p {{
-    margin: 0.15rem 0 !important;
-  }}
-  
-  /* =========================
-     Maßnahmen-Card + Toolbar (Modebar-Look)
-     ========================= */
-  .rgm-measures-card {{
-    position: relative;
-    --rgm-measures-toolbar-space: 44px;
-    padding-top: var(--rgm-measures-toolbar-space);
-    background: var(--rgm-card-solid);
-    border: 1px solid var(--rgm-border);
-    border-radius: 14px;
-    box-shadow: var(--rgm-shadow);
-    overflow: hidden;
-    margin-top: 12px;
-  }}
-
-  .rgm-measures-toolbar {{
-    position: absolute;
-    top: 2px;
-    right: 2px;
-    z-index: 30;
-    display: flex;
-    gap: 8px;
-    background: var(--rgm-toolbar-bg);
-    border: 1px solid var(--rgm-border);
-    border-radius: 10px;
-    padding: 4px 6px;
-    box-shadow: 0 10px 22px rgba(0,0,0,0.25);
-    backdrop-filter: blur(8px);
-  }}
-
-  a.rgm-tool-btn {{
-    width: 34px;
-    height: 30px;
-    border-radius: 8px;
-    border: 0;
-    background: transparent;
-    color: var(--rgm-icon-green);
-    text-decoration: none;
-    display: inline-flex;
-    align-items: center;
-    justify-content: center;
-    cursor: pointer;
-  }}
-  a.rgm-tool-btn:hover {{
-    background: var(--rgm-toolbar-hover);
-  }}
-  .rgm-icon {{
-    width: 18px;
-    height: 18px;
-    display: block;
-  }}
-
-  .rgm-measures-scroll {{
-    max-height: calc(420px - var(--rgm-measures-toolbar-space));
-    overflow: auto;
-    background: var(--rgm-card-solid);
-  }}
-
-  td.rgm-num {{
-    text-align: right;
-    font-variant-numeric: tabular-nums;
-    white-space: nowrap;
-  }}
-
-  td.rgm-wrap {{
-    white-space: normal;
-    word-break: break-word;
-    overflow-wrap: anywhere;
-    line-height: 1.35;
-  }}
-
-  /* Clamp NUR über inneres DIV (niemals auf <td>) */
-  .rgm-cell {{
-    display: block;
-    white-space: normal;
-    word-break: break-word;
-    overflow-wrap: anywhere;
-    line-height: 1.35;
-  }}
-  .rgm-clamp-1 {{
-    display: -webkit-box;
-    -webkit-box-orient: vertical;
-    -webkit-line-clamp: 1;
-    overflow: hidden;
-  }}
-  .rgm-clamp-2 {{
-    display: -webkit-box;
-    -webkit-box-orient: vertical;
-    -webkit-line-clamp: 2;
-    overflow: hidden;
-  }}
-  .rgm-clamp-3 {{
-    display: -webkit-box;
-    -webkit-box-orient: vertical;
-    -webkit-line-clamp: 3;
-    overflow: hidden;
-  }}
-  .rgm-clamp-4 {{
-    display: -webkit-box;
-    -webkit-box-orient: vertical;
-    -webkit-line-clamp: 4;
-    overflow: hidden;
-  }}
-  .rgm-clamp-6 {{
-    display: -webkit-box;
-    -webkit-box-orient: vertical;
-    -webkit-line-clamp: 6;
-    overflow: hidden;
-  }}
-  .rgm-clamp-8 {{
-    display: -webkit-box;
-    -webkit-box-orient: vertical;
-    -webkit-line-clamp: 8;
-    overflow: hidden;
-  }}
-  .rgm-clamp-10 {{
-    display: -webkit-box;
-    -webkit-box-orient: vertical;
-    -webkit-line-clamp: 10;
-    overflow: hidden;
-  }}
-
-  /* Scrollbar */
-  .rgm-measures-scroll::-webkit-scrollbar {{ height: 10px; width: 10px; }}
-  .rgm-measures-scroll::-webkit-scrollbar-thumb {{
-    background: var(--rgm-df-grid);
-    border-radius: 999px;
-  }}
-  .rgm-measures-scroll::-webkit-scrollbar-track {{ background: transparent; }}
-  
-  /* Measures-Tabelle: Header immer deckend (kein Durchscheinen) */
-  table.rgm-measures-table thead th{{
-    background-color: var(--rgm-df-header) !important;  /* SOLID */
-    color: var(--rgm-df-text) !important;
-    opacity: 1 !important;
-    position: sticky;
-    top: 0;
-    z-index: 50;
-    border-bottom: 1px solid var(--rgm-df-grid) !important;
-
-    /* optional, verhindert Artefakte bei Sticky */
-    background-clip: padding-box;
-  }}
-  
-  table.rgm-measures-table{{
-    width: 100%;
-    table-layout: fixed;
-  }}
-  
-  td.rgm-nowrap {{ white-space: nowrap; }}
-  .rgm-nowrap-cell{{
-    white-space: nowrap;
-    overflow: hidden;
-    text-overflow: ellipsis;
-    display: block;
-  }}
-
-  /* =========================
-     Vollbild-Modal (robust, ohne Code-Text)
-     ========================= */
-  #rgm-close {{
-    position: fixed;
-    top: 0;
-    left: 0;
-    width: 1px;
-    height: 1px;
-    opacity: 0;
-    pointer-events: none;
-  }}
-
-  .rgm-modal {{
-    display: none;
-    position: fixed;
-    inset: 0;
-    z-index: 2147483647;
-  }}
-  .rgm-modal:target {{
-    display: block;
-  }}
-
-  .rgm-modal-backdrop {{
-    position: absolute;
-    inset: 0;
-    background: rgba(0,0,0,0.55);
-    z-index: 0;
-    display: block;
-    text-decoration: none;
-  }}
-
-  .rgm-modal-content {{
-    position: absolute;
-    inset: 14px;
-    background: var(--rgm-card-solid);
-    border: 1px solid var(--rgm-border);
-    border-radius: 16px;
-    box-shadow: 0 16px 42px rgba(0,0,0,0.55);
-    overflow: hidden;
-    z-index: 1;
-  }}
-
-  .rgm-modal-header {{
-    display: flex;
-    align-items: center;
-    justify-content: space-between;
-    padding: 10px 12px;
-    border-bottom: 1px solid var(--rgm-border);
-    background: rgba(255,255,255,0.04);
-  }}
-
-  .rgm-modal-title {{
-    font-weight: 900;
-    color: var(--rgm-text);
-    font-size: 16px;
-  }}
-
-  a.rgm-modal-close {{
-    width: 40px;
-    height: 34px;
-    border-radius: 10px;
-    border: 1px solid var(--rgm-border);
-    background: var(--rgm-toolbar-bg);
-    color: var(--rgm-icon-green);
-    text-decoration: none;
-    display: inline-flex;
-    align-items: center;
-    justify-content: center;
-  }}
-  a.rgm-modal-close:hover {{
-    background: var(--rgm-toolbar-hover);
-  }}
-
-  .rgm-modal-body {{
-    height: calc(100% - 56px);
-    overflow: auto;
-    background: var(--rgm-card-solid);
-  }}
-
-  /* Modal: Sticky Header + Separator */
-  .rgm-modal-body table.rgm-measures-table thead th {{
-    position: sticky;
-    top: 0;
-    z-index: 20;
-    background-color: var(--rgm-df-header) !important;
-    border-bottom: 1px solid var(--rgm-df-grid) !important;
-    box-shadow: 0 1px 0 var(--rgm-df-grid);
-  }}
-
-
-  /* Im Modal horizontal scrollen, falls nötig */
-  .rgm-modal-body table.rgm-measures-table {{
-    min-width: 1180px;
-  }}
-
-  @media (max-width: 900px) {{
-    div[data-testid="stAppViewContainer"] .block-container {{
-    padding-left: 0.7rem;
-    padding-right: 0.7rem;}}
-    .rgm-h1 {{ font-size: 26px; }}
-    .rgm-hero {{ padding: 16px; }}
-  }}
-
-  /* =========================================================
-     components.html / iframe – ROBUST (dedupliziert)
-     - volle Breite in Columns/Containers
-     - Plot-Row (2 Cards) nutzt gleiche Spaltenbreite
-     ========================================================= */
-
-  /* Wrapper, in denen components.html landet (variiert je nach Streamlit-Version) */
-  div[data-testid="stAppViewContainer"] div[data-testid="stHtml"],
-  div[data-testid="stAppViewContainer"] div[data-testid="stHtml"] > div,
-  div[data-testid="stAppViewContainer"] div[data-testid="stCustomComponentV1"],
-  div[data-testid="stAppViewContainer"] div[data-testid="stCustomComponentV1"] > div,
-  div[data-testid="stAppViewContainer"] div[data-testid="stIFrame"],
-  div[data-testid="stAppViewContainer"] div[data-testid="stIFrame"] > div,
-  div[data-testid="stAppViewContainer"] div[data-testid="stIframe"],
-  div[data-testid="stAppViewContainer"] div[data-testid="stIframe"] > div {{
-    width: 100% !important;
-    max-width: 100% !important;
-    min-width: 0 !important;
-  }}
-
-  /* Element-Container/Parent, der das iframe hält */
-  div[data-testid="stAppViewContainer"] div.element-container:has(iframe[title="streamlit.components.v1.html"]),
-  div[data-testid="stAppViewContainer"] div[data-testid="stElementContainer"]:has(iframe[title="streamlit.components.v1.html"]),
-  div[data-testid="stAppViewContainer"] div:has(> iframe[title="streamlit.components.v1.html"]) {{
-    width: 100% !important;
-    max-width: 100% !important;
-    display: block !important;
-    flex: 1 1 0% !important;
-    min-width: 0 !important;
-  }}
-
-  /* iframe selbst */
-  div[data-testid="stAppViewContainer"] iframe[title="streamlit.components.v1.html"],
-  div[data-testid="stAppViewContainer"] iframe[srcdoc] {{
-    width: 100% !important;
-    max-width: 100% !important;
-    min-width: 0 !important;
-    display: block !important;
-    border: 0 !important;
-  }}
-
-  /* Row mit components.html: Columns müssen strecken und wirklich gleich breit sein */
-  div[data-testid="stHorizontalBlock"]:has(iframe[srcdoc]),
-  div[data-testid="stHorizontalBlock"]:has(iframe[title="streamlit.components.v1.html"]) {{
-    width: 100% !important;
-    align-items: stretch !important;
-    justify-content: stretch !important;
-    gap: 0.9rem !important;
-  }}
-
-  div[data-testid="stHorizontalBlock"]:has(iframe[srcdoc]) > div,
-  div[data-testid="stHorizontalBlock"]:has(iframe[title="streamlit.components.v1.html"]) > div,
-  div[data-testid="stHorizontalBlock"]:has(iframe[srcdoc]) > div[data-testid="column"],
-  div[data-testid="stHorizontalBlock"]:has(iframe[title="streamlit.components.v1.html"]) > div[data-testid="column"] {{
-    flex: 1 1 0% !important;
-    min-width: 0 !important;
-    width: 0 !important;         /* sorgt für wirklich gleiche Breite */
-    max-width: none !important;
-  }}
-
-  /* Wrapper der Custom-Component in der Row auf 100% zwingen */
-  div[data-testid="stHorizontalBlock"]:has(iframe[srcdoc]) div[data-testid="stCustomComponentV1"],
-  div[data-testid="stHorizontalBlock"]:has(iframe[srcdoc]) div[data-testid="stCustomComponentV1"] > div,
-  div[data-testid="stHorizontalBlock"]:has(iframe[title="streamlit.components.v1.html"]) div[data-testid="stCustomComponentV1"],
-  div[data-testid="stHorizontalBlock"]:has(iframe[title="streamlit.components.v1.html"]) div[data-testid="stCustomComponentV1"] > div {{
-    width: 100% !important;
-    max-width: 100% !important;
-    min-width: 0 !important;
-    display: block !important;
-  }}
-
-  /* Fallback: Column-Umgebung darf nicht "shrink" werden */
-  div[data-testid="column"] div[data-testid="stElementContainer"],
-  div[data-testid="column"] div[data-testid="stElementContainer"] > div,
-  div[data-testid="column"] div[data-testid="stCustomComponentV1"],
-  div[data-testid="column"] div[data-testid="stCustomComponentV1"] > div {{
-    width: 100% !important;
-    max-width: 100% !important;
-    min-width: 0 !important;
-  }}
-
-</style>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(gesamtuebersicht_css(dark), unsafe_allow_html=True)
 
 
 def _clean_overview_df(df: pd.DataFrame) -> pd.DataFrame:
@@ -1275,15 +332,12 @@ def _render_measures_block(
     df_view: pd.DataFrame, csv_filename: str = "geplante_massnahmen.csv"
 ) -> None:
     """Geplante Maßnahmen: Toolbar-Icons (Download + Vollbild)"""
-    csv_bytes = make_csv_bytes(df_view)
+    # Toolbar-Icon Download
+    csv_href = csv_data_href(df_view, key="overview_measures_csv")
 
     if not str(csv_filename).lower().endswith(".csv"):
         csv_filename = f"{csv_filename}.csv"
 
-    # Toolbar-Icon Download
-    csv_b64 = base64.b64encode(csv_bytes).decode("utf-8")
-    csv_href = f"data:text/csv;charset=utf-8;base64,{csv_b64}"
-
     modal_id = "rgmMeasuresModal"
     download_svg, fullscreen_svg, close_svg = _icons_svg()
 
@@ -2183,6 +1237,45 @@ def _render_dual_plot_cards(
 """
     components.html(html_doc, height=initial_height, scrolling=False, width=1200)
 
+def _export_job_status(job_id: str, label: str, key: str, was_pending: bool) -> None:
+    queue = get_export_queue()
+    job = queue.status(job_id)
+    if job is None:
+        st.caption(t("overview.export_expired"))
+        return
+
+    if job.pending:
+        stage = job.stage or "queued"
+        st.progress(float(job.progress), text=t(f"overview.export_stage.{stage}"))
+        return
+
+    if was_pending:
+        # Einmal komplett neu rendern, damit das Fragment nicht weiter pollt
+        st.rerun()
+
+    if job.status == "done":
+        st.download_button(
+            label,
+            data=queue.result(job_id) or b"",
+            file_name=job.file_name,
+            mime=job.mime,
+            key=key,
+            on_click="ignore",
+            use_container_width=True,
+        )
+    else:
+        st.error(t("overview.pdf_unavailable").format(error=job.error or job.status))
+
+
+def _render_export_job(job_id: str, label: str, *, key: str) -> None:
+    """
+    Fortschritt eines Export-Jobs; pollt als Fragment (ohne Voll-Rerun), solange er läuft.
+    """
+    job = get_export_queue().status(job_id)
+    pending = bool(job is not None and job.pending)
+    st.fragment(_export_job_status, run_every=1.0 if pending else None)(job_id, label, key, pending)
+
+
 def main() -> None:
     init_session_state()
     _inject_gesamtuebersicht_css()
@@ -2204,7 +1297,8 @@ def main() -> None:
     
     st.markdown('<div class="rgm-divider"></div>', unsafe_allow_html=True)
 
-    model = load_model_config()
+    # Für die Übersicht genügt das Speicherabbild; ohne kompiliertes Modell das typisierte
+    model = load_mapped_model() or load_model()
     answers = get_answers()
     if not answers:
         st.info(t("common.no_results_assessment"))
@@ -2467,7 +1561,7 @@ def main() -> None:
         view_for_pdf = view.copy()
         view_display = view.copy()
         if "Priorität" in view_display.columns:
-            view_display["Priorität"] = view_display["Priorität"].apply(priority_value_label)
+            view_display["Priorität"] = view_display["Priorität"].map(translator().priority_value_label)
         view_display = view_display.rename(
             columns={
                 "Priorität": t("column.priority"),
@@ -2486,22 +1580,8 @@ def main() -> None:
     # 4) Export
     st.markdown('<div class="rgm-divider"></div>', unsafe_allow_html=True)
 
-    pdf_bytes = None
-    pdf_error = None
-    try:
-        meta_pdf = dict(meta)
-        meta_pdf["global_target"] = f"{float(global_target):.1f}"
-        pdf_bytes = make_pdf_bytes(
-            meta=meta_pdf,
-            df_raw=df_raw,
-            df_report=df_report,
-            df_measures=view_for_pdf,
-            fig_td=fig_td,
-            fig_og=fig_og,
-            dark=dark,
-        )
-    except Exception as e:
-        pdf_error = str(e)
+    meta_pdf = dict(meta)
+    meta_pdf["global_target"] = f"{float(global_target):.1f}"
 
     # --- JSON ---
     session_payload = {
@@ -2528,20 +1608,35 @@ def main() -> None:
         pdf_fn = f"rgm_overview_{org_part}_{date_part}.pdf" if en else f"rgm_gesamtuebersicht_{org_part}_{date_part}.pdf"
         json_fn = f"rgm_save_{org_part}_{date_part}.json"
 
+        # PDF/ZIP entstehen im Hintergrund (Job-Queue + Worker-Prozess); die Seite blockiert nicht
+        export_inputs = ExportInputs(
+            meta=meta_pdf,
+            df_raw=df_raw,
+            df_report=df_report,
+            df_measures=view_for_pdf,
+            fig_td=fig_td,
+            fig_og=fig_og,
+            dark=dark,
+            language=get_language(),
+            file_stem=pdf_fn[: -len(".pdf")],
+            extra_files={json_fn: json_bytes},
+        )
+        export_fp = state_fingerprint(
+            meta_pdf,
+            df_raw.to_numpy().tolist(),
+            list(view_for_pdf.columns),
+            view_for_pdf.to_numpy().tolist(),
+            dark,
+            get_language(),
+            data_version(),  # Modell/Maßnahmen geändert: neu exportieren
+        )
+
         col_pdf, col_json = st.columns(2, gap="small")
 
         with col_pdf:
             st.markdown('<div id="rgm_overview_export_btn_pdf"></div>', unsafe_allow_html=True)
-            if pdf_bytes is not None:
-                st.download_button(
-                    t("overview.pdf_download"),
-                    data=pdf_bytes,
-                    file_name=pdf_fn,
-                    mime="application/pdf",
-                    use_container_width=True,
-                )
-            else:
-                st.error(t("overview.pdf_unavailable").format(error=pdf_error))
+            pdf_job_id = ensure_export_job("pdf", export_inputs, export_fp)
+            _render_export_job(pdf_job_id, t("overview.pdf_download"), key="rgm_overview_pdf")
 
         with col_json:
             st.markdown('<div id="rgm_overview_export_btn_json"></div>', unsafe_allow_html=True)
@@ -2553,5 +1648,15 @@ def main() -> None:
                 use_container_width=True,
             )
 
+        # ZIP-Bundle (PDF, CSV, Radar-PNGs, Sitzung) nur auf Anforderung
+        zip_job_id = st.session_state.get("_rgm_overview_zip_job")
+        zip_job = get_export_queue().status(zip_job_id) if zip_job_id else None
+        if zip_job is None or zip_job.fingerprint != export_fp:
+            if st.button(t("overview.zip_bundle"), use_container_width=True, key="rgm_overview_zip_start"):
+                st.session_state["_rgm_overview_zip_job"] = ensure_export_job("zip", export_inputs, export_fp)
+                st.rerun()
+        else:
+            _render_export_job(zip_job.job_id, t("overview.zip_download"), key="rgm_overview_zip")
+
 if __name__ == "__main__":
     main()
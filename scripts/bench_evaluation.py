@@ -0,0 +1,321 @@
+"""
+Auswertung (core.evaluation.compute_results_df) und Scoring-Kernel (core.scoring.score_model):
+Golden-Files und Micro-Benchmark.
+
+1. --check: vergleicht compute_results_df (JSON- und typisiertes Modell) und score_model für die
+   Profile "standard" und "legacy" mit scripts/golden/scoring.json: feste Antwortsätze auf dem
+   Standardmodell, auch unbeantwortet, unbekannte Antworten, "Nicht anwendbar" und eigene Ziele.
+   Die erwarteten Werte stammen aus der Implementierung vor dem gemeinsamen Kernel (legacy:
+   bisheriges compute_results_df, standard: bisheriges compute_dimension_maturity).
+   Status 1 bei Abweichung.
+2. --update: Golden-File aus dem aktuellen Stand neu schreiben (nur bei gewollter Änderung der
+   Ergebnisse oder des Modells).
+3. Ohne Option: Micro-Benchmark (ms je Aufruf, bester von --rounds Durchgängen), bisheriger
+   Pfad (Schleife über das JSON-Modell, nachgebaut) gegen den Kernel mit JSON-, typisiertem und
+   kompiliertem Modell.
+
+    python scripts/bench_evaluation.py
+    python scripts/bench_evaluation.py --check
+    python scripts/bench_evaluation.py --calls 500 --rounds 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import pandas as pd  # noqa: E402
+
+from core.evaluation import compute_results_df  # noqa: E402
+from core.model_compiler import build_model  # noqa: E402
+from core.scoring import compile_model, score_model  # noqa: E402
+
+SCHEMA = "rgm_scoring_golden_v1"
+MODEL_PATH = ROOT / "data" / "models" / "niro_td_model.json"
+GOLDEN_PATH = ROOT / "scripts" / "golden" / "scoring.json"
+PROFILES = ("standard", "legacy")
+
+# Antwortsätze kompakt: ein Zeichen je Frage in Modellreihenfolge; "." = fehlt im Dict
+ALPHABET = {
+    "0": "Vollständig",
+    "1": "In den meisten Fällen",
+    "2": "In ein paar Fällen",
+    "3": "Gar nicht",
+    "4": "Nicht anwendbar",
+    "?": "Weiß nicht",
+    "_": None,
+}
+
+
+def _question_ids(model: dict[str, Any]) -> list[str]:
+    return [q["id"] for dim in model["dimensions"] for level in dim["levels"] for q in level["questions"]]
+
+
+def decode_answers(model: dict[str, Any], encoded: str) -> dict[str, Any]:
+    return {q_id: ALPHABET[c] for q_id, c in zip(_question_ids(model), encoded) if c != "."}
+
+
+def golden_cases(model: dict[str, Any], seed: int = 0) -> list[dict[str, Any]]:
+    """
+    Feste Antwortsätze (Eingaben des Golden-Files) aus einem Seed.
+    """
+    rng = random.Random(seed)
+    q_ids = _question_ids(model)
+    codes = [dim["code"] for dim in model["dimensions"]]
+    first_level = {q["id"] for dim in model["dimensions"] for q in dim["levels"][0]["questions"]}
+
+    def mixed(weights: list[int], answered: float = 1.0, unknown: float = 0.0) -> str:
+        out = []
+        for _ in q_ids:
+            r = rng.random()
+            if r >= answered:
+                out.append(rng.choice("._"))
+            elif r < unknown:
+                out.append("?")
+            else:
+                out.append(rng.choices("01234", weights)[0])
+        return "".join(out)
+
+    answer_sets = [
+        ("leer", "." * len(q_ids)),
+        ("alles-vollstaendig", "0" * len(q_ids)),
+        ("alles-na", "4" * len(q_ids)),
+        ("level1-na", "".join("4" if q in first_level else "0" for q in q_ids)),
+    ]
+    for i in range(12):
+        answer_sets.append((f"gleichverteilt-{i + 1:02d}", mixed([1, 1, 1, 1, 1])))
+    for i in range(12):
+        answer_sets.append((f"ueberwiegend-erfuellt-{i + 1:02d}", mixed([80, 10, 5, 3, 2])))
+    for i in range(6):
+        answer_sets.append((f"teilweise-beantwortet-{i + 1:02d}", mixed([50, 20, 15, 10, 5], answered=0.4)))
+    for i in range(6):
+        answer_sets.append((f"unbekannte-antworten-{i + 1:02d}", mixed([60, 15, 10, 10, 5], answered=0.9, unknown=0.05)))
+
+    cases = []
+    for name, encoded in answer_sets:
+        own = rng.random() < 0.5
+        cases.append(
+            {
+                "name": name,
+                "answers": encoded,
+                "target_label": "Eigenes Ziel" if own else "Definiert",
+                "global_target_level": rng.choice([2.0, 2.5, 3.0, 4.0]),
+                "dimension_targets": {c: float(rng.randint(1, 5)) for c in codes if own and rng.random() < 0.5},
+            }
+        )
+    return cases
+
+
+def _nan_to_none(values: list[float]) -> list[float | None]:
+    return [None if isinstance(v, float) and math.isnan(v) else v for v in values]
+
+
+def _results(model: Any, answers: dict[str, Any], case: dict[str, Any], profile: str) -> pd.DataFrame:
+    return compute_results_df(
+        model,
+        answers,
+        {"target_label": case["target_label"]},
+        case["global_target_level"],
+        case["dimension_targets"],
+        profile=profile,
+    )
+
+
+def model_sha256() -> str:
+    return hashlib.sha256(MODEL_PATH.read_bytes()).hexdigest()
+
+
+def write_golden(path: Path, codes: list[str], cases: list[dict[str, Any]], generated_by: str) -> None:
+    # Ein Fall je Zeile: kompakt, Diffs bleiben lesbar
+    header = {
+        "schema": SCHEMA,
+        "model": MODEL_PATH.relative_to(ROOT).as_posix(),
+        "model_sha256": model_sha256(),
+        "generated_by": generated_by,
+        "alphabet": ALPHABET,
+        "codes": codes,
+    }
+    text = json.dumps(header, ensure_ascii=False, indent=2)[:-2]
+    text += ',\n  "cases": [\n' + ",\n".join("    " + json.dumps(c, ensure_ascii=False) for c in cases) + "\n  ]\n}\n"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def update_golden(model: dict[str, Any]) -> int:
+    cases = golden_cases(model)
+    codes: list[str] = []
+    for case in cases:
+        answers = decode_answers(model, case["answers"])
+        case["expected"] = {}
+        for profile in PROFILES:
+            df = _results(model, answers, case, profile)
+            codes = df["code"].tolist()
+            case["expected"][profile] = {
+                "ist_level": _nan_to_none(df["ist_level"].tolist()),
+                "gap": _nan_to_none(df["gap"].tolist()),
+            }
+    write_golden(GOLDEN_PATH, codes, cases, "core.evaluation.compute_results_df (aktueller Stand)")
+    print(f"{GOLDEN_PATH} geschrieben ({len(cases)} Fälle)")
+    return 0
+
+
+def check_golden(model: dict[str, Any]) -> int:
+    golden = json.loads(GOLDEN_PATH.read_text(encoding="utf-8"))
+    if golden.get("schema") != SCHEMA:
+        print(f"{GOLDEN_PATH}: unbekanntes Schema {golden.get('schema')!r}")
+        return 1
+    if golden["model_sha256"] != model_sha256():
+        print(f"{golden['model']} hat sich geändert; Ergebnisse prüfen und mit --update neu schreiben.")
+        return 1
+
+    typed = build_model(model)
+    compiled = compile_model(model)
+    failures = []
+    for case in golden["cases"]:
+        answers = decode_answers(model, case["answers"])
+        for profile in PROFILES:
+            expected = case["expected"][profile]
+            variants = {
+                "compute_results_df(JSON)": _results(model, answers, case, profile),
+                "compute_results_df(typisiert)": _results(typed, answers, case, profile),
+            }
+            for label, df in variants.items():
+                got = {
+                    "codes": df["code"].tolist(),
+                    "ist_level": _nan_to_none(df["ist_level"].tolist()),
+                    "gap": _nan_to_none(df["gap"].tolist()),
+                }
+                want = {"codes": golden["codes"], **expected}
+                for key in want:
+                    if got[key] != want[key]:
+                        failures.append(f"{case['name']} {profile} {label}: {key} weicht ab")
+            scores = score_model(compiled, answers, profile)
+            ist = _nan_to_none([scores[c] for c in golden["codes"]])
+            if ist != expected["ist_level"]:
+                failures.append(f"{case['name']} {profile} score_model: ist_level weicht ab")
+
+    checked = f"{len(golden['cases'])} Fälle x {len(PROFILES)} Profile"
+    if failures:
+        for line in failures:
+            print(f"  {line}")
+        print(f"{len(failures)} Abweichung(en) ({checked})")
+        return 1
+    print(f"{checked} identisch mit {GOLDEN_PATH.relative_to(ROOT).as_posix()}")
+    return 0
+
+
+# -----------------------------
+# Micro-Benchmark
+# -----------------------------
+_PREVIOUS_SCORES = {
+    "Nicht anwendbar": None,
+    "Gar nicht": 0.0,
+    "In ein paar Fällen": 0.25,
+    "In den meisten Fällen": 0.75,
+    "Vollständig": 1.0,
+}
+
+
+def _previous_results_df(model: dict[str, Any], answers: dict[str, Any], global_target_level: float) -> pd.DataFrame:
+    # Bisheriger Pfad (vor dem Kernel), auf das Wesentliche reduziert: Schleife über das JSON-Modell
+    import re
+
+    def sort_key(code: str):
+        m = re.match(r"^([A-Za-z]+)(\d+)(?:\.(\d+))?$", code.strip())
+        if not m:
+            return (99, code, 999, 999)
+        prefix = m.group(1).upper()
+        return ({"TD": 0, "OG": 1}.get(prefix, 50), prefix, int(m.group(2)), int(m.group(3) or 0))
+
+    rows = []
+    for dim in sorted(model.get("dimensions", []), key=lambda d: sort_key(str(d.get("code", "")))):
+        ist_total = 0.0
+        for lvl in dim.get("levels", []) or []:
+            scores = []
+            for q in lvl.get("questions", []) or []:
+                a = answers.get(q.get("id"))
+                if a not in _PREVIOUS_SCORES or _PREVIOUS_SCORES[a] is None:
+                    continue
+                scores.append(float(_PREVIOUS_SCORES[a]))
+            ist_total += float(sum(scores) / len(scores)) if scores else 0.0
+        ist_total = round(ist_total, 2)
+        target = float(global_target_level)
+        rows.append(
+            {
+                "code": str(dim.get("code", "")).strip(),
+                "name": str(dim.get("name", "")).strip(),
+                "category": str(dim.get("category", "")).strip(),
+                "ist_level": ist_total,
+                "target_level": round(target, 2),
+                "gap": round(target - ist_total, 2),
+                "priority": "",
+                "action": "",
+                "timeframe": "",
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def _per_call_ms(fn: Callable[[], Any], calls: int, rounds: int) -> float:
+    fn()
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, (time.perf_counter() - start) * 1000 / calls)
+    return best
+
+
+def bench(model: dict[str, Any], calls: int, rounds: int) -> dict[str, float]:
+    rng = random.Random(0)
+    answers = {q_id: rng.choice(list(_PREVIOUS_SCORES)) for q_id in _question_ids(model)}
+    typed = build_model(model)
+    compiled = compile_model(model)
+    meta = {"target_label": "Definiert"}
+    cases: dict[str, Callable[[], Any]] = {
+        "bisher (JSON-Schleife, legacy)": lambda: _previous_results_df(model, answers, 3.0),
+        "compute_results_df JSON, legacy": lambda: compute_results_df(model, answers, meta, 3.0, {}, profile="legacy"),
+        "compute_results_df JSON, standard": lambda: compute_results_df(model, answers, meta, 3.0, {}),
+        "compute_results_df typisiert, legacy": lambda: compute_results_df(typed, answers, meta, 3.0, {}, profile="legacy"),
+        "compute_results_df typisiert, standard": lambda: compute_results_df(typed, answers, meta, 3.0, {}),
+        "compile_model (JSON)": lambda: compile_model(model),
+        "score_model kompiliert, legacy": lambda: score_model(compiled, answers, "legacy"),
+        "score_model kompiliert, standard": lambda: score_model(compiled, answers, "standard"),
+    }
+    return {name: _per_call_ms(fn, calls, rounds) for name, fn in cases.items()}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Golden-Files und Micro-Benchmark der Auswertung")
+    parser.add_argument("--check", action="store_true", help="Mit den Golden-Files vergleichen")
+    parser.add_argument("--update", action="store_true", help="Golden-Files aus dem aktuellen Stand schreiben")
+    parser.add_argument("--calls", type=int, default=200, help="Aufrufe je Durchgang")
+    parser.add_argument("--rounds", type=int, default=5, help="Durchgänge (bester zählt)")
+    args = parser.parse_args(argv)
+
+    model = json.loads(MODEL_PATH.read_text(encoding="utf-8"))
+    if args.update:
+        return update_golden(model)
+    if args.check:
+        return check_golden(model)
+
+    print(f"ms je Aufruf ({args.calls} Aufrufe, bester von {args.rounds}):")
+    for name, ms in bench(model, max(1, args.calls), max(1, args.rounds)).items():
+        print(f"  {name:40s} {ms:7.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,156 @@
+"""
+Benchmark: Antwortzeit anderer Sessions während eines Export-Bursts.
+
+Ein Streamlit-Prozess bedient alle Sessions; solange ein Export (ReportLab-Layout) im selben
+Prozess rechnet, hält er den GIL und bremst jeden Rerun anderer Sessions. Gemessen wird:
+
+1. Sonde ("andere Session"): ein Thread baut fortlaufend die Gesamtübersicht-Tabelle
+   (build_overview_table, wie ein Rerun) und misst die Dauer je Aufruf.
+2. Leerlauf: nur die Sonde (Referenz).
+3. Burst: --burst PDF-Exporte gleichzeitig aus --sessions Threads, einmal inline
+   (ExportExecutor mit 0 Workern, wie ohne Pool) und einmal über den Prozess-Pool (--workers).
+
+Ausgabe je Phase: Sonde p50/p95/max (ms), Anzahl Sonden-Aufrufe, Dauer des Bursts (s).
+
+    python scripts/bench_export_pool.py
+    python scripts/bench_export_pool.py --burst 12 --sessions 4 --workers 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.export_pool import ExportExecutor, _pdf_job  # noqa: E402
+from core.model_compiler import build_model  # noqa: E402
+from core.overview import build_overview_table  # noqa: E402
+
+
+def _answers(model_data: dict[str, Any]) -> dict[str, str]:
+    rng = random.Random(0)
+    options = ["Vollständig", "In den meisten Fällen", "In ein paar Fällen", "Gar nicht"]
+    return {
+        q["id"]: rng.choice(options)
+        for dim in model_data.get("dimensions", [])
+        for level in dim.get("levels", [])
+        for q in level.get("questions", [])
+    }
+
+
+def _export_args(model, answers: dict[str, str]) -> tuple:
+    df_raw = build_overview_table(model, answers, global_target_level=3.0)
+    meta = {"org": "Benchmark", "area": "Burst", "date_str": "2026-01-01", "target_label": "Definiert"}
+    # Wie submit_pdf_export: picklebare Argumente, ohne Radar-Grafiken (kein Kaleido nötig)
+    return (meta, df_raw, None, None, None, None, False, "de")
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def _probe(rerun: Callable[[], Any], stop: threading.Event, samples: list[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        rerun()
+        samples.append((time.perf_counter() - start) * 1000)
+
+
+def run_phase(
+    rerun: Callable[[], Any],
+    executor: ExportExecutor | None,
+    args: tuple,
+    burst: int,
+    sessions: int,
+    idle_s: float,
+) -> dict[str, Any]:
+    """
+    Sonde starten, dann (optional) den Burst abarbeiten; ohne Executor läuft nur die Sonde idle_s lang.
+    """
+    samples: list[float] = []
+    stop = threading.Event()
+    probe = threading.Thread(target=_probe, args=(rerun, stop, samples), daemon=True)
+    probe.start()
+    start = time.perf_counter()
+    if executor is None:
+        time.sleep(idle_s)
+    else:
+        with ThreadPoolExecutor(max_workers=sessions) as sessions_pool:
+            # Jede "Session" wartet wie export_jobs auf ihr Future
+            jobs = [
+                sessions_pool.submit(lambda i=i: executor.submit(_pdf_job, *args, session_id=f"s{i % sessions}").result())
+                for i in range(burst)
+            ]
+            for job in jobs:
+                job.result()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    probe.join()
+    return {
+        "probe_p50_ms": statistics.median(samples),
+        "probe_p95_ms": _percentile(samples, 0.95),
+        "probe_max_ms": max(samples),
+        "probe_calls": len(samples),
+        "elapsed_s": elapsed,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Antwortzeit anderer Sessions während eines Export-Bursts")
+    parser.add_argument("--burst", type=int, default=8, help="Anzahl PDF-Exporte im Burst")
+    parser.add_argument("--sessions", type=int, default=4, help="Gleichzeitig exportierende Sessions (Threads)")
+    parser.add_argument("--workers", type=int, default=2, help="Worker-Prozesse im Pool")
+    parser.add_argument("--idle", type=float, default=2.0, help="Dauer der Leerlauf-Messung in Sekunden")
+    parser.add_argument("--output", type=Path, help="Ergebnis als JSON schreiben")
+    args = parser.parse_args(argv)
+
+    model_data = json.loads((ROOT / "data" / "models" / "niro_td_model.json").read_text(encoding="utf-8"))
+    model = build_model(model_data)
+    answers = _answers(model_data)
+    export_args = _export_args(model, answers)
+
+    def rerun() -> Any:
+        return build_overview_table(model, answers, global_target_level=3.0)
+
+    # Aufwärmen: Importe, Schriften, Caches im Hauptprozess
+    rerun()
+    _pdf_job(*export_args)
+
+    inline = ExportExecutor(max_workers=0)
+    pool = ExportExecutor(max_workers=max(1, args.workers))
+    pool.submit(_pdf_job, *export_args).result()  # Worker gestartet und aufgewärmt
+
+    phases = {
+        "idle": run_phase(rerun, None, export_args, 0, 1, args.idle),
+        "burst_inline": run_phase(rerun, inline, export_args, args.burst, args.sessions, 0.0),
+        f"burst_pool_{pool.max_workers}": run_phase(rerun, pool, export_args, args.burst, args.sessions, 0.0),
+    }
+    pool.shutdown(wait=True)
+
+    print(f"{'Phase':16s} {'p50 ms':>8s} {'p95 ms':>8s} {'max ms':>8s} {'Aufrufe':>8s} {'Dauer s':>8s}")
+    for name, r in phases.items():
+        print(
+            f"{name:16s} {r['probe_p50_ms']:8.2f} {r['probe_p95_ms']:8.2f} {r['probe_max_ms']:8.2f} "
+            f"{r['probe_calls']:8d} {r['elapsed_s']:8.2f}"
+        )
+    if args.output:
+        result = {"burst": args.burst, "sessions": args.sessions, "workers": pool.max_workers, "phases": phases}
+        args.output.write_text(json.dumps(result, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"{args.output} geschrieben")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
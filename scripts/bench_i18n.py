@@ -0,0 +1,260 @@
+"""
+Micro-Benchmark der Übersetzungs-Lookups.
+
+1. Lookups je Rerun: zählt alle Übersetzungen (t(), page_label(), *_option_label(), auch über
+   gebundene Translator) für einen vollständigen Lauf der angegebenen Seiten (Streamlit AppTest).
+2. Kosten je Lookup: bisheriger Pfad (Session-State-Schreibzugriff je Aufruf) gegen t() mit
+   Fast-Path und gegen einen gebundenen Translator – innerhalb einer echten Script-Session.
+3. Kataloge mit N Sprachen (--catalog-languages): Startzeit und Speicher für eingebettete
+   Python-Literale (bisheriges Format) gegen data/i18n/*.json mit Laden nach Bedarf.
+
+    python scripts/bench_i18n.py
+    python scripts/bench_i18n.py --pages Erhebung Priorisierung --lookups 20000
+    python scripts/bench_i18n.py --catalog-languages 2 10 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+import core.i18n as i18n  # noqa: E402
+
+
+def _answers() -> dict[str, str]:
+    model = json.loads((ROOT / "data" / "models" / "niro_td_model.json").read_text(encoding="utf-8"))
+    rng = random.Random(0)
+    options = ["Vollständig", "In den meisten Fällen", "In ein paar Fällen", "Gar nicht"]
+    return {
+        q["id"]: rng.choice(options)
+        for dim in model.get("dimensions", [])
+        for level in dim.get("levels", [])
+        for q in level.get("questions", [])
+    }
+
+
+def count_lookups(pages: list[str]) -> dict[str, int]:
+    """
+    Anzahl der Lookups je Seite (ein vollständiger Rerun nach dem ersten Lauf).
+    """
+    # Alle Wege (t(), Modulfunktionen, gebundene Translator) landen in diesen Methoden
+    methods = (
+        "__call__",
+        "page_label",
+        "target_option_label",
+        "answer_option_label",
+        "priority_option_label",
+        "priority_value_label",
+    )
+    originals = {name: getattr(i18n.Translator, name) for name in methods}
+    calls = {"n": 0}
+
+    def _counting(fn):
+        def wrapper(self, *args, **kwargs):
+            calls["n"] += 1
+            return fn(self, *args, **kwargs)
+        return wrapper
+
+    result: dict[str, int] = {}
+    answers = _answers()
+    for page in pages:
+        at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=120)
+        at.session_state["_rgm_privacy_ack"] = True
+        at.session_state["answers"] = answers
+        at.session_state["nav_request"] = page
+        if page == "Erhebung":
+            at.session_state["erhebung_step"] = 2
+            at.session_state["meta"] = {"org": "Bench", "area": "", "date_str": "", "target_label": "Definiert"}
+        at.run()
+
+        for name, fn in originals.items():
+            setattr(i18n.Translator, name, _counting(fn))
+        try:
+            calls["n"] = 0
+            at.run()
+            result[page] = calls["n"]
+        finally:
+            for name, fn in originals.items():
+                setattr(i18n.Translator, name, fn)
+    return result
+
+
+def _lookup_cost_script(lookups: int) -> None:
+    # Läuft als Streamlit-Script (AppTest.from_function): echter st.session_state
+    import time
+
+    import streamlit as st
+
+    import core.i18n as i18n
+
+    # Bisheriges Format nachgebaut: verschachtelte Dicts, Fallback je Aufruf
+    raw = {lang: i18n._read_catalog(lang) for lang in ("de", "en")}
+    translations = {lang: data.get("strings", {}) for lang, data in raw.items()}
+    answer_labels = {
+        value: {lang: raw[lang]["options"]["answer"].get(value, value) for lang in raw}
+        for value in raw["de"]["options"]["answer"]
+    }
+    keys = list(translations["de"])[:200]
+    answers = list(answer_labels)
+
+    def _legacy_get_language() -> str:
+        if i18n.LANGUAGE_KEY not in st.session_state:
+            st.session_state[i18n.LANGUAGE_KEY] = "de"
+        else:
+            st.session_state[i18n.LANGUAGE_KEY] = i18n.normalize_language(st.session_state[i18n.LANGUAGE_KEY])
+        return i18n.normalize_language(st.session_state.get(i18n.LANGUAGE_KEY))
+
+    def _legacy_t(key: str) -> str:
+        lang = _legacy_get_language()
+        return translations.get(lang, {}).get(key) or translations["de"].get(key) or key
+
+    def _legacy_answer(value: str) -> str:
+        return answer_labels.get(str(value), {}).get(_legacy_get_language(), str(value))
+
+    st.session_state[i18n.LANGUAGE_KEY] = "en"
+    tr = i18n.translator()
+    cases = {
+        "legacy t()": lambda i: _legacy_t(keys[i % len(keys)]),
+        "t()": lambda i: i18n.t(keys[i % len(keys)]),
+        "Translator": lambda i: tr(keys[i % len(keys)]),
+        "legacy answer_option_label()": lambda i: _legacy_answer(answers[i % len(answers)]),
+        "answer_option_label()": lambda i: i18n.answer_option_label(answers[i % len(answers)]),
+        "Translator.answer_option_label": lambda i: tr.answer_option_label(answers[i % len(answers)]),
+    }
+    out = {}
+    for name, fn in cases.items():
+        start = time.perf_counter()
+        for i in range(lookups):
+            fn(i)
+        out[name] = (time.perf_counter() - start) / lookups * 1e6
+    st.session_state["_bench_result"] = out
+
+
+def lookup_cost(lookups: int) -> dict[str, float]:
+    """
+    Mikrosekunden je Lookup für die einzelnen Pfade.
+    """
+    at = AppTest.from_function(_lookup_cost_script, args=(lookups,), default_timeout=300)
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return dict(at.session_state["_bench_result"])
+
+
+_PROBE = """
+import json, sys, time, tracemalloc
+import streamlit  # Basis beider Varianten, nicht mitgemessen
+sys.path[:0] = {paths!r}
+tracemalloc.start()
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+current, peak = tracemalloc.get_traced_memory()
+print(json.dumps({{"ms": elapsed * 1000, "kib": current / 1024, "peak_kib": peak / 1024}}))
+"""
+
+
+def _probe(body: str, paths: list[str], env: dict[str, str] | None = None) -> dict[str, float]:
+    code = _PROBE.format(paths=paths, body=body)
+    runs = []
+    # Erster Lauf schreibt .pyc; gemessen wird der warme Start (wie im Betrieb)
+    for _ in range(3):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, **(env or {})},
+        ).stdout
+        runs.append(json.loads(out.strip().splitlines()[-1]))
+    return min(runs[1:], key=lambda r: r["ms"])
+
+
+def catalog_scaling(counts: list[int]) -> list[dict[str, Any]]:
+    """
+    Startzeit/Speicher mit N Sprachen: bisher (alle Kataloge als Literal im Modul)
+    gegen Dateien, von denen nur die aktive Sprache (plus Fallback) geladen wird.
+    """
+    base = {lang: json.loads((ROOT / "data" / "i18n" / f"{lang}.json").read_text(encoding="utf-8")) for lang in ("de", "en")}
+    key = next(iter(base["de"]["strings"]))
+    rows = []
+    for n in counts:
+        with tempfile.TemporaryDirectory(prefix="rgm_i18n_bench_") as tmp:
+            tmp_path = Path(tmp)
+            catalogs = dict(base)
+            for i in range(max(0, n - len(base))):
+                code = f"x{i:02d}"
+                catalogs[code] = {
+                    **base["en"],
+                    "language": code,
+                    "strings": {k: f"{v} [{code}]" for k, v in base["en"]["strings"].items()},
+                }
+
+            i18n_dir = tmp_path / "i18n"
+            i18n_dir.mkdir()
+            for code, data in catalogs.items():
+                (i18n_dir / f"{code}.json").write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+            literal = {code: data["strings"] for code, data in catalogs.items()}
+            (tmp_path / "legacy_i18n_catalogs.py").write_text(
+                f"TRANSLATIONS = {literal!r}\n", encoding="utf-8"
+            )
+
+            legacy = _probe(
+                f"import legacy_i18n_catalogs\nlegacy_i18n_catalogs.TRANSLATIONS['en'][{key!r}]",
+                [str(tmp_path)],
+            )
+            lazy = _probe(
+                f"import core.i18n as i18n\ni18n.t({key!r}, language='en')\nassert len(i18n.loaded_languages()) == 1",
+                [str(ROOT)],
+                env={"RGM_I18N_DIR": str(i18n_dir)},
+            )
+            rows.append({"languages": n, "legacy": legacy, "lazy": lazy})
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Micro-Benchmark der i18n-Lookups")
+    parser.add_argument("--pages", nargs="*", default=["Erhebung", "Priorisierung", "Gesamtübersicht"])
+    parser.add_argument("--lookups", type=int, default=20000, help="Lookups je Pfad für die Kostenmessung")
+    parser.add_argument("--catalog-languages", type=int, nargs="*", help="Nur Katalog-Skalierung mit N Sprachen messen")
+    args = parser.parse_args(argv)
+
+    if args.catalog_languages:
+        print("Kataloge: Start (ms) / Speicher (KiB) – eingebettet vs. Dateien nach Bedarf")
+        for row in catalog_scaling(args.catalog_languages):
+            legacy, lazy = row["legacy"], row["lazy"]
+            print(
+                f"  N={row['languages']:3d}  eingebettet {legacy['ms']:7.1f} ms {legacy['kib']:8.0f} KiB"
+                f"   Dateien {lazy['ms']:7.1f} ms {lazy['kib']:8.0f} KiB"
+            )
+        return 0
+
+    costs = lookup_cost(args.lookups)
+    print("Kosten je Lookup (µs):")
+    for name, us in costs.items():
+        print(f"  {name:34s} {us:8.3f}")
+
+    counts = count_lookups(args.pages)
+    print("Lookups je Rerun:")
+    for page, n in counts.items():
+        legacy_ms = n * costs["legacy t()"] / 1000
+        now_ms = n * costs["t()"] / 1000
+        print(f"  {page:18s} {n:6d}  (bisher ~{legacy_ms:.1f} ms, jetzt ~{now_ms:.1f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
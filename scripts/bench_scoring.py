@@ -0,0 +1,322 @@
+"""
+Benchmark-Suite für Scoring, Gesamtübersicht und Export auf synthetischen Modellen.
+
+1. Synthetische Modelle (reproduzierbar per --seed): N Dimensionen (abwechselnd TD/OG),
+   L Level je Dimension, Q Fragen je Level; Fall-Angabe als "NxLxQ", z. B. 2000x10x50.
+2. Zufällige Antworten (Anteil beantwortet: --answered; "Vollständig" überwiegt, damit die
+   Stufen-Freischaltung auch höhere Level erreicht) und Prioritäten für einen Teil der Dimensionen.
+3. Gemessen (Millisekunden, bester Wert und Median aus --repeat Läufen; schnelle Funktionen
+   laufen je Messung mehrfach, bis mindestens --min-time erreicht ist):
+   compute_dimension_maturity (alle Dimensionen), build_overview_table,
+   calculate_current_maturity_averages, df_results_for_export, make_csv_bytes, make_pdf_bytes
+   (ohne Radar-Grafiken, damit kein Kaleido/Chrome nötig ist).
+4. Ergebnis als JSON (--output); "compare" meldet Regressionen gegenüber einer gespeicherten
+   Basis und endet dann mit Status 1. Eine Regression liegt nur vor, wenn bester Wert UND Median
+   um mehr als --threshold und mehr als --min-ms langsamer sind; ein einzelner gestörter Lauf
+   (z. B. auf einem Host mit einer CPU) verschiebt nur den Median und löst nichts aus.
+
+    python scripts/bench_scoring.py run
+    python scripts/bench_scoring.py run --cases 33x5x6 500x5x20 2000x10x50 --output bench.json
+    python scripts/bench_scoring.py run --skip make_pdf_bytes --repeat 3
+    python scripts/bench_scoring.py compare baseline.json bench.json --threshold 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import re
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import pandas as pd  # noqa: E402
+
+from core.exporter import df_results_for_export, make_csv_bytes, make_pdf_bytes  # noqa: E402
+from core.i18n import language_override  # noqa: E402
+from core.maturity import calculate_current_maturity_averages  # noqa: E402
+from core.model_compiler import build_model  # noqa: E402
+from core.overview import build_overview_table  # noqa: E402
+from core.scoring import compile_model, compute_dimension_maturity  # noqa: E402
+
+SCHEMA = "rgm_bench_scoring_v1"
+DEFAULT_CASES = ["33x5x6", "500x5x20", "2000x10x50"]
+ANSWER_OPTIONS = ["Vollständig", "In den meisten Fällen", "In ein paar Fällen", "Gar nicht", "Nicht anwendbar"]
+ANSWER_WEIGHTS = [70, 12, 8, 6, 4]
+PRIORITIES = ["A (hoch)", "B (mittel)", "C (niedrig)"]
+TIMEFRAMES = ["< 3 Monate", "3-6 Monate", "6-12 Monate", "> 12 Monate"]
+
+_CASE_RE = re.compile(r"^(\d+)x(\d+)x(\d+)$")
+_WORDS = (
+    "Redaktion Prozess Terminologie Freigabe Übersetzung Qualität Werkzeug Struktur Inhalt "
+    "Verantwortung Planung Prüfung Wiederverwendung Variante Zielgruppe Norm Ablage Medium"
+).split()
+
+
+def parse_case(spec: str) -> tuple[int, int, int]:
+    m = _CASE_RE.match(spec.strip())
+    if not m:
+        raise argparse.ArgumentTypeError(f"Fall {spec!r}: erwartet NxLxQ, z. B. 500x5x20")
+    dims, levels, questions = (int(g) for g in m.groups())
+    if dims < 1 or levels < 1 or questions < 1:
+        raise argparse.ArgumentTypeError(f"Fall {spec!r}: alle Werte müssen mindestens 1 sein")
+    return dims, levels, questions
+
+
+# -----------------------------
+# Synthetische Daten
+# -----------------------------
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize()
+
+
+def synthetic_model(dims: int, levels: int, questions: int, seed: int = 0) -> dict[str, Any]:
+    """
+    Modell im JSON-Format von data/models (wie niro_td_model.json), Codes TD<i>.<j> / OG<i>.<j>.
+    """
+    rng = random.Random(seed)
+    dimensions = []
+    for d in range(dims):
+        category = "TD" if d % 2 == 0 else "OG"
+        code = f"{category}{d // 20 + 1}.{d % 20 // 2 + 1}"
+        dimensions.append(
+            {
+                "code": code,
+                "name": _sentence(rng, 3),
+                "category": category,
+                "description": _sentence(rng, 12),
+                "default_target_level": rng.randint(2, min(4, levels)) if levels > 1 else 1,
+                "levels": [
+                    {
+                        "level_number": lvl,
+                        "name": f"Level {lvl}",
+                        "acceptance_criteria": _sentence(rng, 8),
+                        "benefit": "/",
+                        "questions": [
+                            {"id": f"{code}-L{lvl}-Q{q}", "text": _sentence(rng, 14) + "?"}
+                            for q in range(1, questions + 1)
+                        ],
+                    }
+                    for lvl in range(1, levels + 1)
+                ],
+            }
+        )
+    return {
+        "name": f"Synthetisch {dims}x{levels}x{questions}",
+        "description": "",
+        "levels_info": {str(lvl): f"Level {lvl}" for lvl in range(1, levels + 1)},
+        "glossary": {},
+        "dimensions": dimensions,
+    }
+
+
+def random_answers(model_data: dict[str, Any], seed: int = 0, answered: float = 0.9) -> dict[str, str]:
+    rng = random.Random(seed + 1)
+    return {
+        q["id"]: rng.choices(ANSWER_OPTIONS, ANSWER_WEIGHTS)[0]
+        for dim in model_data["dimensions"]
+        for level in dim["levels"]
+        for q in level["questions"]
+        if rng.random() < answered
+    }
+
+
+def random_priorities(model_data: dict[str, Any], seed: int = 0, share: float = 0.4) -> dict[str, dict[str, str]]:
+    rng = random.Random(seed + 2)
+    return {
+        dim["code"]: {
+            "priority": rng.choice(PRIORITIES),
+            "action": _sentence(rng, 10),
+            "timeframe": rng.choice(TIMEFRAMES),
+        }
+        for dim in model_data["dimensions"]
+        if rng.random() < share
+    }
+
+
+def _report_table(df_raw: pd.DataFrame) -> pd.DataFrame:
+    # Wie die Gesamtübersicht (_clean_overview_df): Ist/Soll <= 0 gilt als nicht bewertet
+    d = df_raw.copy()
+    for col in ("ist_level", "target_level"):
+        d[col] = pd.to_numeric(d[col], errors="coerce")
+        d.loc[d[col].isna() | (d[col] <= 0), col] = pd.NA
+    d["gap"] = d["target_level"] - d["ist_level"]
+    d.loc[d["gap"].notna() & (d["gap"] < 0), "gap"] = 0.0
+    d["answered"] = d["ist_level"].notna()
+    return d
+
+
+# -----------------------------
+# Messung
+# -----------------------------
+def _measure(fn: Callable[[], Any], repeat: int, min_time: float) -> dict[str, Any]:
+    fn()  # Aufwärmen (Importe, Caches für Modell/Schriften)
+    start = time.perf_counter()
+    fn()
+    once = time.perf_counter() - start
+    number = max(1, int(min_time / once)) if once > 0 else 1000
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) * 1000 / number)
+    return {
+        "best_ms": min(samples),
+        "median_ms": statistics.median(samples),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def _case_functions(dims: int, levels: int, questions: int, seed: int, answered: float) -> dict[str, Callable[[], Any]]:
+    model_data = synthetic_model(dims, levels, questions, seed)
+    model = build_model(model_data)
+    answers = random_answers(model_data, seed, answered)
+    priorities = random_priorities(model_data, seed)
+    compiled = compile_model(model)
+
+    df_raw = build_overview_table(model, answers, global_target_level=3.0, priorities=priorities)
+    df_report = _report_table(df_raw)
+    df_export = df_results_for_export(df_report)
+    df_measures = df_export[df_export["Gap"].fillna(-1) > 0]
+    meta = {"org": "Benchmark", "area": f"{dims}x{levels}x{questions}", "date_str": "2026-01-01", "target_label": "Definiert"}
+
+    def pdf() -> bytes:
+        with language_override("de"):
+            return make_pdf_bytes(meta, df_raw, df_report=df_report, df_measures=df_measures)
+
+    return {
+        "compute_dimension_maturity": lambda: [compute_dimension_maturity(d, answers) for d in compiled.dimensions],
+        "build_overview_table": lambda: build_overview_table(model, answers, global_target_level=3.0, priorities=priorities),
+        "calculate_current_maturity_averages": lambda: calculate_current_maturity_averages(df_report),
+        "df_results_for_export": lambda: df_results_for_export(df_report),
+        "make_csv_bytes": lambda: make_csv_bytes(df_measures),
+        "make_pdf_bytes": pdf,
+    }
+
+
+def run(cases: list[str], repeat: int, min_time: float, seed: int, answered: float, skip: set[str]) -> dict[str, Any]:
+    result: dict[str, Any] = {
+        "schema": SCHEMA,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pandas": pd.__version__,
+        "seed": seed,
+        "answered": answered,
+        "cases": {},
+    }
+    for spec in cases:
+        dims, levels, questions = parse_case(spec)
+        print(f"{spec}: {dims} Dimensionen, {levels} Level, {questions} Fragen je Level ({dims * levels * questions} Fragen)")
+        timings: dict[str, Any] = {}
+        for name, fn in _case_functions(dims, levels, questions, seed, answered).items():
+            if name in skip:
+                continue
+            timings[name] = _measure(fn, repeat, min_time)
+            print(f"  {name:38s} {timings[name]['median_ms']:10.2f} ms  (bester {timings[name]['best_ms']:.2f})")
+        result["cases"][spec] = timings
+    return result
+
+
+def _slower(before: float, after: float, threshold: float, min_ms: float) -> bool:
+    ratio = after / before if before > 0 else float("inf")
+    return ratio > 1 + threshold and after - before > min_ms
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float, min_ms: float) -> list[str]:
+    """
+    Regressionen von current gegenüber baseline (bester Wert und Median beide langsamer);
+    Fälle/Funktionen, die nur in einer der beiden Dateien vorkommen, werden übersprungen.
+    """
+    regressions = []
+    print(
+        f"  {'Fall':14s} {'Funktion':38s} {'Basis':>10s} {'Aktuell':>10s} {'Faktor':>7s}"
+        f" {'Best Basis':>10s} {'Best Akt.':>10s} {'Faktor':>7s}"
+    )
+    for spec, timings in current.get("cases", {}).items():
+        base_timings = baseline.get("cases", {}).get(spec, {})
+        for name, cur in timings.items():
+            base = base_timings.get(name)
+            if base is None:
+                continue
+            before, after = base["median_ms"], cur["median_ms"]
+            best_before, best_after = base["best_ms"], cur["best_ms"]
+            ratio = after / before if before > 0 else float("inf")
+            best_ratio = best_after / best_before if best_before > 0 else float("inf")
+            flag = _slower(before, after, threshold, min_ms) and _slower(best_before, best_after, threshold, min_ms)
+            print(
+                f"  {spec:14s} {name:38s} {before:10.2f} {after:10.2f} {ratio:7.2f}"
+                f" {best_before:10.2f} {best_after:10.2f} {best_ratio:7.2f}{'  REGRESSION' if flag else ''}"
+            )
+            if flag:
+                regressions.append(
+                    f"{spec} {name}: Median {before:.2f} -> {after:.2f} ms ({ratio:.2f}x), "
+                    f"bester {best_before:.2f} -> {best_after:.2f} ms ({best_ratio:.2f}x)"
+                )
+    return regressions
+
+
+def _load(path: Path) -> dict[str, Any]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("schema") != SCHEMA:
+        raise SystemExit(f"{path}: kein Ergebnis dieser Suite (schema {data.get('schema')!r})")
+    return data
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Scoring/Übersicht/Export auf synthetischen Modellen")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_run = sub.add_parser("run", help="Benchmarks ausführen")
+    p_run.add_argument("--cases", nargs="+", default=DEFAULT_CASES, help="Fälle als NxLxQ (Dimensionen x Level x Fragen)")
+    p_run.add_argument("--repeat", type=int, default=5, help="Messungen je Funktion")
+    p_run.add_argument("--min-time", type=float, default=0.05, help="Mindestdauer einer Messung in Sekunden")
+    p_run.add_argument("--seed", type=int, default=0)
+    p_run.add_argument("--answered", type=float, default=0.9, help="Anteil beantworteter Fragen")
+    p_run.add_argument("--skip", nargs="*", default=[], help="Funktionen auslassen, z. B. make_pdf_bytes")
+    p_run.add_argument("--output", type=Path, help="Ergebnis als JSON schreiben")
+
+    p_cmp = sub.add_parser("compare", help="Ergebnis mit einer Basis vergleichen")
+    p_cmp.add_argument("baseline", type=Path)
+    p_cmp.add_argument("current", type=Path)
+    p_cmp.add_argument("--threshold", type=float, default=0.2, help="Erlaubte Verlangsamung (0.2 = 20 %%)")
+    p_cmp.add_argument(
+        "--min-ms", type=float, default=2.0, help="Kleinere Differenzen (bester Wert/Median) gelten als Rauschen"
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        for spec in args.cases:
+            try:
+                parse_case(spec)
+            except argparse.ArgumentTypeError as exc:
+                parser.error(str(exc))
+        result = run(args.cases, max(1, args.repeat), args.min_time, args.seed, args.answered, set(args.skip))
+        if args.output:
+            args.output.write_text(json.dumps(result, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+            print(f"{args.output} geschrieben")
+        return 0
+
+    regressions = compare(_load(args.baseline), _load(args.current), args.threshold, args.min_ms)
+    if regressions:
+        print(f"{len(regressions)} Regression(en):")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("Keine Regressionen.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
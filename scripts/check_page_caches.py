@@ -0,0 +1,121 @@
+"""
+Prüft, dass die prozessweiten Caches der Seiten Reruns überdauern.
+
+app.load_page_module führt die Seitenmodule bei jedem Rerun neu aus; ein Cache, der dort
+definiert ist, beginnt jedes Mal leer. Die Caches liegen deshalb in core/. Dieses Skript lässt
+jede Seite mehrfach laufen (Streamlit AppTest, ein Prozess) und prüft an den Cache-Zählern,
+dass ab dem zweiten Lauf nichts mehr neu gebaut wird. Status 1, wenn doch.
+
+    python scripts/check_page_caches.py
+    python scripts/check_page_caches.py --pages Glossar --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+import core.glossary_render as glossary_render  # noqa: E402
+import core.page_css as page_css  # noqa: E402
+from core.measure_store import get_measure_store  # noqa: E402
+
+
+def _misses(fn) -> Callable[[], int]:
+    return lambda: fn.cache_info().misses
+
+
+# Seite -> (Bezeichnung, Zähler der Neuaufbauten)
+CACHES: dict[str, list[tuple[str, Callable[[], int]]]] = {
+    "Start": [("start_css", _misses(page_css.start_css))],
+    "Einführung": [("einfuehrung_css", _misses(page_css.einfuehrung_css))],
+    "Ausfüllhinweise": [("ausfuellhinweise_css", _misses(page_css.ausfuellhinweise_css))],
+    "Erhebung": [
+        ("erhebung_page_css", _misses(page_css.erhebung_page_css)),
+        ("erhebung_footer_css", _misses(page_css.erhebung_footer_css)),
+    ],
+    "Dashboard": [("dashboard_css", _misses(page_css.dashboard_css))],
+    "Priorisierung": [
+        ("priorisierung_css", _misses(page_css.priorisierung_css)),
+        # refresh() des Maßnahmenpools nur, wenn der Dateiwächter eine Änderung meldet
+        ("measure_store.refresh", lambda: get_measure_store().refreshes),
+    ],
+    "Gesamtübersicht": [("gesamtuebersicht_css", _misses(page_css.gesamtuebersicht_css))],
+    "Glossar": [
+        ("glossar_css", _misses(page_css.glossar_css)),
+        ("glossary_index", _misses(glossary_render.glossary_index)),
+        ("glossary_document", _misses(glossary_render.glossary_document)),
+    ],
+}
+
+
+def _answers() -> dict[str, str]:
+    model = json.loads((ROOT / "data" / "models" / "niro_td_model.json").read_text(encoding="utf-8"))
+    rng = random.Random(0)
+    options = ["Vollständig", "In den meisten Fällen", "In ein paar Fällen", "Gar nicht"]
+    return {
+        q["id"]: rng.choice(options)
+        for dim in model.get("dimensions", [])
+        for level in dim.get("levels", [])
+        for q in level.get("questions", [])
+    }
+
+
+def check_page(page: str, runs: int, answers: dict[str, str]) -> list[str]:
+    """
+    Lässt die Seite runs-mal laufen; Rückgabe: Caches, die nach dem ersten Lauf neu gebaut wurden.
+    """
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=120)
+    at.session_state["_rgm_privacy_ack"] = True
+    at.session_state["answers"] = answers
+    at.session_state["nav_request"] = page
+    if page == "Erhebung":
+        at.session_state["erhebung_step"] = 2
+        at.session_state["meta"] = {"org": "Check", "area": "", "date_str": "", "target_label": "Definiert"}
+
+    at.run()
+    if at.exception:
+        raise RuntimeError(f"{page}: {at.exception[0].value}")
+    counters = CACHES.get(page, [])
+    after_first = {name: count() for name, count in counters}
+    for _ in range(runs - 1):
+        at.run()
+
+    failed = []
+    for name, count in counters:
+        rebuilt = count() - after_first[name]
+        print(f"  {page:16s} {name:26s} aufgebaut: {after_first[name]}, danach neu: {rebuilt}")
+        if rebuilt or not after_first[name]:
+            # Nie aufgebaut: die Seite nutzt den Cache nicht (Prüfung wäre wertlos)
+            failed.append(f"{page}: {name}")
+    return failed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Caches der Seiten über Reruns prüfen")
+    parser.add_argument("--pages", nargs="+", default=list(CACHES), help="Seiten (Standard: alle)")
+    parser.add_argument("--runs", type=int, default=3, help="Läufe je Seite")
+    args = parser.parse_args(argv)
+
+    answers = _answers()
+    failed: list[str] = []
+    for page in args.pages:
+        failed += check_page(page, max(2, args.runs), answers)
+    if failed:
+        print(f"{len(failed)} Cache(s) ungenutzt oder bei jedem Rerun neu gebaut: {', '.join(failed)}")
+        return 1
+    print("Alle Caches bleiben über Reruns erhalten.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
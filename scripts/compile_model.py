@@ -0,0 +1,239 @@
+"""
+Kompiliert das Reifegradmodell offline: neueste Version des Standardmodells
+(data/models/niro_td_model*.json, siehe core.model_registry).
+
+1. Validierung: doppelte Kürzel/Frage-IDs, Stufennummerierung, fehlende Kategorien,
+   Zielwerte, Glossar (leere Einträge, nicht verlinkte Begriffe, Sprachabgleich).
+2. Artefakt: zweisprachiges Modell (ein Gerüst, je Sprache eine Texttabelle, siehe
+   core.model_bilingual) und Suchindex als versionierte Binärdatei mit Content-Hash
+   (data/models/compiled/niro_td_model.rgmc), je eine Sektion mit eigener Prüfsumme.
+   core.model_loader lädt nur die Modell-Sektion, solange sie zu den JSON-Dateien passt
+   (sonst wie bisher JSON); den Suchindex erst die erste Suche.
+3. Speicherabbild (niro_td_model.rgmm, core.model_mmap): Stringtabelle und flache Arrays,
+   die sich alle Prozesse eines Hosts teilen; Übersicht/Scoring laufen direkt darauf.
+4. --bench: Kaltstart (frischer Prozess) JSON gegen Artefakt.
+5. --rss N: Speicher je Prozess (Rss/Pss aus /proc, Linux) bei N gleichzeitigen Prozessen,
+   die beide Sprachen laden und einmal scoren: JSON, Artefakt, Speicherabbild.
+
+    python scripts/compile_model.py
+    python scripts/compile_model.py --check
+    python scripts/compile_model.py --bench
+    python scripts/compile_model.py --rss 8
+
+Deployment: data/models/compiled/ ist nicht eingecheckt. Die App baut Artefakt und
+Speicherabbild beim ersten Start selbst, wenn sie fehlen oder veraltet sind
+(core.model_loader.ensure_compiled_model); mit Build-Schritt genügt ein Aufruf dieses
+Skripts vor dem Start. CI (.github/workflows/model-check.yml) führt --check und den Build
+bei jeder Änderung unter data/models/ aus.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.model_compiler import (  # noqa: E402
+    SEVERITY_ERROR,
+    ModelValidationError,
+    compile_models,
+    validate_models,
+    write_artifact,
+)
+from core.model_mmap import write_mapped_model  # noqa: E402
+from core.model_registry import ModelRegistry  # noqa: E402
+
+MODELS_DIR = ROOT / "data" / "models"
+# Neueste Version des Standardmodells (wie core.model_loader.model_sources)
+SOURCES = ModelRegistry(MODELS_DIR).sources()
+DEFAULT_OUTPUT = MODELS_DIR / "compiled" / "niro_td_model.rgmc"
+ANSWER_OPTIONS = ["Vollständig", "In den meisten Fällen", "In ein paar Fällen", "Gar nicht", "Nicht anwendbar"]
+
+
+_PROBE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+from core.model_compiler import build_model, read_artifact
+from core.model_search import ModelSearchIndex
+sources = {sources!r}
+start = time.perf_counter()
+{body}
+print(json.dumps({{"ms": (time.perf_counter() - start) * 1000}}))
+"""
+
+_BODIES = {
+    "json.load": "data = {k: json.load(open(p, encoding='utf-8')) for k, p in sources.items()}",
+    "json.load + Aufbau": (
+        "data = {k: json.load(open(p, encoding='utf-8')) for k, p in sources.items()}\n"
+        "models = {k: build_model(v) for k, v in data.items()}\n"
+        "index = ModelSearchIndex(data)"
+    ),
+    "Artefakt": "artifact = read_artifact({artifact!r}, sources)\nmodel = artifact.models['de']",
+}
+
+
+def cold_load(artifact: Path, runs: int = 5) -> dict[str, float]:
+    """
+    Millisekunden bis zum geladenen Modell in einem frischen Prozess (Importe nicht mitgemessen).
+    """
+    sources = {k: str(v) for k, v in SOURCES.items()}
+    result: dict[str, float] = {}
+    for name, body in _BODIES.items():
+        code = _PROBE.format(root=str(ROOT), sources=sources, body=body.replace("{artifact!r}", repr(str(artifact))))
+        times = []
+        for _ in range(runs):
+            out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+            times.append(json.loads(out.strip().splitlines()[-1])["ms"])
+        result[name] = min(times)
+    return result
+
+
+_RSS_PROBE = """
+import json, sys
+sys.path.insert(0, {root!r})
+from pathlib import Path
+from core.model_compiler import build_model, read_artifact
+from core.model_mmap import MappedModel
+from core.scoring import compile_model, score_model
+
+def memory():
+    # kB aus /proc/self/smaps_rollup: Pss teilt gemeinsam genutzte Seiten durch die Zahl der Nutzer
+    values = {{}}
+    for line in open("/proc/self/smaps_rollup"):
+        parts = line.split()
+        if parts[0] in ("Rss:", "Pss:", "Private_Clean:", "Private_Dirty:"):
+            values[parts[0][:-1]] = int(parts[1])
+    return values
+
+sources = {{k: Path(v) for k, v in {sources!r}.items()}}
+answers = json.loads(sys.stdin.readline())
+{body}
+print(json.dumps(score), flush=True)
+sys.stdin.readline()  # warten, bis alle Prozesse geladen haben
+print(json.dumps(memory()), flush=True)
+"""
+
+_RSS_BODIES = {
+    "Basis": "score = None",
+    "JSON": (
+        "models = {k: build_model(json.load(open(p, encoding='utf-8'))) for k, p in sources.items()}\n"
+        "score = {k: score_model(compile_model(m), answers) for k, m in models.items()}"
+    ),
+    "Artefakt (Pickle)": (
+        "artifact = read_artifact({artifact!r}, sources)\n"
+        "score = {k: score_model(compile_model(m), answers) for k, m in artifact.models.items()}"
+    ),
+    "Speicherabbild": (
+        "mapped = MappedModel({mapped!r}, sources)\n"
+        "score = {k: mapped.language(k).score(answers) for k in mapped.languages}"
+    ),
+}
+
+
+def shared_memory(artifact: Path, mapped: Path, processes: int) -> dict[str, dict[str, float]]:
+    """
+    Speicher je Prozess (KiB) für das geladene Modell, gemessen, während N Prozesse gleichzeitig
+    laufen; abgezogen wird eine Basisgruppe (nur Importe). Rss zählt geteilte Seiten voll,
+    Pss anteilig, Privat nur die Seiten, die kein anderer Prozess nutzt.
+    """
+    sources = {k: str(v) for k, v in SOURCES.items()}
+    models = {k: json.loads(p.read_text(encoding="utf-8")) for k, p in SOURCES.items()}
+    rng = random.Random(0)
+    answers = {
+        q["id"]: rng.choice(ANSWER_OPTIONS)
+        for dim in models["de"].get("dimensions", [])
+        for level in dim.get("levels", [])
+        for q in level.get("questions", [])
+    }
+    means: dict[str, dict[str, float]] = {}
+    scores: dict[str, str] = {}
+    for name, body in _RSS_BODIES.items():
+        body = body.replace("{artifact!r}", repr(str(artifact))).replace("{mapped!r}", repr(str(mapped)))
+        code = _RSS_PROBE.format(root=str(ROOT), sources=sources, body=body)
+        procs = [
+            subprocess.Popen([sys.executable, "-c", code], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+            for _ in range(processes)
+        ]
+        for proc in procs:
+            proc.stdin.write(json.dumps(answers) + "\n")
+            proc.stdin.flush()
+        scores[name] = [proc.stdout.readline() for proc in procs][0]
+        # Alle N Prozesse haben geladen: jetzt messen
+        for proc in procs:
+            proc.stdin.write("\n")
+            proc.stdin.flush()
+        finals = [json.loads(proc.stdout.readline()) for proc in procs]
+        for proc in procs:
+            proc.wait()
+        means[name] = {
+            "Rss": sum(f["Rss"] for f in finals) / processes,
+            "Pss": sum(f["Pss"] for f in finals) / processes,
+            "Private": sum(f["Private_Clean"] + f["Private_Dirty"] for f in finals) / processes,
+        }
+
+    base = means.pop("Basis")
+    scores.pop("Basis")
+    if len(set(scores.values())) != 1:
+        raise RuntimeError("Ergebnisse der Varianten weichen voneinander ab.")
+    return {name: {key: value - base[key] for key, value in m.items()} for name, m in means.items()}
+
+
+def _print_issues(issues) -> None:
+    for issue in issues:
+        print(f"  {issue}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Reifegradmodell validieren und kompilieren")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Zieldatei des Artefakts")
+    parser.add_argument("--check", action="store_true", help="Nur validieren, kein Artefakt schreiben")
+    parser.add_argument("--bench", action="store_true", help="Kaltstart JSON vs. Artefakt messen")
+    parser.add_argument("--rss", type=int, metavar="N", help="Speicher je Prozess bei N gleichzeitigen Prozessen messen")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        models = {k: json.loads(p.read_text(encoding="utf-8")) for k, p in SOURCES.items()}
+        issues = validate_models(models)
+        _print_issues(issues)
+        errors = sum(1 for i in issues if i.severity == SEVERITY_ERROR)
+        print(f"{errors} Fehler, {len(issues) - errors} Warnungen")
+        return 1 if errors else 0
+
+    try:
+        artifact = compile_models(SOURCES)
+    except ModelValidationError as exc:
+        _print_issues(exc.issues)
+        print("Modell ungültig, kein Artefakt geschrieben.")
+        return 1
+
+    _print_issues(artifact.warnings)
+    size = write_artifact(artifact, args.output)
+    dims = {k: len(m.dimensions) for k, m in artifact.models.items()}
+    questions = {k: m.question_count for k, m in artifact.models.items()}
+    print(f"{args.output} ({size / 1024:.0f} KiB), content_hash {artifact.content_hash[:16]}")
+    print(f"  Dimensionen {dims}, Fragen {questions}, Suchindex {len(artifact.search_index or [])} Einträge")
+    mapped = args.output.with_suffix(".rgmm")
+    print(f"{mapped} ({write_mapped_model(artifact, mapped) / 1024:.0f} KiB)")
+
+    if args.bench:
+        print("Kaltstart (ms, bester von 5 frischen Prozessen):")
+        for name, ms in cold_load(args.output).items():
+            print(f"  {name:22s} {ms:8.1f}")
+
+    if args.rss:
+        print(f"Speicher je Prozess (KiB, {args.rss} Prozesse gleichzeitig, über der Basis):")
+        print(f"  {'':22s} {'Rss':>8s} {'Pss':>8s} {'Privat':>8s}")
+        for name, kib in shared_memory(args.output, mapped, args.rss).items():
+            print(f"  {name:22s} {kib['Rss']:8.0f} {kib['Pss']:8.0f} {kib['Private']:8.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
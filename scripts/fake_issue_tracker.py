@@ -0,0 +1,188 @@
+"""
+Lokaler Ersatz für die GitHub-Issues-API (POST/GET /repos/{owner}/{repo}/issues).
+
+Für Tests der Maßnahmen-Outbox (core/measure_outbox.py) ohne Netzwerk/Token:
+
+    python scripts/fake_issue_tracker.py --port 8765 --rate-limit 10 --fail-every 7 --drop-every 5
+
+und in der App bzw. im Test OutboxConfig(api_base="http://127.0.0.1:8765", ...).
+Spricht HTTP/1.1 mit Keep-Alive und liefert GitHub-ähnliche Rate-Limit-Header.
+--drop-every legt das Issue an, trennt aber ohne Antwort (unbestätigter POST).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+
+class FakeIssueTracker(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int] = ("127.0.0.1", 0),
+        *,
+        rate_limit: int = 0,
+        window_s: float = 60.0,
+        fail_every: int = 0,
+        latency_s: float = 0.0,
+        drop_every: int = 0,
+    ) -> None:
+        super().__init__(address, _Handler)
+        self.rate_limit = rate_limit
+        self.window_s = window_s
+        self.fail_every = fail_every
+        self.latency_s = latency_s
+        self.drop_every = drop_every
+        self.lock = threading.Lock()
+        self.issues: list[dict[str, Any]] = []
+        self.requests = 0
+        self.connections = 0
+        self.window_start = time.time()
+        self.window_used = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeIssueTracker":
+        threading.Thread(target=self.serve_forever, name="fake-issue-tracker", daemon=True).start()
+        return self
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: FakeIssueTracker
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _reply(self, status: int, payload: dict | list, headers: dict[str, str] | None = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", "0") or 0)
+        raw = self.rfile.read(length)
+        srv = self.server
+        if srv.latency_s:
+            time.sleep(srv.latency_s)
+
+        parts = self.path.strip("/").split("/")
+        if len(parts) != 4 or parts[0] != "repos" or parts[3] != "issues":
+            self._reply(404, {"message": "Not Found"})
+            return
+        if not self.headers.get("Authorization", "").startswith("Bearer "):
+            self._reply(401, {"message": "Bad credentials"})
+            return
+
+        with srv.lock:
+            srv.requests += 1
+            now = time.time()
+            if now - srv.window_start >= srv.window_s:
+                srv.window_start, srv.window_used = now, 0
+            reset = int(srv.window_start + srv.window_s)
+
+            if srv.rate_limit and srv.window_used >= srv.rate_limit:
+                self._reply(
+                    403,
+                    {"message": "API rate limit exceeded"},
+                    {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset), "Retry-After": str(max(1, reset - int(now)))},
+                )
+                return
+            srv.window_used += 1
+            remaining = max(0, srv.rate_limit - srv.window_used) if srv.rate_limit else 5000
+
+            if srv.fail_every and srv.requests % srv.fail_every == 0:
+                self._reply(502, {"message": "Bad Gateway"})
+                return
+
+            try:
+                issue = json.loads(raw.decode("utf-8"))
+            except ValueError:
+                self._reply(400, {"message": "Problems parsing JSON"})
+                return
+            issue["number"] = len(srv.issues) + 1
+            issue["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+            srv.issues.append(issue)
+            drop = bool(srv.drop_every) and srv.requests % srv.drop_every == 0
+
+        if drop:
+            # Angelegt, aber die Antwort geht verloren
+            self.close_connection = True
+            return
+
+        self._reply(
+            201,
+            {"number": issue["number"], "title": issue.get("title", "")},
+            {"X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": str(reset)},
+        )
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        parts = url.path.strip("/").split("/")
+        if len(parts) != 4 or parts[0] != "repos" or parts[3] != "issues":
+            self._reply(404, {"message": "Not Found"})
+            return
+        if not self.headers.get("Authorization", "").startswith("Bearer "):
+            self._reply(401, {"message": "Bad credentials"})
+            return
+
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        per_page = min(100, int(query.get("per_page", 30)))
+        page = max(1, int(query.get("page", 1)))
+        since = query.get("since", "")
+        with self.server.lock:
+            self.server.requests += 1
+            # Neueste zuerst; ISO-Zeitstempel sind lexikografisch vergleichbar
+            issues = [i for i in reversed(self.server.issues) if i["updated_at"] >= since]
+        self._reply(200, issues[(page - 1) * per_page : page * per_page])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Lokaler Issue-Tracker für Outbox-Tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rate-limit", type=int, default=0, help="Requests pro Fenster (0 = unbegrenzt)")
+    parser.add_argument("--window", type=float, default=60.0, help="Rate-Limit-Fenster in Sekunden")
+    parser.add_argument("--fail-every", type=int, default=0, help="Jeder n-te Request liefert 502")
+    parser.add_argument("--drop-every", type=int, default=0, help="Jeder n-te POST legt an, antwortet aber nicht")
+    parser.add_argument("--latency", type=float, default=0.0, help="Künstliche Antwortzeit in Sekunden")
+    args = parser.parse_args()
+
+    server = FakeIssueTracker(
+        (args.host, args.port),
+        rate_limit=args.rate_limit,
+        window_s=args.window,
+        fail_every=args.fail_every,
+        latency_s=args.latency,
+        drop_every=args.drop_every,
+    )
+    print(f"Fake issue tracker auf {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import argparse
 import json
 import os
 import re
 import sys
 from pathlib import Path
 
-MEASURES_FILE = Path("data/measures.json")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.measure_store import get_measure_store  # noqa: E402
+
+# data/measures/ (ein Shard je Dimension und Sprache); Altformat data/measures.json wird noch gelesen
+DATA_DIR = Path("data")
 
 
 def normalize_measure_text(text: str) -> str:
@@ -84,45 +90,30 @@ def _unique_measure_list(values: object) -> list[str]:
 
 
 def load_measures() -> dict:
-    if not MEASURES_FILE.exists():
-        return {}
-
+    store = get_measure_store(DATA_DIR)
     try:
-        data = json.loads(MEASURES_FILE.read_text(encoding="utf-8"))
+        data = store.load()
     except json.JSONDecodeError as e:
-        raise ValueError(f"{MEASURES_FILE} enthält ungültiges JSON: {e}") from e
-
-    if not isinstance(data, dict):
-        raise ValueError(f"{MEASURES_FILE} muss ein JSON-Objekt sein.")
+        raise ValueError(f"Maßnahmenpool in {DATA_DIR} enthält ungültiges JSON: {e}") from e
 
     cleaned: dict[str, dict[str, list[str]]] = {}
     for key, value in data.items():
         key_str = str(key).strip()
         if not key_str:
             continue
-
-        if isinstance(value, dict):
-            cleaned[key_str] = {
-                "de": _unique_measure_list(value.get("de")),
-                "en": _unique_measure_list(value.get("en")),
-            }
-        elif isinstance(value, list):
-            cleaned[key_str] = {
-                "de": _unique_measure_list(value),
-                "en": [],
-            }
-        else:
-            cleaned[key_str] = {"de": [], "en": []}
+        cleaned[key_str] = {
+            "de": _unique_measure_list(value.get("de")),
+            "en": _unique_measure_list(value.get("en")),
+        }
 
     return cleaned
 
 
-def save_measures(data: dict) -> None:
-    MEASURES_FILE.parent.mkdir(parents=True, exist_ok=True)
-    MEASURES_FILE.write_text(
-        json.dumps(data, ensure_ascii=False, indent=2) + "\n",
-        encoding="utf-8",
-    )
+def save_measures(data: dict) -> list[str]:
+    """
+    Schreibt nur die geänderten Shards (und das Manifest).
+    """
+    return get_measure_store(DATA_DIR).save(data)
 
 
 def add_measure_if_new(data: dict, dimension_code: str, measure_text: str, language: str = "de") -> bool:
@@ -155,7 +146,118 @@ def add_measure_if_new(data: dict, dimension_code: str, measure_text: str, langu
     return True
 
 
-def main() -> int:
+# -----------------------------
+# Batch-Modus
+# -----------------------------
+def build_measure_index(data: dict) -> dict[tuple[str, str], set[str]]:
+    """
+    Normalisierter Index (dimension_code, language) -> Menge der Maßnahmen in Kleinschreibung.
+    Wird einmal pro Batch aufgebaut und beim Hinzufügen mitgeführt.
+    """
+    index: dict[tuple[str, str], set[str]] = {}
+    for code, by_lang in data.items():
+        if not isinstance(by_lang, dict):
+            continue
+        for lang in ("de", "en"):
+            index[(code, lang)] = {
+                normalize_measure_text(str(item)).lower()
+                for item in by_lang.get(lang) or []
+                if normalize_measure_text(str(item))
+            }
+    return index
+
+
+def read_batch(path: Path) -> list[tuple[str, str]]:
+    """
+    Issue-Bodies aus einer JSONL-Datei ({"number": ..., "body": ...} je Zeile)
+    oder einem Verzeichnis (eine Datei je Issue, Dateiname = Issue-ID).
+    """
+    items: list[tuple[str, str]] = []
+    if path.is_dir():
+        for file in sorted(p for p in path.iterdir() if p.is_file()):
+            items.append((file.stem, file.read_text(encoding="utf-8")))
+        return items
+
+    for line_no, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            items.append((f"line-{line_no}", ""))
+            print(f"Warnung: Zeile {line_no} ist kein gültiges JSON: {e}", file=sys.stderr)
+            continue
+        issue_id = record.get("number", record.get("issue_number", record.get("id", f"line-{line_no}")))
+        items.append((str(issue_id), str(record.get("body") or "")))
+    return items
+
+
+def process_batch(data: dict, items: list[tuple[str, str]]) -> list[dict]:
+    """
+    Parst, validiert und dedupliziert alle Issues in einem Durchlauf und ergänzt data.
+    Ergebnis je Issue: status = added | duplicate | invalid.
+    """
+    index = build_measure_index(data)
+    results: list[dict] = []
+
+    for issue_id, body in items:
+        result: dict = {"issue": issue_id}
+        try:
+            measure_text, dimension_code, language = parse_issue_body(body)
+        except ValueError as e:
+            result.update(status="invalid", error=str(e))
+            results.append(result)
+            continue
+
+        result.update(dimension_code=dimension_code, language=language, measure=measure_text)
+        key = normalize_measure_text(measure_text).lower()
+        seen = index.setdefault((dimension_code, language), set())
+        if key in seen:
+            result["status"] = "duplicate"
+        else:
+            by_lang = data.get(dimension_code)
+            if not isinstance(by_lang, dict):
+                by_lang = {"de": [], "en": []}
+                data[dimension_code] = by_lang
+            by_lang.setdefault("de", [])
+            by_lang.setdefault("en", [])
+            by_lang[language].append(normalize_measure_text(measure_text))
+            seen.add(key)
+            result["status"] = "added"
+        results.append(result)
+
+    return results
+
+
+def main_batch(args: argparse.Namespace) -> int:
+    try:
+        items = read_batch(Path(args.batch))
+        measures = load_measures()
+    except Exception as e:
+        print(f"Fehler beim Einlesen des Batches: {e}", file=sys.stderr)
+        return 1
+
+    results = process_batch(measures, items)
+    added = sum(1 for r in results if r["status"] == "added")
+
+    if added and not args.dry_run:
+        save_measures(measures)
+
+    report = "\n".join(json.dumps(r, ensure_ascii=False) for r in results) + ("\n" if results else "")
+    if args.report:
+        Path(args.report).write_text(report, encoding="utf-8")
+    else:
+        sys.stdout.write(report)
+
+    counts = {status: sum(1 for r in results if r["status"] == status) for status in ("added", "duplicate", "invalid")}
+    print(
+        f"Issues: {len(results)} | Added: {counts['added']} | Duplicate: {counts['duplicate']} | Invalid: {counts['invalid']}",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def main_single() -> int:
     issue_body = os.environ.get("ISSUE_BODY", "")
     if not issue_body.strip():
         print("Fehler: Umgebungsvariable ISSUE_BODY fehlt oder ist leer.", file=sys.stderr)
@@ -180,5 +282,17 @@ def main() -> int:
         return 1
 
 
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Maßnahmen-Issues in den Maßnahmenpool (data/measures/) übernehmen")
+    parser.add_argument("--batch", help="JSONL-Datei oder Verzeichnis mit Issue-Bodies (ohne: ISSUE_BODY)")
+    parser.add_argument("--report", help="Ergebnis je Issue als JSONL in diese Datei (sonst stdout)")
+    parser.add_argument("--dry-run", action="store_true", help="Nur prüfen, den Maßnahmenpool nicht schreiben")
+    args = parser.parse_args(argv)
+
+    if args.batch:
+        return main_batch(args)
+    return main_single()
+
+
 if __name__ == "__main__":
     raise SystemExit(main())